@@ -26,6 +26,7 @@ class KISRestMarketDataProvider(MarketDataProvider):
         self._quote_snapshot_calls = 0
         self._latest_price_calls = 0
         self._latest_price_with_open_calls = 0
+        self._bulk_snapshot_calls = 0
 
     @staticmethod
     def _completed_minute_bar_ts() -> datetime:
@@ -126,12 +127,22 @@ class KISRestMarketDataProvider(MarketDataProvider):
         open_price = float(data.get("open_price", 0.0) or 0.0)
         return current_price, open_price
 
+    def prefetch_quotes(self, stock_codes: List[str]) -> List[str]:
+        """Fetch quotes for many symbols through the bulk snapshot API; return fetched codes."""
+        bulk_snapshot = getattr(self._api, "get_market_snapshot_bulk", None)
+        if not callable(bulk_snapshot):
+            return []
+        self._bulk_snapshot_calls += 1
+        rows = bulk_snapshot(list(stock_codes))
+        return [str(row.get("code")) for row in rows if row.get("code")]
+
     def metrics(self) -> dict:
         return {
             "daily_fetch_calls": int(self._daily_fetch_calls),
             "quote_snapshot_calls": int(self._quote_snapshot_calls),
             "latest_price_calls": int(self._latest_price_calls),
             "latest_price_with_open_calls": int(self._latest_price_with_open_calls),
+            "bulk_snapshot_calls": int(self._bulk_snapshot_calls),
             "rest_quote_calls": int(
                 self._quote_snapshot_calls
                 + self._latest_price_calls
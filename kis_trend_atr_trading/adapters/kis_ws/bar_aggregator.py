@@ -9,9 +9,9 @@ from typing import Dict, Optional
 from core.market_data import OHLCVBar
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketTick:
-    """Normalized market tick for adapter-internal aggregation."""
+    """Normalized market tick for adapter-internal aggregation (slots: no per-tick __dict__)."""
 
     stock_code: str
     price: float
@@ -11,7 +11,15 @@ from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 from adapters.kis_rest.market_data import KISRestMarketDataProvider
 from adapters.kis_ws.bar_aggregator import MarketTick, MinuteBarAggregator
+from adapters.kis_ws.tick_dispatcher import TickDispatchQueue
 from adapters.kis_ws.ws_client import KISWSClient
+from api.fill_event_bus import FillEvent, FillEventBus
+from core.intraday_session import (
+    DEFAULT_OPENING_RANGE_BARS,
+    DEFAULT_RECENT_CLOSE_WINDOW,
+    IntradaySessionSnapshot,
+    IntradaySessionStore,
+)
 from core.market_data import BarCallback, MarketDataProvider, OHLCVBar
 from utils.logger import get_logger
 
@@ -26,6 +34,10 @@ class KISWSMarketDataProvider(MarketDataProvider):
     - Emits only completed 1m bars.
     - Keeps in-memory recent bars for `get_recent_bars(..., timeframe='1m')`.
     - On WS failure follows fixed policy (`rest_fallback` by default).
+    - Quote/bar callbacks run on dispatch worker threads (not in the WS recv loop)
+      unless `tick_dispatch_workers=0`; quotes are coalesced per symbol.
+    - Completed bars also update a per-symbol `IntradaySessionStore`
+      (opening range / VWAP / last-bar stats) exposed via `get_intraday_session`.
     """
 
     def __init__(
@@ -40,6 +52,11 @@ class KISWSMarketDataProvider(MarketDataProvider):
         missing_gap_required: int = 2,
         backfill_cooldown_sec: int = 30,
         quote_static_cache_ttl_sec: float = 900.0,
+        tick_dispatch_workers: int = 1,
+        tick_dispatch_max_pending_bars: int = 8,
+        fill_event_bus: Optional[FillEventBus] = None,
+        session_opening_range_bars: int = DEFAULT_OPENING_RANGE_BARS,
+        session_recent_close_window: int = DEFAULT_RECENT_CLOSE_WINDOW,
     ):
         self._ws_client = ws_client or KISWSClient(
             max_reconnect_attempts=max_reconnect_attempts,
@@ -52,6 +69,10 @@ class KISWSMarketDataProvider(MarketDataProvider):
         self._bars: Dict[str, Deque[OHLCVBar]] = defaultdict(
             lambda: deque(maxlen=max(int(max_bar_history), 100))
         )
+        self._sessions = IntradaySessionStore(
+            opening_range_bars=session_opening_range_bars,
+            recent_close_window=session_recent_close_window,
+        )
         self._latest_price: Dict[str, float] = {}
         self._quote_snapshot: Dict[str, Dict[str, object]] = {}
         self._quote_static_cache: Dict[str, Dict[str, object]] = {}
@@ -75,6 +96,16 @@ class KISWSMarketDataProvider(MarketDataProvider):
         self._rest_quote_refresh_count: int = 0
         self._ws_reconnect_count: int = 0
         self._ws_fallback_count: int = 0
+        self._fill_event_bus = fill_event_bus
+        self._execution_notice_count: int = 0
+        self._dispatcher: Optional[TickDispatchQueue] = None
+        if int(tick_dispatch_workers) > 0:
+            self._dispatcher = TickDispatchQueue(
+                on_quote=self._dispatch_quote,
+                on_bar=self._dispatch_bar,
+                workers=int(tick_dispatch_workers),
+                max_pending_bars_per_symbol=int(tick_dispatch_max_pending_bars),
+            )
 
     def get_recent_bars(self, stock_code: str, n: int, timeframe: str) -> List[dict]:
         code = str(stock_code).zfill(6)
@@ -89,6 +120,10 @@ class KISWSMarketDataProvider(MarketDataProvider):
         # Keep compatibility with existing daily-bar strategy path.
         return self._rest_fallback.get_recent_bars(code, count, timeframe)
 
+    def get_intraday_session(self, stock_code: str) -> Optional[IntradaySessionSnapshot]:
+        """Return the incremental regular-session state built from completed WS bars."""
+        return self._sessions.snapshot(stock_code)
+
     def get_latest_price(self, stock_code: str) -> float:
         code = str(stock_code).zfill(6)
         with self._lock:
@@ -303,12 +338,14 @@ class KISWSMarketDataProvider(MarketDataProvider):
 
         return _unsubscribe
 
-    def _handle_tick(self, tick: MarketTick) -> None:
+    def _apply_tick(
+        self, tick: MarketTick
+    ) -> Tuple[str, Optional[Dict[str, object]], Optional[OHLCVBar], int]:
+        """Update in-memory quote/bar state; returns (code, quote snapshot or None, completed bar, missing)."""
         code = str(tick.stock_code).zfill(6)
         received_at = tick.received_at or datetime.now()
-        callbacks: List[QuoteCallback]
         with self._lock:
-            previous = dict(self._quote_snapshot.get(code) or {})
+            previous = self._quote_snapshot.get(code) or {}
             current_session_date = received_at.date().isoformat()
             previous_session_date = str(previous.get("session_date") or "")
             if previous_session_date != current_session_date:
@@ -330,19 +367,11 @@ class KISWSMarketDataProvider(MarketDataProvider):
             }
             self._last_message_ts = received_at
             self._quote_event_count += 1
-            callbacks = list(self._quote_callbacks)
-            quote_snapshot = dict(self._quote_snapshot[code])
-
-        if callbacks:
-            for callback in callbacks:
-                try:
-                    callback(code, dict(quote_snapshot))
-                except Exception as exc:
-                    logger.debug("[WS] quote callback failed stock=%s err=%s", code, exc)
+            quote_snapshot = dict(self._quote_snapshot[code]) if self._quote_callbacks else None
 
         completed = self._aggregator.add_tick(tick)
         if completed is None:
-            return
+            return code, quote_snapshot, None, 0
 
         missing_count = 0
         with self._lock:
@@ -354,7 +383,20 @@ class KISWSMarketDataProvider(MarketDataProvider):
                     self._missing_gap_detected = True
             self._last_completed_bar_ts[code] = completed.start_at
             self._bars[code].append(completed)
+        self._sessions.add_bar(completed)
+        return code, quote_snapshot, completed, missing_count
+
+    def _dispatch_quote(self, code: str, quote_snapshot: Dict[str, object]) -> None:
+        with self._lock:
+            callbacks = list(self._quote_callbacks)
+        for callback in callbacks:
+            try:
+                callback(code, dict(quote_snapshot))
+            except Exception as exc:
+                logger.debug("[WS] quote callback failed stock=%s err=%s", code, exc)
 
+    def _dispatch_bar(self, code: str, item: Tuple[OHLCVBar, int], *, in_event_loop: bool = False) -> None:
+        completed, missing_count = item
         if missing_count >= self._missing_gap_required:
             logger.warning(
                 "[WS] missing completed bars detected stock=%s missing=%s (>= %s)",
@@ -368,15 +410,53 @@ class KISWSMarketDataProvider(MarketDataProvider):
         if cb is None:
             return
         if asyncio.iscoroutinefunction(cb):
-            asyncio.create_task(cb(completed))
+            if in_event_loop:
+                asyncio.create_task(cb(completed))
+            else:
+                asyncio.run(cb(completed))
         else:
             cb(completed)
 
+    def _handle_tick(self, tick: MarketTick) -> None:
+        """Apply a tick and run callbacks inline (used when dispatch is disabled)."""
+        code, quote_snapshot, completed, missing_count = self._apply_tick(tick)
+        if quote_snapshot is not None:
+            self._dispatch_quote(code, quote_snapshot)
+        if completed is not None:
+            self._dispatch_bar(code, (completed, missing_count), in_event_loop=True)
+
+    def _enqueue_tick(self, tick: MarketTick) -> None:
+        """WS recv-loop callback: state update only, consumers run on dispatch workers."""
+        code, quote_snapshot, completed, missing_count = self._apply_tick(tick)
+        if quote_snapshot is not None:
+            self._dispatcher.put_quote(code, quote_snapshot)
+        if completed is not None:
+            self._dispatcher.put_bar(code, (completed, missing_count))
+
+    def _on_execution_notice(self, event: FillEvent) -> None:
+        with self._lock:
+            self._execution_notice_count += 1
+        self._fill_event_bus.publish(event)
+
     def _run_ws(self, stock_codes: List[str]) -> None:
         self._ws_running = True
         self._ws_failed = False
         try:
-            result = asyncio.run(self._ws_client.run(stock_codes, self._handle_tick))
+            on_tick = self._handle_tick
+            if self._dispatcher is not None:
+                self._dispatcher.start()
+                on_tick = self._enqueue_tick
+            if self._fill_event_bus is not None:
+                result = asyncio.run(
+                    self._ws_client.run(
+                        stock_codes,
+                        on_tick,
+                        on_execution=self._on_execution_notice,
+                        on_execution_state=self._fill_event_bus.set_live,
+                    )
+                )
+            else:
+                result = asyncio.run(self._ws_client.run(stock_codes, on_tick))
             with self._lock:
                 self._ws_reconnect_count += max(int(getattr(result, "reconnect_attempts", 0) or 0), 0)
             if not result.success:
@@ -428,6 +508,8 @@ class KISWSMarketDataProvider(MarketDataProvider):
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=3.0)
         self._thread = None
+        if self._dispatcher is not None:
+            self._dispatcher.stop(drain=True)
 
     def _attempt_backfill(self, stock_code: str, missing_count: int) -> None:
         now = datetime.now()
@@ -501,6 +583,9 @@ class KISWSMarketDataProvider(MarketDataProvider):
             "ws_fallback_count": int(self._ws_fallback_count),
             "rest_daily_fetch_calls": int(rest_metrics.get("daily_fetch_calls", 0) or 0),
             "rest_quote_calls": int(rest_metrics.get("rest_quote_calls", 0) or 0),
+            "ws_execution_notices": int(self._execution_notice_count),
+            **self._sessions.metrics(),
+            **(self._dispatcher.metrics() if self._dispatcher is not None else {}),
         }
 
     @property
@@ -0,0 +1,182 @@
+"""Per-symbol coalescing dispatch queue between the WS reader and consumers."""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set
+
+from utils.logger import get_logger
+
+logger = get_logger("kis_ws_tick_dispatcher")
+
+QuoteHandler = Callable[[str, Dict[str, Any]], None]
+BarHandler = Callable[[str, Any], None]
+
+_NO_QUOTE = object()
+
+
+class TickDispatchQueue:
+    """
+    Bounded per-symbol queue drained by worker threads.
+
+    - Quotes: one slot per symbol, latest value wins (older pending quote is coalesced).
+    - Completed bars: bounded deque per symbol, oldest dropped on overflow.
+    - A symbol is processed by at most one worker at a time, so per-symbol
+      event order is preserved even with several workers.
+    - `put_*` never blocks on consumers; the WS recv loop only pays a lock + dict update.
+    """
+
+    def __init__(
+        self,
+        *,
+        on_quote: QuoteHandler,
+        on_bar: BarHandler,
+        workers: int = 1,
+        max_pending_bars_per_symbol: int = 8,
+        thread_name_prefix: str = "kis-ws-dispatch",
+    ):
+        self._on_quote = on_quote
+        self._on_bar = on_bar
+        self._workers = max(int(workers), 1)
+        self._max_pending_bars = max(int(max_pending_bars_per_symbol), 1)
+        self._thread_name_prefix = thread_name_prefix
+        self._cond = threading.Condition(threading.Lock())
+        self._pending_quotes: Dict[str, Any] = {}
+        self._pending_bars: Dict[str, Deque[Any]] = {}
+        self._ready: Deque[str] = deque()
+        self._scheduled: Set[str] = set()
+        self._in_flight: int = 0
+        self._threads: List[threading.Thread] = []
+        self._running = False
+        self._quotes_enqueued = 0
+        self._quotes_coalesced = 0
+        self._bars_enqueued = 0
+        self._bars_dropped = 0
+        self._quotes_dispatched = 0
+        self._bars_dispatched = 0
+        self._handler_errors = 0
+        self._max_ready_depth = 0
+
+    def start(self) -> None:
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            self._threads = [
+                threading.Thread(
+                    target=self._run,
+                    daemon=True,
+                    name=f"{self._thread_name_prefix}-{idx}",
+                )
+                for idx in range(self._workers)
+            ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, drain: bool = True, timeout: float = 3.0) -> None:
+        """Stop workers. With `drain=True` pending events are delivered first."""
+        with self._cond:
+            if not self._running:
+                return
+            if drain:
+                self._cond.wait_for(lambda: not self._ready and self._in_flight == 0, timeout=timeout)
+            self._running = False
+            self._cond.notify_all()
+            threads = list(self._threads)
+            self._threads = []
+        for thread in threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout=timeout)
+
+    def _schedule_locked(self, code: str) -> None:
+        if code in self._scheduled:
+            return
+        self._scheduled.add(code)
+        self._ready.append(code)
+        self._max_ready_depth = max(self._max_ready_depth, len(self._ready))
+        self._cond.notify()
+
+    def put_quote(self, code: str, snapshot: Dict[str, Any]) -> None:
+        with self._cond:
+            self._quotes_enqueued += 1
+            if code in self._pending_quotes:
+                self._quotes_coalesced += 1
+            self._pending_quotes[code] = snapshot
+            self._schedule_locked(code)
+
+    def put_bar(self, code: str, bar: Any) -> None:
+        with self._cond:
+            self._bars_enqueued += 1
+            pending = self._pending_bars.get(code)
+            if pending is None:
+                pending = deque()
+                self._pending_bars[code] = pending
+            if len(pending) >= self._max_pending_bars:
+                pending.popleft()
+                self._bars_dropped += 1
+            pending.append(bar)
+            self._schedule_locked(code)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._running and not self._ready:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                code = self._ready.popleft()
+                quote = self._pending_quotes.pop(code, _NO_QUOTE)
+                bars = self._pending_bars.pop(code, None)
+                self._in_flight += 1
+
+            try:
+                self._deliver(code, quote, bars)
+            finally:
+                with self._cond:
+                    self._in_flight -= 1
+                    if code in self._pending_quotes or code in self._pending_bars:
+                        # More events arrived while this symbol was in flight.
+                        self._ready.append(code)
+                        self._cond.notify()
+                    else:
+                        self._scheduled.discard(code)
+                    if not self._ready and self._in_flight == 0:
+                        self._cond.notify_all()
+
+    def _deliver(self, code: str, quote: Any, bars: Optional[Deque[Any]]) -> None:
+        if quote is not _NO_QUOTE:
+            try:
+                self._on_quote(code, quote)
+            except Exception as exc:
+                self._note_error()
+                logger.debug("[WS] dispatch quote failed stock=%s err=%s", code, exc)
+            with self._cond:
+                self._quotes_dispatched += 1
+        for bar in bars or ():
+            try:
+                self._on_bar(code, bar)
+            except Exception as exc:
+                self._note_error()
+                logger.warning("[WS] dispatch bar failed stock=%s err=%s", code, exc)
+            with self._cond:
+                self._bars_dispatched += 1
+
+    def _note_error(self) -> None:
+        with self._cond:
+            self._handler_errors += 1
+
+    def metrics(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "dispatch_workers": int(self._workers),
+                "dispatch_ready_depth": len(self._ready),
+                "dispatch_max_ready_depth": int(self._max_ready_depth),
+                "dispatch_quotes_enqueued": int(self._quotes_enqueued),
+                "dispatch_quotes_coalesced": int(self._quotes_coalesced),
+                "dispatch_quotes_delivered": int(self._quotes_dispatched),
+                "dispatch_bars_enqueued": int(self._bars_enqueued),
+                "dispatch_bars_dropped": int(self._bars_dropped),
+                "dispatch_bars_delivered": int(self._bars_dispatched),
+                "dispatch_handler_errors": int(self._handler_errors),
+            }
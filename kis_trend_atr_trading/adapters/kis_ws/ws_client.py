@@ -3,25 +3,89 @@
 from __future__ import annotations
 
 import asyncio
+import base64
 import json
 import os
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Awaitable, Callable, Optional, Sequence
+from datetime import date, datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
 
 import requests
 
 from adapters.kis_ws.bar_aggregator import MarketTick
+from api.fill_event_bus import FillEvent
 from utils.logger import get_logger
+from utils.market_hours import KST
 
 logger = get_logger("kis_ws_client")
 
 WS_URL_REAL = "ws://ops.koreainvestment.com:21000"
 WS_URL_PAPER = "ws://ops.koreainvestment.com:31000"
 TR_SUBSCRIBE = "H0STCNT0"
+# Real-time execution notice (체결통보): tr_key is the HTS ID, payload is AES-256-CBC encrypted.
+TR_EXECUTION_NOTICE_REAL = "H0STCNI0"
+TR_EXECUTION_NOTICE_PAPER = "H0STCNI9"
+TR_EXECUTION_NOTICES = (TR_EXECUTION_NOTICE_REAL, TR_EXECUTION_NOTICE_PAPER)
+# Minimum fields per execution-notice record used by the parser (cust_id..cntg_yn).
+EXECUTION_NOTICE_MIN_FIELDS = 14
+# Minimum fields per H0STCNT0 record used by the parser (code..volume).
+TICK_MIN_FIELDS = 13
 
 
 TickCallback = Callable[[MarketTick], Awaitable[None] | None]
+ExecutionCallback = Callable[[FillEvent], None]
+ExecutionStateCallback = Callable[[bool], None]
+
+
+def decrypt_execution_notice(cipher_text: str, key: str, iv: str) -> str:
+    """Decrypt a KIS execution-notice payload (AES-256-CBC, base64, PKCS7)."""
+    try:
+        from Crypto.Cipher import AES
+        from Crypto.Util.Padding import unpad
+    except Exception as err:
+        raise RuntimeError("pycryptodome package is required for WS execution notices.") from err
+
+    cipher = AES.new(key.encode("utf-8"), AES.MODE_CBC, iv.encode("utf-8"))
+    plain = unpad(cipher.decrypt(base64.b64decode(cipher_text)), AES.block_size)
+    return plain.decode("utf-8")
+
+
+class _SecondTimestampCache:
+    """
+    HHMMSS -> trade timestamp cache.
+
+    Ticks inside the same second share one datetime object instead of
+    rebuilding it through `now.replace(...)` per tick. The cache is reset
+    when the local date changes.
+    """
+
+    __slots__ = ("_date", "_by_hhmmss")
+
+    def __init__(self) -> None:
+        self._date: Optional[date] = None
+        self._by_hhmmss: Dict[str, datetime] = {}
+
+    def resolve(self, hhmmss: str, now: datetime) -> datetime:
+        today = now.date()
+        if today != self._date:
+            self._date = today
+            self._by_hhmmss = {}
+        ts = self._by_hhmmss.get(hhmmss)
+        if ts is None:
+            try:
+                ts = now.replace(
+                    hour=int(hhmmss[0:2]),
+                    minute=int(hhmmss[2:4]),
+                    second=int(hhmmss[4:6]),
+                    microsecond=0,
+                )
+            except Exception:
+                return now
+            self._by_hhmmss[hhmmss] = ts
+        return ts
+
+
+_tick_ts_cache = _SecondTimestampCache()
 
 
 @dataclass
@@ -52,6 +116,9 @@ class KISWSClient:
         reconnect_base_delay: float = 1.0,
         failure_policy: str = "rest_fallback",
         approval_key_refresh_margin_min: int = 30,
+        hts_id: Optional[str] = None,
+        execution_notice: bool = False,
+        ws_url: Optional[str] = None,
     ):
         self.app_key = app_key or os.getenv("KIS_APP_KEY", "")
         self.app_secret = app_secret or os.getenv("KIS_APP_SECRET", "")
@@ -61,7 +128,12 @@ class KISWSClient:
             if is_paper_trading
             else "https://openapi.koreainvestment.com:9443"
         )
-        self.ws_url = WS_URL_PAPER if is_paper_trading else WS_URL_REAL
+        self.ws_url = ws_url or (WS_URL_PAPER if is_paper_trading else WS_URL_REAL)
+        self.hts_id = str(hts_id if hts_id is not None else os.getenv("KIS_HTS_ID", "")).strip()
+        self.execution_notice = bool(execution_notice) and bool(self.hts_id)
+        self.execution_notice_tr_id = (
+            TR_EXECUTION_NOTICE_PAPER if is_paper_trading else TR_EXECUTION_NOTICE_REAL
+        )
         self.max_reconnect_attempts = max(int(max_reconnect_attempts), 1)
         self.reconnect_base_delay = max(float(reconnect_base_delay), 0.2)
         self.failure_policy = failure_policy
@@ -72,6 +144,10 @@ class KISWSClient:
         )
         self._running: bool = False
         self._ws = None
+        self._on_execution: Optional[ExecutionCallback] = None
+        self._on_execution_state: Optional[ExecutionStateCallback] = None
+        self._notice_key: Optional[str] = None
+        self._notice_iv: Optional[str] = None
 
     def stop(self) -> None:
         self._running = False
@@ -121,16 +197,167 @@ class KISWSClient:
         }
         await self._ws.send(json.dumps(payload))
 
+    async def _send_execution_notice_subscribe(self) -> None:
+        payload = {
+            "header": {
+                "approval_key": self._approval_key,
+                "custtype": "P",
+                "tr_type": "1",
+                "content-type": "utf-8",
+            },
+            "body": {"input": {"tr_id": self.execution_notice_tr_id, "tr_key": self.hts_id}},
+        }
+        await self._ws.send(json.dumps(payload))
+
+    def _set_execution_notice_ready(self, ready: bool) -> None:
+        if not ready:
+            self._notice_key = None
+            self._notice_iv = None
+        callback = self._on_execution_state
+        if callback is not None:
+            try:
+                callback(bool(ready))
+            except Exception as exc:
+                logger.debug("[WS] execution notice state callback failed err=%s", exc)
+
+    def _handle_execution_message(self, message: str) -> bool:
+        """Consume execution-notice control/data frames; returns False for other messages."""
+        if not message:
+            return False
+        if message[0] == "{":
+            try:
+                data = json.loads(message)
+            except ValueError:
+                return False
+            header = data.get("header") or {}
+            if header.get("tr_id") not in TR_EXECUTION_NOTICES:
+                return False
+            body = data.get("body") or {}
+            output = body.get("output") or {}
+            if str(body.get("rt_cd", "")) == "0" and output.get("key") and output.get("iv"):
+                self._notice_key = str(output["key"])
+                self._notice_iv = str(output["iv"])
+                logger.info("[WS] execution notice subscribed tr_id=%s", header.get("tr_id"))
+                self._set_execution_notice_ready(True)
+            else:
+                logger.warning("[WS] execution notice control message=%s", body.get("msg1", ""))
+            return True
+
+        parts = message.split("|", 3)
+        if len(parts) < 4 or parts[1] not in TR_EXECUTION_NOTICES:
+            return False
+        payload = parts[3]
+        if parts[0] == "1":
+            if not self._notice_key or not self._notice_iv:
+                logger.warning("[WS] execution notice received before AES key; dropped")
+                return True
+            try:
+                payload = decrypt_execution_notice(payload, self._notice_key, self._notice_iv)
+            except Exception as exc:
+                logger.warning("[WS] execution notice decrypt failed err=%s", exc)
+                return True
+        try:
+            record_count = int(parts[2])
+        except ValueError:
+            record_count = 1
+        callback = self._on_execution
+        for event in self._parse_execution_notices(payload, record_count):
+            if callback is not None:
+                callback(event)
+        return True
+
     @staticmethod
-    def _parse_tick(message: str) -> Optional[MarketTick]:
-        if not message or message.startswith("{") or "|" not in message:
+    def _parse_execution_notices(payload: str, record_count: int = 1) -> List[FillEvent]:
+        """
+        Parse decrypted H0STCNI0/H0STCNI9 records.
+
+        Field layout (0-based): 2 ODER_NO, 4 SELN_BYOV_CLS(01 sell/02 buy),
+        8 STCK_SHRN_ISCD, 9 CNTG_QTY, 10 CNTG_UNPR, 11 STCK_CNTG_HOUR,
+        12 RFUS_YN, 13 CNTG_YN(2 = fill), 16 ODER_QTY.
+        """
+        fields = payload.split("^")
+        stride = len(fields)
+        if record_count > 1 and len(fields) % record_count == 0:
+            stride = len(fields) // record_count
+        else:
+            record_count = 1
+        if stride < EXECUTION_NOTICE_MIN_FIELDS:
+            return []
+
+        today = datetime.now(KST)
+        events: List[FillEvent] = []
+        for offset in range(0, stride * record_count, stride):
+            record = fields[offset:offset + stride]
+            hhmmss = str(record[11] or "").strip()
+            executed_at = today
+            if len(hhmmss) >= 6 and hhmmss[:6].isdigit():
+                executed_at = today.replace(
+                    hour=int(hhmmss[0:2]),
+                    minute=int(hhmmss[2:4]),
+                    second=int(hhmmss[4:6]),
+                    microsecond=0,
+                )
+            try:
+                exec_qty = int(float(record[9] or 0))
+                exec_price = float(record[10] or 0.0)
+                order_qty = int(float(record[16] or 0)) if len(record) > 16 else 0
+            except (TypeError, ValueError):
+                continue
+            events.append(
+                FillEvent(
+                    order_no=str(record[2]).strip(),
+                    stock_code=str(record[8]).strip().zfill(6),
+                    side="SELL" if str(record[4]).strip() == "01" else "BUY",
+                    exec_qty=exec_qty,
+                    exec_price=exec_price,
+                    executed_at=executed_at.isoformat(),
+                    order_qty=order_qty,
+                    is_fill=str(record[13]).strip() == "2",
+                    rejected=str(record[12]).strip() == "1",
+                )
+            )
+        return events
+
+    @staticmethod
+    def _tick_from_fields(fields: List[str], offset: int, received_at: datetime) -> Optional[MarketTick]:
+        stock_code = fields[offset].zfill(6)
+        if len(stock_code) != 6 or not stock_code.isdigit():
+            return None
+        try:
+            price = float(fields[offset + 2] or 0.0)
+            best_ask = float(fields[offset + 10] or 0.0)
+            best_bid = float(fields[offset + 11] or 0.0)
+            volume = float(fields[offset + 12] or 0.0)
+        except (TypeError, ValueError):
             return None
+        return MarketTick(
+            stock_code=stock_code,
+            price=price,
+            volume=volume,
+            timestamp=_tick_ts_cache.resolve(fields[offset + 1] or "000000", received_at),
+            best_ask=best_ask,
+            best_bid=best_bid,
+            received_at=received_at,
+        )
+
+    @staticmethod
+    def _parse_ticks(message: str) -> List[MarketTick]:
+        """
+        Parse every record packed in one H0STCNT0 frame.
+
+        Frame layout: "0|H0STCNT0|<record_count>|<f0^f1^...>" where all records
+        are concatenated with "^". The legacy layout without the count segment
+        ("0|H0STCNT0|<fields>") is parsed as a single record.
+        """
+        if not message or message[0] == "{" or "|" not in message:
+            return []
 
         parts = message.split("|")
         if len(parts) < 3 or parts[1] != TR_SUBSCRIBE:
-            return None
+            return []
 
         payload_parts = parts[2:]
+        record_count = 1
 
         # Some environments prepend an extra numeric envelope segment:
         # e.g. "0|H0STCNT0|017|000660^...".
@@ -139,48 +366,44 @@ class KISWSClient:
             and "^" not in payload_parts[0]
             and "^" in payload_parts[1]
         ):
+            try:
+                record_count = int(payload_parts[0])
+            except ValueError:
+                record_count = 1
             payload_parts = payload_parts[1:]
 
         raw = next((seg for seg in payload_parts if "^" in seg), "")
         if not raw:
-            return None
+            return []
 
         fields = raw.split("^")
-        if len(fields) < 13:
-            return None
-
-        stock_code = str(fields[0]).zfill(6)
-        if len(stock_code) != 6 or not stock_code.isdigit():
-            return None
-
-        hhmmss = str(fields[1] or "000000")
-        try:
-            price = float(fields[2] or 0.0)
-            best_ask = float(fields[10] or 0.0)
-            best_bid = float(fields[11] or 0.0)
-            volume = float(fields[12] or 0.0)
-        except (TypeError, ValueError):
-            return None
-        now = datetime.now()
-        try:
-            ts = now.replace(
-                hour=int(hhmmss[0:2]),
-                minute=int(hhmmss[2:4]),
-                second=int(hhmmss[4:6]),
-                microsecond=0,
-            )
-        except Exception:
-            ts = now
+        field_count = len(fields)
+        if (
+            record_count > 1
+            and field_count % record_count == 0
+            and field_count // record_count >= TICK_MIN_FIELDS
+        ):
+            stride = field_count // record_count
+        else:
+            # Count does not describe the payload -> keep legacy single-record behavior.
+            stride = field_count
+            record_count = 1
+        if stride < TICK_MIN_FIELDS:
+            return []
+
+        received_at = datetime.now()
+        ticks: List[MarketTick] = []
+        for offset in range(0, stride * record_count, stride):
+            tick = KISWSClient._tick_from_fields(fields, offset, received_at)
+            if tick is not None:
+                ticks.append(tick)
+        return ticks
 
-        return MarketTick(
-            stock_code=stock_code,
-            price=price,
-            volume=volume,
-            timestamp=ts,
-            best_ask=best_ask,
-            best_bid=best_bid,
-            received_at=now,
-        )
+    @staticmethod
+    def _parse_tick(message: str) -> Optional[MarketTick]:
+        """Return the first tick of a frame (kept for single-record callers)."""
+        ticks = KISWSClient._parse_ticks(message)
+        return ticks[0] if ticks else None
 
     async def _listen_once(self, stock_codes: Sequence[str], on_tick: TickCallback) -> bool:
         try:
@@ -201,55 +424,78 @@ class KISWSClient:
             for stock_code in stock_codes:
                 await self._send_subscribe(stock_code)
                 logger.info("[WS] subscribe sent stock=%s tr_id=%s", str(stock_code).zfill(6), TR_SUBSCRIBE)
+            if self.execution_notice and self._on_execution is not None:
+                await self._send_execution_notice_subscribe()
+                logger.info("[WS] execution notice subscribe sent tr_id=%s", self.execution_notice_tr_id)
 
-            first_tick_logged = False
-            skipped_logged_count = 0
-            while self._running:
-                message = await asyncio.wait_for(ws.recv(), timeout=90)
-                tick = self._parse_tick(message)
-                if tick is None:
-                    if skipped_logged_count < 10:
-                        preview = str(message).replace("\n", "\\n")[:240]
-                        reason = "unknown"
-                        if not message:
-                            reason = "empty_message"
-                        elif str(message).startswith("{"):
-                            reason = "json_control_message"
-                        elif "|" not in str(message):
-                            reason = "non_pipe_message"
+            try:
+                return await self._recv_loop(ws, on_tick)
+            finally:
+                if self._notice_key is not None:
+                    self._set_execution_notice_ready(False)
+
+    async def _recv_loop(self, ws, on_tick: TickCallback) -> bool:
+        first_tick_logged = False
+        skipped_logged_count = 0
+        while self._running:
+            message = await asyncio.wait_for(ws.recv(), timeout=90)
+            if self._on_execution is not None and self._handle_execution_message(message):
+                continue
+            ticks = self._parse_ticks(message)
+            if not ticks:
+                if skipped_logged_count < 10:
+                    preview = str(message).replace("\n", "\\n")[:240]
+                    reason = "unknown"
+                    if not message:
+                        reason = "empty_message"
+                    elif str(message).startswith("{"):
+                        reason = "json_control_message"
+                    elif "|" not in str(message):
+                        reason = "non_pipe_message"
+                    else:
+                        parts = str(message).split("|")
+                        if len(parts) < 3:
+                            reason = f"pipe_parts_too_short:{len(parts)}"
+                        elif parts[1] != TR_SUBSCRIBE:
+                            reason = f"unexpected_tr_id:{parts[1]}"
                         else:
-                            parts = str(message).split("|")
-                            if len(parts) < 3:
-                                reason = f"pipe_parts_too_short:{len(parts)}"
-                            elif parts[1] != TR_SUBSCRIBE:
-                                reason = f"unexpected_tr_id:{parts[1]}"
-                            else:
-                                raw = parts[2] if len(parts) == 3 else "|".join(parts[2:])
-                                field_count = len(raw.split("^"))
-                                reason = f"unexpected_field_count:{field_count}"
-                        logger.info(
-                            "[WS][PARSE] skipped message reason=%s preview=%s",
-                            reason,
-                            preview,
-                        )
-                        skipped_logged_count += 1
-                    continue
-                if not first_tick_logged:
+                            raw = parts[2] if len(parts) == 3 else "|".join(parts[2:])
+                            field_count = len(raw.split("^"))
+                            reason = f"unexpected_field_count:{field_count}"
                     logger.info(
-                        "[WS] first tick stock=%s price=%s ts=%s",
-                        tick.stock_code,
-                        tick.price,
-                        tick.timestamp,
+                        "[WS][PARSE] skipped message reason=%s preview=%s",
+                        reason,
+                        preview,
                     )
-                    first_tick_logged = True
-                if asyncio.iscoroutinefunction(on_tick):
+                    skipped_logged_count += 1
+                continue
+            if not first_tick_logged:
+                logger.info(
+                    "[WS] first tick stock=%s price=%s ts=%s records=%s",
+                    ticks[0].stock_code,
+                    ticks[0].price,
+                    ticks[0].timestamp,
+                    len(ticks),
+                )
+                first_tick_logged = True
+            is_coroutine_callback = asyncio.iscoroutinefunction(on_tick)
+            for tick in ticks:
+                if is_coroutine_callback:
                     await on_tick(tick)
                 else:
                     on_tick(tick)
-            return True
+        return True
 
-    async def run(self, stock_codes: Sequence[str], on_tick: TickCallback) -> WSRunResult:
+    async def run(
+        self,
+        stock_codes: Sequence[str],
+        on_tick: TickCallback,
+        on_execution: Optional[ExecutionCallback] = None,
+        on_execution_state: Optional[ExecutionStateCallback] = None,
+    ) -> WSRunResult:
         self._running = True
+        self._on_execution = on_execution
+        self._on_execution_state = on_execution_state
         attempt = 0
 
         while self._running:
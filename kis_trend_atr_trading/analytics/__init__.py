@@ -5,6 +5,8 @@ from .event_logger import (
     analytics_events_from_replay_report,
     compute_candidate_id,
     compute_intent_id,
+    convert_strategy_event_file,
+    iter_strategy_events,
     load_strategy_events,
 )
 from .materializer import StrategyAnalyticsMaterializer
@@ -22,5 +24,7 @@ __all__ = [
     "analytics_events_from_replay_report",
     "compute_candidate_id",
     "compute_intent_id",
+    "convert_strategy_event_file",
+    "iter_strategy_events",
     "load_strategy_events",
 ]
@@ -0,0 +1,189 @@
+"""Bounded background write queue for StrategyAnalyticsEventLogger."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+try:
+    from utils.logger import get_logger
+except ImportError:
+    from kis_trend_atr_trading.utils.logger import get_logger
+
+
+logger = get_logger("strategy_analytics")
+
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_DROP_NEW = "drop_new"
+OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST, OVERFLOW_DROP_NEW)
+
+BatchSink = Callable[[List[Any]], None]
+
+
+class AnalyticsWriteQueue:
+    """
+    Bounded ring buffer drained by one writer thread.
+
+    - `put` costs a lock + deque append on the caller thread; the sink
+      (serialization + file write) runs on the writer thread.
+    - The writer wakes when `batch_events` items are pending or every
+      `flush_interval_sec`, and hands everything pending to the sink at once.
+    - Overflow policy when `maxsize` items are pending:
+      block (wait for room), drop_oldest (evict head), drop_new (reject item).
+    - `stop(drain=True)` delivers every pending item before returning. A stopped
+      queue is closed: later `put` calls are rejected (counted, never restart the
+      writer) so two writer threads can never append at once.
+    """
+
+    def __init__(
+        self,
+        *,
+        sink: BatchSink,
+        maxsize: int = 8192,
+        batch_events: int = 256,
+        flush_interval_sec: float = 0.5,
+        overflow_policy: str = OVERFLOW_DROP_OLDEST,
+        thread_name: str = "strategy-analytics-writer",
+    ) -> None:
+        policy = str(overflow_policy or OVERFLOW_DROP_OLDEST).strip().lower()
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"unknown overflow policy: {overflow_policy}")
+        self._sink = sink
+        self._maxsize = max(int(maxsize), 1)
+        self._batch_events = max(min(int(batch_events), self._maxsize), 1)
+        self._flush_interval_sec = max(float(flush_interval_sec), 0.001)
+        self._overflow_policy = policy
+        self._thread_name = thread_name
+        self._cond = threading.Condition(threading.Lock())
+        self._pending: Deque[Any] = deque()
+        self._in_flight = 0
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._closed = False
+        self._enqueued = 0
+        self._dropped_oldest = 0
+        self._dropped_new = 0
+        self._blocked = 0
+        self._delivered = 0
+        self._batches = 0
+        self._sink_errors = 0
+        self._rejected_closed = 0
+        self._max_depth = 0
+
+    @property
+    def overflow_policy(self) -> str:
+        return self._overflow_policy
+
+    def _start_locked(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True, name=self._thread_name)
+        self._thread.start()
+
+    def put(self, item: Any) -> bool:
+        """Enqueue one item. Returns False when the item was dropped (drop_new) or the queue is stopped."""
+        with self._cond:
+            if self._closed:
+                self._rejected_closed += 1
+                return False
+            self._start_locked()
+            if len(self._pending) >= self._maxsize:
+                if self._overflow_policy == OVERFLOW_DROP_NEW:
+                    self._dropped_new += 1
+                    return False
+                if self._overflow_policy == OVERFLOW_DROP_OLDEST:
+                    self._pending.popleft()
+                    self._dropped_oldest += 1
+                else:
+                    self._blocked += 1
+                    self._cond.notify_all()
+                    self._cond.wait_for(lambda: len(self._pending) < self._maxsize or not self._running)
+                    if self._closed:
+                        self._rejected_closed += 1
+                        return False
+            self._pending.append(item)
+            self._enqueued += 1
+            depth = len(self._pending)
+            if depth > self._max_depth:
+                self._max_depth = depth
+            if depth >= self._batch_events:
+                self._cond.notify_all()
+        return True
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                deadline = time.monotonic() + self._flush_interval_sec
+                while self._running and len(self._pending) < self._batch_events:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(timeout=remaining)
+                if not self._pending:
+                    if not self._running:
+                        self._cond.notify_all()
+                        return
+                    continue
+                batch = list(self._pending)
+                self._pending.clear()
+                self._in_flight = len(batch)
+                # block 정책에서 대기 중인 생산자를 깨운다
+                self._cond.notify_all()
+
+            try:
+                self._sink(batch)
+            except Exception as exc:
+                with self._cond:
+                    self._sink_errors += 1
+                logger.warning("[STRATEGY_ANALYTICS] async write batch failed size=%s err=%s", len(batch), exc)
+            finally:
+                with self._cond:
+                    self._in_flight = 0
+                    self._delivered += len(batch)
+                    self._batches += 1
+                    self._cond.notify_all()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until everything enqueued so far has been handed to the sink."""
+        with self._cond:
+            if not self._running:
+                return not self._pending
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: not self._pending and self._in_flight == 0, timeout=timeout)
+
+    def stop(self, drain: bool = True, timeout: float = 5.0) -> None:
+        with self._cond:
+            self._closed = True
+            if not self._running:
+                return
+            if not drain:
+                self._dropped_oldest += len(self._pending)
+                self._pending.clear()
+            self._running = False
+            self._cond.notify_all()
+            thread = self._thread
+            self._thread = None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+            if thread.is_alive():
+                logger.warning("[STRATEGY_ANALYTICS] async writer did not drain within %.1fs", timeout)
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "writer_overflow_policy": self._overflow_policy,
+                "writer_queue_depth": len(self._pending),
+                "writer_max_queue_depth": int(self._max_depth),
+                "writer_enqueued": int(self._enqueued),
+                "writer_delivered": int(self._delivered),
+                "writer_batches": int(self._batches),
+                "writer_dropped_oldest": int(self._dropped_oldest),
+                "writer_dropped_new": int(self._dropped_new),
+                "writer_blocked": int(self._blocked),
+                "writer_sink_errors": int(self._sink_errors),
+                "writer_rejected_closed": int(self._rejected_closed),
+            }
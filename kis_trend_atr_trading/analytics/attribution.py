@@ -33,47 +33,55 @@ def _precheck_reason_group(reason: str) -> str:
     return "precheck_other"
 
 
-def _build_competition_context(events: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
-    accepted_by_symbol: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-    tie_break_applied_event_ids: set[str] = set()
-    accepted_strategy_pairs: set[Tuple[str, str]] = set()
+_TIE_BREAK_LOSER_REASONS = {"existing_position", "pending_order"}
 
-    for event in sorted(list(events or []), key=event_sort_key):
-        if str(event.get("event_type") or "") != "intent_ingressed" or str(event.get("decision") or "") != "accepted":
-            continue
+
+def _is_accepted_ingress(event: Dict[str, Any]) -> bool:
+    return str(event.get("event_type") or "") == "intent_ingressed" and str(event.get("decision") or "") == "accepted"
+
+
+class _CompetitionTracker:
+    """종목별 accepted ingress 경쟁 상태 (event_sort_key 순서로 add 해야 함)"""
+
+    def __init__(self) -> None:
+        self._strategies_by_symbol: Dict[str, set[str]] = defaultdict(set)
+        self._winner_by_symbol: Dict[str, Tuple[Tuple[Any, ...], str]] = {}
+        self._tie_break_applied_event_ids: set[str] = set()
+        self._accepted_strategy_pairs: set[Tuple[str, str]] = set()
+
+    def add(self, event: Dict[str, Any]) -> None:
+        if not _is_accepted_ingress(event):
+            return
         symbol = str(event.get("symbol") or "").zfill(6)
         strategy_tag = str(event.get("strategy_tag") or "")
         if not symbol or not strategy_tag:
-            continue
-        prior = [item for item in accepted_by_symbol[symbol] if str(item.get("strategy_tag") or "") != strategy_tag]
-        if prior:
-            tie_break_applied_event_ids.add(str(event.get("event_id") or ""))
-        accepted_by_symbol[symbol].append(event)
-        accepted_strategy_pairs.add((symbol, strategy_tag))
-
-    winner_by_symbol: Dict[str, str] = {}
-    contested_symbols: set[str] = set()
-    for symbol, symbol_events in accepted_by_symbol.items():
-        strategies = {str(item.get("strategy_tag") or "") for item in symbol_events if str(item.get("strategy_tag") or "")}
-        if len(strategies) <= 1:
-            continue
-        contested_symbols.add(symbol)
-        winner_event = min(
-            symbol_events,
-            key=lambda item: (
-                event_sort_key(item)[0],
-                strategy_rank(str(item.get("strategy_tag") or "")),
-                event_sort_key(item)[1],
-            ),
-        )
-        winner_by_symbol[symbol] = str(winner_event.get("strategy_tag") or "")
+            return
+        seen = self._strategies_by_symbol[symbol]
+        if seen - {strategy_tag}:
+            self._tie_break_applied_event_ids.add(str(event.get("event_id") or ""))
+        seen.add(strategy_tag)
+        self._accepted_strategy_pairs.add((symbol, strategy_tag))
+        sort_key = event_sort_key(event)
+        winner_key = (sort_key[0], strategy_rank(strategy_tag), sort_key[1])
+        current = self._winner_by_symbol.get(symbol)
+        if current is None or winner_key < current[0]:
+            self._winner_by_symbol[symbol] = (winner_key, strategy_tag)
 
-    return {
-        "winner_by_symbol": winner_by_symbol,
-        "tie_break_applied_event_ids": tie_break_applied_event_ids,
-        "accepted_strategy_pairs": accepted_strategy_pairs,
-        "contested_symbols": contested_symbols,
-    }
+    def context(self) -> Dict[str, Any]:
+        contested_symbols = {symbol for symbol, strategies in self._strategies_by_symbol.items() if len(strategies) > 1}
+        return {
+            "winner_by_symbol": {symbol: self._winner_by_symbol[symbol][1] for symbol in contested_symbols},
+            "tie_break_applied_event_ids": set(self._tie_break_applied_event_ids),
+            "accepted_strategy_pairs": set(self._accepted_strategy_pairs),
+            "contested_symbols": contested_symbols,
+        }
+
+
+def _build_competition_context(events: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    tracker = _CompetitionTracker()
+    for event in sorted(list(events or []), key=event_sort_key):
+        tracker.add(event)
+    return tracker.context()
 
 
 def _event_weight(event: Dict[str, Any], reason_group: str) -> int:
@@ -118,7 +126,7 @@ def _classify_event(event: Dict[str, Any], context: Dict[str, Any]) -> List[Tupl
             and (symbol, strategy_tag) in set(context.get("accepted_strategy_pairs") or set())
             and winner_by_symbol.get(symbol)
             and winner_by_symbol.get(symbol) != strategy_tag
-            and str(reject_reason or "").lower() in {"existing_position", "pending_order"}
+            and str(reject_reason or "").lower() in _TIE_BREAK_LOSER_REASONS
         ):
             rows.append((reject_stage, reject_reason or "tie_break_loser", "tie_break_loser", 1))
     elif event_type == "native_handoff_rejected":
@@ -148,29 +156,107 @@ def _outcome_class(reason_group: str) -> str:
     return "reject"
 
 
-def build_attribution_rows(trade_date: str, events: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    context = _build_competition_context(events)
-    counts: Counter[Tuple[str, str, str, str, str, str, str]] = Counter()
+_EMPTY_COMPETITION_CONTEXT: Dict[str, Any] = {}
+AttributionKey = Tuple[str, str, str, str, str, str, str]
 
-    for event in sorted(list(events or []), key=event_sort_key):
+
+def _add_counts(
+    counts: Counter[AttributionKey],
+    strategy_tag: str,
+    slices: Iterable[Tuple[str, str]],
+    row: Tuple[str, str, str, int],
+    times: int = 1,
+) -> None:
+    reject_stage, reject_reason, reason_group, weight = row
+    outcome_class = _outcome_class(reason_group)
+    for slice_key, slice_value in slices:
+        counts[
+            (
+                strategy_tag,
+                slice_key,
+                slice_value,
+                str(reject_stage or ""),
+                str(reject_reason or ""),
+                str(reason_group or ""),
+                outcome_class,
+            )
+        ] += int(weight) * int(times)
+
+
+class AttributionRowAccumulator:
+    """
+    build_attribution_rows 의 증분 버전 (event_sort_key 순서로 add 해야 함).
+
+    tie_break_applied / tie_break_loser 는 하루 전체 경쟁 결과에 의존하므로
+    (event_id 또는 종목, 전략, stage, reason, slice) 단위로 모아 두었다가 rows() 에서 확정합니다.
+    """
+
+    def __init__(self) -> None:
+        self._competition = _CompetitionTracker()
+        self._counts: Counter[AttributionKey] = Counter()
+        self._accepted_ingress: Counter[Tuple[str, str, str, Tuple[Tuple[str, str], ...]]] = Counter()
+        self._loser_candidates: Counter[Tuple[str, str, str, str, Tuple[Tuple[str, str], ...]]] = Counter()
+
+    def add(self, event: Dict[str, Any]) -> None:
+        self._competition.add(event)
         strategy_tag = str(event.get("strategy_tag") or "").strip()
         if not strategy_tag:
-            continue
-        for reject_stage, reject_reason, reason_group, weight in _classify_event(event, context):
-            outcome_class = _outcome_class(reason_group)
-            for slice_key, slice_value in iter_slice_pairs(event):
-                counts[
-                    (
-                        strategy_tag,
-                        slice_key,
-                        slice_value,
-                        str(reject_stage or ""),
-                        str(reject_reason or ""),
-                        str(reason_group or ""),
-                        outcome_class,
-                    )
-                ] += int(weight)
+            return
+        rows = _classify_event(event, _EMPTY_COMPETITION_CONTEXT)
+        event_type = str(event.get("event_type") or "")
+        deferred = _is_accepted_ingress(event) or (
+            event_type == "precheck_rejected" and _normalized_reason(event).lower() in _TIE_BREAK_LOSER_REASONS
+        )
+        if not rows and not deferred:
+            return
+        slices = tuple(iter_slice_pairs(event))
+        for row in rows:
+            _add_counts(self._counts, strategy_tag, slices, row)
+        if _is_accepted_ingress(event):
+            key = (str(event.get("event_id") or ""), strategy_tag, str(event.get("stage") or ""), slices)
+            self._accepted_ingress[key] += 1
+        elif deferred:
+            key = (
+                str(event.get("symbol") or "").zfill(6),
+                str(event.get("strategy_tag") or ""),
+                str(event.get("stage") or ""),
+                _normalized_reason(event),
+                slices,
+            )
+            self._loser_candidates[key] += 1
+
+    def rows(self, trade_date: str) -> List[Dict[str, Any]]:
+        context = self._competition.context()
+        counts: Counter[AttributionKey] = Counter(self._counts)
+        applied_ids = context["tie_break_applied_event_ids"]
+        for (event_id, strategy_tag, reject_stage, slices), times in self._accepted_ingress.items():
+            if event_id in applied_ids:
+                row = (reject_stage or "ingress", "tie_break_applied", "tie_break_applied", 1)
+                _add_counts(counts, strategy_tag, slices, row, times)
+        winner_by_symbol = context["winner_by_symbol"]
+        for (symbol, raw_strategy_tag, reject_stage, reject_reason, slices), times in self._loser_candidates.items():
+            if (
+                symbol in context["contested_symbols"]
+                and (symbol, raw_strategy_tag) in context["accepted_strategy_pairs"]
+                and winner_by_symbol.get(symbol)
+                and winner_by_symbol.get(symbol) != raw_strategy_tag
+            ):
+                row = (reject_stage, reject_reason or "tie_break_loser", "tie_break_loser", 1)
+                _add_counts(counts, raw_strategy_tag.strip(), slices, row, times)
+        return _attribution_rows_from_counts(trade_date, counts)
+
+
+def build_attribution_rows(trade_date: str, events: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    accumulator = AttributionRowAccumulator()
+    for event in sorted(list(events or []), key=event_sort_key):
+        accumulator.add(event)
+    return accumulator.rows(trade_date)
+
 
+def _attribution_rows_from_counts(
+    trade_date: str,
+    counts: Counter[AttributionKey],
+) -> List[Dict[str, Any]]:
     rows: List[Dict[str, Any]] = []
     for (strategy_tag, slice_key, slice_value, reject_stage, reject_reason, reason_group, outcome_class), count in sorted(
         counts.items(),
@@ -0,0 +1,297 @@
+"""
+전략 분석 이벤트 바이너리 인코딩 (length-prefixed msgpack).
+
+파일 구조:
+    MAGIC(6 bytes) + frame*
+    frame = kind(1 byte) + body_len(uint32 LE) + msgpack(body)
+
+- FRAME_DICTIONARY: [slot, value] — DICTIONARY_FIELDS[slot] 컬럼의 다음 코드에 value 를 등록
+- FRAME_EVENT: [EVENT_FIELDS 값..., extras, missing_mask]
+  · 사전 인코딩 컬럼은 int 코드로 기록 (문자열이 아니면 None + extras 에 원본)
+  · extras: EVENT_FIELDS 밖의 키 (없으면 None)
+  · missing_mask: 이벤트에 없던 EVENT_FIELDS 의 비트마스크
+
+사전은 파일(=거래일) 단위로 누적되며, 기존 파일에 이어 쓸 때는 사전 프레임을 다시 읽어 복원합니다.
+마지막 프레임이 잘려 있으면(프로세스 중단) 이어 쓰기 전에 잘라내고, 읽기에서는 무시합니다.
+"""
+
+from __future__ import annotations
+
+import struct
+from datetime import date, datetime
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+try:
+    from utils.logger import get_logger
+except ImportError:
+    from kis_trend_atr_trading.utils.logger import get_logger
+
+
+logger = get_logger("strategy_analytics")
+
+BINARY_EVENT_MAGIC = b"KSAE\x00\x01"
+BINARY_EVENT_SUFFIX = ".msgpack"
+FRAME_DICTIONARY = 1
+FRAME_EVENT = 2
+_FRAME_HEADER = struct.Struct("<BI")
+
+EVENT_FIELDS: Tuple[str, ...] = (
+    "schema_version",
+    "trade_date",
+    "event_ts",
+    "strategy_tag",
+    "symbol",
+    "intent_id",
+    "candidate_id",
+    "broker_order_id",
+    "event_type",
+    "stage",
+    "decision",
+    "reject_reason",
+    "regime_state",
+    "degraded_mode",
+    "queue_depth",
+    "payload_schema_version",
+    "source_component",
+    "payload_json",
+    "session_bucket",
+    "source_state",
+    "tie_break_applied",
+    "tie_break_winner_strategy",
+    "ingress_reject_reason",
+    "recovery_flag",
+    "event_id",
+)
+# 카디널리티가 낮은 문자열 컬럼 (파일 단위 사전 인코딩)
+DICTIONARY_FIELDS: Tuple[str, ...] = (
+    "schema_version",
+    "trade_date",
+    "strategy_tag",
+    "symbol",
+    "event_type",
+    "stage",
+    "decision",
+    "reject_reason",
+    "regime_state",
+    "payload_schema_version",
+    "source_component",
+    "session_bucket",
+    "source_state",
+    "tie_break_winner_strategy",
+    "ingress_reject_reason",
+)
+_EVENT_FIELD_SET = frozenset(EVENT_FIELDS)
+_DICTIONARY_SLOT_BY_FIELD: Dict[str, int] = {name: slot for slot, name in enumerate(DICTIONARY_FIELDS)}
+_FIELD_DICTIONARY_SLOTS: Tuple[Optional[int], ...] = tuple(_DICTIONARY_SLOT_BY_FIELD.get(name) for name in EVENT_FIELDS)
+
+
+def _msgpack():
+    import msgpack
+
+    return msgpack
+
+
+def binary_codec_available() -> bool:
+    try:
+        _msgpack()
+    except ImportError:
+        return False
+    return True
+
+
+def _pack_default(value: Any) -> Any:
+    # JSONL 경로의 _json_ready 와 같은 변환 (msgpack 이 모르는 타입만 호출됨)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if hasattr(value, "__dict__"):
+        return {str(key): val for key, val in vars(value).items()}
+    raise TypeError(f"unsupported analytics event value type: {type(value).__name__}")
+
+
+def _read_frames(handle: BinaryIO, path: Path) -> Iterator[Tuple[int, bytes, int]]:
+    """(kind, body, frame_end_offset). 잘리거나 깨진 꼬리 프레임부터는 내보내지 않는다."""
+    offset = handle.tell()
+    while True:
+        header = handle.read(_FRAME_HEADER.size)
+        if not header:
+            return
+        body = b""
+        if len(header) == _FRAME_HEADER.size:
+            kind, length = _FRAME_HEADER.unpack(header)
+            body = handle.read(length)
+        if len(header) < _FRAME_HEADER.size or len(body) < length or kind not in (FRAME_DICTIONARY, FRAME_EVENT):
+            logger.warning("[STRATEGY_ANALYTICS] corrupt binary tail ignored file=%s offset=%s", path, offset)
+            return
+        offset += _FRAME_HEADER.size + length
+        yield kind, body, offset
+
+
+def _check_magic(handle: BinaryIO, path: Path) -> None:
+    magic = handle.read(len(BINARY_EVENT_MAGIC))
+    if magic != BINARY_EVENT_MAGIC:
+        raise ValueError(f"not a strategy analytics binary event file: {path}")
+
+
+class BinaryEventWriter:
+    """거래일 파일 하나에 대한 append 전용 writer (호출 측에서 직렬화)."""
+
+    def __init__(self, path: Path) -> None:
+        self._msgpack = _msgpack()
+        self._packer = self._msgpack.Packer(default=_pack_default, use_bin_type=True)
+        self._path = Path(path)
+        self._codes: List[Dict[str, int]] = [{} for _ in DICTIONARY_FIELDS]
+        self._handle = self._open()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def _open(self) -> BinaryIO:
+        if not self._path.exists() or self._path.stat().st_size == 0:
+            handle = self._path.open("wb")
+            handle.write(BINARY_EVENT_MAGIC)
+            return handle
+        handle = self._path.open("r+b")
+        try:
+            _check_magic(handle, self._path)
+            good_end = handle.tell()
+            for kind, body, frame_end in _read_frames(handle, self._path):
+                if kind == FRAME_DICTIONARY:
+                    slot, value = self._msgpack.unpackb(body, raw=False)
+                    codes = self._codes[int(slot)]
+                    codes[value] = len(codes)
+                good_end = frame_end
+            # 중단으로 잘린 꼬리 프레임은 버리고 이어 쓴다
+            handle.seek(good_end)
+            handle.truncate()
+        except Exception:
+            handle.close()
+            raise
+        return handle
+
+    def _frame(self, kind: int, body: bytes) -> bytes:
+        return _FRAME_HEADER.pack(kind, len(body)) + body
+
+    def encode(self, event: Dict[str, Any]) -> bytes:
+        pack = self._packer.pack
+        prefix: List[bytes] = []
+        registered: List[Tuple[Dict[str, int], str]] = []
+        row: List[Any] = []
+        extras: Optional[Dict[str, Any]] = None
+        missing_mask = 0
+        present = 0
+        for index, name in enumerate(EVENT_FIELDS):
+            if name not in event:
+                missing_mask |= 1 << index
+                row.append(None)
+                continue
+            present += 1
+            value = event[name]
+            slot = _FIELD_DICTIONARY_SLOTS[index]
+            if slot is None:
+                row.append(value)
+                continue
+            if not isinstance(value, str):
+                if extras is None:
+                    extras = {}
+                extras[name] = value
+                row.append(None)
+                continue
+            codes = self._codes[slot]
+            code = codes.get(value)
+            if code is None:
+                code = len(codes)
+                codes[value] = code
+                registered.append((codes, value))
+                prefix.append(self._frame(FRAME_DICTIONARY, pack([slot, value])))
+            row.append(code)
+        if len(event) > present:
+            for key, value in event.items():
+                if key not in _EVENT_FIELD_SET:
+                    if extras is None:
+                        extras = {}
+                    extras[str(key)] = value
+        row.append(extras)
+        row.append(missing_mask)
+        try:
+            prefix.append(self._frame(FRAME_EVENT, pack(row)))
+        except Exception:
+            # 기록되지 않은 사전 코드는 되돌린다 (파일과 메모리 사전 불일치 방지)
+            for codes, value in registered:
+                codes.pop(value, None)
+            raise
+        return b"".join(prefix)
+
+    def write(self, event: Dict[str, Any]) -> None:
+        self._handle.write(self.encode(event))
+
+    def write_encoded(self, data: bytes) -> None:
+        self._handle.write(data)
+
+    def flush(self) -> None:
+        self._handle.flush()
+
+    def close(self) -> None:
+        try:
+            self._handle.flush()
+        finally:
+            self._handle.close()
+
+
+_DICTIONARY_POSITIONS: Tuple[int, ...] = tuple(
+    EVENT_FIELDS.index(name) for name in DICTIONARY_FIELDS
+)
+_dictionary_codes = itemgetter(*_DICTIONARY_POSITIONS)
+_table_lookup = list.__getitem__
+
+
+def _decode_row_slow(row: List[Any], tables: List[List[Any]]) -> Dict[str, Any]:
+    missing_mask = row[-1]
+    event: Dict[str, Any] = {}
+    for position, (name, slot) in enumerate(zip(EVENT_FIELDS, _FIELD_DICTIONARY_SLOTS)):
+        if missing_mask >> position & 1:
+            continue
+        value = row[position]
+        if slot is not None and value is not None:
+            value = tables[slot][value]
+        event[name] = value
+    return event
+
+
+def iter_binary_event_file(path: Path, *, start_index: int = 0) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """(순번, 이벤트). 순번은 start_index 부터 이벤트 프레임마다 1씩 증가 (JSONL 줄 번호 대응)."""
+    msgpack = _msgpack()
+    unpackb = msgpack.unpackb
+    tables: List[List[Any]] = [[] for _ in DICTIONARY_FIELDS]
+    index = int(start_index)
+    with Path(path).open("rb") as handle:
+        _check_magic(handle, path)
+        for kind, body, _ in _read_frames(handle, path):
+            if kind == FRAME_DICTIONARY:
+                slot, value = unpackb(body, raw=False)
+                tables[int(slot)].append(value)
+                continue
+            row = unpackb(body, raw=False, strict_map_key=False)
+            event = None
+            if not row[-1]:
+                # 공통 경로: 모든 컬럼 존재 + 사전 컬럼이 전부 코드 → 컬럼 복원/사전 조회를 C 레벨 zip/map 으로 처리
+                try:
+                    event = dict(zip(EVENT_FIELDS, row))
+                    event.update(zip(DICTIONARY_FIELDS, map(_table_lookup, tables, _dictionary_codes(row))))
+                except TypeError:
+                    event = None
+            if event is None:
+                event = _decode_row_slow(row, tables)
+            extras = row[-2]
+            if extras:
+                event.update(extras)
+            yield index, event
+            index += 1
+
+
+def is_binary_event_file(path: Path) -> bool:
+    return Path(path).suffix == BINARY_EVENT_SUFFIX
@@ -1,17 +1,37 @@
 from __future__ import annotations
 
+import heapq
 import json
+import pickle
+import tempfile
 import threading
+from contextlib import ExitStack
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional
 
 try:
+    from analytics.async_writer import AnalyticsWriteQueue
+    from analytics.event_codec import (
+        BINARY_EVENT_SUFFIX,
+        BinaryEventWriter,
+        binary_codec_available,
+        is_binary_event_file,
+        iter_binary_event_file,
+    )
     from analytics.summary_drilldown import derive_session_bucket, resolve_source_state
     from config import settings
     from utils.logger import get_logger
     from utils.market_hours import KST
 except ImportError:
+    from kis_trend_atr_trading.analytics.async_writer import AnalyticsWriteQueue
+    from kis_trend_atr_trading.analytics.event_codec import (
+        BINARY_EVENT_SUFFIX,
+        BinaryEventWriter,
+        binary_codec_available,
+        is_binary_event_file,
+        iter_binary_event_file,
+    )
     from kis_trend_atr_trading.analytics.summary_drilldown import derive_session_bucket, resolve_source_state
     from kis_trend_atr_trading.config import settings
     from kis_trend_atr_trading.utils.logger import get_logger
@@ -21,6 +41,9 @@ except ImportError:
 logger = get_logger("strategy_analytics")
 
 ANALYTICS_SCHEMA_VERSION = "v1"
+EVENT_FORMAT_JSONL = "jsonl"
+EVENT_FORMAT_MSGPACK = "msgpack"
+_EVENT_FILE_SUFFIXES = {EVENT_FORMAT_JSONL: ".jsonl", EVENT_FORMAT_MSGPACK: BINARY_EVENT_SUFFIX}
 
 
 def _project_root() -> Path:
@@ -39,6 +62,25 @@ def resolve_strategy_event_dir(event_dir: Optional[str] = None) -> Path:
     return base_dir
 
 
+def resolve_strategy_event_format(event_format: Optional[str] = None) -> str:
+    requested = str(
+        event_format
+        or getattr(settings, "STRATEGY_ANALYTICS_EVENT_FORMAT", EVENT_FORMAT_JSONL)
+        or EVENT_FORMAT_JSONL
+    ).strip().lower()
+    if requested not in _EVENT_FILE_SUFFIXES:
+        logger.warning("[STRATEGY_ANALYTICS] unknown event format=%s, falling back to jsonl", requested)
+        return EVENT_FORMAT_JSONL
+    if requested == EVENT_FORMAT_MSGPACK and not binary_codec_available():
+        logger.warning("[STRATEGY_ANALYTICS] msgpack not installed, falling back to jsonl")
+        return EVENT_FORMAT_JSONL
+    return requested
+
+
+def strategy_event_file_path(base_dir: Path, trade_date: str, event_format: str = EVENT_FORMAT_JSONL) -> Path:
+    return Path(base_dir) / f"strategy_events_{str(trade_date).strip()}{_EVENT_FILE_SUFFIXES[event_format]}"
+
+
 def _json_ready(value: Any) -> Any:
     if isinstance(value, datetime):
         return value.isoformat()
@@ -140,13 +182,55 @@ class StrategyAnalyticsEventLogger:
         event_dir: Optional[str] = None,
         enabled: bool = False,
         flush_each_write: bool = False,
+        event_format: Optional[str] = None,
+        async_write: Optional[bool] = None,
+        writer_queue_size: Optional[int] = None,
+        writer_batch_events: Optional[int] = None,
+        writer_flush_sec: Optional[float] = None,
+        writer_overflow_policy: Optional[str] = None,
     ) -> None:
+        """
+        Args:
+            async_write: True 면 log_event/append 는 큐에 넣기만 하고, build_event/직렬화/파일 쓰기는
+                백그라운드 writer 스레드가 배치 단위(write() 1회 + flush)로 처리합니다.
+                None 이면 STRATEGY_ANALYTICS_ASYNC_WRITER 설정을 따릅니다.
+            writer_*: 비동기 writer 큐 크기/배치 크기/flush 주기/overflow 정책
+                (block | drop_oldest | drop_new), None 이면 STRATEGY_ANALYTICS_WRITER_* 설정.
+        """
         self._event_dir = resolve_strategy_event_dir(event_dir)
         self._enabled = bool(enabled)
+        self._event_format = resolve_strategy_event_format(event_format) if self._enabled else EVENT_FORMAT_JSONL
         self._flush_each_write = bool(flush_each_write)
         self._lock = threading.Lock()
         self._current_trade_date: str = ""
         self._handle = None
+        self._write_errors = 0
+        self._write_queue: Optional[AnalyticsWriteQueue] = None
+        if async_write is None:
+            async_write = bool(getattr(settings, "STRATEGY_ANALYTICS_ASYNC_WRITER", False))
+        if self._enabled and async_write:
+            self._write_queue = AnalyticsWriteQueue(
+                sink=self._drain_queued,
+                maxsize=int(
+                    writer_queue_size
+                    if writer_queue_size is not None
+                    else getattr(settings, "STRATEGY_ANALYTICS_WRITER_QUEUE_SIZE", 8192)
+                ),
+                batch_events=int(
+                    writer_batch_events
+                    if writer_batch_events is not None
+                    else getattr(settings, "STRATEGY_ANALYTICS_WRITER_BATCH_EVENTS", 256)
+                ),
+                flush_interval_sec=float(
+                    writer_flush_sec
+                    if writer_flush_sec is not None
+                    else getattr(settings, "STRATEGY_ANALYTICS_WRITER_FLUSH_SEC", 0.5)
+                ),
+                overflow_policy=str(
+                    writer_overflow_policy
+                    or getattr(settings, "STRATEGY_ANALYTICS_WRITER_OVERFLOW", "drop_oldest")
+                ),
+            )
 
     @property
     def enabled(self) -> bool:
@@ -156,7 +240,34 @@ class StrategyAnalyticsEventLogger:
     def event_dir(self) -> Path:
         return self._event_dir
 
+    @property
+    def event_format(self) -> str:
+        return self._event_format
+
+    @property
+    def async_write(self) -> bool:
+        return self._write_queue is not None
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """대기 중인 이벤트를 파일까지 내려씁니다 (비동기 모드면 writer 가 비울 때까지 대기)."""
+        drained = True
+        if self._write_queue is not None:
+            drained = self._write_queue.flush(timeout=timeout)
+        with self._lock:
+            if self._handle is not None:
+                self._handle.flush()
+        return drained
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            payload: Dict[str, Any] = {"async_write": self.async_write, "write_errors": int(self._write_errors)}
+        if self._write_queue is not None:
+            payload.update(self._write_queue.metrics())
+        return payload
+
     def close(self) -> None:
+        if self._write_queue is not None:
+            self._write_queue.stop(drain=True)
         with self._lock:
             if self._handle is not None:
                 try:
@@ -175,8 +286,11 @@ class StrategyAnalyticsEventLogger:
                 self._handle.flush()
             finally:
                 self._handle.close()
-        path = self._event_dir / f"strategy_events_{trade_date}.jsonl"
-        self._handle = path.open("a", encoding="utf-8")
+        path = strategy_event_file_path(self._event_dir, trade_date, self._event_format)
+        if self._event_format == EVENT_FORMAT_MSGPACK:
+            self._handle = BinaryEventWriter(path)
+        else:
+            self._handle = path.open("a", encoding="utf-8")
         self._current_trade_date = trade_date
         return self._handle
 
@@ -255,26 +369,155 @@ class StrategyAnalyticsEventLogger:
         payload["event_id"] = _compute_event_id(payload)
         return payload
 
+    def _encode(self, event: Dict[str, Any], handle: Any) -> Any:
+        if self._event_format == EVENT_FORMAT_MSGPACK:
+            # build_event 결과는 이미 직렬화 가능한 형태 → _json_ready 재귀 없이 바로 인코딩
+            return handle.encode(event)
+        return json.dumps(_json_ready(event), ensure_ascii=True, separators=(",", ":"), sort_keys=True) + "\n"
+
+    def _write_events(self, events: List[Dict[str, Any]], *, flush: bool) -> None:
+        """trade_date 가 같은 연속 구간마다 인코딩 결과를 모아 write() 한 번으로 기록"""
+        with self._lock:
+            index = 0
+            while index < len(events):
+                trade_date = str(events[index].get("trade_date") or "").strip()
+                handle = self._ensure_handle(trade_date)
+                chunks: List[Any] = []
+                while index < len(events) and str(events[index].get("trade_date") or "").strip() == trade_date:
+                    try:
+                        chunks.append(self._encode(events[index], handle))
+                    except Exception as exc:
+                        self._write_errors += 1
+                        logger.warning("[STRATEGY_ANALYTICS] event encode failed trade_date=%s err=%s", trade_date, exc)
+                    index += 1
+                if not chunks:
+                    continue
+                if self._event_format == EVENT_FORMAT_MSGPACK:
+                    handle.write_encoded(b"".join(chunks))
+                else:
+                    handle.write("".join(chunks))
+                if flush:
+                    handle.flush()
+
+    def _drain_queued(self, items: List[Any]) -> None:
+        events: List[Dict[str, Any]] = []
+        for built, payload in items:
+            if not built:
+                try:
+                    payload = self.build_event(**payload)
+                except Exception as exc:
+                    with self._lock:
+                        self._write_errors += 1
+                    logger.warning("[STRATEGY_ANALYTICS] async event build failed err=%s", exc)
+                    continue
+                if not str(payload.get("trade_date") or "").strip():
+                    continue
+            events.append(payload)
+        if events:
+            self._write_events(events, flush=True)
+
     def append(self, event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         if not self.enabled:
             return None
         trade_date = str(event.get("trade_date") or "").strip()
         if not trade_date:
             return None
-        line = json.dumps(_json_ready(event), ensure_ascii=True, separators=(",", ":"), sort_keys=True)
-        with self._lock:
-            handle = self._ensure_handle(trade_date)
-            handle.write(line)
-            handle.write("\n")
-            if self._flush_each_write:
-                handle.flush()
+        if self._write_queue is not None:
+            return event if self._write_queue.put((True, event)) else None
+        if self._event_format == EVENT_FORMAT_JSONL:
+            # 인코딩은 락 밖에서 (다른 스레드의 append 를 막지 않도록)
+            line = self._encode(event, None)
+            with self._lock:
+                handle = self._ensure_handle(trade_date)
+                handle.write(line)
+                if self._flush_each_write:
+                    handle.flush()
+            return event
+        self._write_events([event], flush=self._flush_each_write)
         return event
 
     def log_event(self, **kwargs: Any) -> Optional[Dict[str, Any]]:
+        """
+        이벤트를 만들어 기록합니다.
+
+        비동기 모드에서는 kwargs 만 큐에 넣고 build_event 는 writer 스레드에서 실행하므로
+        None 을 반환합니다. payload_json 은 호출자가 이후 중첩 dict 를 바꿔도 영향이 없도록
+        enqueue 시점에 정규화된 사본으로 고정합니다.
+        """
+        if not self.enabled:
+            return None
+        if self._write_queue is not None:
+            if kwargs.get("payload_json"):
+                kwargs["payload_json"] = _json_ready(kwargs["payload_json"])
+            self._write_queue.put((False, kwargs))
+            return None
         event = self.build_event(**kwargs)
         return self.append(event)
 
 
+def _event_file_trade_date(path: Path) -> str:
+    return path.name[len("strategy_events_"):].split(".", 1)[0]
+
+
+def _event_file_sort_key(path: Path) -> tuple:
+    # 같은 거래일에 두 형식이 공존하면(중간에 형식 전환) JSONL 을 먼저 읽는다
+    return (_event_file_trade_date(path), is_binary_event_file(path))
+
+
+def _strategy_event_files(base_dir: Path) -> List[Path]:
+    paths = [path for suffix in _EVENT_FILE_SUFFIXES.values() for path in base_dir.glob(f"strategy_events_*{suffix}")]
+    return sorted(paths, key=_event_file_sort_key)
+
+
+def _strategy_event_paths(base_dir: Path, trade_date: Optional[str]) -> List[Path]:
+    if trade_date:
+        candidates = [strategy_event_file_path(base_dir, str(trade_date), event_format) for event_format in _EVENT_FILE_SUFFIXES]
+        existing = [path for path in candidates if path.exists()]
+        return existing or candidates[:1]
+    return _strategy_event_files(base_dir)
+
+
+def _iter_event_paths(paths: Iterable[Path]) -> Iterator[Dict[str, Any]]:
+    """여러 파일을 순서대로 읽되, 같은 거래일의 두 번째 파일은 _line_index 를 이어서 매긴다."""
+    next_index: Dict[str, int] = {}
+    for path in paths:
+        trade_date = _event_file_trade_date(path)
+        for event in _iter_event_file(path, start_index=next_index.get(trade_date, 0)):
+            next_index[trade_date] = int(event["_line_index"]) + 1
+            yield event
+
+
+def _iter_event_file(path: Path, *, start_index: int = 0) -> Iterator[Dict[str, Any]]:
+    if not path.exists():
+        return
+    if is_binary_event_file(path):
+        for line_index, payload in iter_binary_event_file(path, start_index=start_index):
+            payload["_line_index"] = line_index
+            yield payload
+        return
+    with path.open("r", encoding="utf-8") as fh:
+        for line_index, raw_line in enumerate(fh, start=start_index):
+            line = raw_line.strip()
+            if not line:
+                continue
+            try:
+                payload = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(
+                    "[STRATEGY_ANALYTICS] corrupt tail ignored file=%s line=%s", path, line_index - start_index + 1
+                )
+                break
+            if not isinstance(payload, dict):
+                continue
+            payload["_line_index"] = line_index
+            yield payload
+
+
+def strategy_event_load_order_key(event: Dict[str, Any]) -> tuple:
+    """load_strategy_events 정렬 기준 (event_ts 문자열, 파일 내 줄 번호)"""
+    return (str(event.get("event_ts") or ""), int(event.get("_line_index", 0) or 0))
+
+
 def load_strategy_events(
     *,
     event_dir: Optional[str] = None,
@@ -283,33 +526,87 @@ def load_strategy_events(
     base_dir = resolve_strategy_event_dir(event_dir)
     if not base_dir.exists():
         return []
-    paths: Iterable[Path]
-    if trade_date:
-        paths = [base_dir / f"strategy_events_{str(trade_date).strip()}.jsonl"]
-    else:
-        paths = sorted(base_dir.glob("strategy_events_*.jsonl"))
-    events: List[Dict[str, Any]] = []
-    for path in paths:
-        if not path.exists():
-            continue
-        with path.open("r", encoding="utf-8") as fh:
-            for line_index, raw_line in enumerate(fh):
-                line = raw_line.strip()
-                if not line:
-                    continue
-                try:
-                    payload = json.loads(line)
-                except json.JSONDecodeError:
-                    logger.warning("[STRATEGY_ANALYTICS] corrupt tail ignored file=%s line=%s", path, line_index + 1)
-                    break
-                if not isinstance(payload, dict):
-                    continue
-                payload["_line_index"] = line_index
-                events.append(payload)
-    events.sort(key=lambda item: (str(item.get("event_ts") or ""), int(item.get("_line_index", 0) or 0)))
+    events = list(_iter_event_paths(_strategy_event_paths(base_dir, trade_date)))
+    events.sort(key=strategy_event_load_order_key)
     return events
 
 
+def _spill_run(events: List[Dict[str, Any]], stack: ExitStack) -> BinaryIO:
+    # 프로세스 내부 임시 파일이므로 JSON 재직렬화 대신 pickle 사용 (왕복 비용 절감)
+    # 레코드마다 독립 pickle → Unpickler memo 에 이미 내보낸 이벤트가 남지 않는다
+    handle = stack.enter_context(tempfile.TemporaryFile(mode="w+b"))
+    for event in events:
+        pickle.dump(event, handle, protocol=pickle.HIGHEST_PROTOCOL)
+    handle.seek(0)
+    return handle
+
+
+def _iter_spilled_run(handle: BinaryIO) -> Iterator[Dict[str, Any]]:
+    while True:
+        try:
+            yield pickle.load(handle)
+        except EOFError:
+            return
+
+
+def iter_strategy_events(
+    *,
+    event_dir: Optional[str] = None,
+    trade_date: Optional[str] = None,
+    sort_key: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    chunk_size: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    load_strategy_events 의 스트리밍 버전 (메모리 상한 = chunk_size 이벤트 x 2).
+
+    파일을 chunk_size 단위로 읽어 정렬한 run 을 임시 파일로 내리고,
+    모든 run 을 heapq.merge 로 k-way merge 합니다. run 은 파일/줄 순서대로 생성되고
+    merge 는 동일 키에서 앞선 run 을 먼저 내보내므로, 결과는 전체를 모아
+    안정 정렬(sorted(..., key=sort_key))한 순서와 같습니다.
+
+    Args:
+        sort_key: 정렬 키 (기본값: load_strategy_events 와 동일한 event_ts/줄 번호)
+        chunk_size: 메모리 정렬 단위 (기본값: STRATEGY_ANALYTICS_SORT_CHUNK_EVENTS, 0 이하면 무제한)
+    """
+    base_dir = resolve_strategy_event_dir(event_dir)
+    if not base_dir.exists():
+        return
+    key = sort_key or strategy_event_load_order_key
+    if chunk_size is None:
+        chunk_size = int(getattr(settings, "STRATEGY_ANALYTICS_SORT_CHUNK_EVENTS", 100000) or 0)
+    limit = int(chunk_size) if int(chunk_size) > 0 else None
+
+    with ExitStack() as stack:
+        runs: List[Iterator[Dict[str, Any]]] = []
+        held: Optional[List[Dict[str, Any]]] = None
+
+        def _emit_run(buffer: List[Dict[str, Any]]) -> None:
+            nonlocal held
+            buffer.sort(key=key)
+            if limit is None:
+                runs.append(iter(buffer))
+                return
+            if held is not None:
+                runs.append(_iter_spilled_run(_spill_run(held, stack)))
+            held = buffer
+
+        buffer: List[Dict[str, Any]] = []
+        for event in _iter_event_paths(_strategy_event_paths(base_dir, trade_date)):
+            buffer.append(event)
+            if limit is not None and len(buffer) >= limit:
+                _emit_run(buffer)
+                buffer = []
+        if buffer:
+            _emit_run(buffer)
+        if held is not None:
+            # 마지막 run 은 메모리에 그대로 둔다 (단일 run 이면 임시 파일 없이 처리)
+            runs.append(iter(held))
+        if len(runs) == 1:
+            yield from runs[0]
+        else:
+            yield from heapq.merge(*runs, key=key)
+
+
 def inspect_strategy_event_input(
     *,
     event_dir: Optional[str] = None,
@@ -327,21 +624,27 @@ def inspect_strategy_event_input(
         "event_dir_exists": bool(base_dir.exists()),
         "event_file": "",
         "event_file_exists": False,
+        "event_file_format": "",
         "event_file_size_bytes": 0,
         "available_event_file_count": 0,
         "missing_input_state": "ok",
     }
     if base_dir.exists():
-        diagnostics["available_event_file_count"] = len(list(base_dir.glob("strategy_events_*.jsonl")))
+        diagnostics["available_event_file_count"] = len(_strategy_event_files(base_dir))
     if trade_date:
-        target_file = base_dir / f"strategy_events_{str(trade_date).strip()}.jsonl"
-        diagnostics["event_file"] = str(target_file)
-        diagnostics["event_file_exists"] = bool(target_file.exists())
-        if target_file.exists():
+        target_files = _strategy_event_paths(base_dir, str(trade_date))
+        diagnostics["event_file"] = str(target_files[-1])
+        diagnostics["event_file_exists"] = bool(target_files[-1].exists())
+        diagnostics["event_file_format"] = (
+            EVENT_FORMAT_MSGPACK if is_binary_event_file(target_files[-1]) else EVENT_FORMAT_JSONL
+        )
+        size_bytes = 0
+        for target_file in target_files:
             try:
-                diagnostics["event_file_size_bytes"] = int(target_file.stat().st_size)
+                size_bytes += int(target_file.stat().st_size)
             except OSError:
-                diagnostics["event_file_size_bytes"] = 0
+                continue
+        diagnostics["event_file_size_bytes"] = size_bytes
 
     if not diagnostics["event_dir_exists"]:
         diagnostics["missing_input_state"] = "event_dir_missing"
@@ -356,6 +659,59 @@ def inspect_strategy_event_input(
     return diagnostics
 
 
+def convert_strategy_event_file(
+    *,
+    event_dir: Optional[str] = None,
+    trade_date: str,
+) -> Dict[str, Any]:
+    """
+    거래일 JSONL 아카이브를 바이너리(msgpack) 이벤트 파일로 변환합니다.
+
+    줄 순서를 그대로 유지하므로 정렬/집계 결과는 변환 전과 같습니다.
+    변환이 끝나면 원본은 `.jsonl.migrated` 로 이름을 바꿔 (두 형식 중복 로드 방지) 보존합니다.
+    """
+    base_dir = resolve_strategy_event_dir(event_dir)
+    source = strategy_event_file_path(base_dir, trade_date, EVENT_FORMAT_JSONL)
+    target = strategy_event_file_path(base_dir, trade_date, EVENT_FORMAT_MSGPACK)
+    result: Dict[str, Any] = {
+        "trade_date": str(trade_date),
+        "source": str(source),
+        "target": str(target),
+        "converted": False,
+        "reason": "",
+        "event_count": 0,
+        "source_size_bytes": 0,
+        "target_size_bytes": 0,
+    }
+    if not source.exists():
+        result["reason"] = "source_missing"
+        return result
+    if target.exists():
+        # 이미 바이너리로 기록 중인 거래일은 병합하지 않는다 (읽기 시 두 파일이 이어 붙는다)
+        result["reason"] = "target_exists"
+        return result
+    staging = target.with_name(target.name + ".tmp")
+    if staging.exists():
+        staging.unlink()
+    writer = BinaryEventWriter(staging)
+    try:
+        for event in _iter_event_file(source):
+            event.pop("_line_index", None)
+            writer.write(event)
+            result["event_count"] += 1
+    except Exception:
+        writer.close()
+        staging.unlink()
+        raise
+    writer.close()
+    staging.replace(target)
+    result["source_size_bytes"] = int(source.stat().st_size)
+    result["target_size_bytes"] = int(target.stat().st_size)
+    source.replace(source.with_name(source.name + ".migrated"))
+    result["converted"] = True
+    return result
+
+
 def analytics_events_from_replay_report(
     report: Dict[str, Any],
     *,
@@ -1,17 +1,25 @@
 from __future__ import annotations
 
+import heapq
 import json
 from collections import Counter, defaultdict
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 try:
     from analytics.alerts import build_alert_rows as build_strategy_alert_rows
     from analytics.diagnostics import build_diagnostics_report
-    from analytics.attribution import build_attribution_rows
-    from analytics.event_logger import inspect_strategy_event_input, load_strategy_events, resolve_strategy_event_dir
+    from analytics.attribution import AttributionRowAccumulator, build_attribution_rows
+    from analytics.event_logger import (
+        inspect_strategy_event_input,
+        iter_strategy_events,
+        load_strategy_events,
+        resolve_strategy_event_dir,
+    )
     from analytics.parity import build_parity_rows as build_strategy_parity_rows
     from analytics.repository import (
         StrategyAlertsDailyRepository,
@@ -22,16 +30,17 @@ try:
         StrategyRejectReasonDailyRepository,
         TradeMarkoutRepository,
     )
-    from analytics.summary_drilldown import build_funnel_rows
+    from analytics.summary_drilldown import FunnelRowAccumulator, build_funnel_rows, event_sort_key
     from config import settings
     from db.mysql import get_db_manager
     from utils.logger import get_logger
 except ImportError:
     from kis_trend_atr_trading.analytics.alerts import build_alert_rows as build_strategy_alert_rows
     from kis_trend_atr_trading.analytics.diagnostics import build_diagnostics_report
-    from kis_trend_atr_trading.analytics.attribution import build_attribution_rows
+    from kis_trend_atr_trading.analytics.attribution import AttributionRowAccumulator, build_attribution_rows
     from kis_trend_atr_trading.analytics.event_logger import (
         inspect_strategy_event_input,
+        iter_strategy_events,
         load_strategy_events,
         resolve_strategy_event_dir,
     )
@@ -45,7 +54,11 @@ except ImportError:
         StrategyRejectReasonDailyRepository,
         TradeMarkoutRepository,
     )
-    from kis_trend_atr_trading.analytics.summary_drilldown import build_funnel_rows
+    from kis_trend_atr_trading.analytics.summary_drilldown import (
+        FunnelRowAccumulator,
+        build_funnel_rows,
+        event_sort_key,
+    )
     from kis_trend_atr_trading.config import settings
     from kis_trend_atr_trading.db.mysql import get_db_manager
     from kis_trend_atr_trading.utils.logger import get_logger
@@ -72,6 +85,26 @@ def _safe_float(value: Any) -> Optional[float]:
         return None
 
 
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_PRICE_FIELDS = (
+    ("current_price", "quote"),
+    ("mark_price", "quote"),
+    ("fill_price", "quote"),
+    ("exec_price", "quote"),
+    ("price", "quote"),
+    ("close_price", "close"),
+)
+
+
+def _epoch_us(ts: datetime) -> int:
+    """datetime -> 정수 µs (aware 는 UTC 기준, naive 는 벽시계 그대로). float 반올림 없이 순서 보존."""
+    offset = ts.utcoffset()
+    if offset is not None:
+        ts = ts.replace(tzinfo=None) - offset
+    delta = ts - _EPOCH_NAIVE
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
 @dataclass(frozen=True)
 class PriceObservation:
     ts: datetime
@@ -80,6 +113,233 @@ class PriceObservation:
     source_type: str
 
 
+@dataclass(frozen=True)
+class SymbolPriceSeries:
+    """종목별 가격 관측치 (ts_us 오름차순, 동일 시각은 입력 순서 유지)"""
+    ts_us: np.ndarray
+    prices: np.ndarray
+    source_codes: np.ndarray
+    source_labels: Tuple[str, ...]
+
+    def __len__(self) -> int:
+        return int(self.ts_us.shape[0])
+
+
+def _extract_price_fields(event: Dict[str, Any]) -> Optional[Tuple[str, datetime, float, str]]:
+    payload = event.get("payload_json") or {}
+    symbol = str(event.get("symbol") or "").zfill(6)
+    ts = _parse_ts(event.get("event_ts"))
+    if not symbol or ts is None:
+        return None
+    for field_name, source_type in _PRICE_FIELDS:
+        price = _safe_float(payload.get(field_name))
+        if price is not None and price > 0.0:
+            return symbol, ts, price, source_type
+    return None
+
+
+def _extract_buy_fill(event: Dict[str, Any]) -> Optional[Tuple[datetime, str, float]]:
+    if str(event.get("event_type") or "") != "order_filled":
+        return None
+    payload = dict(event.get("payload_json") or {})
+    if str(payload.get("side") or "BUY").upper() != "BUY":
+        return None
+    entry_ts = _parse_ts(event.get("event_ts"))
+    symbol = str(event.get("symbol") or "").zfill(6)
+    ref_price = _safe_float(payload.get("fill_price") or payload.get("exec_price") or payload.get("price"))
+    if entry_ts is None or not symbol or ref_price is None or ref_price <= 0.0:
+        return None
+    return entry_ts, symbol, ref_price
+
+
+def _markout_row(
+    trade_date: str,
+    event: Dict[str, Any],
+    *,
+    symbol: str,
+    entry_ts: datetime,
+    horizon_sec: int,
+    ref_price: float,
+) -> Dict[str, Any]:
+    """관측치 없는(na) markout 행. 관측치가 있으면 _fill_markout_row 로 채운다."""
+    return {
+        "trade_date": trade_date,
+        "strategy_tag": str(event.get("strategy_tag") or ""),
+        "symbol": symbol,
+        "entry_ts": entry_ts,
+        "horizon_sec": int(horizon_sec),
+        "intent_id": str(event.get("intent_id") or ""),
+        "broker_order_id": str(event.get("broker_order_id") or ""),
+        "ref_price": float(ref_price),
+        "mark_price": None,
+        "markout_bps": None,
+        "source_type": "na",
+    }
+
+
+def _fill_markout_row(row: Dict[str, Any], mark_price: float, source_type: str) -> None:
+    row["mark_price"] = mark_price
+    row["markout_bps"] = ((mark_price / float(row["ref_price"])) - 1.0) * 10000.0
+    row["source_type"] = str(source_type or "quote")
+
+
+class _RejectReasonAccumulator:
+    def __init__(self) -> None:
+        self._counts: Counter[tuple[str, str, str]] = Counter()
+
+    def add(self, event: Dict[str, Any]) -> None:
+        reason = str(event.get("reject_reason") or "").strip()
+        if not reason:
+            return
+        self._counts[(str(event.get("strategy_tag") or ""), str(event.get("stage") or ""), reason)] += 1
+
+    def rows(self, trade_date: str) -> List[Dict[str, Any]]:
+        rows: List[Dict[str, Any]] = []
+        for (strategy_tag, reject_stage, reject_reason), count in sorted(self._counts.items()):
+            rows.append(
+                {
+                    "trade_date": trade_date,
+                    "strategy_tag": strategy_tag,
+                    "reject_stage": reject_stage,
+                    "reject_reason": reject_reason,
+                    "count": int(count),
+                }
+            )
+        return rows
+
+
+_SUMMARY_EVENT_COUNTERS: Dict[str, str] = {
+    "candidate_created": "candidate_count",
+    "timing_confirmed": "timing_confirm_count",
+    "precheck_rejected": "precheck_reject_count",
+    "native_handoff_rejected": "native_handoff_reject_count",
+    "order_submitted": "submitted_count",
+    "order_filled": "filled_count",
+    "order_cancelled": "cancelled_count",
+    "exit_decision": "exit_count",
+    "recovery_duplicate_prevented": "recovery_duplicate_prevented_count",
+}
+
+
+class _DailySummaryAccumulator:
+    def __init__(self, trade_date: str) -> None:
+        self._summary: Dict[str, Dict[str, Any]] = defaultdict(
+            lambda: {
+                "trade_date": trade_date,
+                "strategy_tag": "",
+                "candidate_count": 0,
+                "timing_confirm_count": 0,
+                "authoritative_ingress_count": 0,
+                "precheck_reject_count": 0,
+                "native_handoff_reject_count": 0,
+                "submitted_count": 0,
+                "filled_count": 0,
+                "cancelled_count": 0,
+                "exit_count": 0,
+                "avg_markout_3m_bps": None,
+                "avg_markout_5m_bps": None,
+                "fill_rate": 0.0,
+                "top_reject_reason_json": [],
+                "degraded_event_count": 0,
+                "recovery_duplicate_prevented_count": 0,
+            }
+        )
+
+    def add(self, event: Dict[str, Any]) -> None:
+        strategy_tag = str(event.get("strategy_tag") or "")
+        row = self._summary[strategy_tag]
+        row["strategy_tag"] = strategy_tag
+        event_type = str(event.get("event_type") or "")
+        counter_field = _SUMMARY_EVENT_COUNTERS.get(event_type)
+        if counter_field is not None:
+            row[counter_field] += 1
+        elif event_type == "intent_ingressed" and str(event.get("decision") or "") == "accepted":
+            row["authoritative_ingress_count"] += 1
+        if bool(event.get("degraded_mode")):
+            row["degraded_event_count"] += 1
+
+    def rows(
+        self,
+        reject_rows: Iterable[Dict[str, Any]],
+        markout_rows: Iterable[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        summary = self._summary
+        reject_by_strategy: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for row in list(reject_rows or []):
+            reject_by_strategy[str(row.get("strategy_tag") or "")].append(dict(row))
+
+        markouts_by_strategy_horizon: Dict[tuple[str, int], List[float]] = defaultdict(list)
+        for row in list(markout_rows or []):
+            if row.get("markout_bps") is None:
+                continue
+            markouts_by_strategy_horizon[(str(row.get("strategy_tag") or ""), int(row.get("horizon_sec", 0) or 0))].append(
+                float(row.get("markout_bps") or 0.0)
+            )
+
+        for strategy_tag, row in summary.items():
+            rejects = sorted(
+                reject_by_strategy.get(strategy_tag, []),
+                key=lambda item: (-int(item.get("count", 0) or 0), str(item.get("reject_reason") or "")),
+            )
+            row["top_reject_reason_json"] = rejects[:5]
+            for horizon_sec, field_name in ((180, "avg_markout_3m_bps"), (300, "avg_markout_5m_bps")):
+                values = markouts_by_strategy_horizon.get((strategy_tag, horizon_sec), [])
+                if values:
+                    row[field_name] = sum(values) / float(len(values))
+            submitted = int(row.get("submitted_count", 0) or 0)
+            row["fill_rate"] = (float(row.get("filled_count", 0) or 0) / float(submitted)) if submitted > 0 else 0.0
+        return [summary[key] for key in sorted(summary.keys())]
+
+
+class _MarkoutAccumulator:
+    """
+    시간순 이벤트 스트림용 markout 집계.
+
+    BUY 체결마다 horizon 별 목표 시각을 종목별 힙에 넣고, 이후 같은 종목 관측치가
+    목표 시각 이상이면 그 첫 관측치로 확정합니다. 스트림이 event_ts 순이면
+    build_markout_rows (정렬 배열 + searchsorted) 와 결과가 같고,
+    메모리는 체결 행 + 미확정 목표 수에만 비례합니다.
+    """
+
+    def __init__(self, trade_date: str, horizons_sec: Sequence[int]) -> None:
+        self._trade_date = trade_date
+        self._horizons_sec = tuple(horizons_sec)
+        self._rows: List[Dict[str, Any]] = []
+        self._pending: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+
+    def add(self, event: Dict[str, Any]) -> None:
+        observation = _extract_price_fields(event)
+        if observation is not None:
+            symbol, ts, price, source_type = observation
+            pending = self._pending.get(symbol)
+            if pending:
+                observed_us = _epoch_us(ts)
+                while pending and pending[0][0] <= observed_us:
+                    _, row_index = heapq.heappop(pending)
+                    _fill_markout_row(self._rows[row_index], float(price), source_type)
+        fill = _extract_buy_fill(event)
+        if fill is None:
+            return
+        entry_ts, symbol, ref_price = fill
+        entry_us = _epoch_us(entry_ts)
+        pending = self._pending[symbol]
+        for horizon_sec in self._horizons_sec:
+            heapq.heappush(pending, (entry_us + int(horizon_sec) * 1_000_000, len(self._rows)))
+            self._rows.append(
+                _markout_row(
+                    self._trade_date,
+                    event,
+                    symbol=symbol,
+                    entry_ts=entry_ts,
+                    horizon_sec=horizon_sec,
+                    ref_price=ref_price,
+                )
+            )
+
+    def rows(self) -> List[Dict[str, Any]]:
+        return self._rows
+
+
 class StrategyAnalyticsMaterializer:
     def __init__(
         self,
@@ -155,131 +415,127 @@ class StrategyAnalyticsMaterializer:
             diagnostics.get("likely_cause") or "",
         )
 
-    def _load_events(self, trade_date: str) -> List[Dict[str, Any]]:
+    def _prepare_event_input(self, trade_date: str) -> None:
         diagnostics = self._resolve_event_input_diagnostics(trade_date)
         self._last_event_input_diagnostics = diagnostics
         self._log_event_input_diagnostics(diagnostics)
+
+    def _load_events(self, trade_date: str) -> List[Dict[str, Any]]:
+        self._prepare_event_input(trade_date)
         return load_strategy_events(event_dir=self._event_dir, trade_date=trade_date)
 
+    def _iter_events(self, trade_date: str) -> Iterator[Dict[str, Any]]:
+        """event_sort_key 순 스트리밍 (청크 정렬 + k-way merge, 하루치 전체를 메모리에 올리지 않음)"""
+        self._prepare_event_input(trade_date)
+        return iter_strategy_events(event_dir=self._event_dir, trade_date=trade_date, sort_key=event_sort_key)
+
     def _extract_price_observation(self, event: Dict[str, Any]) -> Optional[PriceObservation]:
-        payload = dict(event.get("payload_json") or {})
-        symbol = str(event.get("symbol") or "").zfill(6)
-        ts = _parse_ts(event.get("event_ts"))
-        if not symbol or ts is None:
+        fields = _extract_price_fields(event)
+        if fields is None:
             return None
-        price_fields = (
-            ("current_price", "quote"),
-            ("mark_price", "quote"),
-            ("fill_price", "quote"),
-            ("exec_price", "quote"),
-            ("price", "quote"),
-            ("close_price", "close"),
-        )
-        for field_name, source_type in price_fields:
-            price = _safe_float(payload.get(field_name))
-            if price is not None and price > 0.0:
-                return PriceObservation(ts=ts, symbol=symbol, price=price, source_type=source_type)
-        return None
-
-    def _build_price_index(self, events: Iterable[Dict[str, Any]]) -> Dict[str, List[PriceObservation]]:
-        index: Dict[str, List[PriceObservation]] = defaultdict(list)
+        symbol, ts, price, source_type = fields
+        return PriceObservation(ts=ts, symbol=symbol, price=price, source_type=source_type)
+
+    def _build_price_index(self, events: Iterable[Dict[str, Any]]) -> Dict[str, SymbolPriceSeries]:
+        ts_by_symbol: Dict[str, List[int]] = defaultdict(list)
+        price_by_symbol: Dict[str, List[float]] = defaultdict(list)
+        source_by_symbol: Dict[str, List[int]] = defaultdict(list)
+        source_codes: Dict[str, int] = {}
         for event in list(events or []):
-            observation = self._extract_price_observation(event)
-            if observation is None:
+            fields = _extract_price_fields(event)
+            if fields is None:
                 continue
-            index[observation.symbol].append(observation)
-        for symbol in list(index.keys()):
-            index[symbol].sort(key=lambda item: item.ts)
+            symbol, ts, price, source_type = fields
+            ts_by_symbol[symbol].append(_epoch_us(ts))
+            price_by_symbol[symbol].append(price)
+            source_by_symbol[symbol].append(source_codes.setdefault(source_type, len(source_codes)))
+        labels = tuple(sorted(source_codes, key=source_codes.__getitem__))
+        index: Dict[str, SymbolPriceSeries] = {}
+        for symbol, ts_values in ts_by_symbol.items():
+            ts_us = np.asarray(ts_values, dtype=np.int64)
+            # stable: 동일 시각 관측치는 이벤트 순서 유지 (기존 list.sort 와 동일)
+            order = np.argsort(ts_us, kind="stable")
+            index[symbol] = SymbolPriceSeries(
+                ts_us=ts_us[order],
+                prices=np.asarray(price_by_symbol[symbol], dtype=np.float64)[order],
+                source_codes=np.asarray(source_by_symbol[symbol], dtype=np.int16)[order],
+                source_labels=labels,
+            )
         return index
 
-    def _next_observation(
+    def _markout_positions(
         self,
         *,
-        observations: Sequence[PriceObservation],
-        target_ts: datetime,
-    ) -> Optional[PriceObservation]:
-        for observation in observations:
-            if observation.ts >= target_ts:
-                return observation
-        return None
+        price_index: Dict[str, SymbolPriceSeries],
+        symbols: Sequence[str],
+        entry_us: np.ndarray,
+    ) -> np.ndarray:
+        """
+        (체결 수 x horizon 수) 관측치 위치 행렬. -1 은 horizon 이후 관측치 없음.
+
+        종목별로 모든 체결·horizon 목표시각을 한 번에 searchsorted(left) →
+        "ts >= target 인 첫 관측치" 를 O((F*H) log N) 에 찾습니다.
+        """
+        horizons_us = np.asarray(self._markout_horizons_sec, dtype=np.int64) * 1_000_000
+        positions = np.full((len(symbols), len(horizons_us)), -1, dtype=np.int64)
+        rows_by_symbol: Dict[str, List[int]] = defaultdict(list)
+        for row_index, symbol in enumerate(symbols):
+            rows_by_symbol[symbol].append(row_index)
+        for symbol, row_indexes in rows_by_symbol.items():
+            series = price_index.get(symbol)
+            if series is None or len(series) == 0:
+                continue
+            selected = np.asarray(row_indexes, dtype=np.int64)
+            targets = entry_us[selected][:, None] + horizons_us[None, :]
+            found = np.searchsorted(series.ts_us, targets, side="left")
+            found[found >= len(series)] = -1
+            positions[selected] = found
+        return positions
 
     def build_markout_rows(self, trade_date: str, events: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
         if not self._enable_markouts:
             return []
+        events = list(events or [])
         price_index = self._build_price_index(events)
+        fills: List[Tuple[Dict[str, Any], datetime, str, float]] = []
+        for event in events:
+            fill = _extract_buy_fill(event)
+            if fill is not None:
+                fills.append((event, *fill))
+        if not fills:
+            return []
+        positions = self._markout_positions(
+            price_index=price_index,
+            symbols=[fill[2] for fill in fills],
+            entry_us=np.asarray([_epoch_us(fill[1]) for fill in fills], dtype=np.int64),
+        )
         rows: List[Dict[str, Any]] = []
-        for event in list(events or []):
-            if str(event.get("event_type") or "") != "order_filled":
-                continue
-            payload = dict(event.get("payload_json") or {})
-            if str(payload.get("side") or "BUY").upper() != "BUY":
-                continue
-            entry_ts = _parse_ts(event.get("event_ts"))
-            symbol = str(event.get("symbol") or "").zfill(6)
-            ref_price = _safe_float(payload.get("fill_price") or payload.get("exec_price") or payload.get("price"))
-            if entry_ts is None or not symbol or ref_price is None or ref_price <= 0.0:
-                continue
-            observations = price_index.get(symbol, [])
-            for horizon_sec in self._markout_horizons_sec:
-                observation = self._next_observation(
-                    observations=observations,
-                    target_ts=entry_ts + timedelta(seconds=int(horizon_sec)),
+        for fill_index, (event, entry_ts, symbol, ref_price) in enumerate(fills):
+            series = price_index.get(symbol)
+            for horizon_index, horizon_sec in enumerate(self._markout_horizons_sec):
+                row = _markout_row(
+                    trade_date,
+                    event,
+                    symbol=symbol,
+                    entry_ts=entry_ts,
+                    horizon_sec=horizon_sec,
+                    ref_price=ref_price,
                 )
-                if observation is None:
-                    rows.append(
-                        {
-                            "trade_date": trade_date,
-                            "strategy_tag": str(event.get("strategy_tag") or ""),
-                            "symbol": symbol,
-                            "entry_ts": entry_ts,
-                            "horizon_sec": int(horizon_sec),
-                            "intent_id": str(event.get("intent_id") or ""),
-                            "broker_order_id": str(event.get("broker_order_id") or ""),
-                            "ref_price": float(ref_price),
-                            "mark_price": None,
-                            "markout_bps": None,
-                            "source_type": "na",
-                        }
+                position = int(positions[fill_index, horizon_index])
+                if position >= 0:
+                    _fill_markout_row(
+                        row,
+                        float(series.prices[position]),
+                        series.source_labels[int(series.source_codes[position])],
                     )
-                    continue
-                rows.append(
-                    {
-                        "trade_date": trade_date,
-                        "strategy_tag": str(event.get("strategy_tag") or ""),
-                        "symbol": symbol,
-                        "entry_ts": entry_ts,
-                        "horizon_sec": int(horizon_sec),
-                        "intent_id": str(event.get("intent_id") or ""),
-                        "broker_order_id": str(event.get("broker_order_id") or ""),
-                        "ref_price": float(ref_price),
-                        "mark_price": float(observation.price),
-                        "markout_bps": ((float(observation.price) / float(ref_price)) - 1.0) * 10000.0,
-                        "source_type": str(observation.source_type or "quote"),
-                    }
-                )
+                rows.append(row)
         return rows
 
     def build_reject_reason_rows(self, trade_date: str, events: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        counts: Counter[tuple[str, str, str]] = Counter()
+        accumulator = _RejectReasonAccumulator()
         for event in list(events or []):
-            reason = str(event.get("reject_reason") or "").strip()
-            if not reason:
-                continue
-            strategy_tag = str(event.get("strategy_tag") or "")
-            stage = str(event.get("stage") or "")
-            counts[(strategy_tag, stage, reason)] += 1
-        rows: List[Dict[str, Any]] = []
-        for (strategy_tag, reject_stage, reject_reason), count in sorted(counts.items()):
-            rows.append(
-                {
-                    "trade_date": trade_date,
-                    "strategy_tag": strategy_tag,
-                    "reject_stage": reject_stage,
-                    "reject_reason": reject_reason,
-                    "count": int(count),
-                }
-            )
-        return rows
+            accumulator.add(event)
+        return accumulator.rows(trade_date)
 
     def build_daily_summary_rows(
         self,
@@ -288,81 +544,10 @@ class StrategyAnalyticsMaterializer:
         reject_rows: Iterable[Dict[str, Any]],
         markout_rows: Iterable[Dict[str, Any]],
     ) -> List[Dict[str, Any]]:
-        summary: Dict[str, Dict[str, Any]] = defaultdict(
-            lambda: {
-                "trade_date": trade_date,
-                "strategy_tag": "",
-                "candidate_count": 0,
-                "timing_confirm_count": 0,
-                "authoritative_ingress_count": 0,
-                "precheck_reject_count": 0,
-                "native_handoff_reject_count": 0,
-                "submitted_count": 0,
-                "filled_count": 0,
-                "cancelled_count": 0,
-                "exit_count": 0,
-                "avg_markout_3m_bps": None,
-                "avg_markout_5m_bps": None,
-                "fill_rate": 0.0,
-                "top_reject_reason_json": [],
-                "degraded_event_count": 0,
-                "recovery_duplicate_prevented_count": 0,
-            }
-        )
+        accumulator = _DailySummaryAccumulator(trade_date)
         for event in list(events or []):
-            strategy_tag = str(event.get("strategy_tag") or "")
-            row = summary[strategy_tag]
-            row["strategy_tag"] = strategy_tag
-            event_type = str(event.get("event_type") or "")
-            decision = str(event.get("decision") or "")
-            if event_type == "candidate_created":
-                row["candidate_count"] += 1
-            elif event_type == "timing_confirmed":
-                row["timing_confirm_count"] += 1
-            elif event_type == "intent_ingressed" and decision == "accepted":
-                row["authoritative_ingress_count"] += 1
-            elif event_type == "precheck_rejected":
-                row["precheck_reject_count"] += 1
-            elif event_type == "native_handoff_rejected":
-                row["native_handoff_reject_count"] += 1
-            elif event_type == "order_submitted":
-                row["submitted_count"] += 1
-            elif event_type == "order_filled":
-                row["filled_count"] += 1
-            elif event_type == "order_cancelled":
-                row["cancelled_count"] += 1
-            elif event_type == "exit_decision":
-                row["exit_count"] += 1
-            elif event_type == "recovery_duplicate_prevented":
-                row["recovery_duplicate_prevented_count"] += 1
-            if bool(event.get("degraded_mode")):
-                row["degraded_event_count"] += 1
-
-        reject_by_strategy: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-        for row in list(reject_rows or []):
-            reject_by_strategy[str(row.get("strategy_tag") or "")].append(dict(row))
-
-        markouts_by_strategy_horizon: Dict[tuple[str, int], List[float]] = defaultdict(list)
-        for row in list(markout_rows or []):
-            if row.get("markout_bps") is None:
-                continue
-            markouts_by_strategy_horizon[(str(row.get("strategy_tag") or ""), int(row.get("horizon_sec", 0) or 0))].append(
-                float(row.get("markout_bps") or 0.0)
-            )
-
-        for strategy_tag, row in summary.items():
-            rejects = sorted(
-                reject_by_strategy.get(strategy_tag, []),
-                key=lambda item: (-int(item.get("count", 0) or 0), str(item.get("reject_reason") or "")),
-            )
-            row["top_reject_reason_json"] = rejects[:5]
-            for horizon_sec, field_name in ((180, "avg_markout_3m_bps"), (300, "avg_markout_5m_bps")):
-                values = markouts_by_strategy_horizon.get((strategy_tag, horizon_sec), [])
-                if values:
-                    row[field_name] = sum(values) / float(len(values))
-            submitted = int(row.get("submitted_count", 0) or 0)
-            row["fill_rate"] = (float(row.get("filled_count", 0) or 0) / float(submitted)) if submitted > 0 else 0.0
-        return [summary[key] for key in sorted(summary.keys())]
+            accumulator.add(event)
+        return accumulator.rows(reject_rows, markout_rows)
 
     def build_funnel_rows(self, trade_date: str, events: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
         return build_funnel_rows(trade_date, events)
@@ -517,15 +702,31 @@ class StrategyAnalyticsMaterializer:
         trade_date: str,
         persist: bool = True,
     ) -> Dict[str, Any]:
-        events = self._load_events(trade_date)
-        reject_rows = self.build_reject_reason_rows(trade_date, events)
-        funnel_rows = self.build_funnel_rows(trade_date, events)
-        attribution_rows = self.build_attribution_rows(trade_date, events)
-        markout_rows = self.build_markout_rows(trade_date, events)
-        summary_rows = self.build_daily_summary_rows(trade_date, events, reject_rows, markout_rows)
+        # 단일 패스: event_sort_key 순 스트림을 각 집계기에 한 번씩 흘려보낸다 (배치 build_* 와 결과 동일)
+        reject_accumulator = _RejectReasonAccumulator()
+        summary_accumulator = _DailySummaryAccumulator(trade_date)
+        funnel_accumulator = FunnelRowAccumulator()
+        attribution_accumulator = AttributionRowAccumulator()
+        markout_accumulator = (
+            _MarkoutAccumulator(trade_date, self._markout_horizons_sec) if self._enable_markouts else None
+        )
+        event_count = 0
+        for event in self._iter_events(trade_date):
+            event_count += 1
+            reject_accumulator.add(event)
+            summary_accumulator.add(event)
+            funnel_accumulator.add(event)
+            attribution_accumulator.add(event)
+            if markout_accumulator is not None:
+                markout_accumulator.add(event)
+        reject_rows = reject_accumulator.rows(trade_date)
+        funnel_rows = funnel_accumulator.rows(trade_date)
+        attribution_rows = attribution_accumulator.rows(trade_date)
+        markout_rows = markout_accumulator.rows() if markout_accumulator is not None else []
+        summary_rows = summary_accumulator.rows(reject_rows, markout_rows)
         payload = {
             "trade_date": trade_date,
-            "event_count": len(events),
+            "event_count": event_count,
             "event_input_diagnostics": dict(self._last_event_input_diagnostics or {}),
             "summary_rows": summary_rows,
             "reject_rows": reject_rows,
@@ -236,23 +236,43 @@ def funnel_stage_entities(event: Dict[str, Any]) -> Dict[str, str]:
     return stages
 
 
-def build_funnel_rows(trade_date: str, events: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    counts: Dict[Tuple[str, str, str, str], set[str]] = defaultdict(set)
-    slice_keys: set[Tuple[str, str, str]] = set()
+class FunnelRowAccumulator:
+    """build_funnel_rows 의 증분 버전 (이벤트 순서 무관, 메모리는 stage entity 수에 비례)"""
 
-    for event in sorted(list(events or []), key=event_sort_key):
+    def __init__(self) -> None:
+        self._counts: Dict[Tuple[str, str, str, str], set[str]] = defaultdict(set)
+        self._slice_keys: set[Tuple[str, str, str]] = set()
+
+    def add(self, event: Dict[str, Any]) -> None:
         strategy_tag = str(event.get("strategy_tag") or "").strip()
         if not strategy_tag:
-            continue
+            return
         stage_entities = funnel_stage_entities(event)
         if not stage_entities:
-            continue
-        slices = tuple(iter_slice_pairs(event))
-        for slice_key, slice_value in slices:
-            slice_keys.add((strategy_tag, slice_key, slice_value))
+            return
+        for slice_key, slice_value in iter_slice_pairs(event):
+            self._slice_keys.add((strategy_tag, slice_key, slice_value))
             for stage_name, entity_id in stage_entities.items():
-                counts[(strategy_tag, slice_key, slice_value, stage_name)].add(str(entity_id or event.get("event_id") or ""))
+                self._counts[(strategy_tag, slice_key, slice_value, stage_name)].add(
+                    str(entity_id or event.get("event_id") or "")
+                )
+
+    def rows(self, trade_date: str) -> List[Dict[str, Any]]:
+        return _funnel_rows_from_counts(trade_date, self._counts, self._slice_keys)
+
+
+def build_funnel_rows(trade_date: str, events: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    accumulator = FunnelRowAccumulator()
+    for event in sorted(list(events or []), key=event_sort_key):
+        accumulator.add(event)
+    return accumulator.rows(trade_date)
+
 
+def _funnel_rows_from_counts(
+    trade_date: str,
+    counts: Dict[Tuple[str, str, str, str], set[str]],
+    slice_keys: set[Tuple[str, str, str]],
+) -> List[Dict[str, Any]]:
     rows: List[Dict[str, Any]] = []
     for strategy_tag, slice_key, slice_value in sorted(
         slice_keys,
@@ -0,0 +1,240 @@
+"""
+KIS Trend-ATR Trading System - 체결 이벤트 버스
+
+WebSocket 실시간 체결통보(H0STCNI0/H0STCNI9)를 주문번호 기준으로 모아
+체결 대기 중인 호출자(KISApi.wait_for_execution)를 즉시 깨웁니다.
+
+★ 동작:
+    - publish(): WS 수신 스레드에서 체결통보 1건 반영 (주문번호별 누적 수량/금액)
+    - wait_for(): 누적 체결수량이 기대수량에 도달하거나 timeout 까지 대기
+    - 통보가 대기 시작보다 먼저 와도 유실되지 않도록 최근 주문을 보관
+      (max_orders 초과 시 오래된 주문부터 제거)
+    - KIS 주문번호는 매일 다시 시작하므로 (거래일 KST, 주문번호) 로 보관하고,
+      날짜가 바뀌면 지난 거래일 주문은 모두 비웁니다.
+    - wait_for() 에 종목코드/매매구분을 주면 다른 주문의 누적 현황은 받지 않습니다.
+
+★ is_live():
+    체결통보 구독이 살아있을 때만 True.
+    False 이면 wait_for_execution 은 기존 REST 폴링만 사용합니다.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.market_hours import KST
+
+DEFAULT_MAX_ORDERS = 512
+
+OrderKey = Tuple[str, str]
+
+
+def normalize_order_no(value: Any) -> str:
+    """주문번호 정규화 (앞자리 0 제거, KISApi._normalize_order_no 와 동일 규칙)"""
+    raw = str(value or "").strip()
+    digits = "".join(ch for ch in raw if ch.isdigit())
+    if not digits:
+        return raw
+    return digits.lstrip("0") or "0"
+
+
+def _kst_trade_date() -> str:
+    return datetime.now(KST).strftime("%Y-%m-%d")
+
+
+@dataclass
+class FillEvent:
+    """체결통보 1건"""
+    order_no: str
+    stock_code: str
+    side: str
+    exec_qty: int
+    exec_price: float
+    executed_at: str = ""
+    order_qty: int = 0
+    is_fill: bool = True
+    rejected: bool = False
+
+
+@dataclass
+class OrderFillSummary:
+    """주문번호별 누적 체결 현황"""
+    order_no: str
+    stock_code: str = ""
+    side: str = ""
+    order_qty: int = 0
+    filled_qty: int = 0
+    filled_amount: float = 0.0
+    rejected: bool = False
+    fills: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def avg_price(self) -> float:
+        return self.filled_amount / self.filled_qty if self.filled_qty > 0 else 0.0
+
+
+class FillEventBus:
+    """주문번호별 체결 누적 + 대기자 통지"""
+
+    def __init__(
+        self,
+        max_orders: int = DEFAULT_MAX_ORDERS,
+        trade_date_fn: Optional[Callable[[], str]] = None,
+    ):
+        self._max_orders = max(int(max_orders), 1)
+        self._trade_date_fn = trade_date_fn or _kst_trade_date
+        self._cond = threading.Condition(threading.Lock())
+        self._orders: "OrderedDict[OrderKey, OrderFillSummary]" = OrderedDict()
+        self._trade_date = ""
+        self._live = False
+        self._published = 0
+        self._ignored = 0
+        self._waits = 0
+        self._wait_hits = 0
+
+    def set_live(self, live: bool) -> None:
+        with self._cond:
+            self._live = bool(live)
+            self._cond.notify_all()
+
+    def is_live(self) -> bool:
+        with self._cond:
+            return self._live
+
+    def _key_locked(self, order_no: Any) -> OrderKey:
+        """오늘 거래일 키를 만들고, 날짜가 바뀌었으면 지난 거래일 주문을 비웁니다."""
+        trade_date = str(self._trade_date_fn())
+        if trade_date != self._trade_date:
+            if self._orders:
+                self._orders = OrderedDict(
+                    (key, summary) for key, summary in self._orders.items() if key[0] == trade_date
+                )
+            self._trade_date = trade_date
+        return trade_date, normalize_order_no(order_no)
+
+    @staticmethod
+    def _matches(summary: OrderFillSummary, stock_code: str, side: str) -> bool:
+        if stock_code and summary.stock_code and summary.stock_code.zfill(6) != stock_code.zfill(6):
+            return False
+        if side and summary.side and summary.side.upper() != side.upper():
+            return False
+        return True
+
+    def publish(self, event: FillEvent) -> None:
+        if not normalize_order_no(event.order_no):
+            return
+        with self._cond:
+            key = self._key_locked(event.order_no)
+            summary = self._orders.get(key)
+            if summary is None:
+                summary = OrderFillSummary(order_no=str(event.order_no))
+                self._orders[key] = summary
+                while len(self._orders) > self._max_orders:
+                    self._orders.popitem(last=False)
+            else:
+                self._orders.move_to_end(key)
+            summary.stock_code = event.stock_code or summary.stock_code
+            summary.side = event.side or summary.side
+            summary.order_qty = max(int(event.order_qty or 0), summary.order_qty)
+            if event.rejected:
+                summary.rejected = True
+            if event.is_fill and event.exec_qty > 0 and event.exec_price > 0:
+                summary.filled_qty += int(event.exec_qty)
+                summary.filled_amount += float(event.exec_price) * int(event.exec_qty)
+                summary.fills.append(
+                    {
+                        "order_no": summary.order_no,
+                        "exec_id": None,
+                        "executed_at": event.executed_at,
+                        "price": float(event.exec_price),
+                        "qty": int(event.exec_qty),
+                        "side": event.side,
+                    }
+                )
+                self._published += 1
+            else:
+                self._ignored += 1
+            self._cond.notify_all()
+
+    def snapshot(self, order_no: str) -> Optional[OrderFillSummary]:
+        with self._cond:
+            summary = self._orders.get(self._key_locked(order_no))
+            return self._copy(summary) if summary is not None else None
+
+    @staticmethod
+    def _copy(summary: OrderFillSummary) -> OrderFillSummary:
+        return OrderFillSummary(
+            order_no=summary.order_no,
+            stock_code=summary.stock_code,
+            side=summary.side,
+            order_qty=summary.order_qty,
+            filled_qty=summary.filled_qty,
+            filled_amount=summary.filled_amount,
+            rejected=summary.rejected,
+            fills=[dict(item) for item in summary.fills],
+        )
+
+    def wait_for(
+        self,
+        order_no: str,
+        expected_qty: int,
+        timeout: float,
+        stock_code: str = "",
+        side: str = "",
+    ) -> Optional[OrderFillSummary]:
+        """
+        누적 체결수량이 expected_qty 이상이 되거나 거부 통보가 오면 즉시 반환합니다.
+
+        Args:
+            stock_code / side: 주어지면 종목코드/매매구분이 다른 누적 현황은 무시
+
+        Returns:
+            Optional[OrderFillSummary]: 마지막 누적 현황 (통보가 한 건도 없으면 None)
+        """
+        expected = max(int(expected_qty), 1)
+        stock_code = str(stock_code or "").strip()
+        side = str(side or "").strip()
+
+        def _current() -> Optional[OrderFillSummary]:
+            summary = self._orders.get(self._key_locked(order_no))
+            if summary is None or not self._matches(summary, stock_code, side):
+                return None
+            return summary
+
+        def _done() -> bool:
+            summary = _current()
+            return summary is not None and (summary.filled_qty >= expected or summary.rejected)
+
+        with self._cond:
+            self._waits += 1
+            done = self._cond.wait_for(_done, timeout=max(float(timeout), 0.0))
+            if done:
+                self._wait_hits += 1
+            summary = _current()
+            return self._copy(summary) if summary is not None else None
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "live": bool(self._live),
+                "tracked_orders": len(self._orders),
+                "fills_published": int(self._published),
+                "notices_ignored": int(self._ignored),
+                "waits": int(self._waits),
+                "wait_hits": int(self._wait_hits),
+            }
+
+
+_shared_lock = threading.Lock()
+_shared_bus: Optional[FillEventBus] = None
+
+
+def get_shared_fill_event_bus() -> FillEventBus:
+    """프로세스 공용 체결 이벤트 버스"""
+    global _shared_bus
+    with _shared_lock:
+        if _shared_bus is None:
+            _shared_bus = FillEventBus()
+        return _shared_bus
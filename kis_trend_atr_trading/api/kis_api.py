@@ -13,6 +13,7 @@ import json
 import os
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import date as dt_date, datetime, timedelta
 from decimal import Decimal, InvalidOperation
@@ -22,6 +23,16 @@ import requests
 import pandas as pd
 
 from config import settings
+from api.fill_event_bus import FillEventBus, OrderFillSummary, get_shared_fill_event_bus
+from api.rate_limiter import (
+    RATE_LANE_BULK,
+    RATE_LANE_DEFAULT,
+    RATE_LANE_ORDER,
+    TokenBucketRateLimiter,
+    get_shared_rate_limiter,
+)
+from utils.bar_store import DailyBarStore, get_daily_bar_store
+from utils.http_session import PooledHttpSession, get_pooled_session
 from utils.logger import get_logger, TradeLogger
 from utils.market_hours import KST
 
@@ -31,6 +42,12 @@ trade_logger = TradeLogger("kis_api")
 DEFAULT_TOKEN_RETRY_DELAY_SECONDS = 61.0
 DEFAULT_TOKEN_REFRESH_MARGIN_MINUTES = 30
 DEFAULT_TOKEN_CACHE_FILE_NAME = "access_token_cache.json"
+DEFAULT_DAILY_BAR_STORE_FILE_NAME = "daily_bars.sqlite3"
+# 관심종목(멀티종목) 시세조회 1회당 최대 종목 수
+MULTI_PRICE_MAX_CODES = 30
+# 멀티종목 시세조회 "서비스 미지원" 거절 판정 (msg_cd / msg1 일부)
+MULTI_PRICE_UNSUPPORTED_MSG_CODES = frozenset({"OPSQ0002"})
+MULTI_PRICE_UNSUPPORTED_MSG_MARKERS = ("제공되지 않", "없는 서비스", "미지원")
 
 
 class KISApiError(Exception):
@@ -38,6 +55,11 @@ class KISApiError(Exception):
     pass
 
 
+class KISApiUnsupportedError(KISApiError):
+    """해당 환경에서 제공되지 않는 API (rt_cd/msg_cd 로 명시적 거절)"""
+    pass
+
+
 class KISApi:
     """
     한국투자증권 Open API 클라이언트
@@ -105,8 +127,14 @@ class KISApi:
         self._token_cache_file = self._build_token_cache_file_path()
         self._last_token_prewarm_date = None
 
-        # Rate Limit 관리
+        # Rate Limit 관리 (프로세스 공용 토큰 버킷)
         self._last_api_call_time: float = 0.0
+        self._rate_limiter: TokenBucketRateLimiter = get_shared_rate_limiter(
+            rate_per_sec=float(
+                getattr(settings, "RATE_LIMIT_PER_SEC", 1.0 / float(settings.RATE_LIMIT_DELAY))
+            ),
+            burst=float(getattr(settings, "RATE_LIMIT_BURST", 1.0)),
+        )
 
         # 계좌 잔고 조회 단기 캐시 (다종목 초기화 시 과도한 연속 호출 완화)
         self._balance_cache: Optional[Dict[str, Any]] = None
@@ -122,10 +150,22 @@ class KISApi:
             getattr(settings, "ACCOUNT_HOLDINGS_CACHE_TTL_SEC", self._balance_cache_ttl_sec)
         )
         
+        # keep-alive HTTP 세션 (base URL 별 프로세스 공용, 첫 요청 시 생성)
+        self._pooled_http: Optional[PooledHttpSession] = None
+        
+        # 일봉 로컬 저장소 (비활성 시 None)
+        self._daily_bar_store: Optional[DailyBarStore] = self._build_daily_bar_store()
+        
         # 네트워크 상태 관리 (1분 이상 단절 시 거래 중단 판단)
         self._network_down_since: Optional[float] = None
         self._was_disconnected: bool = False
         
+        # 멀티종목 시세조회 지원 여부 (모의투자 미지원, 실패 시 단건 병렬 조회로 전환)
+        self._multi_price_supported: bool = not self.is_paper_trading
+        
+        # WS 체결통보 이벤트 버스 (구독이 살아있을 때만 wait_for_execution 이 사용)
+        self._fill_event_bus: FillEventBus = get_shared_fill_event_bus()
+        
         logger.info(f"KIS API 클라이언트 초기화 완료 (모의투자: {self.is_paper_trading})")
         logger.info(
             "[KIS] api_mode=%s, order_tr_ids={buy:%s,sell:%s,status:%s,cancel:%s,balance:%s}",
@@ -174,6 +214,24 @@ class KISApi:
         )
         return data_dir / DEFAULT_TOKEN_CACHE_FILE_NAME
 
+    def _build_daily_bar_store(self) -> Optional[DailyBarStore]:
+        if not bool(getattr(settings, "ENABLE_DAILY_BAR_STORE", False)):
+            return None
+        raw_path = str(getattr(settings, "DAILY_BAR_STORE_PATH", "") or "").strip()
+        path = (
+            Path(raw_path)
+            if raw_path
+            else self._build_token_cache_file_path().with_name(DEFAULT_DAILY_BAR_STORE_FILE_NAME)
+        )
+        try:
+            return get_daily_bar_store(
+                path,
+                tail_ttl_sec=float(getattr(settings, "DAILY_BAR_STORE_TAIL_TTL_SEC", 30.0)),
+            )
+        except Exception as e:
+            logger.warning(f"[KIS] 일봉 저장소 초기화 실패, REST 직접 조회로 동작: {e}")
+            return None
+
     @staticmethod
     def _parse_datetime(value: Any) -> Optional[datetime]:
         raw = str(value or "").strip()
@@ -672,16 +730,41 @@ class KISApi:
         except Exception as e:
             logger.warning(f"[KIS] 토큰 캐시 저장 실패: {e}")
     
-    def _wait_for_rate_limit(self) -> None:
+    def _wait_for_rate_limit(self, lane: str = RATE_LANE_DEFAULT) -> None:
         """
         Rate Limit을 준수하기 위해 대기합니다.
-        KIS API는 초당 20회 제한이 있습니다.
+        KIS API는 초당 20회 제한이 있으며, 프로세스 내 모든 KISApi 인스턴스가
+        하나의 토큰 버킷을 공유합니다.
+        
+        Args:
+            lane: 우선순위 lane (order > default > bulk)
         """
-        elapsed = time.time() - self._last_api_call_time
-        if elapsed < settings.RATE_LIMIT_DELAY:
-            time.sleep(settings.RATE_LIMIT_DELAY - elapsed)
+        self._rate_limiter.acquire(lane)
         self._last_api_call_time = time.time()
     
+    def _http_session(self) -> PooledHttpSession:
+        """base URL 별 공용 keep-alive 세션 (첫 요청 시 생성)"""
+        if self._pooled_http is None:
+            self._pooled_http = get_pooled_session(
+                self.base_url,
+                pool_size=int(getattr(settings, "HTTP_POOL_SIZE", 10)),
+                connect_retries=int(getattr(settings, "HTTP_POOL_CONNECT_RETRIES", 1)),
+                keepalive_idle_sec=float(getattr(settings, "HTTP_KEEPALIVE_IDLE_SEC", 55.0)),
+            )
+        return self._pooled_http
+    
+    @property
+    def fill_event_bus(self) -> FillEventBus:
+        """WS 체결통보 이벤트 버스 (KISWSMarketDataProvider 에 연결)"""
+        return self._fill_event_bus
+    
+    def metrics(self) -> Dict[str, Any]:
+        """REST rate limiter lane 별 대기시간 히스토그램 + HTTP 연결 재사용/지연 통계"""
+        return {
+            "rate_limiter": self._rate_limiter.metrics(),
+            "http": self._http_session().metrics(),
+        }
+    
     def _request_with_retry(
         self,
         method: str,
@@ -692,6 +775,7 @@ class KISApi:
         max_retries: int = None,
         retry_delay: float = None,
         use_exponential_backoff: bool = True,
+        lane: str = RATE_LANE_DEFAULT,
     ) -> requests.Response:
         """
         재시도 로직이 포함된 HTTP 요청
@@ -705,6 +789,7 @@ class KISApi:
             max_retries: 최대 재시도 횟수
             retry_delay: 재시도 대기 시간(초). None이면 settings.RETRY_DELAY 사용
             use_exponential_backoff: 지수 백오프 사용 여부
+            lane: rate limit 우선순위 lane (order/default/bulk)
         
         Returns:
             requests.Response: 응답 객체
@@ -723,19 +808,21 @@ class KISApi:
         
         for attempt in range(max_retries + 1):
             try:
-                self._wait_for_rate_limit()
+                self._wait_for_rate_limit(lane)
                 
                 start_time = time.time()
                 
                 if method.upper() == "GET":
-                    response = requests.get(
+                    response, reused = self._http_session().request(
+                        "GET",
                         url,
                         headers=headers,
                         params=params,
                         timeout=settings.API_TIMEOUT
                     )
                 elif method.upper() == "POST":
-                    response = requests.post(
+                    response, reused = self._http_session().request(
+                        "POST",
                         url,
                         headers=headers,
                         json=json_data,
@@ -745,7 +832,9 @@ class KISApi:
                     raise KISApiError(f"지원하지 않는 HTTP 메서드: {method}")
                 
                 elapsed = time.time() - start_time
-                trade_logger.log_api_call(url, response.ok, elapsed)
+                trade_logger.log_api_call(
+                    url, response.ok, elapsed, f"conn={'reuse' if reused else 'new'}"
+                )
                 
                 # 성공적인 응답 확인
                 if response.status_code == 200:
@@ -968,6 +1057,10 @@ class KISApi:
                 - low_price: 저가
                 - open_price: 시가
         """
+        return self._fetch_current_price(stock_code)
+
+    def _fetch_current_price(self, stock_code: str, lane: str = RATE_LANE_DEFAULT) -> Dict:
+        """현재가 단건 조회 본문 (lane 지정 가능)"""
         url = f"{self.base_url}/uapi/domestic-stock/v1/quotations/inquire-price"
         
         # 모의투자용 TR_ID
@@ -982,7 +1075,7 @@ class KISApi:
         # SESSION FULL은 단기적으로 해소되는 경우가 있어 소폭 재시도합니다.
         session_full_retries = 2
         for attempt in range(session_full_retries + 1):
-            response = self._request_with_retry("GET", url, headers, params=params)
+            response = self._request_with_retry("GET", url, headers, params=params, lane=lane)
             data = response.json()
             if data.get("rt_cd") == "0":
                 break
@@ -1039,6 +1132,9 @@ class KISApi:
         TR_ID: FHKST03010100
         ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
         
+        ENABLE_DAILY_BAR_STORE=true 이면 일봉(D)은 로컬 저장소(utils/bar_store.py)에서
+        반환하고, 저장소에 없는 앞/뒤 구간만 REST 로 조회합니다.
+        
         Args:
             stock_code: 종목 코드 (6자리)
             start_date: 조회 시작일 (YYYYMMDD, 미입력 시 100일 전)
@@ -1059,6 +1155,32 @@ class KISApi:
         if start_date is None:
             start_date = (datetime.now(KST) - timedelta(days=100)).strftime("%Y%m%d")
         
+        store = self._daily_bar_store
+        if store is None or period_type != "D":
+            return self._fetch_daily_ohlcv_remote(stock_code, start_date, end_date, period_type)
+        
+        # 저장소에 없는 앞/뒤 구간만 REST 조회 후 저장소 기준으로 반환
+        now = datetime.now(KST)
+        ranges = store.missing_ranges(stock_code, period_type, start_date, end_date, now=now)
+        for range_start, range_end in ranges:
+            fetched = self._fetch_daily_ohlcv_remote(stock_code, range_start, range_end, period_type)
+            store.save_fetched(stock_code, period_type, range_start, range_end, fetched, now=now)
+        
+        df = store.load_bars(stock_code, period_type, start_date, end_date)
+        if not ranges:
+            logger.debug(f"일봉 저장소 적중: {stock_code}, {len(df)}개")
+        if df.empty:
+            logger.warning(f"조회된 데이터 없음: {stock_code}")
+        return df
+    
+    def _fetch_daily_ohlcv_remote(
+        self,
+        stock_code: str,
+        start_date: str,
+        end_date: str,
+        period_type: str = "D",
+    ) -> pd.DataFrame:
+        """get_daily_ohlcv 의 REST 조회 본체 (페이징 포함, 저장소 미사용)"""
         url = f"{self.base_url}/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice"
         
         # 모의투자용 TR_ID
@@ -1078,7 +1200,9 @@ class KISApi:
         
         # 페이징 처리 (최대 100개씩)
         while True:
-            response = self._request_with_retry("GET", url, headers, params=params)
+            response = self._request_with_retry(
+                "GET", url, headers, params=params, lane=RATE_LANE_BULK
+            )
             data = response.json()
             
             if data.get("rt_cd") != "0":
@@ -1211,7 +1335,9 @@ class KISApi:
             "FID_INPUT_DATE_1": "",
         }
 
-        response = self._request_with_retry("GET", url, headers, params=params)
+        response = self._request_with_retry(
+            "GET", url, headers, params=params, lane=RATE_LANE_BULK
+        )
         data = response.json()
         if data.get("rt_cd") != "0":
             raise KISApiError(f"거래량 순위 조회 실패: {data.get('msg1', 'Unknown error')}")
@@ -1307,6 +1433,196 @@ class KISApi:
         rows.sort(key=lambda x: float(x.get("trade_value", 0.0)), reverse=True)
         return rows[:limit]
 
+    def _build_market_snapshot(
+        self,
+        code: str,
+        item: Dict[str, Any],
+        *,
+        price_keys: List[str],
+        open_keys: List[str],
+        name_keys: List[str],
+    ) -> Optional[Dict[str, Any]]:
+        """시세 응답 1건을 UniverseSelector 스냅샷 형식으로 정규화 (현재가 0 이면 None)"""
+        current_price = self._to_float(self._first_present(item, price_keys, 0))
+        if current_price <= 0:
+            return None
+        open_price = self._to_float(self._first_present(item, open_keys, 0))
+        volume = self._to_float(self._first_present(item, ["acml_vol", "volume"], 0))
+        trade_value = self._to_float(
+            self._first_present(item, ["acml_tr_pbmn", "trade_value"], 0)
+        )
+        if trade_value <= 0 and volume > 0:
+            trade_value = current_price * volume
+        pct_from_open = 0.0
+        if open_price > 0:
+            pct_from_open = ((current_price - open_price) / open_price) * 100.0
+        market_cap_raw = self._first_present(item, ["hts_avls", "market_cap"], None)
+        stock_name = str(self._first_present(item, name_keys, "") or "").strip()
+        return {
+            "code": code,
+            "stock_name": stock_name or None,
+            "current_price": current_price,
+            "open_price": open_price,
+            "volume": volume,
+            "trade_value": trade_value,
+            "market_cap": (
+                self._to_float(market_cap_raw, 0.0)
+                if market_cap_raw not in (None, "")
+                else None
+            ),
+            "is_suspended": self._to_bool_flag(
+                self._first_present(
+                    item,
+                    ["is_suspended", "suspended", "trht_yn", "halt_yn", "trading_halt_yn"],
+                    False,
+                ),
+                False,
+            ),
+            "is_management": self._to_bool_flag(
+                self._first_present(
+                    item,
+                    ["is_management", "management_yn", "mang_issu_yn", "mang_issu_cls_code"],
+                    False,
+                ),
+                False,
+            ),
+            "pct_from_open": pct_from_open,
+        }
+
+    def _fetch_multi_price_chunk(self, codes: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        관심종목(멀티종목) 시세를 1회 호출로 조회합니다.
+        
+        ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        KIS API Endpoint: GET /uapi/domestic-stock/v1/quotations/intstock-multprice
+        TR_ID: FHKST11300006 (실전 전용, 1회 최대 30종목)
+        ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        """
+        url = f"{self.base_url}/uapi/domestic-stock/v1/quotations/intstock-multprice"
+        headers = self._get_auth_headers("FHKST11300006")
+        params: Dict[str, str] = {}
+        for idx, code in enumerate(codes[:MULTI_PRICE_MAX_CODES], start=1):
+            params[f"FID_COND_MRKT_DIV_CODE_{idx}"] = "J"
+            params[f"FID_INPUT_ISCD_{idx}"] = code
+
+        response = self._request_with_retry(
+            "GET", url, headers, params=params, lane=RATE_LANE_BULK
+        )
+        data = response.json()
+        if data.get("rt_cd") != "0":
+            msg_cd = str(data.get("msg_cd") or "").strip()
+            msg = str(data.get("msg1") or "Unknown error")
+            if msg_cd in MULTI_PRICE_UNSUPPORTED_MSG_CODES or any(
+                marker in msg for marker in MULTI_PRICE_UNSUPPORTED_MSG_MARKERS
+            ):
+                raise KISApiUnsupportedError(f"멀티종목 시세 미지원: [{msg_cd}] {msg}")
+            raise KISApiError(f"멀티종목 시세 조회 실패: [{msg_cd}] {msg}")
+
+        snapshots: Dict[str, Dict[str, Any]] = {}
+        for item in data.get("output") or data.get("output1") or []:
+            code = str(
+                self._first_present(item, ["inter_shrn_iscd", "stck_shrn_iscd", "code"], "")
+            ).strip()
+            if code not in params.values():
+                continue
+            snap = self._build_market_snapshot(
+                code,
+                item,
+                price_keys=["inter2_prpr", "stck_prpr", "current_price"],
+                open_keys=["inter2_oprc", "stck_oprc", "open_price"],
+                name_keys=["inter_kor_isnm", "hts_kor_isnm", "stock_name"],
+            )
+            if snap is not None:
+                snapshots[code] = snap
+        return snapshots
+
+    def _fetch_single_snapshot(self, code: str) -> Optional[Dict[str, Any]]:
+        try:
+            price = self._fetch_current_price(code, lane=RATE_LANE_BULK)
+        except Exception as e:
+            logger.debug(f"[KIS][SNAPSHOT] 단건 시세 조회 실패 stock={code}: {e}")
+            return None
+        return self._build_market_snapshot(
+            code,
+            price,
+            price_keys=["current_price"],
+            open_keys=["open_price"],
+            name_keys=["stock_name"],
+        )
+
+    def get_market_snapshot_bulk(
+        self,
+        codes: List[str],
+        max_workers: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 종목의 시세 스냅샷을 한 번에 조회합니다.
+
+        ★ 조회 순서:
+            1) 실전: 멀티종목 시세조회 (30종목/회)
+            2) 모의투자 또는 멀티조회 실패분: 현재가 단건 조회를 스레드로 병렬 실행
+               (멀티조회는 명시적 미지원 거절일 때만 이후 호출에서도 끔)
+        모든 호출은 공용 rate limiter 의 bulk lane 을 거치므로
+        병렬 조회 중에도 주문 요청이 뒤로 밀리지 않습니다.
+
+        Args:
+            codes: 종목 코드 목록 (중복/비정상 코드는 무시)
+            max_workers: 단건 병렬 조회 스레드 수 (None 이면 SNAPSHOT_BULK_MAX_WORKERS)
+
+        Returns:
+            List[Dict]: 입력 순서를 유지한 스냅샷 목록 (조회 실패 종목 제외)
+                - code, stock_name, current_price, open_price, volume, trade_value,
+                  market_cap, is_suspended, is_management, pct_from_open
+        """
+        ordered = [
+            code
+            for code in dict.fromkeys(str(c).strip().zfill(6) for c in (codes or []))
+            if len(code) == 6 and code.isdigit()
+        ]
+        if not ordered:
+            return []
+
+        snapshots: Dict[str, Dict[str, Any]] = {}
+        remaining = list(ordered)
+        if self._multi_price_supported:
+            remaining = []
+            for start in range(0, len(ordered), MULTI_PRICE_MAX_CODES):
+                chunk = ordered[start:start + MULTI_PRICE_MAX_CODES]
+                if not self._multi_price_supported:
+                    remaining.extend(chunk)
+                    continue
+                try:
+                    snapshots.update(self._fetch_multi_price_chunk(chunk))
+                except KISApiUnsupportedError as e:
+                    logger.warning(f"[KIS][SNAPSHOT] 멀티종목 시세 미지원 -> 단건 병렬 조회 전환: {e}")
+                    self._multi_price_supported = False
+                    remaining.extend(chunk)
+                except KISApiError as e:
+                    # 타임아웃/네트워크/일시 오류: 이 묶음만 단건 조회, 다음 묶음은 멀티조회 유지
+                    logger.warning(f"[KIS][SNAPSHOT] 멀티종목 시세 실패 -> 이 묶음만 단건 조회: {e}")
+                    remaining.extend(chunk)
+
+        if remaining:
+            workers = int(
+                max_workers
+                if max_workers is not None
+                else getattr(settings, "SNAPSHOT_BULK_MAX_WORKERS", 4)
+            )
+            workers = max(min(workers, len(remaining)), 1)
+            if workers <= 1:
+                fetched = [self._fetch_single_snapshot(code) for code in remaining]
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=workers,
+                    thread_name_prefix="kis-snapshot",
+                ) as pool:
+                    fetched = list(pool.map(self._fetch_single_snapshot, remaining))
+            for code, snap in zip(remaining, fetched):
+                if snap is not None:
+                    snapshots[code] = snap
+
+        return [snapshots[code] for code in ordered if code in snapshots]
+
     def get_market_universe_codes(self, limit: int = 200) -> List[str]:
         """
         시장 후보 종목 코드를 반환합니다.
@@ -1451,7 +1767,7 @@ class KISApi:
         try:
             # 주문 API는 재시도 시 중복 주문 위험이 있어 무조건 1회 호출
             response = self._request_with_retry(
-                "POST", url, headers, json_data=body, max_retries=0
+                "POST", url, headers, json_data=body, max_retries=0, lane=RATE_LANE_ORDER
             )
             data = response.json()
             if self._should_log_order_response():
@@ -1574,7 +1890,9 @@ class KISApi:
                 ),
             )
         
-        response = self._request_with_retry("GET", url, headers, params=params)
+        response = self._request_with_retry(
+            "GET", url, headers, params=params, lane=RATE_LANE_ORDER
+        )
         data = response.json()
         if self._should_log_order_status_response():
             resp_payload = {
@@ -1748,6 +2066,7 @@ class KISApi:
                 - exec_price: 평균 체결가
                 - status: "FILLED" / "PARTIAL" / "TIMEOUT" / "CANCELLED"
                 - message: 상세 메시지
+                - rejected: 체결통보로 주문 거부를 받은 경우 True
         """
         start_time = time.time()
         query_branch_no = str(ord_gno_brno or "").strip()
@@ -1923,14 +2242,85 @@ class KISApi:
                 ],
             }
         
+        fill_bus = self._fill_event_bus if self._fill_event_bus.is_live() else None
+        if fill_bus is not None:
+            # 체결통보 수신 중에는 REST 조회를 fallback 주기로만 수행
+            check_interval = max(
+                float(check_interval),
+                float(getattr(settings, "WS_EXECUTION_NOTICE_REST_FALLBACK_SEC", 10.0) or 0.0),
+            )
+
+        def _pushed_result(summary: Optional[OrderFillSummary]) -> Optional[Dict[str, Any]]:
+            if summary is None:
+                return None
+            if summary.filled_qty >= expected_qty > 0:
+                exec_price = summary.avg_price
+                logger.info(
+                    "체결 완료(WS 체결통보): %s주 @ %s원, 주문번호=%s",
+                    summary.filled_qty,
+                    f"{exec_price:,.0f}",
+                    order_no,
+                )
+                return {
+                    "success": True,
+                    "exec_qty": summary.filled_qty,
+                    "exec_price": exec_price,
+                    "status": "FILLED",
+                    "message": f"완전 체결(WS 체결통보): {summary.filled_qty}주 @ {exec_price:,.0f}원",
+                    "fills": summary.fills,
+                    "source": "ws_execution_notice",
+                }
+            if summary.rejected:
+                # 거부 통보: REST fallback 주기까지 기다리지 않고 바로 실패 반환
+                filled_qty = int(summary.filled_qty)
+                logger.warning(
+                    "주문 거부(WS 체결통보): 주문번호=%s, 체결=%s/%s주",
+                    order_no,
+                    filled_qty,
+                    expected_qty,
+                )
+                return {
+                    "success": False,
+                    "exec_qty": filled_qty,
+                    "exec_price": summary.avg_price if filled_qty > 0 else 0,
+                    "status": "PARTIAL" if filled_qty > 0 else "CANCELLED",
+                    "message": f"주문 거부(WS 체결통보): 체결 {filled_qty}/{expected_qty}주",
+                    "fills": summary.fills,
+                    "source": "ws_execution_notice",
+                    "rejected": True,
+                }
+            return None
+
+        def _pause(seconds: float) -> Optional[Dict[str, Any]]:
+            # 체결통보가 살아있으면 sleep 대신 이벤트 대기 (도착 즉시 반환)
+            if fill_bus is None or not fill_bus.is_live():
+                time.sleep(seconds)
+                return None
+            paused_at = time.monotonic()
+            pushed = _pushed_result(
+                fill_bus.wait_for(order_no, expected_qty, seconds, stock_code=probe_symbol, side=probe_side)
+            )
+            if pushed is None:
+                # 부분 통보로 일찍 깨어난 경우 남은 시간은 그대로 대기 (REST 재조회 폭주 방지)
+                remaining = seconds - (time.monotonic() - paused_at)
+                if remaining > 0:
+                    time.sleep(remaining)
+            return pushed
+
         logger.info(
-            "체결 대기 시작: 주문번호=%s, 주문지점=%s, 예상수량=%s, 타임아웃=%s초",
+            "체결 대기 시작: 주문번호=%s, 주문지점=%s, 예상수량=%s, 타임아웃=%s초, 체결통보=%s",
             order_no,
             query_branch_no or "-",
             expected_qty,
             timeout_seconds,
+            "ws" if fill_bus is not None else "off",
         )
         
+        if fill_bus is not None:
+            pushed = _pause(min(check_interval, float(timeout_seconds)))
+            if pushed is not None:
+                return pushed
+        
         while time.time() - start_time < timeout_seconds:
             try:
                 status_result = self.get_order_status(
@@ -1951,7 +2341,9 @@ class KISApi:
                     inferred = _infer_execution_from_holdings(status_result)
                     if inferred is not None:
                         return inferred
-                    time.sleep(check_interval)
+                    pushed = _pause(check_interval)
+                    if pushed is not None:
+                        return pushed
                     continue
 
                 matched_orders = _target_orders(all_rows)
@@ -1964,7 +2356,9 @@ class KISApi:
                     inferred = _infer_execution_from_holdings(status_result)
                     if inferred is not None:
                         return inferred
-                    time.sleep(check_interval)
+                    pushed = _pause(check_interval)
+                    if pushed is not None:
+                        return pushed
                     continue
 
                 order = max(
@@ -2004,11 +2398,15 @@ class KISApi:
                     logger.info(f"부분 체결 진행: {exec_qty}/{expected_qty}주")
                     last_exec_qty = exec_qty
                 
-                time.sleep(check_interval)
+                pushed = _pause(check_interval)
+                if pushed is not None:
+                    return pushed
                 
             except KISApiError as e:
                 logger.warning(f"체결 확인 중 오류: {e}")
-                time.sleep(check_interval)
+                pushed = _pause(check_interval)
+                if pushed is not None:
+                    return pushed
         
         # 타임아웃 - 미체결분 취소 시도
         logger.warning(
@@ -2175,7 +2573,9 @@ class KISApi:
         logger.info(f"주문 취소 요청: 주문번호={order_no}")
         
         try:
-            response = self._request_with_retry("POST", url, headers, json_data=body)
+            response = self._request_with_retry(
+                "POST", url, headers, json_data=body, lane=RATE_LANE_ORDER
+            )
             data = response.json()
             
             success = data.get("rt_cd") == "0"
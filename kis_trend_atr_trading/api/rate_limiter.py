@@ -0,0 +1,162 @@
+"""
+KIS Trend-ATR Trading System - KIS REST 호출 Rate Limiter
+
+프로세스 내 모든 KISApi 인스턴스/스레드가 공유하는 토큰 버킷입니다.
+(메인 루프, RiskSnapshotThread, DailyRefreshThread, MarketRegimeRefreshThread 등)
+
+★ 우선순위 lane:
+    - order   : 주문/취소/주문조회 (최우선)
+    - default : 시세/잔고 등 일반 조회
+    - bulk    : 일봉/랭킹 등 대량 조회
+    상위 lane 대기자가 있으면 하위 lane 은 토큰을 가져가지 못하므로
+    주문은 대량 조회 뒤에 줄서지 않습니다.
+
+★ metrics(): lane 별 대기시간 히스토그램 (건수/합계/최대/구간별 건수)
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+RATE_LANE_ORDER = "order"
+RATE_LANE_DEFAULT = "default"
+RATE_LANE_BULK = "bulk"
+
+# 앞쪽일수록 우선순위가 높음
+RATE_LANES: Tuple[str, ...] = (RATE_LANE_ORDER, RATE_LANE_DEFAULT, RATE_LANE_BULK)
+
+# 대기시간 히스토그램 구간 상한 (ms)
+WAIT_BUCKETS_MS: Tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+class _WaitHistogram:
+    """lane 별 대기시간 누적 히스토그램"""
+
+    __slots__ = ("count", "total_ms", "max_ms", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def observe(self, wait_ms: float) -> None:
+        self.count += 1
+        self.total_ms += wait_ms
+        self.max_ms = max(self.max_ms, wait_ms)
+        for idx, bound in enumerate(WAIT_BUCKETS_MS):
+            if wait_ms <= bound:
+                self.buckets[idx] += 1
+                return
+        self.buckets[-1] += 1
+
+    def snapshot(self) -> Dict[str, object]:
+        labels = [f"le_{bound:g}ms" for bound in WAIT_BUCKETS_MS] + ["gt_max"]
+        return {
+            "count": int(self.count),
+            "total_wait_ms": round(self.total_ms, 3),
+            "avg_wait_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_wait_ms": round(self.max_ms, 3),
+            "buckets": dict(zip(labels, self.buckets)),
+        }
+
+
+class TokenBucketRateLimiter:
+    """
+    스레드 안전 토큰 버킷 (우선순위 lane 지원)
+
+    사용 예시:
+        limiter = TokenBucketRateLimiter(rate_per_sec=10, burst=1)
+        limiter.acquire(RATE_LANE_ORDER)
+    """
+
+    def __init__(
+        self,
+        rate_per_sec: float,
+        burst: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            rate_per_sec: 초당 토큰 보충 수
+            burst: 버킷 최대 토큰 수 (순간 허용 호출 수)
+            clock: 단조 시계 (테스트 주입용)
+        """
+        self.rate_per_sec = max(float(rate_per_sec), 1e-6)
+        self.burst = max(float(burst), 1.0)
+        self._clock = clock
+        self._cond = threading.Condition(threading.Lock())
+        self._tokens = self.burst
+        self._updated_at = clock()
+        self._waiting: Dict[str, int] = {lane: 0 for lane in RATE_LANES}
+        self._histograms: Dict[str, _WaitHistogram] = {lane: _WaitHistogram() for lane in RATE_LANES}
+
+    @staticmethod
+    def _normalize_lane(lane: Optional[str]) -> str:
+        return lane if lane in RATE_LANES else RATE_LANE_DEFAULT
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate_per_sec)
+        self._updated_at = now
+
+    def _has_higher_priority_waiter(self, lane: str) -> bool:
+        for other in RATE_LANES:
+            if other == lane:
+                return False
+            if self._waiting[other] > 0:
+                return True
+        return False
+
+    def acquire(self, lane: str = RATE_LANE_DEFAULT) -> float:
+        """
+        토큰 1개를 얻을 때까지 대기합니다.
+
+        Returns:
+            float: 대기 시간(초)
+        """
+        lane = self._normalize_lane(lane)
+        with self._cond:
+            started = self._clock()
+            self._waiting[lane] += 1
+            try:
+                while True:
+                    now = self._clock()
+                    self._refill(now)
+                    if not self._has_higher_priority_waiter(lane) and self._tokens >= 1.0:
+                        self._tokens -= 1.0
+                        break
+                    if self._tokens >= 1.0:
+                        # 상위 lane 대기자에게 양보 (토큰 소비 시 notify 로 깨어남)
+                        self._cond.wait(timeout=1.0 / self.rate_per_sec)
+                    else:
+                        self._cond.wait(timeout=(1.0 - self._tokens) / self.rate_per_sec)
+            finally:
+                self._waiting[lane] -= 1
+                self._cond.notify_all()
+            waited = max(self._clock() - started, 0.0)
+            self._histograms[lane].observe(waited * 1000.0)
+        return waited
+
+    def metrics(self) -> Dict[str, object]:
+        with self._cond:
+            return {
+                "rate_per_sec": float(self.rate_per_sec),
+                "burst": float(self.burst),
+                "waiting": dict(self._waiting),
+                "lanes": {lane: hist.snapshot() for lane, hist in self._histograms.items()},
+            }
+
+
+_shared_lock = threading.Lock()
+_shared_limiter: Optional[TokenBucketRateLimiter] = None
+
+
+def get_shared_rate_limiter(rate_per_sec: float, burst: float = 1.0) -> TokenBucketRateLimiter:
+    """프로세스 공용 limiter 를 반환합니다 (최초 호출 시 설정값으로 생성)."""
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = TokenBucketRateLimiter(rate_per_sec=rate_per_sec, burst=burst)
+        return _shared_limiter
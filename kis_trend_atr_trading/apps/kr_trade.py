@@ -21,6 +21,7 @@ from adapters.kis_rest.market_data import KISRestMarketDataProvider
 from adapters.kis_ws.market_data import KISWSMarketDataProvider
 from api.kis_api import KISApi
 from config import settings
+from core.intraday_session import DEFAULT_OPENING_RANGE_BARS, DEFAULT_RECENT_CLOSE_WINDOW
 from engine.multiday_executor import MultidayExecutor
 from engine.strategy_pipeline_persistence import (
     PipelinePersistenceThread,
@@ -73,7 +74,19 @@ def run_trade_app(args: argparse.Namespace) -> int:
 
     ws_provider = None
     if feed == "ws":
-        ws_provider = KISWSMarketDataProvider(rest_fallback_provider=rest_provider)
+        ws_provider = KISWSMarketDataProvider(
+            rest_fallback_provider=rest_provider,
+            tick_dispatch_workers=int(getattr(settings, "WS_TICK_DISPATCH_WORKERS", 1)),
+            tick_dispatch_max_pending_bars=int(getattr(settings, "WS_TICK_DISPATCH_MAX_PENDING_BARS", 8)),
+            session_opening_range_bars=max(
+                DEFAULT_OPENING_RANGE_BARS,
+                int(getattr(settings, "ORB_OPENING_RANGE_MINUTES", 5) or 5),
+            ),
+            session_recent_close_window=max(
+                DEFAULT_RECENT_CLOSE_WINDOW,
+                int(getattr(settings, "ORB_RECENT_BREAKOUT_LOOKBACK_BARS", 3) or 3),
+            ),
+        )
         provider = ws_provider
 
     logger.info(
@@ -1,4 +1,5 @@
 # backtest 패키지 초기화
 from .backtester import Backtester, BacktestResult
+from .portfolio_backtester import PortfolioBacktester, PortfolioBacktestResult
 
-__all__ = ['Backtester', 'BacktestResult']
+__all__ = ['Backtester', 'BacktestResult', 'PortfolioBacktester', 'PortfolioBacktestResult']
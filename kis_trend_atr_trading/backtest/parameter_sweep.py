@@ -0,0 +1,549 @@
+"""
+KIS Trend-ATR Trading System - 파라미터 스윕 / 워크포워드 최적화
+
+PortfolioBacktester 를 파라미터 그리드(또는 랜덤 탐색) 전체에 대해 실행하고
+Sharpe / MDD / Profit Factor 기준 순위표를 만듭니다.
+
+★ 구조:
+    - 지표(ATR/MA/ADX)는 (종목, atr_period, ma_period) 조합마다 1회만 계산
+    - 계산된 지표 프레임은 워커 프로세스 시작 시 1회 전달 (작업마다 pickle 하지 않음)
+    - 작업(윈도우 × 구간 × 파라미터)은 ProcessPoolExecutor 로 전 코어에 분산
+    - 완료된 작업은 체크포인트 JSONL 에 한 줄씩 추가 → 중단 후 재실행 시 이어서 진행
+      (작업 키 = 윈도우/구간/기간/입력 데이터 지문/파라미터)
+
+★ 워크포워드:
+    - 각 윈도우의 in-sample(IS) 구간에서 전체 파라미터를 평가
+    - IS Sharpe 1위 파라미터를 out-of-sample(OOS) 구간에서 검증
+    - 지표는 전체 기간으로 계산 후 구간을 자르므로 OOS 시작 시점에도 워밍업된 값 사용
+      (잘린 앞부분 봉 수를 워밍업 오프셋으로 넘겨 구간 첫 봉부터 거래 대상)
+"""
+
+import hashlib
+import itertools
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+
+from backtest.portfolio_backtester import ATR_SPIKE_AVG_COLUMN, PortfolioBacktester
+from config import settings
+from report.performance import calculate_sharpe_ratio
+from strategy.trend_atr import TrendATRStrategy
+from utils.logger import get_logger
+
+logger = get_logger("parameter_sweep")
+
+PHASE_FULL = "FULL"
+PHASE_IN_SAMPLE = "IS"
+PHASE_OUT_OF_SAMPLE = "OOS"
+
+
+@dataclass(frozen=True)
+class SweepParams:
+    """
+    스윕 대상 파라미터 1세트
+
+    Attributes:
+        atr_period: ATR 계산 기간
+        ma_period: 추세 판단용 이동평균 기간
+        atr_multiplier_sl: 손절 ATR 배수
+        atr_multiplier_tp: 익절 ATR 배수
+        adx_threshold: ADX 진입 임계값 (settings.ADX_THRESHOLD)
+        atr_spike_threshold: ATR 급등 배수 (settings.ATR_SPIKE_THRESHOLD)
+    """
+    atr_period: int
+    ma_period: int
+    atr_multiplier_sl: float
+    atr_multiplier_tp: float
+    adx_threshold: float
+    atr_spike_threshold: float
+
+    @classmethod
+    def from_settings(cls, **overrides: Any) -> "SweepParams":
+        values = {
+            "atr_period": settings.ATR_PERIOD,
+            "ma_period": settings.TREND_MA_PERIOD,
+            "atr_multiplier_sl": settings.ATR_MULTIPLIER_SL,
+            "atr_multiplier_tp": settings.ATR_MULTIPLIER_TP,
+            "adx_threshold": settings.ADX_THRESHOLD,
+            "atr_spike_threshold": settings.ATR_SPIKE_THRESHOLD,
+        }
+        values.update(overrides)
+        return cls(
+            atr_period=int(values["atr_period"]),
+            ma_period=int(values["ma_period"]),
+            atr_multiplier_sl=float(values["atr_multiplier_sl"]),
+            atr_multiplier_tp=float(values["atr_multiplier_tp"]),
+            adx_threshold=float(values["adx_threshold"]),
+            atr_spike_threshold=float(values["atr_spike_threshold"]),
+        )
+
+    @property
+    def indicator_key(self) -> Tuple[int, int]:
+        return (self.atr_period, self.ma_period)
+
+    def key(self) -> str:
+        return ",".join(f"{item.name}={getattr(self, item.name)}" for item in fields(self))
+
+
+@dataclass(frozen=True)
+class WalkForwardWindow:
+    """워크포워드 윈도우 (날짜는 YYYY-MM-DD, 양끝 포함)"""
+    index: int
+    train_start: str
+    train_end: str
+    test_start: str
+    test_end: str
+
+
+@dataclass(frozen=True)
+class SweepTask:
+    """
+    스윕 작업 1건
+
+    data_fingerprint 는 입력 데이터/실행 설정 지문으로, 같은 체크포인트 파일을
+    다른 데이터나 기간으로 재사용해도 이전 결과를 잘못 이어 쓰지 않도록 키에 포함합니다.
+    """
+    window: int
+    phase: str
+    start: Optional[str]
+    end: Optional[str]
+    params: SweepParams
+    data_fingerprint: str = ""
+
+    def key(self) -> str:
+        return (
+            f"{self.window}|{self.phase}|{self.start or ''}|{self.end or ''}|"
+            f"{self.data_fingerprint}|{self.params.key()}"
+        )
+
+
+# ════════════════════════════════════════════════════════════════
+# 파라미터 공간
+# ════════════════════════════════════════════════════════════════
+
+def build_parameter_grid(space: Mapping[str, Sequence[Any]]) -> List[SweepParams]:
+    """
+    파라미터 그리드(데카르트 곱)를 생성합니다.
+
+    Args:
+        space: {SweepParams 필드명: 후보값 목록}, 누락 필드는 설정 파일 값 사용
+
+    Returns:
+        List[SweepParams]: 중복 제거된 파라미터 목록
+    """
+    _validate_space(space)
+    names = list(space.keys())
+    grid: Dict[str, SweepParams] = {}
+    for values in itertools.product(*(list(space[name]) for name in names)):
+        params = SweepParams.from_settings(**dict(zip(names, values)))
+        grid.setdefault(params.key(), params)
+    return list(grid.values())
+
+
+def sample_random_parameters(
+    space: Mapping[str, Sequence[Any]],
+    n_samples: int,
+    seed: Optional[int] = None,
+) -> List[SweepParams]:
+    """파라미터 공간에서 n_samples 개를 랜덤 샘플링합니다 (중복 제외)."""
+    _validate_space(space)
+    rng = random.Random(seed)
+    names = list(space.keys())
+    total = int(np.prod([len(space[name]) for name in names])) if names else 1
+    target = min(max(int(n_samples), 0), total)
+    sampled: Dict[str, SweepParams] = {}
+    while len(sampled) < target:
+        params = SweepParams.from_settings(
+            **{name: rng.choice(list(space[name])) for name in names}
+        )
+        sampled.setdefault(params.key(), params)
+    return list(sampled.values())
+
+
+def _validate_space(space: Mapping[str, Sequence[Any]]) -> None:
+    allowed = {item.name for item in fields(SweepParams)}
+    unknown = set(space) - allowed
+    if unknown:
+        raise ValueError(f"알 수 없는 스윕 파라미터: {sorted(unknown)}")
+    empty = [name for name, values in space.items() if len(list(values)) == 0]
+    if empty:
+        raise ValueError(f"후보값이 비어 있는 스윕 파라미터: {empty}")
+
+
+def build_walk_forward_windows(
+    dates: Iterable[Any],
+    train_days: int,
+    test_days: int,
+    step_days: Optional[int] = None,
+) -> List[WalkForwardWindow]:
+    """
+    거래일 목록으로 워크포워드 윈도우를 생성합니다.
+
+    Args:
+        dates: 거래일 목록 (정렬 불필요, 중복 허용)
+        train_days: in-sample 거래일 수
+        test_days: out-of-sample 거래일 수
+        step_days: 윈도우 이동 거래일 수 (기본: test_days)
+
+    Returns:
+        List[WalkForwardWindow]: 윈도우 목록
+    """
+    labels = sorted({pd.Timestamp(value).strftime("%Y-%m-%d") for value in dates})
+    train_days = int(train_days)
+    test_days = int(test_days)
+    step = int(step_days or test_days)
+    if train_days <= 0 or test_days <= 0 or step <= 0:
+        raise ValueError("train_days/test_days/step_days 는 1 이상이어야 합니다.")
+
+    windows: List[WalkForwardWindow] = []
+    start = 0
+    while start + train_days + test_days <= len(labels):
+        windows.append(
+            WalkForwardWindow(
+                index=len(windows),
+                train_start=labels[start],
+                train_end=labels[start + train_days - 1],
+                test_start=labels[start + train_days],
+                test_end=labels[start + train_days + test_days - 1],
+            )
+        )
+        start += step
+    return windows
+
+
+# ════════════════════════════════════════════════════════════════
+# 워커 프로세스
+# ════════════════════════════════════════════════════════════════
+
+_WORKER_INDICATORS: Dict[Tuple[int, int], Dict[str, pd.DataFrame]] = {}
+_WORKER_CONFIG: Dict[str, Any] = {}
+
+
+def _init_sweep_worker(
+    indicators: Dict[Tuple[int, int], Dict[str, pd.DataFrame]],
+    config: Dict[str, Any],
+) -> None:
+    global _WORKER_INDICATORS, _WORKER_CONFIG
+    _WORKER_INDICATORS = indicators
+    _WORKER_CONFIG = config
+
+
+def _slice_frames(
+    frames: Mapping[str, pd.DataFrame],
+    start: Optional[str],
+    end: Optional[str],
+) -> Tuple[Dict[str, pd.DataFrame], Dict[str, int]]:
+    """구간 [start, end] 로 자른 프레임과 종목별 잘린 앞부분 봉 수(워밍업 오프셋)를 반환합니다."""
+    if start is None and end is None:
+        return dict(frames), {}
+    sliced: Dict[str, pd.DataFrame] = {}
+    offsets: Dict[str, int] = {}
+    for code, frame in frames.items():
+        stamps = pd.to_datetime(frame["date"])
+        mask = np.ones(len(frame), dtype=bool)
+        if start is not None:
+            before = (stamps < pd.Timestamp(start)).to_numpy()
+            mask &= ~before
+            offsets[code] = int(before.sum())
+        if end is not None:
+            mask &= (stamps <= pd.Timestamp(end)).to_numpy()
+        if mask.any():
+            sliced[code] = frame.loc[mask].reset_index(drop=True)
+    return sliced, offsets
+
+
+def _profit_factor(trades: Sequence[Any]) -> float:
+    gross_profit = sum(t.pnl for t in trades if t.pnl > 0)
+    gross_loss = abs(sum(t.pnl for t in trades if t.pnl < 0))
+    if gross_loss > 0:
+        return float(gross_profit / gross_loss)
+    return float("inf") if gross_profit > 0 else 0.0
+
+
+def _run_sweep_task(task: SweepTask) -> Dict[str, Any]:
+    """워커에서 작업 1건을 실행하고 체크포인트용 결과 dict 를 반환합니다."""
+    params = task.params
+    frames, warmup_offsets = _slice_frames(
+        _WORKER_INDICATORS[params.indicator_key], task.start, task.end
+    )
+    backtester = PortfolioBacktester(
+        strategy=TrendATRStrategy(
+            atr_period=params.atr_period,
+            ma_period=params.ma_period,
+            atr_multiplier_sl=params.atr_multiplier_sl,
+            atr_multiplier_tp=params.atr_multiplier_tp,
+        ),
+        initial_capital=_WORKER_CONFIG.get("initial_capital"),
+        commission_rate=_WORKER_CONFIG.get("commission_rate"),
+        max_positions=_WORKER_CONFIG.get("max_positions"),
+        adx_threshold=params.adx_threshold,
+        atr_spike_threshold=params.atr_spike_threshold,
+    )
+    result = backtester.run(frames, print_summary=False, warmup_offsets=warmup_offsets)
+
+    equity = np.asarray(result.equity_curve, dtype=float)
+    returns: List[float] = []
+    if len(equity) >= 2:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            daily = equity[1:] / equity[:-1] - 1.0
+        returns = [float(value) for value in daily[np.isfinite(daily)]]
+
+    row: Dict[str, Any] = {
+        "task_key": task.key(),
+        "window": task.window,
+        "phase": task.phase,
+        "start": task.start or result.start_date,
+        "end": task.end or result.end_date,
+    }
+    row.update(asdict(params))
+    row.update(
+        {
+            "sharpe": float(
+                calculate_sharpe_ratio(returns, _WORKER_CONFIG.get("risk_free_rate", 0.02))
+            ),
+            "total_return": float(result.total_return),
+            "max_drawdown": float(result.max_drawdown),
+            "profit_factor": _profit_factor(result.trades),
+            "total_trades": int(result.total_trades),
+            "win_rate": float(result.win_rate),
+        }
+    )
+    return row
+
+
+# ════════════════════════════════════════════════════════════════
+# 스윕 실행기
+# ════════════════════════════════════════════════════════════════
+
+class ParameterSweepRunner:
+    """
+    병렬 파라미터 스윕 / 워크포워드 실행기
+
+    사용 예시:
+        runner = ParameterSweepRunner(frames, checkpoint_path="data/sweep.jsonl")
+        grid = build_parameter_grid({"atr_multiplier_sl": [1.5, 2.0], "ma_period": [20, 50]})
+        table = runner.run(grid)
+    """
+
+    def __init__(
+        self,
+        data: Mapping[str, pd.DataFrame],
+        *,
+        checkpoint_path: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        initial_capital: float = None,
+        commission_rate: float = None,
+        max_positions: int = None,
+        risk_free_rate: float = 0.02,
+    ):
+        """
+        Args:
+            data: {종목코드: OHLCV 프레임}
+            checkpoint_path: 완료 작업 체크포인트(JSONL) 경로, None 이면 메모리만 사용
+            max_workers: 워커 프로세스 수 (기본: CPU 코어 수, 1 이면 현재 프로세스에서 실행)
+            initial_capital: 초기 자본금 (기본: 설정 파일 값)
+            commission_rate: 수수료율 (기본: 설정 파일 값)
+            max_positions: 최대 동시 보유 종목 수 (기본: settings.MAX_POSITIONS)
+            risk_free_rate: Sharpe 계산용 연 무위험 이자율
+        """
+        self.frames = {
+            str(code): frame.sort_values("date").reset_index(drop=True)
+            for code, frame in data.items()
+            if frame is not None and not frame.empty
+        }
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self.max_workers = max(int(max_workers or os.cpu_count() or 1), 1)
+        self.config = {
+            "initial_capital": initial_capital,
+            "commission_rate": commission_rate,
+            "max_positions": max_positions,
+            "risk_free_rate": float(risk_free_rate),
+        }
+        self.data_fingerprint = self._fingerprint()
+        self._completed: Dict[str, Dict[str, Any]] = self._load_checkpoint()
+
+    def _fingerprint(self) -> str:
+        """입력 OHLCV + 실행 설정 지문 (체크포인트 키용, 16자리 hex)"""
+        digest = hashlib.sha256(json.dumps(self.config, sort_keys=True).encode("utf-8"))
+        for code in sorted(self.frames):
+            frame = self.frames[code]
+            digest.update(code.encode("utf-8"))
+            digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+        return digest.hexdigest()[:16]
+
+    # ── 체크포인트 ──
+
+    def _load_checkpoint(self) -> Dict[str, Dict[str, Any]]:
+        completed: Dict[str, Dict[str, Any]] = {}
+        if self.checkpoint_path is None or not self.checkpoint_path.exists():
+            return completed
+        with self.checkpoint_path.open("r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    # 크래시로 잘린 마지막 줄은 무시하고 재실행
+                    logger.warning("스윕 체크포인트 손상 줄 무시")
+                    continue
+                if row.get("task_key"):
+                    completed[str(row["task_key"])] = row
+        if completed:
+            logger.info(f"스윕 체크포인트 복구: 완료 작업 {len(completed)}건 ({self.checkpoint_path})")
+        return completed
+
+    def _append_checkpoint(self, row: Dict[str, Any]) -> None:
+        self._completed[row["task_key"]] = row
+        if self.checkpoint_path is None:
+            return
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.checkpoint_path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    # ── 지표 사전 계산 ──
+
+    def _precompute_indicators(
+        self,
+        params_list: Sequence[SweepParams],
+    ) -> Dict[Tuple[int, int], Dict[str, pd.DataFrame]]:
+        """(atr_period, ma_period) 조합마다 종목별 지표를 1회 계산합니다."""
+        indicators: Dict[Tuple[int, int], Dict[str, pd.DataFrame]] = {}
+        for atr_period, ma_period in sorted({params.indicator_key for params in params_list}):
+            strategy = TrendATRStrategy(atr_period=atr_period, ma_period=ma_period)
+            frames: Dict[str, pd.DataFrame] = {}
+            for code, frame in self.frames.items():
+                ind = strategy.add_indicators(frame)
+                # 구간을 잘라도 ATR 급등 평균이 전체 기간 기준과 같도록 미리 계산
+                ind[ATR_SPIKE_AVG_COLUMN] = PortfolioBacktester.atr_spike_average(ind["atr"], atr_period)
+                frames[code] = ind
+            indicators[(atr_period, ma_period)] = frames
+        return indicators
+
+    # ── 실행 ──
+
+    def _execute(
+        self,
+        tasks: Sequence[SweepTask],
+        indicators: Dict[Tuple[int, int], Dict[str, pd.DataFrame]],
+    ) -> None:
+        pending = [task for task in tasks if task.key() not in self._completed]
+        skipped = len(tasks) - len(pending)
+        if skipped:
+            logger.info(f"체크포인트 완료 작업 {skipped}건 건너뜀")
+        if not pending:
+            return
+
+        if self.max_workers <= 1:
+            _init_sweep_worker(indicators, self.config)
+            for task in pending:
+                self._append_checkpoint(_run_sweep_task(task))
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.max_workers, len(pending)),
+            initializer=_init_sweep_worker,
+            initargs=(indicators, self.config),
+        ) as pool:
+            futures = {pool.submit(_run_sweep_task, task): task for task in pending}
+            for done, future in enumerate(as_completed(futures), start=1):
+                self._append_checkpoint(future.result())
+                if done % 50 == 0 or done == len(futures):
+                    logger.info(f"스윕 진행: {done}/{len(futures)}")
+
+    def run(
+        self,
+        params_list: Sequence[SweepParams],
+        windows: Optional[Sequence[WalkForwardWindow]] = None,
+        output_path: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        스윕을 실행하고 순위표를 반환합니다.
+
+        Args:
+            params_list: 평가할 파라미터 목록
+            windows: 워크포워드 윈도우 (None 이면 전체 기간 1회 평가)
+            output_path: 순위표 CSV 저장 경로
+
+        Returns:
+            pd.DataFrame: Sharpe 내림차순 순위표 (워크포워드는 IS/OOS 행 포함)
+        """
+        params_list = list(params_list)
+        if not params_list or not self.frames:
+            return pd.DataFrame()
+
+        indicators = self._precompute_indicators(params_list)
+        if windows:
+            tasks = [
+                SweepTask(
+                    window.index,
+                    PHASE_IN_SAMPLE,
+                    window.train_start,
+                    window.train_end,
+                    params,
+                    self.data_fingerprint,
+                )
+                for window in windows
+                for params in params_list
+            ]
+        else:
+            tasks = [
+                SweepTask(-1, PHASE_FULL, None, None, params, self.data_fingerprint)
+                for params in params_list
+            ]
+        logger.info(
+            f"파라미터 스윕 시작: 파라미터 {len(params_list)}개, 작업 {len(tasks)}건, "
+            f"워커 {self.max_workers}개"
+        )
+        self._execute(tasks, indicators)
+
+        rows = [self._completed[task.key()] for task in tasks]
+        if windows:
+            oos_tasks = []
+            for window in windows:
+                window_rows = [row for row in rows if row["window"] == window.index]
+                best = max(window_rows, key=lambda row: (row["sharpe"], row["total_return"]))
+                best_params = SweepParams.from_settings(
+                    **{item.name: best[item.name] for item in fields(SweepParams)}
+                )
+                oos_tasks.append(
+                    SweepTask(
+                        window.index,
+                        PHASE_OUT_OF_SAMPLE,
+                        window.test_start,
+                        window.test_end,
+                        best_params,
+                        self.data_fingerprint,
+                    )
+                )
+            self._execute(oos_tasks, indicators)
+            rows.extend(self._completed[task.key()] for task in oos_tasks)
+
+        table = self._rank(rows)
+        if output_path:
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            table.to_csv(output_path, index=False)
+            logger.info(f"스윕 순위표 저장: {output_path} ({len(table)}행)")
+        return table
+
+    @staticmethod
+    def _rank(rows: Sequence[Dict[str, Any]]) -> pd.DataFrame:
+        table = pd.DataFrame(list(rows)).drop(columns=["task_key"], errors="ignore")
+        if table.empty:
+            return table
+        table = table.sort_values(
+            ["window", "phase", "sharpe", "total_return", "max_drawdown"],
+            ascending=[True, True, False, False, True],
+            kind="stable",
+        ).reset_index(drop=True)
+        table.insert(0, "rank", table.groupby(["window", "phase"]).cumcount() + 1)
+        return table
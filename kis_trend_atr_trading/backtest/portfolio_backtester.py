@@ -0,0 +1,498 @@
+"""
+KIS Trend-ATR Trading System - 멀티 종목 포트폴리오 백테스트 모듈
+
+여러 종목의 OHLCV 패널을 한 번에 받아 NumPy 배열로 진입/청산 조건을 계산하고,
+하나의 자본 풀과 최대 보유 종목 수(max_positions) 제한 아래에서 시뮬레이션합니다.
+
+★ 단일 종목 Backtester.run 과 동일한 규칙:
+    - 진입: 종가 > MA, 고가 > 직전 고가, ADX >= 임계값, ATR 급등 아님
+    - 진입가: 직전 캔들 고가 / 손절: max(ATR 손절, 최대손실 손절) / 익절: ATR 익절
+    - 청산 봉에서는 신규 진입하지 않음, 종료 시 미청산 포지션은 마지막 종가로 청산
+    - 종목 1개 + max_positions=1 이면 BacktestResult 가 단일 종목 결과와 일치
+
+★ 포트폴리오 규칙:
+    - 같은 날 진입 후보가 남은 슬롯보다 많으면 ADX 내림차순(동률은 종목 순서)으로 배정
+    - 종목당 배정 자금 = 현금 / 남은 슬롯 수
+"""
+
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Mapping, Optional, Union
+import numpy as np
+import pandas as pd
+
+from backtest.backtester import Backtester, BacktestResult, Trade
+from config import settings
+from strategy.trend_atr import TrendATRStrategy
+from utils.logger import get_logger
+
+logger = get_logger("portfolio_backtester")
+
+PanelInput = Union[Mapping[str, pd.DataFrame], pd.DataFrame]
+
+# 사전 계산 프레임에 담아 전달할 수 있는 ATR 급등 평균 컬럼 (없으면 프레임에서 계산)
+ATR_SPIKE_AVG_COLUMN = "atr_spike_avg"
+
+
+@dataclass
+class PortfolioTrade(Trade):
+    """포트폴리오 백테스트 개별 거래 기록 (종목 코드 포함)"""
+    stock_code: str = ""
+
+
+@dataclass
+class PortfolioBacktestResult(BacktestResult):
+    """
+    포트폴리오 백테스트 결과
+
+    Attributes:
+        symbols: 백테스트 대상 종목 목록
+        max_positions: 최대 동시 보유 종목 수
+        max_concurrent_positions: 실제 최대 동시 보유 종목 수
+        equity_dates: equity_curve[1:] 에 대응하는 날짜
+    """
+    symbols: List[str] = field(default_factory=list)
+    max_positions: int = 0
+    max_concurrent_positions: int = 0
+    equity_dates: List[str] = field(default_factory=list)
+
+
+@dataclass
+class _PanelArrays:
+    """날짜(T) × 종목(N) 정렬 배열"""
+    symbols: List[str]
+    dates: pd.DatetimeIndex
+    date_labels: List[str]
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    atr: np.ndarray
+    adx: np.ndarray
+    prev_high: np.ndarray
+    tradable: np.ndarray
+    entry_signal: np.ndarray
+    bar_index: np.ndarray
+    raw_dates: List[np.ndarray]
+    last_t: np.ndarray
+    start_t: int
+
+
+class PortfolioBacktester(Backtester):
+    """
+    벡터화 멀티 종목 백테스터
+
+    Attributes:
+        strategy: Trend-ATR 전략 (지표/배수 설정)
+        initial_capital: 초기 자본금 (전 종목 공유)
+        commission_rate: 수수료율
+        max_positions: 최대 동시 보유 종목 수
+    """
+
+    REQUIRED_INDICATOR_COLUMNS = frozenset({"atr", "ma", "adx", "prev_high"})
+
+    def __init__(
+        self,
+        strategy: TrendATRStrategy = None,
+        initial_capital: float = None,
+        commission_rate: float = None,
+        max_positions: int = None,
+        adx_threshold: float = None,
+        atr_spike_threshold: float = None,
+        max_loss_pct: float = None,
+    ):
+        """
+        포트폴리오 백테스터 초기화
+
+        Args:
+            strategy: 전략 인스턴스 (미입력 시 자동 생성)
+            initial_capital: 초기 자본금 (기본: 설정 파일 값)
+            commission_rate: 수수료율 (기본: 설정 파일 값)
+            max_positions: 최대 동시 보유 종목 수 (기본: settings.MAX_POSITIONS)
+            adx_threshold: ADX 진입 임계값 (기본: settings.ADX_THRESHOLD)
+            atr_spike_threshold: ATR 급등 배수 (기본: settings.ATR_SPIKE_THRESHOLD)
+            max_loss_pct: 최대 손실 손절 비율 (기본: settings.MAX_LOSS_PCT)
+        """
+        super().__init__(
+            strategy=strategy,
+            initial_capital=initial_capital,
+            commission_rate=commission_rate,
+        )
+        self.max_positions = max(
+            int(max_positions if max_positions is not None else getattr(settings, "MAX_POSITIONS", 1)),
+            1,
+        )
+        self.adx_threshold = float(
+            adx_threshold if adx_threshold is not None else settings.ADX_THRESHOLD
+        )
+        self.atr_spike_threshold = float(
+            atr_spike_threshold if atr_spike_threshold is not None else settings.ATR_SPIKE_THRESHOLD
+        )
+        self.max_loss_pct = float(
+            max_loss_pct if max_loss_pct is not None else settings.MAX_LOSS_PCT
+        )
+
+    # ════════════════════════════════════════════════════════════════
+    # 입력 정규화
+    # ════════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def _split_panel(data: PanelInput) -> Dict[str, pd.DataFrame]:
+        """dict / MultiIndex(종목, 날짜) / stock_code 컬럼 프레임을 종목별 프레임으로 분리"""
+        if isinstance(data, Mapping):
+            return {str(code): frame for code, frame in data.items()}
+        if not isinstance(data, pd.DataFrame) or data.empty:
+            return {}
+        if isinstance(data.index, pd.MultiIndex):
+            frames: Dict[str, pd.DataFrame] = {}
+            for code, frame in data.groupby(level=0, sort=False):
+                frame = frame.droplevel(0)
+                if "date" not in frame.columns:
+                    frame = frame.rename_axis("date").reset_index()
+                frames[str(code)] = frame
+            return frames
+        for column in ("stock_code", "symbol"):
+            if column in data.columns:
+                return {
+                    str(code): frame.drop(columns=[column])
+                    for code, frame in data.groupby(column, sort=False)
+                }
+        raise ValueError("패널 입력은 dict, MultiIndex(종목, 날짜) 또는 stock_code 컬럼이 필요합니다.")
+
+    @staticmethod
+    def atr_spike_average(atr: pd.Series, atr_period: int) -> np.ndarray:
+        """ATR 급등 판단용 직전 (atr_period * 2)개 봉 평균 (앞쪽 워밍업 봉은 NaN)"""
+        min_periods = int(atr_period) * 2
+        avg_atr = (
+            atr.rolling(window=min_periods, min_periods=1)
+            .mean()
+            .shift(1)
+            .to_numpy(dtype=float, copy=True)
+        )
+        avg_atr[: min(min_periods, len(avg_atr))] = np.nan
+        return avg_atr
+
+    def _entry_signal(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Backtester.run 진입 조건을 NumPy 로 한 번에 계산합니다.
+
+        ATR 급등 평균은 직전 (atr_period * 2)개 봉의 NaN 제외 평균을 rolling 으로 계산합니다.
+        """
+        close = df["close"].to_numpy(dtype=float)
+        high = df["high"].to_numpy(dtype=float)
+        atr = df["atr"].to_numpy(dtype=float)
+        ma = df["ma"].to_numpy(dtype=float)
+        prev_high = df["prev_high"].to_numpy(dtype=float)
+        if "adx" in df.columns:
+            adx = df["adx"].to_numpy(dtype=float)
+        else:
+            adx = np.full(len(df), np.nan)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            is_uptrend = close > ma
+            is_breakout = ~np.isnan(prev_high) & (high > prev_high)
+            has_trend_strength = np.isnan(adx) | (adx >= self.adx_threshold)
+
+            # 구간을 잘라낸 사전 계산 프레임은 전체 기간 기준 평균을 함께 전달
+            if ATR_SPIKE_AVG_COLUMN in df.columns:
+                avg_atr = df[ATR_SPIKE_AVG_COLUMN].to_numpy(dtype=float)
+            else:
+                avg_atr = self.atr_spike_average(df["atr"], self.strategy.atr_period)
+            atr_ratio = atr / avg_atr
+            is_atr_spike = (~np.isnan(avg_atr)) & (avg_atr > 0) & (atr_ratio > self.atr_spike_threshold)
+
+        return is_uptrend & is_breakout & has_trend_strength & ~is_atr_spike
+
+    def _build_panel(
+        self,
+        frames: Dict[str, pd.DataFrame],
+        warmup_offsets: Optional[Mapping[str, int]] = None,
+    ) -> Optional[_PanelArrays]:
+        prepared: List[tuple] = []
+        for code, frame in frames.items():
+            if frame is None or frame.empty:
+                continue
+            df = frame.sort_values("date").reset_index(drop=True)
+            # 파라미터 스윕 등에서 미리 계산한 지표 프레임은 재사용
+            if self.REQUIRED_INDICATOR_COLUMNS.issubset(set(df.columns)):
+                ind = df
+            else:
+                ind = self.strategy.add_indicators(df)
+            prepared.append((code, ind, pd.to_datetime(ind["date"]).to_numpy()))
+        if not prepared:
+            return None
+
+        dates = pd.DatetimeIndex(np.unique(np.concatenate([item[2] for item in prepared])))
+        T, N = len(dates), len(prepared)
+        high = np.full((T, N), np.nan)
+        low = np.full((T, N), np.nan)
+        close = np.full((T, N), np.nan)
+        atr = np.full((T, N), np.nan)
+        adx = np.full((T, N), np.nan)
+        prev_high = np.full((T, N), np.nan)
+        tradable = np.zeros((T, N), dtype=bool)
+        entry_signal = np.zeros((T, N), dtype=bool)
+        bar_index = np.full((T, N), -1, dtype=np.int64)
+        last_t = np.zeros(N, dtype=np.int64)
+        raw_dates: List[np.ndarray] = []
+        start_t = T
+
+        for n, (code, ind, stamps) in enumerate(prepared):
+            rows = dates.get_indexer(stamps)
+            # 구간을 잘라낸 사전 계산 프레임: 잘린 앞부분 봉 수만큼 이미 워밍업됨
+            offset = max(int((warmup_offsets or {}).get(code, 0)), 0)
+            first_ready = max(self.strategy.ma_period - offset, 0)
+            raw_dates.append(ind["date"].to_numpy())
+
+            atr_values = ind["atr"].to_numpy(dtype=float)
+            high[rows, n] = ind["high"].to_numpy(dtype=float)
+            low[rows, n] = ind["low"].to_numpy(dtype=float)
+            close[rows, n] = ind["close"].to_numpy(dtype=float)
+            atr[rows, n] = atr_values
+            prev_high[rows, n] = ind["prev_high"].to_numpy(dtype=float)
+            if "adx" in ind.columns:
+                adx[rows, n] = ind["adx"].to_numpy(dtype=float)
+            bar_index[rows, n] = np.arange(len(ind))
+
+            # MA 계산에 필요한 최소 기간 이후 + 유효 ATR 봉만 거래 대상
+            warmed_up = np.arange(len(ind)) >= first_ready
+            with np.errstate(invalid="ignore"):
+                valid_atr = ~np.isnan(atr_values) & (atr_values > 0)
+            tradable[rows, n] = warmed_up & valid_atr
+            entry_signal[rows, n] = warmed_up & valid_atr & self._entry_signal(ind)
+            last_t[n] = rows[-1]
+            if len(ind) > first_ready:
+                start_t = min(start_t, int(rows[first_ready]))
+
+        return _PanelArrays(
+            symbols=[item[0] for item in prepared],
+            dates=dates,
+            date_labels=list(dates.strftime("%Y-%m-%d")),
+            high=high,
+            low=low,
+            close=close,
+            atr=atr,
+            adx=adx,
+            prev_high=prev_high,
+            tradable=tradable,
+            entry_signal=entry_signal,
+            bar_index=bar_index,
+            raw_dates=raw_dates,
+            last_t=last_t,
+            start_t=start_t,
+        )
+
+    # ════════════════════════════════════════════════════════════════
+    # 시뮬레이션
+    # ════════════════════════════════════════════════════════════════
+
+    def run(
+        self,
+        data: PanelInput,
+        stock_code: str = "",
+        print_summary: bool = True,
+        warmup_offsets: Optional[Mapping[str, int]] = None,
+    ) -> PortfolioBacktestResult:
+        """
+        포트폴리오 백테스트를 실행합니다.
+
+        Args:
+            data: {종목코드: OHLCV 프레임} 또는 MultiIndex(종목, 날짜) 프레임
+                  (atr/ma/adx/prev_high 컬럼이 이미 있으면 지표를 재계산하지 않음)
+            stock_code: 로깅용 라벨
+            print_summary: 결과 요약 출력 여부
+            warmup_offsets: {종목코드: 프레임 앞에서 잘려 나간 봉 수}
+                  (전체 기간으로 계산한 지표 프레임을 구간별로 잘라 넘길 때,
+                  그만큼 MA 워밍업 구간이 이미 지난 것으로 봄)
+
+        Returns:
+            PortfolioBacktestResult: 포트폴리오 백테스트 결과
+        """
+        panel = self._build_panel(self._split_panel(data), warmup_offsets)
+        if panel is None:
+            logger.error("데이터가 없어 포트폴리오 백테스트를 실행할 수 없습니다.")
+            return self._wrap_result(self._create_empty_result(), [], 0, [])
+
+        T, N = panel.close.shape
+        logger.info(
+            f"포트폴리오 백테스트 시작: {stock_code or 'PORTFOLIO'}, "
+            f"종목 {N}개 × {T}일, max_positions={self.max_positions}"
+        )
+
+        cash = float(self.initial_capital)
+        held = np.zeros(N, dtype=bool)
+        quantity = np.zeros(N, dtype=np.int64)
+        entry_price = np.zeros(N)
+        stop_loss = np.zeros(N)
+        take_profit = np.zeros(N)
+        entry_commission = np.zeros(N)
+        entry_bar = np.zeros(N, dtype=np.int64)
+        entry_label: List[str] = [""] * N
+        mark = np.zeros(N)
+        trades: List[PortfolioTrade] = []
+        equity_curve: List[float] = [cash]
+        equity_dates: List[str] = []
+        max_concurrent = 0
+
+        for t in range(panel.start_t, T):
+            tradable = panel.tradable[t]
+            held_at_open = held.copy()
+
+            # ── 청산: 손절 우선, 그다음 익절 ──
+            if held_at_open.any():
+                check = held_at_open & tradable
+                hit_sl = check & (panel.low[t] <= stop_loss)
+                hit_tp = check & ~hit_sl & (panel.high[t] >= take_profit)
+                for n in np.flatnonzero(hit_sl | hit_tp):
+                    is_sl = bool(hit_sl[n])
+                    exit_price = float(stop_loss[n] if is_sl else take_profit[n])
+                    cash += self._close_position(
+                        trades,
+                        panel=panel,
+                        n=n,
+                        exit_price=exit_price,
+                        exit_bar=int(panel.bar_index[t, n]),
+                        quantity=int(quantity[n]),
+                        entry_price=float(entry_price[n]),
+                        entry_commission=float(entry_commission[n]),
+                        entry_bar=int(entry_bar[n]),
+                        entry_label=entry_label[n],
+                        exit_reason="손절" if is_sl else "익절",
+                    )
+                    held[n] = False
+
+            mark = np.where(tradable, panel.close[t], mark)
+
+            # ── 진입: 봉 시작 시 미보유 종목만 ──
+            candidates = panel.entry_signal[t] & ~held_at_open
+            free_slots = max(self.max_positions - int(held.sum()), 0)
+            if free_slots > 0 and candidates.any():
+                idx = np.flatnonzero(candidates)
+                rank_key = np.nan_to_num(panel.adx[t, idx], nan=-np.inf)
+                for n in idx[np.argsort(-rank_key, kind="stable")]:
+                    if free_slots <= 0:
+                        break
+                    price = float(panel.prev_high[t, n])
+                    qty = self._calculate_position_size(price, cash / free_slots)
+                    if qty <= 0:
+                        continue
+                    atr = float(panel.atr[t, n])
+                    atr_stop_loss = price - (atr * self.strategy.atr_multiplier_sl)
+                    max_loss_stop = price * (1 - self.max_loss_pct / 100)
+                    commission = self._calculate_commission(price, qty)
+
+                    held[n] = True
+                    quantity[n] = qty
+                    entry_price[n] = price
+                    stop_loss[n] = max(atr_stop_loss, max_loss_stop)
+                    take_profit[n] = price + (atr * self.strategy.atr_multiplier_tp)
+                    entry_commission[n] = commission
+                    entry_bar[n] = panel.bar_index[t, n]
+                    entry_label[n] = self._bar_label(panel, n, int(panel.bar_index[t, n]))
+                    mark[n] = panel.close[t, n]
+                    cash -= price * qty + commission
+                    free_slots -= 1
+
+            held_count = int(held.sum())
+            max_concurrent = max(max_concurrent, held_count)
+            equity_curve.append(
+                cash + float(np.dot(quantity[held], mark[held])) if held_count else cash
+            )
+            equity_dates.append(panel.date_labels[t])
+
+        # ── 백테스트 종료: 미청산 포지션은 종목별 마지막 종가로 청산 ──
+        for n in np.flatnonzero(held):
+            last_t = int(panel.last_t[n])
+            cash += self._close_position(
+                trades,
+                panel=panel,
+                n=n,
+                exit_price=float(panel.close[last_t, n]),
+                exit_bar=int(panel.bar_index[last_t, n]),
+                quantity=int(quantity[n]),
+                entry_price=float(entry_price[n]),
+                entry_commission=float(entry_commission[n]),
+                entry_bar=int(entry_bar[n]),
+                entry_label=entry_label[n],
+                exit_reason="백테스트 종료",
+            )
+
+        result = self._calculate_results(
+            trades=trades,
+            equity_curve=equity_curve,
+            df=pd.DataFrame({"date": [self._date_label(panel, 0), self._date_label(panel, T - 1)]}),
+        )
+        wrapped = self._wrap_result(result, panel.symbols, max_concurrent, equity_dates)
+        if print_summary:
+            self._print_summary(wrapped)
+        return wrapped
+
+    @staticmethod
+    def _bar_label(panel: _PanelArrays, n: int, bar: int) -> str:
+        """원본 date 값 기준 라벨 (Backtester 와 동일하게 str(date)[:10])"""
+        value = panel.raw_dates[n][bar]
+        if isinstance(value, np.datetime64):
+            value = pd.Timestamp(value)
+        return str(value)[:10]
+
+    @classmethod
+    def _date_label(cls, panel: _PanelArrays, t: int) -> str:
+        for n in np.flatnonzero(panel.bar_index[t] >= 0):
+            return cls._bar_label(panel, int(n), int(panel.bar_index[t, n]))
+        return panel.date_labels[t]
+
+    def _close_position(
+        self,
+        trades: List[PortfolioTrade],
+        *,
+        panel: _PanelArrays,
+        n: int,
+        exit_price: float,
+        exit_bar: int,
+        quantity: int,
+        entry_price: float,
+        entry_commission: float,
+        entry_bar: int,
+        entry_label: str,
+        exit_reason: str,
+    ) -> float:
+        """거래 기록을 추가하고 현금 증가분(매도금액 - 수수료)을 반환합니다."""
+        sell_commission = self._calculate_commission(exit_price, quantity)
+        gross_pnl = (exit_price - entry_price) * quantity
+        trades.append(
+            PortfolioTrade(
+                entry_date=entry_label,
+                exit_date=self._bar_label(panel, n, exit_bar),
+                entry_price=entry_price,
+                exit_price=exit_price,
+                quantity=quantity,
+                pnl=gross_pnl - entry_commission - sell_commission,
+                pnl_pct=(exit_price - entry_price) / entry_price * 100,
+                holding_days=exit_bar - entry_bar,
+                exit_reason=exit_reason,
+                stock_code=panel.symbols[n],
+            )
+        )
+        return exit_price * quantity - sell_commission
+
+    def _wrap_result(
+        self,
+        result: BacktestResult,
+        symbols: List[str],
+        max_concurrent: int,
+        equity_dates: List[str],
+    ) -> PortfolioBacktestResult:
+        values = {item.name: getattr(result, item.name) for item in fields(BacktestResult)}
+        return PortfolioBacktestResult(
+            **values,
+            symbols=list(symbols),
+            max_positions=self.max_positions,
+            max_concurrent_positions=int(max_concurrent),
+            equity_dates=list(equity_dates),
+        )
+
+    def get_trade_details(self, result: BacktestResult) -> pd.DataFrame:
+        """개별 거래 상세 내역 (종목코드 컬럼 포함)"""
+        details = super().get_trade_details(result)
+        if details.empty:
+            return details
+        details.insert(0, "종목코드", [getattr(t, "stock_code", "") for t in result.trades])
+        return details
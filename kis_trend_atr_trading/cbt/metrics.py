@@ -21,8 +21,11 @@ from datetime import datetime
 from typing import Dict, List, Optional
 from dataclasses import dataclass, asdict
 
+import numpy as np
+
 from .trade_store import Trade, TradeStore
 from .virtual_account import VirtualAccount, EquitySnapshot
+from performance.drawdown import max_drawdown
 from utils.logger import get_logger
 from utils.market_hours import KST
 
@@ -279,33 +282,17 @@ class CBTMetrics:
         Maximum Drawdown 계산
         
         Equity Curve에서 고점 대비 최대 하락폭을 계산합니다.
+        스냅샷마다 갱신되는 계좌의 러닝 상태를 읽으므로 O(1) 입니다.
         
         Returns:
             tuple: (최대 낙폭 금액, 최대 낙폭 %)
         """
-        equity_curve = self.account.get_equity_curve()
+        state = self.account.get_drawdown_state()
         
-        if len(equity_curve) < 2:
+        if state.count < 2:
             return 0.0, 0.0
         
-        peak = equity_curve[0]["total_equity"]
-        max_dd = 0.0
-        max_dd_pct = 0.0
-        
-        for snapshot in equity_curve:
-            equity = snapshot["total_equity"]
-            
-            if equity > peak:
-                peak = equity
-            
-            dd = peak - equity
-            dd_pct = (dd / peak) * 100 if peak > 0 else 0
-            
-            if dd > max_dd:
-                max_dd = dd
-                max_dd_pct = dd_pct
-        
-        return max_dd, max_dd_pct
+        return state.mdd, state.mdd_percent
     
     def calculate_max_drawdown_from_trades(self) -> tuple:
         """
@@ -324,26 +311,11 @@ class CBTMetrics:
         # 거래를 시간순으로 정렬
         sorted_trades = sorted(trades, key=lambda t: t.exit_date)
         
-        initial = self.account.initial_capital
-        equity = initial
-        peak = initial
-        max_dd = 0.0
-        max_dd_pct = 0.0
-        
-        for trade in sorted_trades:
-            equity += trade.pnl
-            
-            if equity > peak:
-                peak = equity
-            
-            dd = peak - equity
-            dd_pct = (dd / peak) * 100 if peak > 0 else 0
-            
-            if dd > max_dd:
-                max_dd = dd
-                max_dd_pct = dd_pct
+        # 초기 자본금에서 시작해 거래 손익을 누적한 곡선
+        pnl = np.array([trade.pnl for trade in sorted_trades], dtype=float)
+        equity = self.account.initial_capital + np.concatenate(([0.0], np.cumsum(pnl)))
         
-        return max_dd, max_dd_pct
+        return max_drawdown(equity)
     
     # ════════════════════════════════════════════════════════════════
     # 기타 지표
@@ -21,6 +21,7 @@ from dataclasses import dataclass, field, asdict
 import threading
 
 from config import settings
+from performance.drawdown import DrawdownState, compute_drawdown
 from utils.logger import get_logger
 from utils.market_hours import KST
 
@@ -64,6 +65,7 @@ class AccountState:
     position: Optional[Dict] = None
     equity_curve: List[Dict] = field(default_factory=list)
     last_updated: str = ""
+    drawdown: Dict = field(default_factory=dict)  # 러닝 고점/MDD 상태
     
     def to_dict(self) -> Dict:
         """딕셔너리로 변환"""
@@ -139,6 +141,7 @@ class VirtualAccount:
         self.losing_trades: int = 0
         self.position: Optional[Position] = None
         self.equity_curve: List[EquitySnapshot] = []
+        self.drawdown = DrawdownState()
         
         # 기존 상태 로드
         if load_existing and self._state_file.exists():
@@ -469,10 +472,15 @@ class VirtualAccount:
         )
         
         self.equity_curve.append(snapshot)
+        self.drawdown.update(total_equity, snapshot.timestamp)
     
     def get_equity_curve(self) -> List[Dict]:
         """Equity Curve 데이터 반환"""
         return [asdict(s) for s in self.equity_curve]
+
+    def get_drawdown_state(self) -> DrawdownState:
+        """전체 기간 러닝 고점/MDD 상태 (저장 시 잘린 Equity Curve 와 무관)"""
+        return self.drawdown
     
     # ════════════════════════════════════════════════════════════════
     # 상태 저장/로드
@@ -490,7 +498,8 @@ class VirtualAccount:
             losing_trades=self.losing_trades,
             position=asdict(self.position) if self.position else None,
             equity_curve=[asdict(s) for s in self.equity_curve[-1000:]],  # 최근 1000개만
-            last_updated=datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S")
+            last_updated=datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S"),
+            drawdown=self.drawdown.to_dict()
         )
         
         with open(self._state_file, "w", encoding="utf-8") as f:
@@ -521,6 +530,14 @@ class VirtualAccount:
             self.equity_curve = [
                 EquitySnapshot(**s) for s in data.get("equity_curve", [])
             ]
+            # MDD 상태 (이전 버전 파일이면 Equity Curve 로 재구성)
+            if data.get("drawdown"):
+                self.drawdown = DrawdownState.from_dict(data["drawdown"])
+            else:
+                self.drawdown = compute_drawdown(
+                    [s.total_equity for s in self.equity_curve],
+                    [s.timestamp for s in self.equity_curve],
+                )
             
             logger.info(
                 f"[CBT] 계좌 상태 로드 완료: "
@@ -543,6 +560,7 @@ class VirtualAccount:
             self.losing_trades = 0
             self.position = None
             self.equity_curve = []
+            self.drawdown = DrawdownState()
             
             # 저장 파일 삭제
             if self._state_file.exists():
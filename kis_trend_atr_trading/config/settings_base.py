@@ -245,6 +245,20 @@ RETRY_DELAY: float = 1.0
 # Rate Limit 대기 시간 (초) - KIS API 초당 20회 제한
 RATE_LIMIT_DELAY: float = 0.1
 
+# 프로세스 공용 토큰 버킷 (기본: RATE_LIMIT_DELAY 간격과 동일한 초당 호출 수)
+# 주문/취소/주문조회는 우선 lane 으로 일봉/랭킹 등 대량 조회보다 먼저 토큰을 배정받습니다.
+RATE_LIMIT_PER_SEC: float = float(os.getenv("RATE_LIMIT_PER_SEC", str(1.0 / RATE_LIMIT_DELAY)))
+RATE_LIMIT_BURST: float = float(os.getenv("RATE_LIMIT_BURST", "1"))
+
+# keep-alive HTTP 세션 풀 (KIS REST / 텔레그램, base URL 별 1개 세션 공유)
+HTTP_POOL_SIZE: int = int(os.getenv("HTTP_POOL_SIZE", "10"))
+# 연결 단계 실패만 재시도 (요청 전송 후에는 재시도하지 않음 → 주문 중복 방지)
+HTTP_POOL_CONNECT_RETRIES: int = int(os.getenv("HTTP_POOL_CONNECT_RETRIES", "1"))
+# 유휴 시간이 이 값을 넘으면 세션을 새로 생성 (서버/LB 유휴 끊김 대응)
+HTTP_KEEPALIVE_IDLE_SEC: float = float(os.getenv("HTTP_KEEPALIVE_IDLE_SEC", "55"))
+# 멀티종목 시세 스냅샷: 단건 조회 fallback 병렬 스레드 수 (rate limiter bulk lane 공유)
+SNAPSHOT_BULK_MAX_WORKERS: int = int(os.getenv("SNAPSHOT_BULK_MAX_WORKERS", "4"))
+
 # 토큰 발급 재시도 간격 (초) - KIS 토큰발급 API 1분당 1회 제한 대응
 TOKEN_RETRY_DELAY_SECONDS: float = float(os.getenv("TOKEN_RETRY_DELAY_SECONDS", "61.0"))
 
@@ -259,6 +273,14 @@ TOKEN_PREWARM_MINUTE: int = int(os.getenv("TOKEN_PREWARM_MINUTE", "0"))
 ACCOUNT_BALANCE_CACHE_TTL_SEC: float = float(os.getenv("ACCOUNT_BALANCE_CACHE_TTL_SEC", "2.0"))
 ACCOUNT_HOLDINGS_CACHE_TTL_SEC: float = float(os.getenv("ACCOUNT_HOLDINGS_CACHE_TTL_SEC", "2.0"))
 
+# 일봉 로컬 저장소 (SQLite) - 확정 일봉은 재조회하지 않고 비어 있는 구간만 REST 조회
+ENABLE_DAILY_BAR_STORE: bool = os.getenv("ENABLE_DAILY_BAR_STORE", "false").lower() in (
+    "true", "1", "yes"
+)
+DAILY_BAR_STORE_PATH: str = os.getenv("DAILY_BAR_STORE_PATH", "")  # 빈 값이면 data/daily_bars.sqlite3
+# 당일 잠정봉 등 미확정 구간 재조회 최소 간격 (초)
+DAILY_BAR_STORE_TAIL_TTL_SEC: float = float(os.getenv("DAILY_BAR_STORE_TAIL_TTL_SEC", "30"))
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # 실행 주기 설정
@@ -437,6 +459,8 @@ ORB_ALLOWED_ENTRY_VENUES: str = os.getenv("ORB_ALLOWED_ENTRY_VENUES", "KRX").str
 #   STRATEGY_CANDIDATE_MAX_AGE_SEC=300
 #   PULLBACK_SETUP_REFRESH_SEC=60
 #   PULLBACK_TIMING_DIRTY_POLL_SEC=0.5
+#   PULLBACK_TIMING_DIRTY_COALESCE_SEC=0.0
+#   PULLBACK_TIMING_WORKERS=1
 #   PULLBACK_ENTRY_INTENT_QUEUE_MAXSIZE=256
 #   ENABLE_PULLBACK_DAILY_REFRESH_THREAD=true
 #   DAILY_CONTEXT_REFRESH_SEC=60
@@ -514,6 +538,10 @@ THREADED_PIPELINE_ENABLED_STRATEGIES: str = (
 STRATEGY_CANDIDATE_MAX_AGE_SEC: int = int(os.getenv("STRATEGY_CANDIDATE_MAX_AGE_SEC", "300"))
 PULLBACK_SETUP_REFRESH_SEC: int = int(os.getenv("PULLBACK_SETUP_REFRESH_SEC", "60"))
 PULLBACK_TIMING_DIRTY_POLL_SEC: float = float(os.getenv("PULLBACK_TIMING_DIRTY_POLL_SEC", "0.5"))
+PULLBACK_TIMING_DIRTY_COALESCE_SEC: float = float(os.getenv("PULLBACK_TIMING_DIRTY_COALESCE_SEC", "0.0"))
+# 타이밍 워커 샤드 수. 워커들이 executor 의 시세 스냅샷/타이밍 지표 필드를 공유하므로
+# 2 이상은 병렬 이득 없이 경합만 늘어난다 (평가 상태가 샤드별로 분리되기 전까지 1 유지).
+PULLBACK_TIMING_WORKERS: int = int(os.getenv("PULLBACK_TIMING_WORKERS", "1"))
 PULLBACK_ENTRY_INTENT_QUEUE_MAXSIZE: int = int(os.getenv("PULLBACK_ENTRY_INTENT_QUEUE_MAXSIZE", "256"))
 ENABLE_PIPELINE_HEALTH_MONITORING: bool = os.getenv(
     "ENABLE_PIPELINE_HEALTH_MONITORING",
@@ -541,6 +569,8 @@ MAX_PENDING_INTENTS_PER_SYMBOL: int = int(os.getenv("MAX_PENDING_INTENTS_PER_SYM
 MAX_DIRTY_SYMBOL_BATCH: int = int(os.getenv("MAX_DIRTY_SYMBOL_BATCH", "50"))
 MAX_INTENT_QUEUE_DEPTH: int = int(os.getenv("MAX_INTENT_QUEUE_DEPTH", "1024"))
 CANDIDATE_CLEANUP_INTERVAL_SEC: int = int(os.getenv("CANDIDATE_CLEANUP_INTERVAL_SEC", "30"))
+# armed 후보 / shadow 후보·intent 저장소별 최대 보관 수 (0=무제한, 초과 시 가장 먼저 만료될 항목부터 제거)
+CANDIDATE_STORE_MAX_SIZE: int = int(os.getenv("CANDIDATE_STORE_MAX_SIZE", "0"))
 DEGRADED_MODE_ENTER_QUEUE_DEPTH: int = int(os.getenv("DEGRADED_MODE_ENTER_QUEUE_DEPTH", "512"))
 DEGRADED_MODE_EXIT_QUEUE_DEPTH: int = int(os.getenv("DEGRADED_MODE_EXIT_QUEUE_DEPTH", "256"))
 DEGRADED_MODE_MIN_HOLD_SEC: int = int(os.getenv("DEGRADED_MODE_MIN_HOLD_SEC", "15"))
@@ -589,6 +619,28 @@ ENABLE_STRATEGY_ANALYTICS: bool = os.getenv(
 STRATEGY_ANALYTICS_EVENT_DIR: str = str(
     os.getenv("STRATEGY_ANALYTICS_EVENT_DIR", "data/analytics") or "data/analytics"
 ).strip() or "data/analytics"
+# 이벤트 스트리밍 집계 시 메모리에 올리는 정렬 청크 크기 (초과분은 임시 파일 run 으로 k-way merge)
+STRATEGY_ANALYTICS_SORT_CHUNK_EVENTS: int = int(os.getenv("STRATEGY_ANALYTICS_SORT_CHUNK_EVENTS", "100000"))
+# 이벤트 파일 형식: jsonl (기본) | msgpack (length-prefixed 바이너리, msgpack 미설치 시 jsonl)
+STRATEGY_ANALYTICS_EVENT_FORMAT: str = str(
+    os.getenv("STRATEGY_ANALYTICS_EVENT_FORMAT", "jsonl") or "jsonl"
+).strip().lower() or "jsonl"
+# 비동기 writer: log_event 는 큐 적재만, build/직렬화/쓰기는 백그라운드 스레드에서 배치 처리
+STRATEGY_ANALYTICS_ASYNC_WRITER: bool = os.getenv(
+    "STRATEGY_ANALYTICS_ASYNC_WRITER",
+    "false",
+).lower() in (
+    "true",
+    "1",
+    "yes",
+)
+STRATEGY_ANALYTICS_WRITER_QUEUE_SIZE: int = int(os.getenv("STRATEGY_ANALYTICS_WRITER_QUEUE_SIZE", "8192"))
+STRATEGY_ANALYTICS_WRITER_BATCH_EVENTS: int = int(os.getenv("STRATEGY_ANALYTICS_WRITER_BATCH_EVENTS", "256"))
+STRATEGY_ANALYTICS_WRITER_FLUSH_SEC: float = float(os.getenv("STRATEGY_ANALYTICS_WRITER_FLUSH_SEC", "0.5"))
+# 큐가 가득 찼을 때: block | drop_oldest | drop_new
+STRATEGY_ANALYTICS_WRITER_OVERFLOW: str = str(
+    os.getenv("STRATEGY_ANALYTICS_WRITER_OVERFLOW", "drop_oldest") or "drop_oldest"
+).strip().lower() or "drop_oldest"
 ENABLE_STRATEGY_MARKOUTS: bool = os.getenv(
     "ENABLE_STRATEGY_MARKOUTS",
     "false",
@@ -905,6 +957,27 @@ FAST_EVAL_DAILY_REFRESH_INTERVAL_SEC: float = float(
     os.getenv("FAST_EVAL_DAILY_REFRESH_INTERVAL_SEC", "300")
 )
 WS_QUOTE_STATIC_CACHE_TTL_SEC: float = float(os.getenv("WS_QUOTE_STATIC_CACHE_TTL_SEC", "900"))
+# WS 틱 콜백 분리: 수신 루프 밖 디스패치 스레드 수 (0 = 수신 루프에서 직접 호출)
+WS_TICK_DISPATCH_WORKERS: int = int(os.getenv("WS_TICK_DISPATCH_WORKERS", "1"))
+# 종목별 미처리 완성봉 최대 보관 수 (초과 시 오래된 봉부터 드롭, metrics 에 집계)
+WS_TICK_DISPATCH_MAX_PENDING_BARS: int = int(os.getenv("WS_TICK_DISPATCH_MAX_PENDING_BARS", "8"))
+# WS 실시간 체결통보(H0STCNI0/H0STCNI9) 구독 → 체결 대기 시 REST 폴링 대신 이벤트 사용
+ENABLE_WS_EXECUTION_NOTICE: bool = os.getenv("ENABLE_WS_EXECUTION_NOTICE", "false").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+# 체결통보 구독 키 (HTS ID)
+KIS_HTS_ID: str = os.getenv("KIS_HTS_ID", "")
+# 체결통보 수신 중 REST 체결조회 fallback 주기 (초)
+WS_EXECUTION_NOTICE_REST_FALLBACK_SEC: float = float(
+    os.getenv("WS_EXECUTION_NOTICE_REST_FALLBACK_SEC", "10")
+)
+
+# 멀티종목 평가 병렬도 (1 = 기존 순차 평가, 종목당 동시 평가는 항상 1개)
+SYMBOL_EVAL_MAX_WORKERS: int = int(os.getenv("SYMBOL_EVAL_MAX_WORKERS", "1"))
+# 종목 평가 배치 지연 예산 (초, 초과 시 [LOOP_METRIC] eval_budget_exceeded=True)
+SYMBOL_EVAL_LOOP_BUDGET_SEC: float = float(os.getenv("SYMBOL_EVAL_LOOP_BUDGET_SEC", "2.0"))
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -1001,6 +1074,14 @@ DB_POOL_RESET_SESSION: bool = os.getenv(
     "DB_POOL_RESET_SESSION", "true"
 ).lower() in ("true", "1", "yes")
 
+# 리포트 trades/account_snapshots INSERT 배치 버퍼 (체결 INSERT 는 동기)
+DB_WRITE_BUFFER_ENABLED: bool = os.getenv(
+    "DB_WRITE_BUFFER_ENABLED", "true"
+).lower() in ("true", "1", "yes")
+DB_WRITE_BUFFER_BATCH_ROWS: int = int(os.getenv("DB_WRITE_BUFFER_BATCH_ROWS", "200"))
+DB_WRITE_BUFFER_FLUSH_SEC: float = float(os.getenv("DB_WRITE_BUFFER_FLUSH_SEC", "1.0"))
+DB_WRITE_BUFFER_MAX_ROWS: int = int(os.getenv("DB_WRITE_BUFFER_MAX_ROWS", "20000"))
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # 데이터 저장 경로
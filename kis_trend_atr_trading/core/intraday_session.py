@@ -0,0 +1,262 @@
+"""Incremental per-symbol intraday session state built from completed 1m bars."""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from utils.market_hours import KST, MARKET_OPEN
+
+DEFAULT_OPENING_RANGE_BARS = 60
+DEFAULT_RECENT_CLOSE_WINDOW = 16
+
+
+def _bar_field(bar: Any, name: str) -> Any:
+    if isinstance(bar, dict):
+        return bar.get(name)
+    return getattr(bar, name, None)
+
+
+def parse_session_bar_time(raw_value: object) -> Optional[datetime]:
+    """Normalize a bar timestamp to an aware KST datetime (naive values are treated as KST)."""
+    if raw_value is None:
+        return None
+    if isinstance(raw_value, pd.Timestamp):
+        dt_value = raw_value.to_pydatetime()
+    elif isinstance(raw_value, datetime):
+        dt_value = raw_value
+    elif isinstance(raw_value, str):
+        token = raw_value.strip()
+        if not token:
+            return None
+        try:
+            dt_value = datetime.fromisoformat(token)
+        except ValueError:
+            return None
+    else:
+        return None
+    if dt_value.tzinfo is None:
+        return KST.localize(dt_value)
+    return dt_value.astimezone(KST)
+
+
+@dataclass(frozen=True)
+class IntradaySessionSnapshot:
+    """
+    Immutable view of one symbol's regular-session state.
+
+    - `range_highs[i]` / `range_lows[i]`: high/low over the first `i + 1` session bars.
+    - VWAP uses typical price `(high + low + close) / 3` weighted by volume;
+      zero-volume bars are skipped.
+    """
+
+    stock_code: str
+    trade_date: Optional[date]
+    bar_count: int = 0
+    first_bar_at: Optional[datetime] = None
+    last_bar_at: Optional[datetime] = None
+    last_open: float = 0.0
+    last_high: float = 0.0
+    last_low: float = 0.0
+    last_close: float = 0.0
+    last_volume: float = 0.0
+    cum_turnover: float = 0.0
+    cum_volume: float = 0.0
+    range_highs: Tuple[float, ...] = ()
+    range_lows: Tuple[float, ...] = ()
+    recent_closes: Tuple[float, ...] = ()
+
+    @property
+    def vwap(self) -> float:
+        if self.cum_volume <= 0:
+            return 0.0
+        return self.cum_turnover / self.cum_volume
+
+    def opening_range(self, bars: int) -> Optional[Tuple[float, float]]:
+        """(high, low) over the first `bars` session bars, or None when not yet formed/tracked."""
+        count = int(bars)
+        if count <= 0 or count > len(self.range_highs):
+            return None
+        return self.range_highs[count - 1], self.range_lows[count - 1]
+
+    def covers(self, opening_range_bars: int, recent_lookback: int) -> bool:
+        """True when the tracked range/close windows hold everything a consumer needs so far."""
+        bar_count = int(self.bar_count)
+        return len(self.range_highs) >= min(bar_count, int(opening_range_bars)) and len(
+            self.recent_closes
+        ) >= min(bar_count, int(recent_lookback))
+
+
+class IntradaySessionAccumulator:
+    """
+    O(1)-per-bar accumulator for one symbol.
+
+    Rules:
+    - Bars starting before `session_open` are ignored (pre-market).
+    - A bar on a later trade date resets the session.
+    - Bars not newer than the last applied bar are rejected
+      (replays/backfills must not double-count volume).
+    """
+
+    __slots__ = (
+        "stock_code",
+        "_session_open",
+        "_range_capacity",
+        "_trade_date",
+        "_bar_count",
+        "_first_bar_at",
+        "_last_bar_at",
+        "_last_bar",
+        "_cum_turnover",
+        "_cum_volume",
+        "_range_highs",
+        "_range_lows",
+        "_recent_closes",
+    )
+
+    def __init__(
+        self,
+        stock_code: str = "",
+        *,
+        session_open: time = MARKET_OPEN,
+        opening_range_bars: int = DEFAULT_OPENING_RANGE_BARS,
+        recent_close_window: int = DEFAULT_RECENT_CLOSE_WINDOW,
+    ):
+        self.stock_code = str(stock_code or "")
+        self._session_open = session_open
+        self._range_capacity = max(int(opening_range_bars), 1)
+        self._recent_closes: Deque[float] = deque(maxlen=max(int(recent_close_window), 1))
+        self._reset(None)
+
+    def _reset(self, trade_date: Optional[date]) -> None:
+        self._trade_date = trade_date
+        self._bar_count = 0
+        self._first_bar_at: Optional[datetime] = None
+        self._last_bar_at: Optional[datetime] = None
+        self._last_bar = (0.0, 0.0, 0.0, 0.0, 0.0)
+        self._cum_turnover = 0.0
+        self._cum_volume = 0.0
+        self._range_highs: List[float] = []
+        self._range_lows: List[float] = []
+        self._recent_closes.clear()
+
+    def add_bar(self, bar: Any) -> bool:
+        """Apply one completed bar (OHLCVBar or dict). Returns False when the bar is ignored."""
+        start_at = parse_session_bar_time(_bar_field(bar, "start_at") or _bar_field(bar, "date"))
+        if start_at is None or start_at.time() < self._session_open:
+            return False
+        try:
+            open_ = float(_bar_field(bar, "open") or 0.0)
+            high = float(_bar_field(bar, "high") or 0.0)
+            low = float(_bar_field(bar, "low") or 0.0)
+            close = float(_bar_field(bar, "close") or 0.0)
+            volume = float(_bar_field(bar, "volume") or 0.0)
+        except (TypeError, ValueError):
+            return False
+
+        trade_date = start_at.date()
+        if self._trade_date is None or trade_date > self._trade_date:
+            self._reset(trade_date)
+        elif trade_date < self._trade_date:
+            return False
+        if self._last_bar_at is not None and start_at <= self._last_bar_at:
+            return False
+
+        if self._bar_count < self._range_capacity:
+            if self._range_highs:
+                self._range_highs.append(max(self._range_highs[-1], high))
+                self._range_lows.append(min(self._range_lows[-1], low))
+            else:
+                self._range_highs.append(high)
+                self._range_lows.append(low)
+        if volume > 0:
+            self._cum_turnover += (high + low + close) / 3.0 * volume
+            self._cum_volume += volume
+        self._recent_closes.append(close)
+        self._bar_count += 1
+        if self._first_bar_at is None:
+            self._first_bar_at = start_at
+        self._last_bar_at = start_at
+        self._last_bar = (open_, high, low, close, volume)
+        return True
+
+    def snapshot(self) -> IntradaySessionSnapshot:
+        open_, high, low, close, volume = self._last_bar
+        return IntradaySessionSnapshot(
+            stock_code=self.stock_code,
+            trade_date=self._trade_date,
+            bar_count=self._bar_count,
+            first_bar_at=self._first_bar_at,
+            last_bar_at=self._last_bar_at,
+            last_open=open_,
+            last_high=high,
+            last_low=low,
+            last_close=close,
+            last_volume=volume,
+            cum_turnover=self._cum_turnover,
+            cum_volume=self._cum_volume,
+            range_highs=tuple(self._range_highs),
+            range_lows=tuple(self._range_lows),
+            recent_closes=tuple(self._recent_closes),
+        )
+
+
+class IntradaySessionStore:
+    """Thread-safe per-symbol accumulators fed from the completed-bar stream."""
+
+    def __init__(
+        self,
+        *,
+        session_open: time = MARKET_OPEN,
+        opening_range_bars: int = DEFAULT_OPENING_RANGE_BARS,
+        recent_close_window: int = DEFAULT_RECENT_CLOSE_WINDOW,
+    ):
+        self._session_open = session_open
+        self._opening_range_bars = max(int(opening_range_bars), 1)
+        self._recent_close_window = max(int(recent_close_window), 1)
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, IntradaySessionAccumulator] = {}
+        self._bars_applied = 0
+        self._bars_ignored = 0
+
+    def add_bar(self, bar: Any) -> bool:
+        code = str(_bar_field(bar, "stock_code") or "").zfill(6)
+        with self._lock:
+            accumulator = self._sessions.get(code)
+            if accumulator is None:
+                accumulator = IntradaySessionAccumulator(
+                    code,
+                    session_open=self._session_open,
+                    opening_range_bars=self._opening_range_bars,
+                    recent_close_window=self._recent_close_window,
+                )
+                self._sessions[code] = accumulator
+            applied = accumulator.add_bar(bar)
+            if applied:
+                self._bars_applied += 1
+            else:
+                self._bars_ignored += 1
+            return applied
+
+    def snapshot(self, stock_code: str) -> Optional[IntradaySessionSnapshot]:
+        code = str(stock_code).zfill(6)
+        with self._lock:
+            accumulator = self._sessions.get(code)
+            return accumulator.snapshot() if accumulator is not None else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+
+    def metrics(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "intraday_sessions": len(self._sessions),
+                "intraday_session_bars_applied": int(self._bars_applied),
+                "intraday_session_bars_ignored": int(self._bars_ignored),
+            }
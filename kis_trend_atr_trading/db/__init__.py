@@ -40,10 +40,23 @@ from db.mysql import (
     QueryError
 )
 
+from db.schema_catalog import (
+    SchemaCatalog,
+    get_schema_catalog
+)
+
+from db.write_buffer import (
+    BufferedDbWriter,
+    get_db_write_buffer,
+    flush_db_write_buffers,
+    close_db_write_buffers
+)
+
 from db.repository import (
     PositionRepository,
     TradeRepository,
     AccountSnapshotRepository,
+    AccountDrawdownRepository,
     SymbolCacheRepository,
     PositionRecord,
     TradeRecord,
@@ -52,6 +65,7 @@ from db.repository import (
     get_position_repository,
     get_trade_repository,
     get_account_snapshot_repository,
+    get_account_drawdown_repository,
     get_symbol_cache_repository
 )
 
@@ -64,6 +78,14 @@ __all__ = [
     "DatabaseError",
     "ConnectionError",
     "QueryError",
+    "SchemaCatalog",
+    "get_schema_catalog",
+    
+    # Write Buffer
+    "BufferedDbWriter",
+    "get_db_write_buffer",
+    "flush_db_write_buffers",
+    "close_db_write_buffers",
     
     # Data Records
     "PositionRecord",
@@ -75,9 +97,11 @@ __all__ = [
     "PositionRepository",
     "TradeRepository",
     "AccountSnapshotRepository",
+    "AccountDrawdownRepository",
     "SymbolCacheRepository",
     "get_position_repository",
     "get_trade_repository",
     "get_account_snapshot_repository",
+    "get_account_drawdown_repository",
     "get_symbol_cache_repository"
 ]
@@ -48,6 +48,7 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 
+from performance.drawdown import compute_drawdown
 from utils.logger import get_logger
 from utils.market_hours import KST
 
@@ -645,35 +646,11 @@ class JsonDatabase(DatabaseInterface):
         if not snapshots:
             return {"mdd": 0.0, "mdd_percent": 0.0, "peak_time": None, "trough_time": None}
         
-        # MDD 계산
-        peak = 0.0
-        mdd = 0.0
-        mdd_percent = 0.0
-        peak_time = None
-        trough_time = None
-        
-        for s in sorted(snapshots, key=lambda x: x["snapshot_time"]):
-            equity = float(s["total_equity"])
-            
-            if equity > peak:
-                peak = equity
-                peak_time = s["snapshot_time"]
-            
-            if peak > 0:
-                drawdown = peak - equity
-                drawdown_pct = (drawdown / peak) * 100
-                
-                if drawdown > mdd:
-                    mdd = drawdown
-                    mdd_percent = drawdown_pct
-                    trough_time = s["snapshot_time"]
-        
-        return {
-            "mdd": mdd,
-            "mdd_percent": mdd_percent,
-            "peak_time": peak_time,
-            "trough_time": trough_time
-        }
+        ordered = sorted(snapshots, key=lambda x: x["snapshot_time"])
+        return compute_drawdown(
+            [float(s["total_equity"]) for s in ordered],
+            [s["snapshot_time"] for s in ordered],
+        ).to_mdd_dict()
     
     def is_connected(self) -> bool:
         """JSON DB는 항상 연결 가능"""
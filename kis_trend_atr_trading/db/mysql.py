@@ -41,6 +41,7 @@ Oracle Cloud Infrastructure Free Tier MySQL 호환.
 
 import builtins
 import os
+import re
 import sys
 import time
 from datetime import datetime
@@ -57,6 +58,7 @@ except ImportError:
     MYSQL_AVAILABLE = False
     MySQLError = Exception  # Fallback
 
+from db.schema_catalog import SchemaCatalog
 from utils.logger import get_logger
 
 logger = get_logger("mysql")
@@ -64,6 +66,11 @@ logger = get_logger("mysql")
 CANONICAL_DB_MODULE_PATH = "kis_trend_atr_trading.db.mysql"
 LEGACY_DB_MODULE_PATH = "db.mysql"
 _MAX_DB_POOL_SIZE = 32
+# 스키마 카탈로그를 무효화해야 하는 DDL
+_SCHEMA_CHANGE_PATTERN = re.compile(r"^\s*(CREATE|ALTER|DROP|RENAME)\b", re.IGNORECASE)
+_CREATE_TABLE_IF_NOT_EXISTS_PATTERN = re.compile(
+    r"^\s*CREATE\s+TABLE\s+IF\s+NOT\s+EXISTS\s+`?(\w+)`?", re.IGNORECASE
+)
 
 
 def _env_bool(name: str, default: bool) -> bool:
@@ -281,6 +288,8 @@ class MySQLManager:
         self._query_error_count = 0
         self._command_error_count = 0
         self._pool_bootstrap_logged = False
+        # information_schema 캐시 (싱글톤 매니저 → 프로세스 공용)
+        self.schema_catalog = SchemaCatalog(self)
         
         logger.info(f"[DB] MySQL 관리자 초기화: {self.config}")
     
@@ -338,6 +347,7 @@ class MySQLManager:
                 test_conn.close()
                 
                 self._connected = True
+                self.schema_catalog.invalidate()
                 logger.info(
                     "[DB] MySQL 연결 성공: %s:%s manager_identity=%s pool_identity=%s effective_db_pool_size=%s",
                     self.config.host,
@@ -510,6 +520,7 @@ class MySQLManager:
                 cursor.execute(command, params)
                 affected = cursor.rowcount
                 conn.commit()
+                self._invalidate_schema_catalog_for(command)
                 return affected
                     
         except MySQLError as e:
@@ -711,8 +722,10 @@ class MySQLManager:
                     statement = statement.strip()
                     if statement:
                         cursor.execute(statement)
+                self.schema_catalog.invalidate()
 
                 # 기존 DB 호환을 위한 안전 마이그레이션
+                # (존재 여부 확인은 카탈로그 1회 로드로 처리, DDL 후에는 무효화)
                 self._ensure_columns(cursor)
                 self._ensure_primary_keys(cursor)
                 self._ensure_indexes(cursor)
@@ -723,6 +736,7 @@ class MySQLManager:
             
         except MySQLError as e:
             conn.rollback()
+            self.schema_catalog.invalidate()
             logger.error(f"[DB] 스키마 초기화 실패: {e}")
             raise QueryError(f"스키마 초기화 실패: {e}")
         finally:
@@ -791,6 +805,21 @@ class MySQLManager:
             updated_at DATETIME NOT NULL
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
+        CREATE TABLE IF NOT EXISTS account_drawdown_state (
+            mode VARCHAR(16) NOT NULL PRIMARY KEY,
+            peak_equity DECIMAL(15, 2) NOT NULL,
+            peak_time DATETIME NULL,
+            mdd DECIMAL(15, 2) NOT NULL DEFAULT 0,
+            mdd_percent DECIMAL(8, 4) NOT NULL DEFAULT 0,
+            mdd_peak_time DATETIME NULL,
+            trough_time DATETIME NULL,
+            last_equity DECIMAL(15, 2) NULL,
+            last_snapshot_time DATETIME NULL,
+            snapshot_count INT NOT NULL DEFAULT 0,
+            needs_rebuild TINYINT(1) NOT NULL DEFAULT 0,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
         CREATE TABLE IF NOT EXISTS order_state (
             id INT AUTO_INCREMENT PRIMARY KEY,
             idempotency_key VARCHAR(128) NOT NULL,
@@ -810,31 +839,29 @@ class MySQLManager:
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
         """
 
+    def _invalidate_schema_catalog_for(self, command: str) -> None:
+        """DDL 이면 스키마 카탈로그를 무효화합니다."""
+        if not _SCHEMA_CHANGE_PATTERN.match(command or ""):
+            return
+        # 이미 카탈로그에 있는 테이블의 CREATE TABLE IF NOT EXISTS 는 no-op
+        create_match = _CREATE_TABLE_IF_NOT_EXISTS_PATTERN.match(command)
+        catalog = self.schema_catalog
+        if create_match and catalog.loaded and catalog.table_exists(create_match.group(1)):
+            return
+        catalog.invalidate()
+
+    def _execute_schema_ddl(self, cursor, ddl: str) -> None:
+        """마이그레이션 DDL 실행 후 카탈로그 무효화 (실패한 DDL 은 스키마를 바꾸지 않음)"""
+        cursor.execute(ddl)
+        self.schema_catalog.invalidate()
+
     def _column_exists(self, table_name: str, column_name: str) -> bool:
-        """컬럼 존재 여부 확인 (구버전 MySQL 호환)."""
-        result = self.execute_query(
-            """
-            SELECT COUNT(*) as cnt
-            FROM information_schema.columns
-            WHERE table_schema = %s AND table_name = %s AND column_name = %s
-            """,
-            (self.config.database, table_name, column_name),
-            fetch_one=True
-        )
-        return bool(result and result.get("cnt", 0) > 0)
+        """컬럼 존재 여부 확인 (스키마 카탈로그)."""
+        return self.schema_catalog.has_column(table_name, column_name)
 
     def _index_exists(self, table_name: str, index_name: str) -> bool:
-        """인덱스 존재 여부 확인 (구버전 MySQL 호환)."""
-        result = self.execute_query(
-            """
-            SELECT COUNT(*) as cnt
-            FROM information_schema.statistics
-            WHERE table_schema = %s AND table_name = %s AND index_name = %s
-            """,
-            (self.config.database, table_name, index_name),
-            fetch_one=True
-        )
-        return bool(result and result.get("cnt", 0) > 0)
+        """인덱스 존재 여부 확인 (스키마 카탈로그)."""
+        return self.schema_catalog.has_index(table_name, index_name)
 
     def _ensure_columns(self, cursor) -> None:
         """필수 컬럼을 존재할 때만 안전하게 추가합니다."""
@@ -851,8 +878,9 @@ class MySQLManager:
             try:
                 if self._column_exists(table_name, column_name):
                     continue
-                cursor.execute(
-                    f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_ddl}"
+                self._execute_schema_ddl(
+                    cursor,
+                    f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_ddl}",
                 )
             except MySQLError as e:
                 logger.warning(
@@ -883,8 +911,9 @@ class MySQLManager:
             try:
                 if self._column_exists("positions", column_name):
                     continue
-                cursor.execute(
-                    f"ALTER TABLE positions ADD COLUMN {column_name} {column_ddl}"
+                self._execute_schema_ddl(
+                    cursor,
+                    f"ALTER TABLE positions ADD COLUMN {column_name} {column_ddl}",
                 )
                 logger.info(f"[DB] positions 호환 컬럼 추가: {column_name}")
             except MySQLError as e:
@@ -984,30 +1013,13 @@ class MySQLManager:
             try:
                 if self._index_exists(table_name, index_name):
                     continue
-                cursor.execute(ddl)
+                self._execute_schema_ddl(cursor, ddl)
             except MySQLError as e:
                 logger.warning(f"[DB] 인덱스 생성 건너뜀: {index_name} ({e})")
 
     def _get_primary_key_columns(self, table_name: str) -> List[str]:
-        """기본 키 컬럼 순서를 반환합니다."""
-        rows = self.execute_query(
-            """
-            SELECT column_name
-            FROM information_schema.key_column_usage
-            WHERE table_schema = %s
-              AND table_name = %s
-              AND constraint_name = 'PRIMARY'
-            ORDER BY ordinal_position
-            """,
-            (self.config.database, table_name),
-        )
-        result: List[str] = []
-        for row in rows or []:
-            # 일부 환경에서 키가 대문자로 반환되는 경우를 방어합니다.
-            column_name = row.get("column_name") or row.get("COLUMN_NAME")
-            if column_name:
-                result.append(str(column_name))
-        return result
+        """기본 키 컬럼 순서를 반환합니다 (스키마 카탈로그)."""
+        return self.schema_catalog.get_primary_key(table_name)
 
     def _has_duplicate_composite_key(self, table_name: str, key_columns: List[str]) -> bool:
         """복합 키 기준 중복 레코드 존재 여부를 확인합니다."""
@@ -1063,12 +1075,14 @@ class MySQLManager:
 
                 target_pk_expr = ", ".join([f"`{column}`" for column in target_pk_columns])
                 if current_pk_columns:
-                    cursor.execute(
-                        f"ALTER TABLE `{table_name}` DROP PRIMARY KEY, ADD PRIMARY KEY ({target_pk_expr})"
+                    self._execute_schema_ddl(
+                        cursor,
+                        f"ALTER TABLE `{table_name}` DROP PRIMARY KEY, ADD PRIMARY KEY ({target_pk_expr})",
                     )
                 else:
-                    cursor.execute(
-                        f"ALTER TABLE `{table_name}` ADD PRIMARY KEY ({target_pk_expr})"
+                    self._execute_schema_ddl(
+                        cursor,
+                        f"ALTER TABLE `{table_name}` ADD PRIMARY KEY ({target_pk_expr})",
                     )
                 logger.info(
                     f"[DB] PK 마이그레이션 적용: {table_name} "
@@ -1078,17 +1092,10 @@ class MySQLManager:
                 logger.warning(f"[DB] PK 마이그레이션 건너뜀: {table_name} ({e})")
     
     def table_exists(self, table_name: str) -> bool:
-        """테이블 존재 여부 확인"""
-        result = self.execute_query(
-            """
-            SELECT COUNT(*) as cnt 
-            FROM information_schema.tables 
-            WHERE table_schema = %s AND table_name = %s
-            """,
-            (self.config.database, table_name),
-            fetch_one=True
-        )
-        return result and result.get("cnt", 0) > 0
+        """테이블 존재 여부 확인 (스키마 카탈로그)"""
+        if not self.config.enabled:
+            return False
+        return self.schema_catalog.table_exists(table_name)
     
     # ═══════════════════════════════════════════════════════════════════════════
     # 상태 확인
@@ -44,6 +44,9 @@ import hashlib
 import threading
 
 from db.mysql import MySQLManager, get_db_manager, QueryError
+from db.schema_catalog import get_schema_catalog
+from db.write_buffer import BufferedDbWriter, get_db_write_buffer
+from performance.drawdown import DrawdownState, compute_drawdown
 from utils.logger import get_logger
 from utils.market_hours import KST, get_today
 from env import get_db_namespace_mode
@@ -63,6 +66,14 @@ def _get_repository_schema_state() -> Dict[str, Any]:
     return state
 
 
+def _get_drawdown_repository_state() -> Dict[str, Any]:
+    state = getattr(builtins, "_kis_drawdown_repository_state", None)
+    if state is None:
+        state = {"lock": threading.Lock(), "repos": {}}
+        setattr(builtins, "_kis_drawdown_repository_state", state)
+    return state
+
+
 def _get_namespace_mode() -> str:
     """DB 네임스페이스용 모드를 반환합니다 (DRY_RUN/PAPER/REAL)."""
     try:
@@ -325,45 +336,30 @@ class PositionRepository:
         if not database_name:
             return dict(default_info)
 
+        # 공용 스키마 카탈로그가 있으면 메모리에서 바로 계산 (마이그레이션 후 재로드도 카탈로그가 담당)
+        catalog = get_schema_catalog(self.db)
         state = _get_repository_schema_state()
         with state["lock"]:
             cached = state["positions_schema_cache"].get(database_name)
-            if cached is not None and not refresh:
+            if cached is not None and not refresh and catalog is None:
                 self.__class__._repository_schema_introspection_count = int(
                     state["repository_schema_introspection_count"]
                 )
                 return dict(cached)
 
             try:
-                rows = self.db.execute_query(
-                    """
-                    SELECT column_name, data_type, is_nullable, column_default, extra
-                    FROM information_schema.columns
-                    WHERE table_schema = %s
-                      AND table_name = 'positions'
-                    """,
-                    (database_name,),
-                ) or []
+                if catalog is not None:
+                    if refresh:
+                        catalog.invalidate()
+                    columns = catalog.get_columns("positions")
+                else:
+                    columns = self._query_positions_columns(database_name)
             except Exception as e:
                 logger.warning(f"[REPO] positions 스키마 introspection 실패: {e}")
                 if cached is not None:
                     return dict(cached)
                 return dict(default_info)
 
-            columns: Dict[str, Dict[str, Any]] = {}
-            for raw in rows:
-                column_name = str(raw.get("column_name") or raw.get("COLUMN_NAME") or "").lower()
-                if not column_name:
-                    continue
-                columns[column_name] = {
-                    "data_type": str(raw.get("data_type") or raw.get("DATA_TYPE") or "").lower(),
-                    "is_nullable": str(raw.get("is_nullable") or raw.get("IS_NULLABLE") or "").upper(),
-                    "column_default": raw.get("column_default")
-                    if "column_default" in raw
-                    else raw.get("COLUMN_DEFAULT"),
-                    "extra": str(raw.get("extra") or raw.get("EXTRA") or "").lower(),
-                }
-
             position_id_meta = columns.get("position_id") or {}
             is_numeric = str(position_id_meta.get("data_type") or "").lower() in {
                 "tinyint",
@@ -394,6 +390,8 @@ class PositionRepository:
                 "has_updated_at": "updated_at" in columns,
             }
             state["positions_schema_cache"][database_name] = dict(info)
+            if catalog is not None:
+                return dict(info)
             state["repository_schema_introspection_count"] = int(state["repository_schema_introspection_count"]) + 1
             self.__class__._repository_schema_introspection_count = int(
                 state["repository_schema_introspection_count"]
@@ -406,6 +404,32 @@ class PositionRepository:
             )
             return dict(info)
 
+    def _query_positions_columns(self, database_name: str) -> Dict[str, Dict[str, Any]]:
+        """카탈로그가 없는 DB 객체용: information_schema 직접 조회"""
+        rows = self.db.execute_query(
+            """
+            SELECT column_name, data_type, is_nullable, column_default, extra
+            FROM information_schema.columns
+            WHERE table_schema = %s
+              AND table_name = 'positions'
+            """,
+            (database_name,),
+        ) or []
+        columns: Dict[str, Dict[str, Any]] = {}
+        for raw in rows:
+            column_name = str(raw.get("column_name") or raw.get("COLUMN_NAME") or "").lower()
+            if not column_name:
+                continue
+            columns[column_name] = {
+                "data_type": str(raw.get("data_type") or raw.get("DATA_TYPE") or "").lower(),
+                "is_nullable": str(raw.get("is_nullable") or raw.get("IS_NULLABLE") or "").upper(),
+                "column_default": raw.get("column_default")
+                if "column_default" in raw
+                else raw.get("COLUMN_DEFAULT"),
+                "extra": str(raw.get("extra") or raw.get("EXTRA") or "").lower(),
+            }
+        return columns
+
     def _schema_compat_tokens(self) -> List[str]:
         """현재 positions 호환 활성화 항목을 토큰 리스트로 반환합니다."""
         tokens: List[str] = []
@@ -1093,9 +1117,17 @@ class TradeRepository:
         trades = repo.get_trades_by_date(date.today())
     """
     
-    def __init__(self, db: MySQLManager = None):
+    def __init__(self, db: MySQLManager = None, writer: Optional[BufferedDbWriter] = None):
         self.db = db or get_db_manager()
         self.mode = _get_namespace_mode()
+        # writer 는 조회 전 배리어용 (리포트 거래 행이 같은 버퍼를 거침).
+        # 체결 INSERT 는 포지션 반영 여부를 결정하므로 항상 동기로 실행한다.
+        self.writer = writer
+
+    def _flush_pending_writes(self) -> None:
+        """조회 전 배리어: 이 프로세스에서 버퍼링된 쓰기를 먼저 반영"""
+        if self.writer is not None:
+            self.writer.flush()
 
     @staticmethod
     def _normalize_order_no(value: Any) -> str:
@@ -1272,6 +1304,7 @@ class TradeRepository:
                 )
 
         if dedup_on_order_no and order_no:
+            self._flush_pending_writes()
             existing_order_row = self._find_trade_by_order_no_side(
                 order_no=order_no,
                 side=side_upper,
@@ -1348,25 +1381,56 @@ class TradeRepository:
                 quantity,
                 order_no,
             )
-            saved = TradeRecord(
+            saved = self._build_fill_record(
                 symbol=symbol,
                 side=side_upper,
-                price=float(price_dec),
-                quantity=int(quantity),
+                price=price_dec,
+                quantity=quantity,
                 executed_at=executed_at,
                 reason=reason,
-                pnl=float(pnl_dec) if pnl_dec is not None else None,
-                pnl_percent=float(pnl_pct_dec) if pnl_pct_dec is not None else None,
-                entry_price=float(entry_price_dec) if entry_price_dec is not None else None,
-                holding_days=int(holding_days) if holding_days is not None else None,
+                pnl=pnl_dec,
+                pnl_percent=pnl_pct_dec,
+                entry_price=entry_price_dec,
+                holding_days=holding_days,
                 order_no=order_no,
                 idempotency_key=idempotency_key,
-                mode=self.mode,
             )
             return saved, True
         except QueryError as e:
             logger.error(f"[REPO] 체결 저장 실패: {e}")
             return None, False
+
+    def _build_fill_record(
+        self,
+        *,
+        symbol: str,
+        side: str,
+        price: Decimal,
+        quantity: int,
+        executed_at: datetime,
+        reason: Optional[str],
+        pnl: Optional[Decimal],
+        pnl_percent: Optional[Decimal],
+        entry_price: Optional[Decimal],
+        holding_days: Optional[int],
+        order_no: Optional[str],
+        idempotency_key: str,
+    ) -> TradeRecord:
+        return TradeRecord(
+            symbol=symbol,
+            side=side,
+            price=float(price),
+            quantity=int(quantity),
+            executed_at=executed_at,
+            reason=reason,
+            pnl=float(pnl) if pnl is not None else None,
+            pnl_percent=float(pnl_percent) if pnl_percent is not None else None,
+            entry_price=float(entry_price) if entry_price is not None else None,
+            holding_days=int(holding_days) if holding_days is not None else None,
+            order_no=order_no,
+            idempotency_key=idempotency_key,
+            mode=self.mode,
+        )
     
     def save_buy(
         self,
@@ -1596,6 +1660,7 @@ class TradeRepository:
         Returns:
             List[TradeRecord]: 거래 기록 목록
         """
+        self._flush_pending_writes()
         if symbol:
             results = self.db.execute_query(
                 """
@@ -1632,6 +1697,7 @@ class TradeRepository:
         Returns:
             List[TradeRecord]: 거래 기록 목록
         """
+        self._flush_pending_writes()
         results = self.db.execute_query(
             """
             SELECT * FROM trades 
@@ -1646,6 +1712,7 @@ class TradeRepository:
     
     def get_recent_trades(self, limit: int = 50) -> List[TradeRecord]:
         """최근 거래 기록 조회"""
+        self._flush_pending_writes()
         results = self.db.execute_query(
             "SELECT * FROM trades WHERE mode = %s ORDER BY executed_at DESC LIMIT %s",
             (self.mode, limit)
@@ -1662,6 +1729,7 @@ class TradeRepository:
         Returns:
             Dict: 요약 정보
         """
+        self._flush_pending_writes()
         trade_date = trade_date or get_today()
         
         result = self.db.execute_query(
@@ -1720,6 +1788,7 @@ class TradeRepository:
         Returns:
             Dict: 성과 지표
         """
+        self._flush_pending_writes()
         result = self.db.execute_query(
             """
             SELECT 
@@ -1791,6 +1860,7 @@ class TradeRepository:
         Returns:
             List[Dict]: 사유별 통계
         """
+        self._flush_pending_writes()
         results = self.db.execute_query(
             """
             SELECT 
@@ -1853,9 +1923,22 @@ class AccountSnapshotRepository:
         - MDD (최대 낙폭) 계산
     """
     
-    def __init__(self, db: MySQLManager = None):
+    def __init__(
+        self,
+        db: MySQLManager = None,
+        writer: Optional[BufferedDbWriter] = None,
+        drawdown: Optional["AccountDrawdownRepository"] = None,
+    ):
         self.db = db or get_db_manager()
         self.mode = _get_namespace_mode()
+        self.writer = writer
+        # 있으면 스냅샷마다 러닝 MDD 상태를 갱신하고, 전체 기간 MDD 를 O(1) 로 조회
+        self.drawdown = drawdown
+
+    def _flush_pending_writes(self) -> None:
+        """조회 전 배리어: 이 프로세스에서 버퍼링된 스냅샷을 먼저 반영"""
+        if self.writer is not None:
+            self.writer.flush()
     
     def save(
         self,
@@ -1881,29 +1964,36 @@ class AccountSnapshotRepository:
             AccountSnapshotRecord: 저장된 스냅샷
         """
         snapshot_time = snapshot_time or datetime.now(KST)
+        # MySQL INSERT ... ON DUPLICATE KEY UPDATE
+        sql = """
+            INSERT INTO account_snapshots (
+                snapshot_time, total_equity, cash, 
+                unrealized_pnl, realized_pnl, mode, position_count
+            )
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                total_equity = VALUES(total_equity),
+                cash = VALUES(cash),
+                unrealized_pnl = VALUES(unrealized_pnl),
+                realized_pnl = VALUES(realized_pnl),
+                mode = VALUES(mode),
+                position_count = VALUES(position_count)
+        """
+        params = (
+            snapshot_time, total_equity, cash,
+            unrealized_pnl, realized_pnl, self.mode, position_count
+        )
+        
+        if self.drawdown is not None:
+            self.drawdown.record(snapshot_time, total_equity)
         
         try:
-            # MySQL INSERT ... ON DUPLICATE KEY UPDATE
-            self.db.execute_command(
-                """
-                INSERT INTO account_snapshots (
-                    snapshot_time, total_equity, cash, 
-                    unrealized_pnl, realized_pnl, mode, position_count
-                )
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-                ON DUPLICATE KEY UPDATE
-                    total_equity = VALUES(total_equity),
-                    cash = VALUES(cash),
-                    unrealized_pnl = VALUES(unrealized_pnl),
-                    realized_pnl = VALUES(realized_pnl),
-                    mode = VALUES(mode),
-                    position_count = VALUES(position_count)
-                """,
-                (
-                    snapshot_time, total_equity, cash,
-                    unrealized_pnl, realized_pnl, self.mode, position_count
-                )
-            )
+            if self.writer is not None:
+                # 버퍼에서 폐기되면 이미 반영한 러닝 MDD 가 DB 와 어긋나므로 무효화
+                on_drop = self.drawdown.invalidate if self.drawdown is not None else None
+                self.writer.submit(sql, params, on_drop=on_drop)
+            else:
+                self.db.execute_command(sql, params)
             
             logger.debug(f"[REPO] 계좌 스냅샷: {total_equity:,.0f}원")
             return AccountSnapshotRecord(
@@ -1918,10 +2008,13 @@ class AccountSnapshotRepository:
             
         except QueryError as e:
             logger.error(f"[REPO] 스냅샷 저장 실패: {e}")
+            if self.drawdown is not None:
+                self.drawdown.invalidate()
             return None
     
     def get_latest(self) -> Optional[AccountSnapshotRecord]:
         """최신 스냅샷 조회"""
+        self._flush_pending_writes()
         result = self.db.execute_query(
             "SELECT * FROM account_snapshots WHERE mode = %s ORDER BY snapshot_time DESC LIMIT 1",
             (self.mode,),
@@ -1934,6 +2027,7 @@ class AccountSnapshotRepository:
     
     def get_by_date(self, snapshot_date: date) -> List[AccountSnapshotRecord]:
         """특정 날짜의 스냅샷 조회"""
+        self._flush_pending_writes()
         results = self.db.execute_query(
             """
             SELECT * FROM account_snapshots 
@@ -1957,6 +2051,7 @@ class AccountSnapshotRepository:
         Returns:
             List[Dict]: 일별 평가금액
         """
+        self._flush_pending_writes()
         # MySQL에서는 array_agg가 없으므로 다른 방법 사용
         cutoff = datetime.now(KST) - timedelta(days=days)
 
@@ -1991,61 +2086,46 @@ class AccountSnapshotRepository:
         """
         최대 낙폭(MDD)을 계산합니다.
         
+        - 전체 기간: account_drawdown_state 의 러닝 상태를 반환 (스냅샷 스캔 없음)
+        - 최근 N일: 해당 구간 스냅샷만 읽어 NumPy 로 계산
+        
         Args:
             days: 계산 기간 (None이면 전체)
         
         Returns:
-            Dict: MDD 정보
+            Dict: MDD 정보 (peak_time 은 MDD 구간의 고점 시각)
         """
+        if not days and self.drawdown is not None:
+            return self.drawdown.get_state().to_mdd_dict()
+        
+        self._flush_pending_writes()
         if days:
             cutoff = datetime.now(KST) - timedelta(days=days)
-            query = """
+            results = self.db.execute_query(
+                """
                 SELECT snapshot_time, total_equity
                 FROM account_snapshots
-                WHERE snapshot_time >= %s
+                WHERE mode = %s AND snapshot_time >= %s
                 ORDER BY snapshot_time
-            """
-            results = self.db.execute_query(query, (cutoff,))
+                """,
+                (self.mode, cutoff),
+            )
         else:
-            query = """
+            results = self.db.execute_query(
+                """
                 SELECT snapshot_time, total_equity
                 FROM account_snapshots
+                WHERE mode = %s
                 ORDER BY snapshot_time
-            """
-            results = self.db.execute_query(query)
-        
-        if not results:
-            return {"mdd": 0.0, "mdd_percent": 0.0, "peak_time": None, "trough_time": None}
-        
-        # MDD 계산
-        peak = 0.0
-        mdd = 0.0
-        mdd_percent = 0.0
-        peak_time = None
-        trough_time = None
-        
-        for r in results:
-            equity = float(r["total_equity"])
-            
-            if equity > peak:
-                peak = equity
-                peak_time = r["snapshot_time"]
-            
-            if peak > 0:
-                drawdown = peak - equity
-                drawdown_pct = (drawdown / peak) * 100
-                
-                if drawdown > mdd:
-                    mdd = drawdown
-                    mdd_percent = drawdown_pct
-                    trough_time = r["snapshot_time"]
+                """,
+                (self.mode,),
+            )
         
-        return {
-            "mdd": mdd,
-            "mdd_percent": mdd_percent,
-            "peak_time": peak_time,
-            "trough_time": trough_time
-        }
+        results = results or []
+        return compute_drawdown(
+            [float(r["total_equity"]) for r in results],
+            [r["snapshot_time"] for r in results],
+        ).to_mdd_dict()
     
     def _to_record(self, row: Dict) -> AccountSnapshotRecord:
         """DB 행을 Record로 변환"""
@@ -2061,6 +2141,214 @@ class AccountSnapshotRepository:
         )
 
 
+class AccountDrawdownRepository:
+    """
+    계좌 낙폭(MDD) 요약 상태 접근 클래스
+    
+    ★ 역할:
+        - account_snapshots 가 적재될 때마다 러닝 고점/MDD 를 O(1) 로 갱신
+        - 상태는 account_drawdown_state 테이블(모드당 1행)에 저장
+        - 전체 기간 MDD 조회는 스냅샷 전체 스캔 없이 이 상태만 반환
+    
+    ★ 재구성:
+        - 상태 행이 없거나, 시간 역순/같은 시각 스냅샷(덮어쓰기)으로 러닝 상태가
+          어긋나면 다음 조회 시 스냅샷을 한 번 읽어 NumPy 로 다시 계산합니다.
+        - 어긋난 상태는 저장하지 않습니다: 다음 record() 가 먼저 재구성하고,
+          저장된 행에는 needs_rebuild=1 을 남겨 재시작 후 첫 로드도 재구성합니다.
+        - needs_rebuild 는 재구성 결과를 저장할 때만 0 으로 되돌립니다
+          (일반 갱신 upsert 는 건드리지 않으므로 버퍼의 SQL 문별 묶음 순서와 무관).
+    
+    ★ 주의:
+        - 같은 모드의 스냅샷을 적재하는 프로세스는 하나라고 가정합니다 (인스턴스 락).
+        - record() 는 해당 스냅샷 INSERT 보다 먼저 호출해야 합니다.
+    """
+    
+    def __init__(
+        self,
+        db: MySQLManager = None,
+        writer: Optional[BufferedDbWriter] = None,
+        mode: Optional[str] = None,
+    ):
+        self.db = db or get_db_manager()
+        self.mode = mode or _get_namespace_mode()
+        self.writer = writer
+        self._lock = threading.RLock()
+        self._state: Optional[DrawdownState] = None
+        self._stale = False
+        self._schema_ready = False
+    
+    def _ensure_table(self) -> None:
+        if self._schema_ready:
+            return
+        try:
+            self.db.execute_command(
+                """
+                CREATE TABLE IF NOT EXISTS account_drawdown_state (
+                    mode VARCHAR(16) NOT NULL PRIMARY KEY,
+                    peak_equity DECIMAL(15, 2) NOT NULL,
+                    peak_time DATETIME NULL,
+                    mdd DECIMAL(15, 2) NOT NULL DEFAULT 0,
+                    mdd_percent DECIMAL(8, 4) NOT NULL DEFAULT 0,
+                    mdd_peak_time DATETIME NULL,
+                    trough_time DATETIME NULL,
+                    last_equity DECIMAL(15, 2) NULL,
+                    last_snapshot_time DATETIME NULL,
+                    snapshot_count INT NOT NULL DEFAULT 0,
+                    needs_rebuild TINYINT(1) NOT NULL DEFAULT 0,
+                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+                """
+            )
+            self._schema_ready = True
+        except Exception as e:
+            logger.warning(f"[REPO] account_drawdown_state 스키마 보장 실패: {e}")
+    
+    @staticmethod
+    def _normalize_time(value: Any) -> Optional[datetime]:
+        """DB DATETIME 과 비교할 수 있도록 KST naive datetime 으로 통일"""
+        if value in (None, ""):
+            return None
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if isinstance(value, datetime) and value.tzinfo is not None:
+            value = value.astimezone(KST).replace(tzinfo=None)
+        return value
+    
+    def _row_to_state(self, row: Dict[str, Any]) -> DrawdownState:
+        return DrawdownState(
+            peak_equity=float(row["peak_equity"]),
+            peak_time=self._normalize_time(row.get("peak_time")),
+            mdd=float(row.get("mdd") or 0),
+            mdd_percent=float(row.get("mdd_percent") or 0),
+            mdd_peak_time=self._normalize_time(row.get("mdd_peak_time")),
+            trough_time=self._normalize_time(row.get("trough_time")),
+            last_equity=float(row["last_equity"]) if row.get("last_equity") is not None else None,
+            last_time=self._normalize_time(row.get("last_snapshot_time")),
+            count=int(row.get("snapshot_count") or 0),
+        )
+    
+    def _load_state_locked(self) -> DrawdownState:
+        self._ensure_table()
+        row = self.db.execute_query(
+            "SELECT * FROM account_drawdown_state WHERE mode = %s",
+            (self.mode,),
+            fetch_one=True,
+        )
+        if row and not int(row.get("needs_rebuild") or 0):
+            return self._row_to_state(row)
+        return self._rebuild_locked()
+    
+    def _rebuild_locked(self) -> DrawdownState:
+        """스냅샷 전체를 1회 읽어 상태를 다시 계산하고 저장"""
+        self._ensure_table()
+        if self.writer is not None:
+            self.writer.flush()
+        rows = self.db.execute_query(
+            """
+            SELECT snapshot_time, total_equity
+            FROM account_snapshots
+            WHERE mode = %s
+            ORDER BY snapshot_time
+            """,
+            (self.mode,),
+        ) or []
+        state = compute_drawdown(
+            [float(r["total_equity"]) for r in rows],
+            [self._normalize_time(r["snapshot_time"]) for r in rows],
+        )
+        logger.info(f"[REPO] MDD 상태 재구성: mode={self.mode}, 스냅샷 {len(rows)}건")
+        self._persist_locked(state, rebuilt=True)
+        return state
+    
+    def _persist_locked(self, state: DrawdownState, rebuilt: bool = False) -> None:
+        sql = """
+            INSERT INTO account_drawdown_state (
+                mode, peak_equity, peak_time, mdd, mdd_percent,
+                mdd_peak_time, trough_time, last_equity, last_snapshot_time, snapshot_count
+            )
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                peak_equity = VALUES(peak_equity),
+                peak_time = VALUES(peak_time),
+                mdd = VALUES(mdd),
+                mdd_percent = VALUES(mdd_percent),
+                mdd_peak_time = VALUES(mdd_peak_time),
+                trough_time = VALUES(trough_time),
+                last_equity = VALUES(last_equity),
+                last_snapshot_time = VALUES(last_snapshot_time),
+                snapshot_count = VALUES(snapshot_count)
+        """
+        params = (
+            self.mode, state.peak_equity, state.peak_time, state.mdd, state.mdd_percent,
+            state.mdd_peak_time, state.trough_time, state.last_equity, state.last_time, state.count
+        )
+        if rebuilt:
+            # 재구성 직전에 writer 를 flush 했으므로 동기로 기록하고 재구성 표시를 해제
+            self.db.execute_command(sql.rstrip() + ",\n                needs_rebuild = 0", params)
+        elif self.writer is not None:
+            self.writer.submit(sql, params, on_drop=self.invalidate)
+        else:
+            self.db.execute_command(sql, params)
+    
+    def _flag_rebuild(self) -> None:
+        """저장된 상태 행에 needs_rebuild=1 을 남깁니다 (재시작 후 첫 로드가 재구성)."""
+        sql = "UPDATE account_drawdown_state SET needs_rebuild = 1 WHERE mode = %s"
+        try:
+            if self.writer is not None:
+                self.writer.submit(sql, (self.mode,))
+            else:
+                self.db.execute_command(sql, (self.mode,))
+        except Exception as e:
+            logger.warning(f"[REPO] MDD 재구성 표시 실패: {e}")
+    
+    def _current_state_locked(self) -> DrawdownState:
+        if self._stale:
+            # 재구성 중(writer flush) 새로 폐기된 행은 다시 stale 로 표시되도록 먼저 해제
+            self._stale = False
+            self._state = self._rebuild_locked()
+        elif self._state is None:
+            self._state = self._load_state_locked()
+        return self._state
+    
+    def record(self, snapshot_time: datetime, total_equity: float) -> None:
+        """
+        스냅샷 1건을 러닝 상태에 반영합니다 (실패해도 예외를 올리지 않음).
+        """
+        ts = self._normalize_time(snapshot_time)
+        with self._lock:
+            try:
+                # stale 상태에는 점을 이어 붙이지 않는다 (먼저 재구성)
+                state = self._current_state_locked()
+                last_time = state.last_time
+                if last_time is not None and ts is not None and ts <= last_time:
+                    # 시간 역순/덮어쓰기 → 러닝 상태로는 반영 불가, 다음 record/조회 시 재구성
+                    self.invalidate()
+                    return
+                state.update(float(total_equity), ts)
+                self._persist_locked(state)
+            except Exception as e:
+                logger.warning(f"[REPO] MDD 상태 갱신 실패 (다음 조회 시 재구성): {e}")
+                self.invalidate()
+    
+    def invalidate(self) -> None:
+        """
+        스냅샷 적재 실패/버퍼 폐기 등으로 상태를 신뢰할 수 없을 때 호출
+
+        writer 스레드의 폐기 콜백에서도 호출되므로 락을 잡지 않습니다
+        (_rebuild_locked 가 락을 쥔 채 writer.flush() 로 대기할 수 있음).
+        이미 stale 이면 표시 UPDATE 를 다시 보내지 않습니다 (폐기 콜백 연쇄 방지).
+        """
+        if self._stale:
+            return
+        self._stale = True
+        self._flag_rebuild()
+    
+    def get_state(self) -> DrawdownState:
+        """전체 기간 러닝 상태 (사본)"""
+        with self._lock:
+            return DrawdownState.from_dict(self._current_state_locked().to_dict())
+
+
 class SymbolCacheRepository:
     """
     종목명 캐시 데이터 접근 클래스
@@ -2200,7 +2488,7 @@ def get_trade_repository() -> TradeRepository:
     """싱글톤 TradeRepository 인스턴스"""
     global _trade_repo
     if _trade_repo is None:
-        _trade_repo = TradeRepository()
+        _trade_repo = TradeRepository(writer=get_db_write_buffer())
     return _trade_repo
 
 
@@ -2208,10 +2496,41 @@ def get_account_snapshot_repository() -> AccountSnapshotRepository:
     """싱글톤 AccountSnapshotRepository 인스턴스"""
     global _snapshot_repo
     if _snapshot_repo is None:
-        _snapshot_repo = AccountSnapshotRepository()
+        writer = get_db_write_buffer()
+        _snapshot_repo = AccountSnapshotRepository(
+            writer=writer,
+            drawdown=get_account_drawdown_repository(writer=writer),
+        )
     return _snapshot_repo
 
 
+def get_account_drawdown_repository(
+    db: MySQLManager = None,
+    writer: Optional[BufferedDbWriter] = None,
+    mode: Optional[str] = None,
+) -> Optional[AccountDrawdownRepository]:
+    """
+    DB/모드별 공유 AccountDrawdownRepository
+
+    같은 프로세스에서 스냅샷을 적재하는 경로(저장소, 멀티데이 실행기)가
+    하나의 러닝 상태를 공유하도록 합니다. DB 비활성이면 None.
+    """
+    db = db or get_db_manager()
+    config = getattr(db, "config", None)
+    if config is not None and not getattr(config, "enabled", True):
+        return None
+    mode = mode or _get_namespace_mode()
+    state = _get_drawdown_repository_state()
+    with state["lock"]:
+        repo = state["repos"].get((id(db), mode))
+        if repo is None or repo.db is not db:
+            repo = AccountDrawdownRepository(db=db, writer=writer, mode=mode)
+            state["repos"][(id(db), mode)] = repo
+        elif repo.writer is None and writer is not None:
+            repo.writer = writer
+        return repo
+
+
 def get_symbol_cache_repository() -> SymbolCacheRepository:
     """싱글톤 SymbolCacheRepository 인스턴스"""
     global _symbol_cache_repo
@@ -0,0 +1,208 @@
+"""
+KIS Trend-ATR Trading System - 스키마 카탈로그 (information_schema 캐시)
+
+설정된 데이터베이스의 컬럼/인덱스/기본 키 정보를 information_schema 쿼리
+1회로 읽어 프로세스 메모리에 보관합니다. 마이그레이션 헬퍼, 저장소,
+멀티데이 실행기, 일일 리포트가 각자 information_schema 를 조회하던 것을
+이 카탈로그 하나로 대체합니다.
+
+★ 동작:
+    - 첫 조회 시 1회 로드 (columns + statistics UNION ALL)
+    - invalidate() 후 다음 조회 시 다시 로드
+    - MySQLManager 가 DDL(CREATE/ALTER/DROP/RENAME) 실행, 스키마 초기화,
+      재연결 시 invalidate() 를 호출합니다.
+
+★ 이름 규칙:
+    - 테이블/컬럼/인덱스 조회는 대소문자를 구분하지 않습니다.
+    - 기본 키 컬럼은 DB 가 반환한 이름과 순서 그대로 돌려줍니다.
+
+사용 예시:
+    from db.schema_catalog import get_schema_catalog
+
+    catalog = get_schema_catalog(db)
+    if catalog is not None and catalog.has_column("trades", "mode"):
+        ...
+"""
+
+import sys
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from utils.logger import get_logger
+
+logger = get_logger("schema_catalog")
+
+CANONICAL_MODULE_PATH = "kis_trend_atr_trading.db.schema_catalog"
+LEGACY_MODULE_PATH = "db.schema_catalog"
+
+
+_CATALOG_QUERY = """
+    SELECT 'COLUMN' AS entry_kind,
+           c.table_name AS entry_table,
+           c.column_name AS entry_column,
+           c.ordinal_position AS entry_position,
+           NULL AS entry_index,
+           c.data_type AS entry_data_type,
+           c.is_nullable AS entry_nullable,
+           c.column_default AS entry_default,
+           c.extra AS entry_extra
+    FROM information_schema.columns c
+    WHERE c.table_schema = %s
+    UNION ALL
+    SELECT 'INDEX' AS entry_kind,
+           s.table_name,
+           s.column_name,
+           s.seq_in_index,
+           s.index_name,
+           NULL, NULL, NULL, NULL
+    FROM information_schema.statistics s
+    WHERE s.table_schema = %s
+    ORDER BY entry_table, entry_kind, entry_index, entry_position
+"""
+
+
+@dataclass
+class TableSchema:
+    """테이블 1개의 컬럼/인덱스 정보"""
+
+    name: str
+    # 소문자 컬럼명 → {"name", "data_type", "is_nullable", "column_default", "extra"}
+    columns: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # 소문자 인덱스명 → 컬럼명 목록 (seq_in_index 순서)
+    indexes: Dict[str, List[str]] = field(default_factory=dict)
+
+    @property
+    def primary_key(self) -> List[str]:
+        return list(self.indexes.get("primary", []))
+
+
+def _row_value(row: Dict[str, Any], key: str) -> Any:
+    # 일부 환경에서 키가 대문자로 반환되는 경우를 방어합니다.
+    if key in row:
+        return row[key]
+    return row.get(key.upper())
+
+
+class SchemaCatalog:
+    """
+    프로세스 공용 information_schema 캐시
+
+    MySQLManager 인스턴스마다 1개 (싱글톤 매니저 → 프로세스당 1개).
+    """
+
+    def __init__(self, db: Any):
+        self.db = db
+        self._lock = threading.RLock()
+        self._tables: Optional[Dict[str, TableSchema]] = None
+        self._load_count = 0
+        self._invalidation_count = 0
+
+    @property
+    def database(self) -> str:
+        return str(getattr(getattr(self.db, "config", None), "database", "") or "")
+
+    @property
+    def loaded(self) -> bool:
+        return self._tables is not None
+
+    def invalidate(self) -> None:
+        """다음 조회 시 다시 로드 (마이그레이션/DDL 이후 호출)"""
+        with self._lock:
+            if self._tables is not None:
+                self._invalidation_count += 1
+            self._tables = None
+
+    def _load_locked(self) -> Dict[str, TableSchema]:
+        database = self.database
+        rows = self.db.execute_query(_CATALOG_QUERY, (database, database)) or []
+        tables: Dict[str, TableSchema] = {}
+        for row in rows:
+            table_name = str(_row_value(row, "entry_table") or "")
+            column_name = str(_row_value(row, "entry_column") or "")
+            if not table_name or not column_name:
+                continue
+            table = tables.get(table_name.lower())
+            if table is None:
+                table = TableSchema(name=table_name)
+                tables[table_name.lower()] = table
+            if _row_value(row, "entry_kind") == "INDEX":
+                index_name = str(_row_value(row, "entry_index") or "").lower()
+                table.indexes.setdefault(index_name, []).append(column_name)
+            else:
+                table.columns[column_name.lower()] = {
+                    "name": column_name,
+                    "data_type": str(_row_value(row, "entry_data_type") or "").lower(),
+                    "is_nullable": str(_row_value(row, "entry_nullable") or "").upper(),
+                    "column_default": _row_value(row, "entry_default"),
+                    "extra": str(_row_value(row, "entry_extra") or "").lower(),
+                }
+        self._load_count += 1
+        logger.info(
+            f"[DB] 스키마 카탈로그 로드: database={database}, tables={len(tables)}, "
+            f"load_count={self._load_count}"
+        )
+        return tables
+
+    def _get_table(self, table_name: str) -> Optional[TableSchema]:
+        with self._lock:
+            if self._tables is None:
+                self._tables = self._load_locked()
+            return self._tables.get(str(table_name).lower())
+
+    def table_exists(self, table_name: str) -> bool:
+        return self._get_table(table_name) is not None
+
+    def get_columns(self, table_name: str) -> Dict[str, Dict[str, Any]]:
+        """소문자 컬럼명 → 컬럼 메타 (테이블이 없으면 빈 dict)"""
+        table = self._get_table(table_name)
+        return {name: dict(meta) for name, meta in table.columns.items()} if table else {}
+
+    def get_column_names(self, table_name: str) -> set:
+        """소문자 컬럼명 집합"""
+        table = self._get_table(table_name)
+        return set(table.columns) if table else set()
+
+    def has_column(self, table_name: str, column_name: str) -> bool:
+        table = self._get_table(table_name)
+        return bool(table and str(column_name).lower() in table.columns)
+
+    def has_index(self, table_name: str, index_name: str) -> bool:
+        table = self._get_table(table_name)
+        return bool(table and str(index_name).lower() in table.indexes)
+
+    def get_primary_key(self, table_name: str) -> List[str]:
+        table = self._get_table(table_name)
+        return table.primary_key if table else []
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "loaded": self._tables is not None,
+                "tables": len(self._tables or {}),
+                "load_count": self._load_count,
+                "invalidation_count": self._invalidation_count,
+            }
+
+
+def get_schema_catalog(db: Any) -> Optional[SchemaCatalog]:
+    """
+    db 에 연결된 공용 카탈로그를 반환합니다.
+
+    카탈로그가 없는 DB 객체(PostgreSQL 매니저, 테스트 더블 등)는 None →
+    호출부는 기존 information_schema 조회로 대체합니다.
+    """
+    catalog = getattr(db, "schema_catalog", None)
+    return catalog if isinstance(catalog, SchemaCatalog) else None
+
+
+def _alias_module_names() -> None:
+    # db.mysql 과 같이 두 import 경로가 같은 모듈(같은 클래스)을 보도록 고정
+    module = sys.modules.get(__name__)
+    if module is None:
+        return
+    sys.modules.setdefault(CANONICAL_MODULE_PATH, module)
+    sys.modules.setdefault(LEGACY_MODULE_PATH, module)
+
+
+_alias_module_names()
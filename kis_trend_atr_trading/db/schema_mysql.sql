@@ -200,6 +200,31 @@ CREATE TABLE IF NOT EXISTS symbol_cache (
 CREATE INDEX idx_symbol_cache_updated_at ON symbol_cache(updated_at);
 
 
+-- ───────────────────────────────────────────────────────────────────────────────
+-- 4-1. account_drawdown_state 테이블: 러닝 고점/MDD 요약
+-- ───────────────────────────────────────────────────────────────────────────────
+--
+-- ★ 왜 필요한가?
+--    - 스냅샷이 쌓일수록 MDD 계산이 전체 스캔이 되는 문제 해결
+--    - account_snapshots 적재 시 모드별 1행을 O(1) 로 갱신, 리포트는 이 행만 읽음
+--    - 행이 없거나 어긋나면 account_snapshots 로부터 다시 계산됨
+--
+CREATE TABLE IF NOT EXISTS account_drawdown_state (
+    mode VARCHAR(16) NOT NULL PRIMARY KEY COMMENT '실행 모드 네임스페이스 (DRY_RUN/PAPER/REAL)',
+    peak_equity DECIMAL(15, 2) NOT NULL COMMENT '현재까지 최고 평가금액',
+    peak_time DATETIME NULL COMMENT '최고 평가금액 시각',
+    mdd DECIMAL(15, 2) NOT NULL DEFAULT 0 COMMENT '최대 낙폭 금액',
+    mdd_percent DECIMAL(8, 4) NOT NULL DEFAULT 0 COMMENT '최대 낙폭률 (%)',
+    mdd_peak_time DATETIME NULL COMMENT 'MDD 구간 고점 시각',
+    trough_time DATETIME NULL COMMENT 'MDD 저점 시각',
+    last_equity DECIMAL(15, 2) NULL COMMENT '마지막 반영 평가금액',
+    last_snapshot_time DATETIME NULL COMMENT '마지막 반영 스냅샷 시각',
+    snapshot_count INT NOT NULL DEFAULT 0 COMMENT '반영된 스냅샷 수',
+    needs_rebuild TINYINT(1) NOT NULL DEFAULT 0 COMMENT '1 이면 다음 로드 시 account_snapshots 로 재구성',
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '갱신 시각'
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='account_snapshots 기반 러닝 MDD 요약';
+
+
 -- ───────────────────────────────────────────────────────────────────────────────
 -- 5-1. 주문 상태 테이블: 재시작 복원용
 -- ───────────────────────────────────────────────────────────────────────────────
@@ -0,0 +1,408 @@
+"""
+KIS Trend-ATR Trading System - DB 배치 쓰기 버퍼
+
+주문 경로(trading thread)에서 account_snapshots / 리포트용 trades INSERT 를
+바로 실행하지 않고 메모리 큐에 쌓아 두었다가, 백그라운드 스레드가 한 트랜잭션
+안에서 SQL 문별 executemany 로 묶어 반영합니다.
+
+체결(fill) INSERT 는 이 버퍼를 거치지 않습니다 (TradeRepository 가 동기로 실행하고
+그 결과로 포지션 반영 여부를 결정하므로, 폐기될 수 있는 큐에 넣지 않음).
+
+★ 동작:
+    - submit(): 락 + deque append 만 수행 (DB 왕복 없음)
+    - 대기 행이 batch_rows 이상이거나 flush_interval_sec 가 지나면 반영
+    - flush(): 지금까지 submit 된 행이 모두 커밋될 때까지 기다리는 배리어
+      (일일 리포트 직전, 프로그램 종료 시 호출)
+    - 트랜잭션 실패 시 SQL 문별로 나눠 재시도하고, 실패한 행은 순서를 유지해
+      큐 앞쪽에 되돌려 backoff 후 다시 시도 (max_attempts 초과 시 폐기 + 로그)
+    - 재시도 행이 포함된 SQL 문이 다시 실패하면 행 단위로 실행해 문제 행만
+      되돌린다 (같은 배치의 정상 행은 반영)
+    - 대기 행이 max_pending_rows 를 넘으면 가장 오래된 행부터 폐기
+    - 폐기되는 행은 submit(on_drop=...) 콜백으로 호출 측에 알림
+      (예: 계좌 스냅샷 폐기 → MDD 러닝 상태 무효화)
+
+★ 멱등성:
+    - 버퍼는 SQL/파라미터를 그대로 전달하므로 idempotency_key 컬럼과
+      ON DUPLICATE KEY UPDATE 는 기존과 동일하게 동작합니다.
+
+★ 환경변수:
+    DB_WRITE_BUFFER_ENABLED    : 버퍼 사용 여부 (기본: true)
+    DB_WRITE_BUFFER_BATCH_ROWS : 즉시 반영을 트리거하는 대기 행 수 (기본: 200)
+    DB_WRITE_BUFFER_FLUSH_SEC  : 최대 반영 지연 (기본: 1.0초)
+    DB_WRITE_BUFFER_MAX_ROWS   : 최대 대기 행 수 (기본: 20000)
+
+사용 예시:
+    from db.write_buffer import get_db_write_buffer
+
+    writer = get_db_write_buffer()
+    if writer is not None:
+        writer.submit("INSERT INTO trades (...) VALUES (%s, ...)", params)
+        writer.flush()  # 배리어
+"""
+
+import atexit
+import builtins
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence
+
+from db.mysql import MySQLManager, get_db_manager
+from utils.logger import get_logger
+
+logger = get_logger("db_write_buffer")
+
+DEFAULT_BATCH_ROWS = 200
+DEFAULT_FLUSH_INTERVAL_SEC = 1.0
+DEFAULT_MAX_PENDING_ROWS = 20000
+DEFAULT_MAX_ATTEMPTS = 5
+_MAX_BACKOFF_SEC = 30.0
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    raw = os.getenv(name)
+    if raw is None:
+        return bool(default)
+    return str(raw).strip().lower() in ("true", "1", "yes", "on")
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return float(default)
+
+
+@dataclass
+class _PendingWrite:
+    sql: str
+    params: Sequence[Any]
+    attempts: int = 0
+    on_drop: Optional[Callable[[], None]] = None
+
+
+class BufferedDbWriter:
+    """
+    SQL 쓰기를 모아 executemany 배치로 반영하는 버퍼
+
+    Args:
+        db: MySQLManager (transaction() 컨텍스트를 제공하는 객체)
+        batch_rows: 대기 행이 이 수 이상이면 즉시 반영
+        flush_interval_sec: 최대 반영 지연
+        max_pending_rows: 최대 대기 행 수 (초과 시 오래된 행부터 폐기)
+        max_attempts: 행 단위 최대 시도 횟수
+    """
+
+    def __init__(
+        self,
+        db: MySQLManager,
+        *,
+        batch_rows: int = DEFAULT_BATCH_ROWS,
+        flush_interval_sec: float = DEFAULT_FLUSH_INTERVAL_SEC,
+        max_pending_rows: int = DEFAULT_MAX_PENDING_ROWS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ) -> None:
+        self.db = db
+        self._max_pending_rows = max(int(max_pending_rows), 1)
+        self._batch_rows = max(min(int(batch_rows), self._max_pending_rows), 1)
+        self._flush_interval_sec = max(float(flush_interval_sec), 0.001)
+        self._max_attempts = max(int(max_attempts), 1)
+        self._cond = threading.Condition(threading.Lock())
+        self._pending: Deque[_PendingWrite] = deque()
+        self._in_flight = 0
+        self._flush_requested = False
+        self._consecutive_failures = 0
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._submitted = 0
+        self._written = 0
+        self._transactions = 0
+        self._failed_transactions = 0
+        self._retried_rows = 0
+        self._dropped_overflow = 0
+        self._dropped_failed = 0
+        self._max_depth = 0
+        self._last_error = ""
+
+    # ════════════════════════════════════════════════════════════════
+    # 생산자 API
+    # ════════════════════════════════════════════════════════════════
+
+    def _start_locked(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True, name="db-write-buffer")
+        self._thread.start()
+
+    def submit(
+        self,
+        sql: str,
+        params: Sequence[Any],
+        on_drop: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        쓰기 1건을 큐에 넣습니다 (DB 왕복 없음).
+
+        on_drop: 이 행이 반영되지 못하고 폐기될 때(overflow / 최대 재시도 초과)
+                 writer 락 밖에서 호출되는 콜백
+        """
+        dropped: Optional[_PendingWrite] = None
+        with self._cond:
+            self._start_locked()
+            if len(self._pending) >= self._max_pending_rows:
+                dropped = self._pending.popleft()
+                self._dropped_overflow += 1
+                if self._dropped_overflow % 100 == 1:
+                    logger.error(
+                        "[DB_BUFFER] 대기 행 한도 초과 - 오래된 행 폐기 (누적 %s건)",
+                        self._dropped_overflow,
+                    )
+            self._pending.append(_PendingWrite(sql=sql, params=tuple(params), on_drop=on_drop))
+            self._submitted += 1
+            depth = len(self._pending)
+            if depth > self._max_depth:
+                self._max_depth = depth
+            if depth >= self._batch_rows:
+                self._cond.notify_all()
+        if dropped is not None:
+            self._notify_dropped([dropped])
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """지금까지 submit 된 행이 모두 반영(또는 폐기)될 때까지 대기합니다."""
+        with self._cond:
+            if not self._pending and self._in_flight == 0:
+                return True
+            if not self._running:
+                return False
+            self._flush_requested = True
+            self._cond.notify_all()
+            done = self._cond.wait_for(lambda: not self._pending and self._in_flight == 0, timeout=timeout)
+            if not done:
+                logger.warning("[DB_BUFFER] flush 배리어 타임아웃: pending=%s", len(self._pending))
+            return done
+
+    def close(self, timeout: float = 10.0) -> bool:
+        """남은 행을 반영하고 writer 스레드를 종료합니다."""
+        flushed = self.flush(timeout=timeout)
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+            thread = self._thread
+            self._thread = None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+        with self._cond:
+            if self._pending:
+                logger.error("[DB_BUFFER] 종료 시 미반영 행 %s건", len(self._pending))
+                return False
+        return flushed
+
+    # ════════════════════════════════════════════════════════════════
+    # writer 스레드
+    # ════════════════════════════════════════════════════════════════
+
+    def _backoff_sec(self) -> float:
+        if self._consecutive_failures <= 0:
+            return self._flush_interval_sec
+        return min(self._flush_interval_sec * (2 ** self._consecutive_failures), _MAX_BACKOFF_SEC)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                deadline = time.monotonic() + self._backoff_sec()
+                while self._running and not self._flush_requested:
+                    if self._consecutive_failures == 0 and len(self._pending) >= self._batch_rows:
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(timeout=remaining)
+                self._flush_requested = False
+                if not self._pending:
+                    if not self._running:
+                        return
+                    continue
+                batch = list(self._pending)
+                self._pending.clear()
+                self._in_flight = len(batch)
+
+            failed = self._write_batch(batch)
+
+            dropped: List[_PendingWrite] = []
+            with self._cond:
+                retry: List[_PendingWrite] = []
+                for item in failed:
+                    item.attempts += 1
+                    if item.attempts >= self._max_attempts:
+                        self._dropped_failed += 1
+                        dropped.append(item)
+                    else:
+                        retry.append(item)
+                if len(failed) > len(retry):
+                    logger.error(
+                        "[DB_BUFFER] 최대 재시도 초과 행 폐기: %s건 err=%s",
+                        len(failed) - len(retry),
+                        self._last_error,
+                    )
+                self._retried_rows += len(retry)
+                # 실패 행은 순서를 유지해 큐 앞쪽에 되돌린다
+                self._pending.extendleft(reversed(retry))
+                self._written += len(batch) - len(failed)
+                self._consecutive_failures = self._consecutive_failures + 1 if failed else 0
+                self._in_flight = 0
+                stop_now = bool(failed) and not self._running
+                self._cond.notify_all()
+            self._notify_dropped(dropped)
+            if stop_now:
+                # 종료 중 DB 장애: 무한 재시도하지 않고 남은 행은 close() 에서 보고
+                return
+
+    @staticmethod
+    def _notify_dropped(items: List[_PendingWrite]) -> None:
+        for item in items:
+            if item.on_drop is None:
+                continue
+            try:
+                item.on_drop()
+            except Exception as exc:
+                logger.warning("[DB_BUFFER] 폐기 콜백 오류: %s", exc)
+
+    def _execute_groups(self, groups: "OrderedDict[str, List[_PendingWrite]]") -> None:
+        with self.db.transaction() as cursor:
+            for sql, items in groups.items():
+                cursor.executemany(sql, [item.params for item in items])
+        with self._cond:
+            self._transactions += 1
+
+    def _execute_rows(self, sql: str, items: List[_PendingWrite]) -> List[_PendingWrite]:
+        """행마다 별도 트랜잭션으로 실행하고 실패한 행 목록을 반환합니다."""
+        failed: List[_PendingWrite] = []
+        for item in items:
+            try:
+                with self.db.transaction() as cursor:
+                    cursor.execute(sql, item.params)
+                with self._cond:
+                    self._transactions += 1
+            except Exception as exc:
+                self._record_failure(exc)
+                failed.append(item)
+        return failed
+
+    def _write_batch(self, batch: List[_PendingWrite]) -> List[_PendingWrite]:
+        """배치를 반영하고 실패한 행 목록을 반환합니다."""
+        groups: "OrderedDict[str, List[_PendingWrite]]" = OrderedDict()
+        for item in batch:
+            groups.setdefault(item.sql, []).append(item)
+
+        try:
+            self._execute_groups(groups)
+            return []
+        except Exception as exc:
+            self._record_failure(exc)
+
+        # 문제 SQL 을 격리하기 위해 SQL 문별 트랜잭션으로 재시도.
+        # 재시도 중인 행이 있는 SQL 문이 또 실패하면 일시 장애가 아니라 특정 행
+        # 문제로 보고 행 단위로 실행해 실패한 행만 되돌린다 (첫 실패는 순서 유지)
+        failed: List[_PendingWrite] = []
+        for sql, items in groups.items():
+            if len(groups) > 1:
+                try:
+                    self._execute_groups(OrderedDict([(sql, items)]))
+                    continue
+                except Exception as exc:
+                    self._record_failure(exc)
+            if len(items) > 1 and any(item.attempts > 0 for item in items):
+                failed.extend(self._execute_rows(sql, items))
+            else:
+                failed.extend(items)
+        return failed
+
+    def _record_failure(self, exc: Exception) -> None:
+        with self._cond:
+            self._failed_transactions += 1
+            self._last_error = str(exc)
+        logger.warning("[DB_BUFFER] 배치 반영 실패 (재시도 예정): %s", exc)
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "pending": len(self._pending),
+                "in_flight": int(self._in_flight),
+                "max_pending": int(self._max_depth),
+                "submitted": int(self._submitted),
+                "written": int(self._written),
+                "transactions": int(self._transactions),
+                "failed_transactions": int(self._failed_transactions),
+                "retried_rows": int(self._retried_rows),
+                "dropped_overflow": int(self._dropped_overflow),
+                "dropped_failed": int(self._dropped_failed),
+                "last_error": self._last_error,
+            }
+
+
+# ════════════════════════════════════════════════════════════════════════════════
+# 프로세스 단위 버퍼 레지스트리
+# ════════════════════════════════════════════════════════════════════════════════
+
+
+def _get_write_buffer_state() -> Dict[str, Any]:
+    # db.mysql 싱글톤과 동일하게 import 경로(db.* / kis_trend_atr_trading.db.*)와 무관하게 공유
+    state = getattr(builtins, "_kis_db_write_buffer_state", None)
+    if state is None:
+        state = {"lock": threading.Lock(), "buffers": {}}
+        setattr(builtins, "_kis_db_write_buffer_state", state)
+    return state
+
+
+def get_db_write_buffer(db: MySQLManager = None) -> Optional[BufferedDbWriter]:
+    """
+    DB 관리자별 공유 BufferedDbWriter 를 반환합니다.
+
+    DB_WRITE_BUFFER_ENABLED=false 이거나 DB 가 비활성이면 None
+    (호출 측은 기존 동기 경로를 사용).
+    """
+    if not _env_bool("DB_WRITE_BUFFER_ENABLED", True):
+        return None
+    db = db or get_db_manager()
+    config = getattr(db, "config", None)
+    if config is not None and not getattr(config, "enabled", True):
+        return None
+
+    state = _get_write_buffer_state()
+    with state["lock"]:
+        writer = state["buffers"].get(id(db))
+        if writer is None or writer.db is not db:
+            writer = BufferedDbWriter(
+                db,
+                batch_rows=int(_env_number("DB_WRITE_BUFFER_BATCH_ROWS", DEFAULT_BATCH_ROWS)),
+                flush_interval_sec=_env_number("DB_WRITE_BUFFER_FLUSH_SEC", DEFAULT_FLUSH_INTERVAL_SEC),
+                max_pending_rows=int(_env_number("DB_WRITE_BUFFER_MAX_ROWS", DEFAULT_MAX_PENDING_ROWS)),
+            )
+            state["buffers"][id(db)] = writer
+        return writer
+
+
+def flush_db_write_buffers(timeout: float = 10.0) -> bool:
+    """프로세스 내 모든 버퍼에 대한 배리어 (일일 리포트 직전 등)."""
+    state = _get_write_buffer_state()
+    with state["lock"]:
+        writers = list(state["buffers"].values())
+    return all([writer.flush(timeout=timeout) for writer in writers])
+
+
+def close_db_write_buffers(timeout: float = 10.0) -> None:
+    state = _get_write_buffer_state()
+    with state["lock"]:
+        writers = list(state["buffers"].values())
+        state["buffers"].clear()
+    for writer in writers:
+        try:
+            writer.close(timeout=timeout)
+        except Exception as exc:
+            logger.warning("[DB_BUFFER] 종료 중 오류: %s", exc)
+
+
+atexit.register(close_db_write_buffers)
@@ -31,6 +31,7 @@ KIS Trend-ATR Trading System - 멀티데이 전략 실행 파일
 """
 
 import argparse
+import functools
 import math
 import os
 import sys
@@ -70,6 +71,11 @@ from kis_trend_atr_trading.engine.evaluation_scheduler import (
     EvaluationSchedulerConfig,
     SymbolEvaluationScheduler,
 )
+from kis_trend_atr_trading.engine.symbol_evaluation_pool import (
+    SymbolEvaluationBatch,
+    SymbolEvaluationJob,
+    SymbolEvaluationPool,
+)
 from kis_trend_atr_trading.backtest.backtester import Backtester
 from kis_trend_atr_trading.universe import UniverseSelector
 from kis_trend_atr_trading.universe.universe_service import UniverseService
@@ -469,6 +475,7 @@ def run_trade(
     market_regime_worker_stop_event = None
     shared_pipeline_persistence_manager = None
     shared_pipeline_persistence_worker = None
+    symbol_eval_pool = None
     shared_pipeline_persistence_stop_event = None
     _stop_market_regime_worker = lambda: None
 
@@ -536,6 +543,16 @@ def run_trade(
             )
         )
         cadence_tracker = EvaluationCadenceTracker()
+        # 종목별 평가 병렬 실행 풀 (1이면 기존과 동일하게 메인 스레드에서 순차 실행)
+        symbol_eval_pool = SymbolEvaluationPool(
+            max_workers=int(getattr(settings, "SYMBOL_EVAL_MAX_WORKERS", 1) or 1),
+            budget_sec=float(getattr(settings, "SYMBOL_EVAL_LOOP_BUDGET_SEC", 2.0) or 0.0),
+        )
+        logger.info(
+            "[MULTI] symbol_eval workers=%s loop_budget_sec=%.1f",
+            symbol_eval_pool.max_workers,
+            symbol_eval_pool.budget_sec,
+        )
 
         rest_provider = KISRestMarketDataProvider(api=api)
         ws_provider = None
@@ -556,6 +573,8 @@ def run_trade(
                     reconnect_base_delay=float(runtime_config.ws_reconnect_backoff_base_sec),
                     failure_policy="rest_fallback",
                     approval_key_refresh_margin_min=30,
+                    hts_id=str(getattr(settings, "KIS_HTS_ID", "") or ""),
+                    execution_notice=bool(getattr(settings, "ENABLE_WS_EXECUTION_NOTICE", False)),
                 )
                 ws_provider = KISWSMarketDataProvider(
                     ws_client=ws_client,
@@ -565,6 +584,13 @@ def run_trade(
                     quote_static_cache_ttl_sec=float(
                         getattr(settings, "WS_QUOTE_STATIC_CACHE_TTL_SEC", 900.0) or 900.0
                     ),
+                    tick_dispatch_workers=int(getattr(settings, "WS_TICK_DISPATCH_WORKERS", 1)),
+                    tick_dispatch_max_pending_bars=int(
+                        getattr(settings, "WS_TICK_DISPATCH_MAX_PENDING_BARS", 8) or 8
+                    ),
+                    fill_event_bus=(
+                        api.fill_event_bus if ws_client.execution_notice else None
+                    ),
                 )
         
         # Universe 서비스 (일자별 1회 생성 + 재사용, 보유종목/신규진입 분리)
@@ -1281,6 +1307,87 @@ def run_trade(
                 _snapshot_is_stale(snapshot),
             )
 
+        def _preload_preopen_symbol(symbol: str, fetch_quote: bool) -> None:
+            rest_provider.get_recent_bars(stock_code=symbol, n=5, timeframe="D")
+            if fetch_quote:
+                rest_provider.get_latest_price(stock_code=symbol)
+
+        def _run_legacy_bar_evaluation(executor, backfill_missing_count: int):
+            symbol = executor.stock_code
+            if backfill_missing_count >= 2:
+                try:
+                    rest_provider.get_recent_bars(
+                        stock_code=symbol,
+                        n=max(backfill_missing_count + 2, 3),
+                        timeframe="1m",
+                    )
+                    logger.info(
+                        "[RUNTIME] WS recovery backfill attempted symbol=%s missing=%s",
+                        symbol,
+                        backfill_missing_count,
+                    )
+                except Exception as backfill_err:
+                    logger.warning(
+                        "[RUNTIME] WS recovery backfill failed symbol=%s missing=%s err=%s",
+                        symbol,
+                        backfill_missing_count,
+                        backfill_err,
+                    )
+            return executor.run_once()
+
+        def _recompute_entry_capacity() -> None:
+            nonlocal runtime_holdings, holdings_count, free_slots, ranked_entry_candidates, entry_candidates
+            runtime_holdings = [e.stock_code for e in active_executors if e.strategy.has_position]
+            holdings_count = len(runtime_holdings)
+            compute_capacity = getattr(universe_service, "compute_entry_capacity", None)
+            if callable(compute_capacity):
+                free_slots = int(compute_capacity(runtime_holdings, max_positions))
+            else:
+                free_slots = max(max_positions - len(set(runtime_holdings)), 0)
+            free_slots = max(free_slots, 0)
+            if stock_code == settings.DEFAULT_STOCK_CODE:
+                ranked_entry_candidates = universe_service.compute_entry_candidates(
+                    runtime_holdings,
+                    todays_universe,
+                )
+            else:
+                ranked_entry_candidates = [stock_code] if stock_code not in runtime_holdings else []
+            limit_candidates = getattr(universe_service, "limit_entry_candidates", None)
+            if callable(limit_candidates):
+                entry_candidates = list(limit_candidates(ranked_entry_candidates, free_slots))
+            else:
+                entry_candidates = list(ranked_entry_candidates[:free_slots])
+
+        def _finalize_symbol_evaluation(outcome) -> None:
+            """평가 결과 후처리 (스케줄러/메트릭/bar gate 는 메인 스레드에서만 갱신)"""
+            if outcome.error is not None:
+                raise outcome.error
+            executor = outcome.context["executor"]
+            symbol = executor.stock_code
+            path = outcome.context["path"]
+            reason = outcome.context["reason"]
+            executor_result = outcome.result or {}
+            evaluated_at = datetime.now(KST)
+            evaluation_interval_sec = fast_eval_scheduler.mark_evaluated(
+                symbol,
+                evaluated_at=evaluated_at,
+                evaluated_monotonic=time.monotonic(),
+                reason=reason,
+            )
+            executor_result["evaluation_interval_sec"] = evaluation_interval_sec
+            _record_cadence_metric(
+                symbol=str(symbol).zfill(6),
+                executor_result=executor_result,
+                has_position=bool(executor.strategy.has_position),
+                path=path,
+                reason=reason,
+            )
+            if path == "legacy_bar":
+                normalized_symbol_bar_ts = _normalize_bar_ts(outcome.context["symbol_bar_ts"])
+                if normalized_symbol_bar_ts is not None:
+                    bar_gate.mark_processed(symbol, normalized_symbol_bar_ts)
+            _recompute_entry_capacity()
+
         def _log_loop_metric(
             *,
             iteration: int,
@@ -1291,12 +1398,15 @@ def run_trade(
             market_regime_refresh_elapsed_sec: float,
             market_regime_snapshot,
             market_regime_refresh_skip_reason: str,
+            eval_metric: dict,
         ) -> None:
             logger.info(
                 "[LOOP_METRIC] iteration=%s elapsed_sec=%.3f since_prev_loop_start_sec=%s "
                 "symbols=%s market_regime_refresh_state=%s "
                 "market_regime_refresh_elapsed_sec=%.3f market_regime_snapshot_stale=%s "
-                "market_regime_refresh_skip_reason=%s",
+                "market_regime_refresh_skip_reason=%s eval_workers=%s eval_jobs=%s "
+                "eval_elapsed_sec=%.3f eval_budget_sec=%.3f eval_budget_exceeded=%s "
+                "eval_slowest_symbol=%s eval_slowest_sec=%.3f",
                 iteration,
                 max(time.monotonic() - loop_started_monotonic, 0.0),
                 _format_optional_elapsed_sec(since_prev_loop_start_sec),
@@ -1305,6 +1415,24 @@ def run_trade(
                 max(float(market_regime_refresh_elapsed_sec or 0.0), 0.0),
                 _snapshot_is_stale(market_regime_snapshot),
                 market_regime_refresh_skip_reason or "none",
+                symbol_eval_pool.max_workers,
+                int(eval_metric.get("jobs", 0)),
+                float(eval_metric.get("elapsed_sec", 0.0)),
+                symbol_eval_pool.budget_sec,
+                bool(eval_metric.get("budget_exceeded", False)),
+                eval_metric.get("slowest_symbol") or "none",
+                float(eval_metric.get("slowest_sec", 0.0)),
+            )
+
+        def _accumulate_eval_metric(eval_metric: dict, batch: SymbolEvaluationBatch) -> None:
+            eval_metric["jobs"] = int(eval_metric.get("jobs", 0)) + len(batch.outcomes)
+            eval_metric["elapsed_sec"] = float(eval_metric.get("elapsed_sec", 0.0)) + batch.elapsed_sec
+            if batch.slowest_sec >= float(eval_metric.get("slowest_sec", 0.0)) and batch.slowest_symbol:
+                eval_metric["slowest_symbol"] = batch.slowest_symbol
+                eval_metric["slowest_sec"] = batch.slowest_sec
+            eval_metric["budget_exceeded"] = bool(
+                symbol_eval_pool.budget_sec > 0
+                and eval_metric["elapsed_sec"] > symbol_eval_pool.budget_sec
             )
 
         def _record_cadence_metric(symbol: str, executor_result: dict, has_position: bool, path: str, reason: str) -> None:
@@ -1390,6 +1518,7 @@ def run_trade(
             market_regime_refresh_elapsed_sec = 0.0
             market_regime_refresh_skip_reason = "filter_disabled"
             market_regime_loop_context = MarketRegimeLoopContext()
+            loop_eval_metric = {}
             if hasattr(api, "prewarm_access_token_if_due"):
                 api.prewarm_access_token_if_due()
 
@@ -1580,23 +1709,51 @@ def run_trade(
             if _state_equals(decision.market_state, MarketSessionState.PREOPEN_WARMUP):
                 prewarm_date = now_kst.strftime("%Y-%m-%d")
                 if prewarm_date != last_prewarm_prepare_date:
-                    for symbol in run_symbols:
+                    prewarm_started = time.monotonic()
+                    prefetched_quote_codes = set()
+                    prefetch_quotes = getattr(rest_provider, "prefetch_quotes", None)
+                    if callable(prefetch_quotes):
                         try:
-                            rest_provider.get_recent_bars(stock_code=symbol, n=5, timeframe="D")
-                            rest_provider.get_latest_price(stock_code=symbol)
-                            if ws_provider is not None:
-                                prewarm_quotes = getattr(ws_provider, "prewarm_quotes", None)
-                                if callable(prewarm_quotes):
-                                    prewarm_quotes(_market_regime_subscription_symbols([symbol]))
-                        except Exception as preload_err:
+                            prefetched_quote_codes = set(prefetch_quotes(list(run_symbols)))
+                        except Exception as prefetch_err:
+                            logger.warning("[RUNTIME] preopen bulk quote prefetch failed err=%s", prefetch_err)
+                    preload_jobs = [
+                        SymbolEvaluationJob(
+                            symbol=str(symbol),
+                            fn=functools.partial(
+                                _preload_preopen_symbol,
+                                symbol,
+                                str(symbol) not in prefetched_quote_codes,
+                            ),
+                        )
+                        for symbol in dict.fromkeys(run_symbols)
+                    ]
+                    preload_batch = symbol_eval_pool.run_batch(preload_jobs)
+                    for outcome in preload_batch.outcomes:
+                        if outcome.error is not None:
                             logger.warning(
                                 "[RUNTIME] preopen preload failed symbol=%s err=%s",
-                                symbol,
-                                preload_err,
+                                outcome.symbol,
+                                outcome.error,
                             )
+                            continue
+                        if ws_provider is not None:
+                            prewarm_quotes = getattr(ws_provider, "prewarm_quotes", None)
+                            if callable(prewarm_quotes):
+                                try:
+                                    prewarm_quotes(_market_regime_subscription_symbols([outcome.symbol]))
+                                except Exception as preload_err:
+                                    logger.warning(
+                                        "[RUNTIME] preopen preload failed symbol=%s err=%s",
+                                        outcome.symbol,
+                                        preload_err,
+                                    )
                     logger.info(
-                        "[RUNTIME] PREOPEN_WARMUP preload completed symbols=%s",
+                        "[RUNTIME] PREOPEN_WARMUP preload completed symbols=%s "
+                        "bulk_quotes=%s elapsed_sec=%.3f",
                         len(run_symbols),
+                        len(prefetched_quote_codes),
+                        time.monotonic() - prewarm_started,
                     )
                     last_prewarm_prepare_date = prewarm_date
 
@@ -1901,6 +2058,7 @@ def run_trade(
                 )
                 due_fast_by_symbol = {item.symbol: item for item in due_fast}
 
+            pending_eval_jobs = []
             for executor in active_executors:
                 symbol = executor.stock_code
                 sticky_blocked = False
@@ -1961,120 +2119,81 @@ def run_trade(
                     due_item = due_fast_by_symbol.get(str(symbol).zfill(6))
                     if due_item is None:
                         continue
-                    executor_result = executor.run_fast_cycle() or {}
-                    evaluated_at = datetime.now(KST)
-                    evaluation_interval_sec = fast_eval_scheduler.mark_evaluated(
-                        symbol,
-                        evaluated_at=evaluated_at,
-                        evaluated_monotonic=time.monotonic(),
-                        reason=due_item.reason,
+                    eval_job = SymbolEvaluationJob(
+                        symbol=str(symbol),
+                        fn=executor.run_fast_cycle,
+                        context={
+                            "executor": executor,
+                            "path": "fast_ws",
+                            "reason": due_item.reason,
+                            "symbol_bar_ts": None,
+                        },
                     )
-                    executor_result["evaluation_interval_sec"] = evaluation_interval_sec
-                    _record_cadence_metric(
-                        symbol=str(symbol).zfill(6),
-                        executor_result=executor_result,
-                        has_position=bool(executor.strategy.has_position),
-                        path="fast_ws",
-                        reason=due_item.reason,
-                    )
-                    runtime_holdings = [e.stock_code for e in active_executors if e.strategy.has_position]
-                    holdings_count = len(runtime_holdings)
-                    compute_capacity = getattr(universe_service, "compute_entry_capacity", None)
-                    if callable(compute_capacity):
-                        free_slots = int(compute_capacity(runtime_holdings, max_positions))
+                else:
+                    backfill_missing_count = 0
+                    if active_feed_name == "ws" and ws_provider is not None:
+                        symbol_bar_ts = _normalize_bar_ts(ws_provider.get_last_completed_bar_ts(symbol))
+                        prev_bar_ts = bar_gate.last_processed(symbol)
+                        if (
+                            prev_bar_ts is not None
+                            and symbol_bar_ts is not None
+                            and symbol_bar_ts > (prev_bar_ts + timedelta(minutes=1))
+                        ):
+                            missing_count = int((symbol_bar_ts - prev_bar_ts).total_seconds() // 60) - 1
+                            if missing_count >= 2:
+                                backfill_missing_count = missing_count
                     else:
-                        free_slots = max(max_positions - len(set(runtime_holdings)), 0)
-                    free_slots = max(free_slots, 0)
-                    if stock_code == settings.DEFAULT_STOCK_CODE:
-                        ranked_entry_candidates = universe_service.compute_entry_candidates(
-                            runtime_holdings,
-                            todays_universe,
+                        symbol_bar_ts = completed_bar_ts_1m(
+                            now=now_kst,
+                            tz=runtime_config.market_timezone,
                         )
-                    else:
-                        ranked_entry_candidates = [stock_code] if stock_code not in runtime_holdings else []
-                    limit_candidates = getattr(universe_service, "limit_entry_candidates", None)
-                    if callable(limit_candidates):
-                        entry_candidates = list(limit_candidates(ranked_entry_candidates, free_slots))
-                    else:
-                        entry_candidates = list(ranked_entry_candidates[:free_slots])
-                    continue
 
-                if active_feed_name == "ws" and ws_provider is not None:
-                    symbol_bar_ts = _normalize_bar_ts(ws_provider.get_last_completed_bar_ts(symbol))
-                    prev_bar_ts = bar_gate.last_processed(symbol)
-                    if (
-                        prev_bar_ts is not None
-                        and symbol_bar_ts is not None
-                        and symbol_bar_ts > (prev_bar_ts + timedelta(minutes=1))
-                    ):
-                        missing_count = int((symbol_bar_ts - prev_bar_ts).total_seconds() // 60) - 1
-                        if missing_count >= 2:
-                            try:
-                                rest_provider.get_recent_bars(
-                                    stock_code=symbol,
-                                    n=max(missing_count + 2, 3),
-                                    timeframe="1m",
-                                )
-                                logger.info(
-                                    "[RUNTIME] WS recovery backfill attempted symbol=%s missing=%s",
-                                    symbol,
-                                    missing_count,
-                                )
-                            except Exception as backfill_err:
-                                logger.warning(
-                                    "[RUNTIME] WS recovery backfill failed symbol=%s missing=%s err=%s",
-                                    symbol,
-                                    missing_count,
-                                    backfill_err,
-                                )
-                else:
-                    symbol_bar_ts = completed_bar_ts_1m(
-                        now=now_kst,
-                        tz=runtime_config.market_timezone,
-                    )
+                    if not bar_gate.should_run(symbol, _normalize_bar_ts(symbol_bar_ts)):
+                        continue
 
-                if not bar_gate.should_run(symbol, _normalize_bar_ts(symbol_bar_ts)):
-                    continue
+                    eval_job = SymbolEvaluationJob(
+                        symbol=str(symbol),
+                        fn=functools.partial(
+                            _run_legacy_bar_evaluation,
+                            executor,
+                            backfill_missing_count,
+                        ),
+                        context={
+                            "executor": executor,
+                            "path": "legacy_bar",
+                            "reason": "legacy_bar",
+                            "symbol_bar_ts": symbol_bar_ts,
+                        },
+                    )
 
-                executor_result = executor.run_once() or {}
-                evaluated_at = datetime.now(KST)
-                evaluation_interval_sec = fast_eval_scheduler.mark_evaluated(
-                    symbol,
-                    evaluated_at=evaluated_at,
-                    evaluated_monotonic=time.monotonic(),
-                    reason="legacy_bar",
-                )
-                executor_result["evaluation_interval_sec"] = evaluation_interval_sec
-                _record_cadence_metric(
-                    symbol=str(symbol).zfill(6),
-                    executor_result=executor_result,
-                    has_position=bool(executor.strategy.has_position),
-                    path="legacy_bar",
-                    reason="legacy_bar",
-                )
-                normalized_symbol_bar_ts = _normalize_bar_ts(symbol_bar_ts)
-                if normalized_symbol_bar_ts is not None:
-                    bar_gate.mark_processed(symbol, normalized_symbol_bar_ts)
-                runtime_holdings = [e.stock_code for e in active_executors if e.strategy.has_position]
-                holdings_count = len(runtime_holdings)
-                compute_capacity = getattr(universe_service, "compute_entry_capacity", None)
-                if callable(compute_capacity):
-                    free_slots = int(compute_capacity(runtime_holdings, max_positions))
+                if symbol_eval_pool.max_workers <= 1:
+                    # 순차 모드: 평가 직후 후처리 → 다음 종목 진입 허용에 즉시 반영
+                    eval_batch = symbol_eval_pool.run_batch([eval_job])
+                    _accumulate_eval_metric(loop_eval_metric, eval_batch)
+                    _finalize_symbol_evaluation(eval_batch.outcomes[0])
                 else:
-                    free_slots = max(max_positions - len(set(runtime_holdings)), 0)
-                free_slots = max(free_slots, 0)
-                if stock_code == settings.DEFAULT_STOCK_CODE:
-                    ranked_entry_candidates = universe_service.compute_entry_candidates(
-                        runtime_holdings,
-                        todays_universe,
+                    pending_eval_jobs.append(eval_job)
+
+            if pending_eval_jobs:
+                # 병렬 모드: 진입 허용 종목 수는 free_slots 이하로 이미 제한되어 있으므로
+                # 동시에 평가해도 max_positions 를 넘지 않음
+                eval_batch = symbol_eval_pool.run_batch(pending_eval_jobs)
+                _accumulate_eval_metric(loop_eval_metric, eval_batch)
+                if eval_batch.budget_exceeded:
+                    logger.warning(
+                        "[MULTI] symbol eval budget exceeded elapsed_sec=%.3f budget_sec=%.3f "
+                        "slowest_symbol=%s slowest_sec=%.3f jobs=%s",
+                        eval_batch.elapsed_sec,
+                        eval_batch.budget_sec,
+                        eval_batch.slowest_symbol,
+                        eval_batch.slowest_sec,
+                        len(eval_batch.outcomes),
                     )
-                else:
-                    ranked_entry_candidates = [stock_code] if stock_code not in runtime_holdings else []
-                limit_candidates = getattr(universe_service, "limit_entry_candidates", None)
-                if callable(limit_candidates):
-                    entry_candidates = list(limit_candidates(ranked_entry_candidates, free_slots))
-                else:
-                    entry_candidates = list(ranked_entry_candidates[:free_slots])
+                for outcome in eval_batch.outcomes:
+                    if outcome.error is None:
+                        _finalize_symbol_evaluation(outcome)
+                if eval_batch.first_error is not None:
+                    raise eval_batch.first_error
 
             if _state_equals(decision.market_state, MarketSessionState.POSTCLOSE):
                 report_date = now_kst.strftime("%Y-%m-%d")
@@ -2100,6 +2219,7 @@ def run_trade(
                     market_regime_refresh_elapsed_sec=market_regime_refresh_elapsed_sec,
                     market_regime_snapshot=shared_market_regime_snapshot,
                     market_regime_refresh_skip_reason=market_regime_refresh_skip_reason,
+                    eval_metric=loop_eval_metric,
                 )
                 logger.info(f"[MULTI] 최대 반복 도달: {max_runs}")
                 break
@@ -2126,6 +2246,7 @@ def run_trade(
                 market_regime_refresh_elapsed_sec=market_regime_refresh_elapsed_sec,
                 market_regime_snapshot=shared_market_regime_snapshot,
                 market_regime_refresh_skip_reason=market_regime_refresh_skip_reason,
+                eval_metric=loop_eval_metric,
             )
             logger.info(
                 "[MULTI] 다음 실행까지 %s초 대기 (market=%s overlay=%s feed=%s)",
@@ -2166,6 +2287,8 @@ def run_trade(
         logger.error(f"거래 오류: {e}")
     finally:
         _stop_market_regime_worker()
+        if symbol_eval_pool is not None:
+            symbol_eval_pool.shutdown()
         if shared_pipeline_persistence_stop_event is not None:
             shared_pipeline_persistence_stop_event.set()
         if shared_pipeline_persistence_worker is not None:
@@ -67,18 +67,24 @@ try:
     )
     from kis_trend_atr_trading.db.repository import get_position_repository
     from kis_trend_atr_trading.db.repository import get_trade_repository
+    from kis_trend_atr_trading.db.repository import get_account_drawdown_repository
     from kis_trend_atr_trading.db.mysql import get_db_manager, QueryError
+    from kis_trend_atr_trading.db.write_buffer import flush_db_write_buffers, get_db_write_buffer
+    from kis_trend_atr_trading.db.schema_catalog import get_schema_catalog
     from kis_trend_atr_trading.core.market_data import MarketDataProvider
     from kis_trend_atr_trading.engine.pullback_pipeline_models import (
         AccountRiskSnapshot,
         HoldingsRiskSnapshot,
     )
     from kis_trend_atr_trading.engine.pullback_pipeline_stores import (
+        EVICT_REASON_CAPACITY,
         AccountRiskStore,
         ArmedCandidateStore,
         DailyContextStore,
         DirtySymbolSet,
         EntryIntentQueue,
+        ExpiringMap,
+        ShardedDirtySymbolSet,
     )
     from kis_trend_atr_trading.engine.pullback_pipeline_workers import (
         DailyRefreshThread,
@@ -154,18 +160,24 @@ except ImportError:
     )
     from db.repository import get_position_repository
     from db.repository import get_trade_repository
+    from db.repository import get_account_drawdown_repository
     from db.mysql import get_db_manager, QueryError
+    from db.write_buffer import flush_db_write_buffers, get_db_write_buffer
+    from db.schema_catalog import get_schema_catalog
     from core.market_data import MarketDataProvider
     from engine.pullback_pipeline_models import (
         AccountRiskSnapshot,
         HoldingsRiskSnapshot,
     )
     from engine.pullback_pipeline_stores import (
+        EVICT_REASON_CAPACITY,
         AccountRiskStore,
         ArmedCandidateStore,
         DailyContextStore,
         DirtySymbolSet,
         EntryIntentQueue,
+        ExpiringMap,
+        ShardedDirtySymbolSet,
     )
     from engine.pullback_pipeline_workers import (
         DailyRefreshThread,
@@ -230,6 +242,7 @@ class DailySignalSnapshotCache:
     atr: float = 0.0
     adx: float = 0.0
     trend: str = "SIDEWAYS"
+    indicator_engine: Optional[Any] = None
 
 
 @dataclass
@@ -242,6 +255,7 @@ class PreparedEvaluationContext:
     intraday_bars: List[dict] = field(default_factory=list)
     has_pending_order: bool = False
     used_cached_daily: bool = False
+    intraday_session: Optional[Any] = None
 
 
 class MultidayExecutor:
@@ -377,6 +391,14 @@ class MultidayExecutor:
         except Exception as e:
             logger.warning(f"[REPORT_DB] DB 매니저 초기화 실패 (성과 적재 비활성): {e}")
             self._report_db = None
+        # 성과 적재 INSERT 는 배치 버퍼로 넘겨 주문 경로에서 DB 왕복을 제거
+        try:
+            self._report_writer = (
+                get_db_write_buffer(self._report_db) if self._report_db is not None else None
+            )
+        except Exception as e:
+            logger.warning(f"[REPORT_DB] 쓰기 버퍼 초기화 실패 (동기 적재): {e}")
+            self._report_writer = None
         self._report_table_columns: Dict[str, set] = {}
         try:
             self._report_mode = get_db_namespace_mode()
@@ -385,6 +407,19 @@ class MultidayExecutor:
                 "REAL" if self.trading_mode in ("REAL", "LIVE")
                 else ("DRY_RUN" if self.trading_mode == "CBT" else "PAPER")
             )
+        # 스냅샷 적재 시 러닝 MDD 상태를 함께 갱신 (리포트의 전체 스캔 제거)
+        try:
+            self._report_drawdown = (
+                get_account_drawdown_repository(
+                    self._report_db,
+                    writer=self._report_writer,
+                    mode=self._report_mode,
+                )
+                if self._report_db is not None else None
+            )
+        except Exception as e:
+            logger.warning(f"[REPORT_DB] MDD 상태 초기화 실패 (리포트에서 재계산): {e}")
+            self._report_drawdown = None
         self._report_snapshot_interval_sec = max(
             int(getattr(settings, "REPORT_SNAPSHOT_INTERVAL_SEC", 300)),
             30,
@@ -447,12 +482,13 @@ class MultidayExecutor:
         self._pullback_candidate_store: Optional[ArmedCandidateStore] = None
         self._pullback_daily_context_store: Optional[DailyContextStore] = None
         self._pullback_account_risk_store: Optional[AccountRiskStore] = None
-        self._pullback_dirty_symbols: Optional[DirtySymbolSet] = None
+        self._pullback_dirty_symbols: Optional[ShardedDirtySymbolSet] = None
         self._pullback_entry_queue: Optional[EntryIntentQueue] = None
         self._pullback_daily_refresh_worker: Optional[DailyRefreshThread] = None
         self._pullback_risk_snapshot_worker: Optional[RiskSnapshotThread] = None
         self._pullback_setup_worker: Optional[PullbackSetupWorker] = None
         self._pullback_timing_worker: Optional[PullbackTimingWorker] = None
+        self._pullback_timing_workers: List[PullbackTimingWorker] = []
         self._pullback_order_worker: Optional[OrderExecutionWorker] = None
         self._pipeline_health_monitor_worker: Optional[PipelineHealthMonitorThread] = None
         self._pipeline_persistence_worker: Optional[PipelinePersistenceThread] = None
@@ -472,8 +508,11 @@ class MultidayExecutor:
         self._bootstrap_pipeline_recovery: Optional[Any] = None
         self._strategy_pipeline_enabled_tags: tuple[str, ...] = ()
         self._strategy_shadow_state_lock = threading.Lock()
-        self._strategy_shadow_candidates: Dict[str, Any] = {}
-        self._strategy_shadow_intents: Dict[str, Any] = {}
+        self._strategy_shadow_candidates = ExpiringMap(
+            max_size=self._candidate_store_max_size(),
+            on_evict=self._on_pipeline_candidate_evicted,
+        )
+        self._strategy_shadow_intents = ExpiringMap(max_size=self._candidate_store_max_size())
         self._pipeline_recovered_pending_intents: List[Dict[str, Any]] = []
         self._pullback_threaded_context_version: str = ""
         self._pullback_daily_context_version: str = ""
@@ -532,6 +571,8 @@ class MultidayExecutor:
         self._degraded_mode_transitions: int = 0
         self._degraded_mode_current: bool = False
         self._degraded_mode_reason: str = ""
+        self._degraded_stalled_shards: List[str] = []
+        self._timing_shard_health: Dict[int, str] = {}
         self._degraded_ingress_reject_count_by_strategy: Dict[str, int] = {}
         self._authoritative_queue_reject_reason: str = ""
         self._candidate_cleanup_stats: Dict[str, int] = {}
@@ -651,6 +692,30 @@ class MultidayExecutor:
                 tags.append(normalized)
         return tuple(tags)
 
+    @staticmethod
+    def _candidate_store_max_size() -> int:
+        return max(int(getattr(settings, "CANDIDATE_STORE_MAX_SIZE", 0) or 0), 0)
+
+    def _on_pipeline_candidate_evicted(self, key: str, candidate: Any, reason: str) -> None:
+        """용량 초과로 밀려난 후보를 analytics 에 남김 (만료는 cleanup_threaded_pipeline_state 에서 기록)"""
+        if reason != EVICT_REASON_CAPACITY:
+            return
+        self._log_strategy_analytics_event(
+            event_type="candidate_evicted",
+            stage="cleanup",
+            decision="evicted",
+            reject_reason=reason,
+            strategy_tag=str(getattr(candidate, "strategy_tag", "") or "pullback_rebreakout"),
+            symbol=str(getattr(candidate, "symbol", "") or ""),
+            candidate=candidate,
+            source_component="candidate_store",
+            payload_json={
+                "store_key": key,
+                "expires_at": getattr(candidate, "expires_at", None),
+                "max_size": self._candidate_store_max_size(),
+            },
+        )
+
     @staticmethod
     def _strategy_shadow_key(strategy_tag: str, symbol: str) -> str:
         return f"{str(strategy_tag or '').strip()}:{str(symbol or '').zfill(6)}"
@@ -1110,16 +1175,11 @@ class MultidayExecutor:
             expired_pullback_candidates = list(self._pullback_candidate_store.pop_expired(current_now) or [])
             removed_pullback_candidates = len(expired_pullback_candidates)
         with self._strategy_shadow_state_lock:
-            for key, candidate in list(self._strategy_shadow_candidates.items()):
-                expires_at = getattr(candidate, "expires_at", None)
-                if isinstance(expires_at, datetime) and expires_at <= current_now:
-                    expired_shadow_candidates.append(self._strategy_shadow_candidates.pop(key))
-                    removed_shadow_candidates += 1
-            for key, intent in list(self._strategy_shadow_intents.items()):
-                expires_at = getattr(intent, "expires_at", None)
-                if isinstance(expires_at, datetime) and expires_at <= current_now:
-                    self._strategy_shadow_intents.pop(key, None)
-                    removed_shadow_intents += 1
+            expired_shadow_candidates = [
+                candidate for _, candidate in self._strategy_shadow_candidates.pop_expired(current_now)
+            ]
+            removed_shadow_candidates = len(expired_shadow_candidates)
+            removed_shadow_intents = len(self._strategy_shadow_intents.pop_expired(current_now))
         total_candidates = int(removed_pullback_candidates + removed_shadow_candidates)
         stats = {
             "pullback_candidates": removed_pullback_candidates,
@@ -1181,6 +1241,7 @@ class MultidayExecutor:
             getattr(self, "_pullback_setup_worker", None),
             getattr(self, "_pullback_timing_worker", None),
             getattr(self, "_pullback_order_worker", None),
+            *list(getattr(self, "_pullback_timing_workers", None) or []),
         )
         return bool(
             stop_event is not None
@@ -1197,6 +1258,9 @@ class MultidayExecutor:
         stop_event = getattr(self, "_pullback_pipeline_stop_event", None)
         if stop_event is not None:
             stop_event.set()
+        dirty_symbols = getattr(self, "_pullback_dirty_symbols", None)
+        if dirty_symbols is not None:
+            dirty_symbols.wake()
 
     def _ensure_threaded_pullback_pipeline_started(self) -> None:
         if not self._is_any_threaded_pullback_pipeline_enabled():
@@ -1221,12 +1285,29 @@ class MultidayExecutor:
                 exit_queue_depth=max(int(getattr(settings, "DEGRADED_MODE_EXIT_QUEUE_DEPTH", 256) or 256), 0),
                 min_hold_sec=max(float(getattr(settings, "DEGRADED_MODE_MIN_HOLD_SEC", 15) or 15.0), 0.0),
             )
-        self._pullback_candidate_store = ArmedCandidateStore()
+        self._pullback_candidate_store = ArmedCandidateStore(
+            max_size=self._candidate_store_max_size(),
+            on_evict=self._on_pipeline_candidate_evicted,
+        )
         self._pullback_daily_context_store = DailyContextStore(
             max_symbols=max(int(getattr(settings, "DAILY_CONTEXT_STORE_MAX_SYMBOLS", 256) or 256), 1)
         )
         self._pullback_account_risk_store = AccountRiskStore()
-        self._pullback_dirty_symbols = DirtySymbolSet()
+        timing_worker_count = max(int(getattr(settings, "PULLBACK_TIMING_WORKERS", 1) or 1), 1)
+        if timing_worker_count > 1:
+            logger.warning(
+                "[PULLBACK_PIPELINE] PULLBACK_TIMING_WORKERS=%s: timing shards share executor evaluation state, "
+                "so extra workers add contention without parallelism (1 recommended)",
+                timing_worker_count,
+            )
+        self._pullback_dirty_symbols = ShardedDirtySymbolSet(
+            timing_worker_count,
+            coalesce_window_sec=max(
+                float(getattr(settings, "PULLBACK_TIMING_DIRTY_COALESCE_SEC", 0.0) or 0.0),
+                0.0,
+            ),
+            priority_fn=self._is_pullback_dirty_priority_symbol,
+        )
         authoritative_queue = True
         queue_maxsize = min(
             max(int(getattr(settings, "PULLBACK_ENTRY_INTENT_QUEUE_MAXSIZE", 256) or 256), 1),
@@ -1249,6 +1330,7 @@ class MultidayExecutor:
                 pullback_strategy=self.strategy.pullback_strategy,
                 trend_atr_strategy=self.strategy,
                 orb_strategy=getattr(self.strategy, "orb_strategy", None),
+                orb_session_source=self.fetch_cached_intraday_session_if_available,
             )
         if self._is_pipeline_state_persistence_enabled() and self._pipeline_persistence_manager is None:
             logger.warning(
@@ -1284,18 +1366,25 @@ class MultidayExecutor:
             stop_event=self._pullback_pipeline_stop_event,
             on_error=self._handle_pullback_pipeline_worker_error,
         )
-        self._pullback_timing_worker = PullbackTimingWorker(
-            executor=self,
-            candidate_store=self._pullback_candidate_store,
-            dirty_symbols=self._pullback_dirty_symbols,
-            entry_queue=self._pullback_entry_queue,
-            strategy_registry=self._strategy_pipeline_registry,
-            enabled_strategy_tags=self._strategy_pipeline_enabled_tags,
-            health_store=self._strategy_pipeline_health_store,
-            degraded_controller=self._strategy_pipeline_degraded_controller,
-            stop_event=self._pullback_pipeline_stop_event,
-            on_error=self._handle_pullback_pipeline_worker_error,
-        )
+        # 샤드별 워커 1개: 같은 종목은 항상 같은 워커, 의도는 단일 authoritative 큐로 합류
+        self._pullback_timing_workers = [
+            PullbackTimingWorker(
+                executor=self,
+                candidate_store=self._pullback_candidate_store,
+                dirty_symbols=self._pullback_dirty_symbols.shard(shard_index),
+                entry_queue=self._pullback_entry_queue,
+                strategy_registry=self._strategy_pipeline_registry,
+                enabled_strategy_tags=self._strategy_pipeline_enabled_tags,
+                health_store=self._strategy_pipeline_health_store,
+                degraded_controller=self._strategy_pipeline_degraded_controller,
+                stop_event=self._pullback_pipeline_stop_event,
+                on_error=self._handle_pullback_pipeline_worker_error,
+                shard_index=shard_index,
+                shard_count=timing_worker_count,
+            )
+            for shard_index in range(timing_worker_count)
+        ]
+        self._pullback_timing_worker = self._pullback_timing_workers[0]
         self._pullback_order_worker = OrderExecutionWorker(
             executor=self,
             candidate_store=self._pullback_candidate_store,
@@ -1365,7 +1454,8 @@ class MultidayExecutor:
         if self._pipeline_persistence_worker is not None:
             self._pipeline_persistence_worker.start()
         self._pullback_setup_worker.start()
-        self._pullback_timing_worker.start()
+        for timing_worker in self._pullback_timing_workers:
+            timing_worker.start()
         self._pullback_order_worker.start()
         if self._pipeline_health_monitor_worker is not None:
             self._pipeline_health_monitor_worker.start()
@@ -1393,6 +1483,9 @@ class MultidayExecutor:
         stop_event = getattr(self, "_pullback_pipeline_stop_event", None)
         if stop_event is not None:
             stop_event.set()
+        dirty_symbols = getattr(self, "_pullback_dirty_symbols", None)
+        if dirty_symbols is not None:
+            dirty_symbols.wake()
 
         current_thread = threading.current_thread()
         for attr_name in (
@@ -1410,6 +1503,10 @@ class MultidayExecutor:
             if worker.is_alive() and worker is not current_thread:
                 worker.join(timeout=2.0)
             setattr(self, attr_name, None)
+        for worker in list(getattr(self, "_pullback_timing_workers", None) or []):
+            if worker.is_alive() and worker is not current_thread:
+                worker.join(timeout=2.0)
+        self._pullback_timing_workers = []
 
         self._pullback_pipeline_stop_event = None
         self._pullback_entry_queue = None
@@ -1447,6 +1544,8 @@ class MultidayExecutor:
         self._degraded_mode_transitions = 0
         self._degraded_mode_current = False
         self._degraded_mode_reason = ""
+        self._degraded_stalled_shards = []
+        self._timing_shard_health = {}
         self._degraded_ingress_reject_count_by_strategy = {}
         self._authoritative_queue_reject_reason = ""
         self._candidate_cleanup_stats = {}
@@ -1496,6 +1595,47 @@ class MultidayExecutor:
             return []
         return normalized
 
+    def fetch_intraday_session(self, stock_code: Optional[str] = None) -> Optional[Any]:
+        """
+        WS 완성 분봉으로 누적된 장중 세션 스냅샷 (opening range / VWAP / 최근 종가).
+
+        provider 가 세션 누적을 지원하지 않거나, 거래량 있는 분봉이 아직 없거나,
+        누적 범위가 ORB 설정(opening range / 최근 돌파 lookback)보다 짧으면 None 을 반환하며,
+        이 경우 호출자는 기존 분봉 리스트 경로를 사용합니다.
+        """
+        provider = getattr(self, "market_data_provider", None)
+        session_fn = getattr(provider, "get_intraday_session", None)
+        if not callable(session_fn):
+            return None
+        try:
+            session = session_fn(str(stock_code or self.stock_code).zfill(6))
+        except Exception as exc:
+            logger.debug("[ORB] intraday session unavailable: symbol=%s err=%s", stock_code or self.stock_code, exc)
+            return None
+        if session is None or float(getattr(session, "cum_volume", 0.0) or 0.0) <= 0.0:
+            return None
+        covers = getattr(session, "covers", None)
+        if callable(covers) and not covers(
+            max(int(getattr(settings, "ORB_OPENING_RANGE_MINUTES", 5) or 5), 3),
+            max(int(getattr(settings, "ORB_RECENT_BREAKOUT_LOOKBACK_BARS", 3) or 3), 1),
+        ):
+            return None
+        return session
+
+    def fetch_cached_intraday_session_if_available(self, stock_code: Optional[str] = None) -> Optional[Any]:
+        if not self.is_cached_intraday_provider_ready():
+            return None
+        return self.fetch_intraday_session(stock_code)
+
+    def _is_pullback_dirty_priority_symbol(self, symbol: str) -> bool:
+        """보유 중이거나 armed 후보가 있는 종목은 dirty 대기열에서 우선 평가"""
+        if str(symbol).zfill(6) == str(self.stock_code).zfill(6) and bool(
+            getattr(self.strategy, "has_position", False)
+        ):
+            return True
+        candidate_store = getattr(self, "_pullback_candidate_store", None)
+        return candidate_store is not None and candidate_store.get(symbol) is not None
+
     def _pullback_pipeline_metrics(self) -> Dict[str, Any]:
         shadow_counts = self.get_strategy_shadow_counts()
         candidate_counts = dict(getattr(self, "_candidate_store_size_by_strategy", {}) or {})
@@ -1506,6 +1646,8 @@ class MultidayExecutor:
         intent_counts.update(dict(shadow_counts.get("intents") or {}))
         if self._pullback_entry_queue is not None:
             intent_counts["pullback_rebreakout"] = int(self._pullback_entry_queue.qsize())
+        dirty_symbols = getattr(self, "_pullback_dirty_symbols", None)
+        dirty_metrics = dirty_symbols.metrics() if dirty_symbols is not None else {}
         return {
             "daily_context_refresh_ms": float(getattr(self, "_daily_context_refresh_ms", 0.0) or 0.0),
             "daily_context_refresh_count": int(getattr(self, "_daily_context_refresh_count", 0) or 0),
@@ -1551,11 +1693,18 @@ class MultidayExecutor:
             "worker_state_reason": dict(getattr(self, "_worker_state_reason", {}) or {}),
             "worker_lag_sec": dict(getattr(self, "_worker_lag_sec", {}) or {}),
             "dirty_symbol_count": int(getattr(self, "_dirty_symbol_count", 0) or 0),
+            "dirty_mark_to_drain_ms": dict(dirty_metrics.get("dirty_mark_to_drain_ms") or {}),
+            "dirty_mark_to_eval_ms": dict(dirty_metrics.get("dirty_mark_to_eval_ms") or {}),
+            "dirty_coalesced_count": int(dirty_metrics.get("dirty_coalesced_count", 0) or 0),
+            "dirty_priority_drain_count": int(dirty_metrics.get("dirty_priority_drain_count", 0) or 0),
             "candidate_store_size": int(getattr(self, "_candidate_store_size", 0) or 0),
             "dropped_intent_count": int(getattr(self, "_dropped_intent_count", 0) or 0),
             "degraded_mode_transitions": int(getattr(self, "_degraded_mode_transitions", 0) or 0),
             "degraded_mode_current": bool(getattr(self, "_degraded_mode_current", False)),
             "degraded_mode_reason": str(getattr(self, "_degraded_mode_reason", "") or ""),
+            "degraded_stalled_shards": list(getattr(self, "_degraded_stalled_shards", []) or []),
+            "timing_shard_health": dict(getattr(self, "_timing_shard_health", {}) or {}),
+            "dirty_pending_by_shard": list(dirty_metrics.get("dirty_pending_by_shard") or []),
             "degraded_ingress_reject_count_by_strategy": dict(
                 getattr(self, "_degraded_ingress_reject_count_by_strategy", {}) or {}
             ),
@@ -2167,6 +2316,13 @@ class MultidayExecutor:
     def _report_db_available(self) -> bool:
         return getattr(self, "_report_db", None) is not None
 
+    def _execute_report_write(self, sql: str, params: tuple, on_drop=None) -> None:
+        writer = getattr(self, "_report_writer", None)
+        if writer is not None:
+            writer.submit(sql, params, on_drop=on_drop)
+            return
+        self._report_db.execute_command(sql, params)
+
     def _to_db_datetime(self, value: Optional[datetime] = None) -> datetime:
         dt = value or datetime.now(KST)
         if dt.tzinfo is not None:
@@ -2174,6 +2330,15 @@ class MultidayExecutor:
         return dt
 
     def _get_report_table_columns(self, table_name: str) -> set:
+        # 공용 스키마 카탈로그: 실행기 수와 무관하게 프로세스당 information_schema 1회
+        catalog = get_schema_catalog(getattr(self, "_report_db", None))
+        if catalog is not None:
+            try:
+                return catalog.get_column_names(table_name)
+            except Exception as err:
+                logger.warning(f"[REPORT_DB] 컬럼 조회 실패: table={table_name}, err={err}")
+                return set()
+
         cached = self._report_table_columns.get(table_name)
         if cached is not None:
             return cached
@@ -2277,7 +2442,7 @@ class MultidayExecutor:
             sql += " ON DUPLICATE KEY UPDATE idempotency_key = VALUES(idempotency_key)"
 
         try:
-            self._report_db.execute_command(
+            self._execute_report_write(
                 sql,
                 tuple(col_values[column] for column in insert_columns),
             )
@@ -2537,16 +2702,25 @@ class MultidayExecutor:
         else:
             sql = f"INSERT INTO account_snapshots ({col_sql}) VALUES ({placeholders})"
 
+        drawdown = getattr(self, "_report_drawdown", None)
+        if drawdown is not None and "total_equity" in col_values:
+            drawdown.record(col_values["snapshot_time"], total_equity)
+
         try:
-            self._report_db.execute_command(
+            self._execute_report_write(
                 sql,
                 tuple(col_values[column] for column in insert_columns),
+                on_drop=drawdown.invalidate if drawdown is not None else None,
             )
             self._last_report_snapshot_at = now
         except QueryError as err:
             logger.warning(f"[REPORT_DB] 계좌 스냅샷 적재 실패(무시): {err}")
+            if drawdown is not None:
+                drawdown.invalidate()
         except Exception as err:
             logger.warning(f"[REPORT_DB] 계좌 스냅샷 적재 예외(무시): {err}")
+            if drawdown is not None:
+                drawdown.invalidate()
     
     # ════════════════════════════════════════════════════════════════
     # 포지션 영속화
@@ -2895,6 +3069,20 @@ class MultidayExecutor:
         self._last_fast_risk_sync_at = now
         return True
 
+    def _add_live_indicators(
+        self,
+        cache: DailySignalSnapshotCache,
+        live_df: pd.DataFrame,
+    ) -> pd.DataFrame:
+        """완료 일봉 지표 상태를 캐시에 보관하고 잠정 봉만 증분 갱신"""
+        incremental_fn = getattr(self.strategy, "add_indicators_incremental", None)
+        engine_factory = getattr(self.strategy, "create_indicator_engine", None)
+        if not callable(incremental_fn) or not callable(engine_factory):
+            return self.strategy.add_indicators(live_df)
+        if cache.indicator_engine is None:
+            cache.indicator_engine = engine_factory()
+        return incremental_fn(live_df, cache.indicator_engine)
+
     def _build_live_daily_frame_from_cache(
         self,
         *,
@@ -2995,7 +3183,7 @@ class MultidayExecutor:
             )
 
         live_df = self._normalize_market_data_frame(live_df)
-        indicator_df = self.strategy.add_indicators(live_df)
+        indicator_df = self._add_live_indicators(cache, live_df)
         if indicator_df.empty:
             return indicator_df
 
@@ -3045,14 +3233,17 @@ class MultidayExecutor:
             return None
 
         intraday_bars: List[dict] = []
+        intraday_session = None
         if bool(getattr(settings, "ENABLE_OPENING_RANGE_BREAKOUT_STRATEGY", False)):
-            intraday_lookback = max(
-                int(getattr(settings, "ORB_ENTRY_CUTOFF_MINUTES", 90) or 90)
-                + int(getattr(settings, "ORB_OPENING_RANGE_MINUTES", 5) or 5)
-                + 5,
-                30,
-            )
-            intraday_bars = self.fetch_intraday_bars(n=intraday_lookback)
+            intraday_session = self.fetch_intraday_session()
+            if intraday_session is None:
+                intraday_lookback = max(
+                    int(getattr(settings, "ORB_ENTRY_CUTOFF_MINUTES", 90) or 90)
+                    + int(getattr(settings, "ORB_OPENING_RANGE_MINUTES", 5) or 5)
+                    + 5,
+                    30,
+                )
+                intraday_bars = self.fetch_intraday_bars(n=intraday_lookback)
 
         has_pending_order = (
             self._has_active_pending_buy_order()
@@ -3073,6 +3264,7 @@ class MultidayExecutor:
             intraday_bars=intraday_bars,
             has_pending_order=has_pending_order,
             used_cached_daily=bool(use_cached_daily),
+            intraday_session=intraday_session,
         )
 
     def evaluate_signal_from_context(self, context: PreparedEvaluationContext) -> TradingSignal:
@@ -3088,6 +3280,7 @@ class MultidayExecutor:
             has_pending_order=context.has_pending_order,
             market_regime_snapshot=getattr(self, "market_regime_snapshot", None),
             intraday_bars=context.intraday_bars,
+            intraday_session=context.intraday_session,
             defer_pullback_buy=self._should_defer_pullback_buy_to_threaded_pipeline(),
         )
         signal = self._apply_stale_quote_guard(signal, context.quote_snapshot)
@@ -5447,14 +5640,17 @@ class MultidayExecutor:
                 return result
 
             intraday_bars: list[dict] = []
+            intraday_session = None
             if bool(getattr(settings, "ENABLE_OPENING_RANGE_BREAKOUT_STRATEGY", False)):
-                intraday_lookback = max(
-                    int(getattr(settings, "ORB_ENTRY_CUTOFF_MINUTES", 90) or 90)
-                    + int(getattr(settings, "ORB_OPENING_RANGE_MINUTES", 5) or 5)
-                    + 5,
-                    30,
-                )
-                intraday_bars = self.fetch_intraday_bars(n=intraday_lookback)
+                intraday_session = self.fetch_intraday_session()
+                if intraday_session is None:
+                    intraday_lookback = max(
+                        int(getattr(settings, "ORB_ENTRY_CUTOFF_MINUTES", 90) or 90)
+                        + int(getattr(settings, "ORB_OPENING_RANGE_MINUTES", 5) or 5)
+                        + 5,
+                        30,
+                    )
+                    intraday_bars = self.fetch_intraday_bars(n=intraday_lookback)
 
             has_pending_order = (
                 self._has_active_pending_buy_order()
@@ -5474,6 +5670,7 @@ class MultidayExecutor:
                 open_price=open_price,
                 intraday_bars=intraday_bars,
                 has_pending_order=has_pending_order,
+                intraday_session=intraday_session,
             )
             signal = self.evaluate_signal_from_context(context)
             result = self._finalize_evaluation_result(
@@ -5689,6 +5886,12 @@ class MultidayExecutor:
             
             # 포지션 저장
             self._save_position_on_exit()
+
+            # 버퍼링된 성과 적재 반영 (배리어)
+            try:
+                flush_db_write_buffers()
+            except Exception as e:
+                logger.warning(f"[REPORT_DB] 종료 시 쓰기 버퍼 반영 실패: {e}")
             
             # ★ 인스턴스 락 해제
             try:
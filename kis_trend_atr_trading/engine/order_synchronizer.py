@@ -1241,6 +1241,10 @@ class OrderSynchronizer:
             holding_before_qty=before_qty,
             holding_before_avg_price=before_avg_price,
         )
+        logger.info(
+            f"[SYNC] 체결 확인 경로: 주문번호={order_no}, "
+            f"status={exec_result.get('status')}, source={exec_result.get('source', 'rest_polling')}"
+        )
         
         # 4. 결과 반환
         if exec_result.get("status") == "FILLED":
@@ -1490,6 +1494,10 @@ class OrderSynchronizer:
             holding_before_qty=before_qty,
             holding_before_avg_price=before_avg_price,
         )
+        logger.info(
+            f"[SYNC] 체결 확인 경로: 주문번호={order_no}, "
+            f"status={exec_result.get('status')}, source={exec_result.get('source', 'rest_polling')}"
+        )
         
         # 4. 결과 반환
         if exec_result.get("status") == "FILLED":
@@ -2,15 +2,168 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+DAILY_BAR_FLOAT_COLUMNS: Tuple[str, ...] = (
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "atr",
+    "adx",
+    "ma",
+    "ma20",
+    "prev_high",
+    "prev_close",
+)
+DAILY_BAR_COLUMNS: Tuple[str, ...] = (
+    "date",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "atr",
+    "adx",
+    "ma",
+    "ma20",
+    "trend",
+    "prev_high",
+    "prev_close",
+)
+
+
+def _readonly_column(values: Any, name: str) -> np.ndarray:
+    # 원본 프레임 버퍼와 분리된 C-연속 사본 1개만 보관
+    array = np.array(values, order="C")
+    if name in DAILY_BAR_FLOAT_COLUMNS and array.dtype.kind not in "iuf":
+        try:
+            array = array.astype(np.float64)
+        except (TypeError, ValueError):
+            pass
+    array.flags.writeable = False
+    return array
 
 
-@dataclass(frozen=True)
+class DailyBarColumns:
+    """
+    일봉 컬럼별 연속 NumPy 배열 (행 dict 튜플 대체)
+
+    - 슬라이스는 배열 view 를 공유 (복사 없음), 배열은 읽기 전용
+    - as_frame(): 같은 배열을 감싼 DataFrame (평가기는 기존처럼 df.copy() 후 가공)
+    - 반복/정수 인덱싱은 기존 recent_bars(행 dict) 와 동일하게 동작
+    """
+
+    __slots__ = ("_columns", "_length")
+
+    def __init__(self, columns: Mapping[str, np.ndarray], length: Optional[int] = None) -> None:
+        self._columns: Dict[str, np.ndarray] = dict(columns)
+        if length is None:
+            length = len(next(iter(self._columns.values()))) if self._columns else 0
+        self._length = int(length)
+
+    @classmethod
+    def from_frame(cls, frame: Any, columns: Sequence[str] = DAILY_BAR_COLUMNS) -> "DailyBarColumns":
+        present = [column for column in columns if column in frame.columns]
+        return cls(
+            {column: _readonly_column(frame[column].to_numpy(), column) for column in present},
+            length=len(frame),
+        )
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping[str, Any]]) -> "DailyBarColumns":
+        import pandas as pd
+
+        frame = pd.DataFrame([dict(row) for row in records])
+        return cls.from_frame(frame, columns=tuple(frame.columns))
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        return tuple(self._columns)
+
+    def column(self, name: str) -> np.ndarray:
+        return self._columns[name]
+
+    def tail(self, count: int) -> "DailyBarColumns":
+        return self[max(self._length - max(int(count), 0), 0):]
+
+    def as_frame(self) -> Any:
+        import pandas as pd
+
+        return pd.DataFrame(self._columns, columns=list(self._columns), copy=False)
+
+    def nbytes(self) -> int:
+        return int(sum(array.nbytes for array in self._columns.values()))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    def _row(self, index: int) -> Dict[str, Any]:
+        row: Dict[str, Any] = {}
+        for name, array in self._columns.items():
+            value = array[index]
+            if isinstance(value, np.datetime64):
+                import pandas as pd
+
+                value = pd.Timestamp(value)
+            elif isinstance(value, np.generic):
+                value = value.item()
+            row[name] = value
+        return row
+
+    def __getitem__(self, key: Union[int, slice]) -> Any:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._length)
+            return DailyBarColumns(
+                {name: array[key] for name, array in self._columns.items()},
+                length=len(range(start, stop, step)),
+            )
+        index = int(key)
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("DailyBarColumns index out of range")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for index in range(self._length):
+            yield self._row(index)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DailyBarColumns):
+            return NotImplemented
+        if self._length != other._length or self.columns != other.columns:
+            return False
+        return all(np.array_equal(array, other._columns[name]) for name, array in self._columns.items())
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"DailyBarColumns(rows={self._length}, columns={list(self._columns)})"
+
+
+def daily_context_frame(daily_context: Any) -> Any:
+    """DailyContext.recent_bars 를 평가기용 DataFrame 으로 변환"""
+    recent_bars = getattr(daily_context, "recent_bars", None)
+    if isinstance(recent_bars, DailyBarColumns):
+        return recent_bars.as_frame()
+    import pandas as pd
+
+    return pd.DataFrame(list(recent_bars or ()))
+
+
+@dataclass(frozen=True, slots=True)
 class DailyContext:
     symbol: str
     trade_date: str
     context_version: str
-    recent_bars: Tuple[Dict[str, Any], ...]
+    recent_bars: DailyBarColumns
     prev_high: float
     prev_close: float
     atr: float
@@ -23,6 +176,11 @@ class DailyContext:
     refreshed_at: datetime
     source: str
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.recent_bars, DailyBarColumns):
+            # 기존 호출자(리플레이/테스트)의 행 dict 튜플 입력 호환
+            object.__setattr__(self, "recent_bars", DailyBarColumns.from_records(self.recent_bars or ()))
+
 
 @dataclass(frozen=True)
 class PullbackSetupCandidate:
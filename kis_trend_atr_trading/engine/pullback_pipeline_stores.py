@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from collections import OrderedDict
+from bisect import bisect_left
+from collections import OrderedDict, deque
 from dataclasses import replace
 from datetime import datetime
+import heapq
 import queue
 import threading
-from typing import Any, Dict, List, Optional, Tuple
+import time
+import zlib
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 try:
     from engine.pullback_pipeline_models import (
@@ -25,14 +29,187 @@ except ImportError:
     )
 
 
+EVICT_REASON_EXPIRED = "expired"
+EVICT_REASON_CAPACITY = "capacity"
+
+
+def _default_expires_at(value: Any) -> Optional[datetime]:
+    expires_at = getattr(value, "expires_at", None)
+    return expires_at if isinstance(expires_at, datetime) else None
+
+
+class ExpiringMap:
+    """
+    expires_at 인덱스가 붙은 dict (잠금은 호출자 책임)
+
+    - 조회/저장은 dict 와 동일 (get / [] / pop / items ...)
+    - 만료 인덱스는 lazy-deletion min-heap: 덮어쓰기·삭제 시 heap 항목은 남겨두고
+      pop 시점에 세대(seq) 불일치로 버림 → pop_expired() 는 만료 k건에 O(k log n)
+    - expires_at 이 datetime 이 아닌 값은 만료 대상에서 제외
+    - max_size > 0 이면 초과 시 가장 먼저 만료될 항목부터 제거
+      (만료시각 있는 항목이 없으면 가장 오래 저장된 항목)
+    - on_evict(key, value, reason): expired / capacity 제거마다 호출
+    """
+
+    _COMPACT_MIN_ENTRIES = 64
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 0,
+        expires_at_fn: Callable[[Any], Optional[datetime]] = _default_expires_at,
+        on_evict: Optional[Callable[[str, Any, str], None]] = None,
+    ) -> None:
+        self._max_size = max(int(max_size or 0), 0)
+        self._expires_at_fn = expires_at_fn
+        self._on_evict = on_evict
+        self._values: Dict[str, Any] = {}
+        self._seq_by_key: Dict[str, int] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._seq = 0
+        self._expired_count = 0
+        self._capacity_evicted_count = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.set(key, value)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._values.get(key, default)
+
+    def keys(self):
+        return self._values.keys()
+
+    def values(self):
+        return self._values.values()
+
+    def items(self):
+        return self._values.items()
+
+    def set(self, key: str, value: Any) -> List[Tuple[str, Any]]:
+        """값을 저장하고, 용량 초과로 제거된 (key, value) 목록을 반환합니다."""
+        self._values.pop(key, None)
+        self._values[key] = value
+        self._seq += 1
+        self._seq_by_key[key] = self._seq
+        expires_at = self._expires_at_fn(value)
+        if expires_at is not None:
+            heapq.heappush(self._heap, (expires_at.timestamp(), self._seq, key))
+        evicted: List[Tuple[str, Any]] = []
+        while self._max_size and len(self._values) > self._max_size:
+            victim = self._pop_earliest(exclude=key)
+            if victim is None:
+                break
+            evicted.append(victim)
+            self._capacity_evicted_count += 1
+            self._notify(victim[0], victim[1], EVICT_REASON_CAPACITY)
+        self._maybe_compact()
+        return evicted
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        if key not in self._values:
+            return default
+        self._seq_by_key.pop(key, None)
+        value = self._values.pop(key)
+        self._maybe_compact()
+        return value
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._seq_by_key.clear()
+        self._heap.clear()
+
+    def _is_live(self, entry: Tuple[float, int, str]) -> bool:
+        return self._seq_by_key.get(entry[2]) == entry[1]
+
+    def _pop_earliest(self, *, exclude: str) -> Optional[Tuple[str, Any]]:
+        skipped: List[Tuple[float, int, str]] = []
+        victim: Optional[Tuple[str, Any]] = None
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            if not self._is_live(entry):
+                continue
+            if entry[2] == exclude:
+                skipped.append(entry)
+                continue
+            victim = (entry[2], self._values.pop(entry[2]))
+            self._seq_by_key.pop(entry[2], None)
+            break
+        for entry in skipped:
+            heapq.heappush(self._heap, entry)
+        if victim is not None:
+            return victim
+        for candidate_key in self._values:
+            if candidate_key != exclude:
+                self._seq_by_key.pop(candidate_key, None)
+                return candidate_key, self._values.pop(candidate_key)
+        return None
+
+    def pop_expired(self, now: datetime) -> List[Tuple[str, Any]]:
+        """expires_at <= now 인 항목을 만료 순서대로 제거해 반환합니다."""
+        now_ts = now.timestamp()
+        removed: List[Tuple[str, Any]] = []
+        while self._heap and self._heap[0][0] <= now_ts:
+            entry = heapq.heappop(self._heap)
+            if not self._is_live(entry):
+                continue
+            key = entry[2]
+            self._seq_by_key.pop(key, None)
+            removed.append((key, self._values.pop(key)))
+        self._expired_count += len(removed)
+        for key, value in removed:
+            self._notify(key, value, EVICT_REASON_EXPIRED)
+        return removed
+
+    def next_expiry_ts(self) -> Optional[float]:
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def _notify(self, key: str, value: Any, reason: str) -> None:
+        if self._on_evict is not None:
+            self._on_evict(key, value, reason)
+
+    def _maybe_compact(self) -> None:
+        # 덮어쓰기/삭제가 많으면 죽은 heap 항목이 쌓이므로 살아있는 항목 수의 2배를 넘으면 재구성
+        if len(self._heap) <= max(self._COMPACT_MIN_ENTRIES, 2 * len(self._seq_by_key)):
+            return
+        self._heap = [entry for entry in self._heap if self._is_live(entry)]
+        heapq.heapify(self._heap)
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            "size": len(self._values),
+            "heap_entries": len(self._heap),
+            "expired_count": int(self._expired_count),
+            "capacity_evicted_count": int(self._capacity_evicted_count),
+        }
+
+
 class ArmedCandidateStore:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        max_size: int = 0,
+        on_evict: Optional[Callable[[str, PullbackSetupCandidate, str], None]] = None,
+    ) -> None:
         self._lock = threading.Lock()
-        self._candidates: Dict[str, PullbackSetupCandidate] = {}
+        self._candidates = ExpiringMap(max_size=max_size, on_evict=on_evict)
 
     def upsert(self, candidate: PullbackSetupCandidate) -> None:
         with self._lock:
-            self._candidates[str(candidate.symbol).zfill(6)] = candidate
+            self._candidates.set(str(candidate.symbol).zfill(6), candidate)
 
     def get(self, symbol: str) -> Optional[PullbackSetupCandidate]:
         with self._lock:
@@ -56,15 +233,8 @@ class ArmedCandidateStore:
 
     def pop_expired(self, now: Optional[datetime] = None) -> List[PullbackSetupCandidate]:
         current_now = now or datetime.now()
-        removed: List[PullbackSetupCandidate] = []
         with self._lock:
-            for symbol, candidate in list(self._candidates.items()):
-                expires_at = getattr(candidate, "expires_at", None)
-                if not isinstance(expires_at, datetime):
-                    continue
-                if expires_at <= current_now:
-                    removed.append(self._candidates.pop(symbol))
-        return removed
+            return [candidate for _, candidate in self._candidates.pop_expired(current_now)]
 
     def cleanup_expired(self, now: Optional[datetime] = None) -> int:
         return len(self.pop_expired(now))
@@ -131,34 +301,298 @@ class DailyContextStore:
         return context, ""
 
 
-class DirtySymbolSet:
-    def __init__(self) -> None:
+DIRTY_LATENCY_BUCKETS_MS: Tuple[float, ...] = (1.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0)
+DIRTY_LATENCY_WINDOW = 1024
+
+
+def _percentile_ms(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(pct / 100.0 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return float(sorted_values[index])
+
+
+class _LatencyHistogram:
+    """고정 버킷 누적 카운트 + 최근 구간 p50/p99 (샤드 간 공유 가능)"""
+
+    def __init__(self, buckets_ms: Tuple[float, ...] = DIRTY_LATENCY_BUCKETS_MS) -> None:
         self._lock = threading.Lock()
-        self._symbols: set[str] = set()
+        self._bounds = tuple(float(bound) for bound in buckets_ms)
+        self._counts: List[int] = [0] * (len(self._bounds) + 1)
+        self._recent: "deque[float]" = deque(maxlen=DIRTY_LATENCY_WINDOW)
+        self._total = 0
+        self._max_ms = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        value = max(float(value_ms), 0.0)
+        with self._lock:
+            self._counts[bisect_left(self._bounds, value)] += 1
+            self._recent.append(value)
+            self._total += 1
+            self._max_ms = max(self._max_ms, value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            recent = sorted(self._recent)
+            counts = list(self._counts)
+            total = int(self._total)
+            max_ms = float(self._max_ms)
+        buckets: Dict[str, int] = {}
+        for bound, count in zip(self._bounds, counts):
+            buckets[f"le_{bound:g}"] = int(count)
+        buckets[f"gt_{self._bounds[-1]:g}"] = int(counts[-1])
+        return {
+            "count": total,
+            "p50_ms": round(_percentile_ms(recent, 50), 3),
+            "p99_ms": round(_percentile_ms(recent, 99), 3),
+            "max_ms": round(max_ms, 3),
+            "buckets": buckets,
+        }
+
+
+class DirtySymbolSet:
+    """
+    이벤트 기반 dirty 종목 대기열
 
-    def mark(self, symbol: str) -> None:
+    - mark(): 삽입 순서 유지 + 중복 mark 는 최초 시각 기준으로 병합
+    - 보유/armed 후보 종목(priority_fn True)은 일반 종목보다 먼저 drain
+    - wait_for_ready(): mark 즉시 깨어나며, coalesce_window_sec 동안
+      같은 종목의 연속 틱을 한 번의 평가로 모은 뒤 반환
+    - mark→drain / mark→평가완료 지연 히스토그램 제공
+    """
+
+    def __init__(
+        self,
+        *,
+        coalesce_window_sec: float = 0.0,
+        priority_fn: Optional[Callable[[str], bool]] = None,
+        mark_to_drain: Optional[_LatencyHistogram] = None,
+        mark_to_eval: Optional[_LatencyHistogram] = None,
+    ) -> None:
+        self._cond = threading.Condition(threading.Lock())
+        self._coalesce_window_sec = max(float(coalesce_window_sec or 0.0), 0.0)
+        self._priority_fn = priority_fn
+        self._priority: "OrderedDict[str, float]" = OrderedDict()
+        self._normal: "OrderedDict[str, float]" = OrderedDict()
+        self._in_flight: Dict[str, float] = {}
+        self._wake_requested = False
+        self._mark_count = 0
+        self._coalesced_count = 0
+        self._priority_drain_count = 0
+        self._mark_to_drain = mark_to_drain or _LatencyHistogram()
+        self._mark_to_eval = mark_to_eval or _LatencyHistogram()
+
+    def _is_priority(self, code: str) -> bool:
+        if self._priority_fn is None:
+            return False
+        try:
+            return bool(self._priority_fn(code))
+        except Exception:
+            return False
+
+    def mark(self, symbol: str, *, priority: Optional[bool] = None) -> None:
         code = str(symbol).zfill(6)
         if not code:
             return
-        with self._lock:
-            self._symbols.add(code)
+        is_priority = self._is_priority(code) if priority is None else bool(priority)
+        now = time.monotonic()
+        with self._cond:
+            self._mark_count += 1
+            marked_at = self._priority.get(code)
+            if marked_at is None:
+                marked_at = self._normal.get(code)
+            if marked_at is not None:
+                self._coalesced_count += 1
+                if is_priority and code in self._normal:
+                    self._priority[code] = self._normal.pop(code)
+                return
+            if is_priority:
+                self._priority[code] = now
+            else:
+                self._normal[code] = now
+            self._cond.notify_all()
+
+    def _oldest_marked_at_locked(self) -> Optional[float]:
+        oldest: Optional[float] = None
+        for pending in (self._priority, self._normal):
+            if pending:
+                first = next(iter(pending.values()))
+                oldest = first if oldest is None else min(oldest, first)
+        return oldest
+
+    def wait_for_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        drain 할 종목이 생길 때까지 대기합니다.
+
+        Returns:
+            bool: 대기 종료 시 dirty 종목 존재 여부 (timeout/wake() 면 False 가능)
+        """
+        deadline = None if timeout is None else time.monotonic() + max(float(timeout), 0.0)
+        with self._cond:
+            while True:
+                if self._wake_requested:
+                    self._wake_requested = False
+                    return bool(self._priority or self._normal)
+                oldest = self._oldest_marked_at_locked()
+                now = time.monotonic()
+                if oldest is not None:
+                    ready_at = oldest + self._coalesce_window_sec
+                    if now >= ready_at:
+                        return True
+                    wait_until = ready_at if deadline is None else min(ready_at, deadline)
+                else:
+                    wait_until = deadline
+                if deadline is not None and now >= deadline:
+                    return oldest is not None
+                self._cond.wait(None if wait_until is None else max(wait_until - now, 0.0))
+
+    def wake(self) -> None:
+        """종료 등으로 대기 중인 wait_for_ready() 를 즉시 깨웁니다."""
+        with self._cond:
+            self._wake_requested = True
+            self._cond.notify_all()
 
     def drain(self, max_items: Optional[int] = None) -> List[str]:
-        with self._lock:
-            if not self._symbols:
-                return []
-            symbols = sorted(self._symbols)
-            if max_items is not None:
-                drained = symbols[: max(int(max_items), 0)]
-            else:
-                drained = symbols
-            for symbol in drained:
-                self._symbols.discard(symbol)
+        limit = None if max_items is None else max(int(max_items), 0)
+        now = time.monotonic()
+        drained: List[str] = []
+        with self._cond:
+            for pending, is_priority in ((self._priority, True), (self._normal, False)):
+                while pending and (limit is None or len(drained) < limit):
+                    code, marked_at = pending.popitem(last=False)
+                    drained.append(code)
+                    self._in_flight[code] = marked_at
+                    self._mark_to_drain.observe((now - marked_at) * 1000.0)
+                    if is_priority:
+                        self._priority_drain_count += 1
             return drained
 
+    def mark_evaluated(self, symbol: str) -> None:
+        """drain 된 종목의 평가 완료를 기록합니다 (mark→평가완료 지연)."""
+        code = str(symbol).zfill(6)
+        now = time.monotonic()
+        with self._cond:
+            marked_at = self._in_flight.pop(code, None)
+            if marked_at is not None:
+                self._mark_to_eval.observe((now - marked_at) * 1000.0)
+
     def size(self) -> int:
-        with self._lock:
-            return len(self._symbols)
+        with self._cond:
+            return len(self._priority) + len(self._normal)
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "dirty_pending": len(self._priority) + len(self._normal),
+                "dirty_pending_priority": len(self._priority),
+                "dirty_mark_count": int(self._mark_count),
+                "dirty_coalesced_count": int(self._coalesced_count),
+                "dirty_priority_drain_count": int(self._priority_drain_count),
+                "dirty_coalesce_window_ms": round(self._coalesce_window_sec * 1000.0, 3),
+                "dirty_mark_to_drain_ms": self._mark_to_drain.snapshot(),
+                "dirty_mark_to_eval_ms": self._mark_to_eval.snapshot(),
+            }
+
+
+def _ring_hash(key: str) -> int:
+    # 프로세스마다 달라지는 hash() 대신 고정 해시 (재시작 후에도 같은 샤드 배정)
+    return zlib.crc32(key.encode("utf-8")) & 0xFFFFFFFF
+
+
+class ShardedDirtySymbolSet:
+    """
+    타이밍 워커 N개용 dirty 대기열 (consistent hash 로 종목→샤드 고정)
+
+    - 같은 종목은 항상 같은 샤드(=같은 워커)로 가므로 종목 단위 평가 순서 유지
+    - mark/size/drain/wake 는 DirtySymbolSet 과 동일 인터페이스 (셋업 워커/헬스 모니터 호환)
+    - 지연 히스토그램은 전 샤드가 공유
+    - 워커는 샤드별로 나뉘어도 평가는 executor 공용 시세 스냅샷/타이밍 지표 필드를 거치므로
+      현재는 샤드 1개(PULLBACK_TIMING_WORKERS=1)가 기본이자 권장값
+    """
+
+    def __init__(
+        self,
+        shard_count: int = 1,
+        *,
+        coalesce_window_sec: float = 0.0,
+        priority_fn: Optional[Callable[[str], bool]] = None,
+        virtual_nodes: int = 64,
+    ) -> None:
+        self._shard_count = max(int(shard_count or 1), 1)
+        self._mark_to_drain = _LatencyHistogram()
+        self._mark_to_eval = _LatencyHistogram()
+        self._shards: Tuple[DirtySymbolSet, ...] = tuple(
+            DirtySymbolSet(
+                coalesce_window_sec=coalesce_window_sec,
+                priority_fn=priority_fn,
+                mark_to_drain=self._mark_to_drain,
+                mark_to_eval=self._mark_to_eval,
+            )
+            for _ in range(self._shard_count)
+        )
+        ring: List[Tuple[int, int]] = []
+        for shard_index in range(self._shard_count):
+            for replica in range(max(int(virtual_nodes or 1), 1)):
+                ring.append((_ring_hash(f"timing-shard-{shard_index}#{replica}"), shard_index))
+        ring.sort()
+        self._ring_keys: List[int] = [point for point, _ in ring]
+        self._ring_shards: List[int] = [shard_index for _, shard_index in ring]
+
+    @property
+    def shard_count(self) -> int:
+        return self._shard_count
+
+    def shard_for(self, symbol: str) -> int:
+        if self._shard_count == 1:
+            return 0
+        index = bisect_left(self._ring_keys, _ring_hash(str(symbol).zfill(6)))
+        if index >= len(self._ring_keys):
+            index = 0
+        return self._ring_shards[index]
+
+    def shard(self, shard_index: int) -> DirtySymbolSet:
+        return self._shards[int(shard_index)]
+
+    def mark(self, symbol: str, *, priority: Optional[bool] = None) -> None:
+        self._shards[self.shard_for(symbol)].mark(symbol, priority=priority)
+
+    def drain(self, max_items: Optional[int] = None) -> List[str]:
+        drained: List[str] = []
+        for shard in self._shards:
+            remaining = None if max_items is None else max(int(max_items), 0) - len(drained)
+            if remaining is not None and remaining <= 0:
+                break
+            drained.extend(shard.drain(max_items=remaining))
+        return drained
+
+    def mark_evaluated(self, symbol: str) -> None:
+        self._shards[self.shard_for(symbol)].mark_evaluated(symbol)
+
+    def wake(self) -> None:
+        for shard in self._shards:
+            shard.wake()
+
+    def size(self) -> int:
+        return sum(shard.size() for shard in self._shards)
+
+    def metrics(self) -> Dict[str, Any]:
+        shard_metrics = [shard.metrics() for shard in self._shards]
+        merged: Dict[str, Any] = {
+            "dirty_shard_count": int(self._shard_count),
+            "dirty_pending_by_shard": [int(item["dirty_pending"]) for item in shard_metrics],
+            "dirty_mark_to_drain_ms": self._mark_to_drain.snapshot(),
+            "dirty_mark_to_eval_ms": self._mark_to_eval.snapshot(),
+        }
+        for key in (
+            "dirty_pending",
+            "dirty_pending_priority",
+            "dirty_mark_count",
+            "dirty_coalesced_count",
+            "dirty_priority_drain_count",
+        ):
+            merged[key] = sum(int(item.get(key, 0) or 0) for item in shard_metrics)
+        merged["dirty_coalesce_window_ms"] = shard_metrics[0]["dirty_coalesce_window_ms"]
+        return merged
 
 
 class EntryIntentQueue:
@@ -14,6 +14,7 @@ try:
     from config import settings
     from engine.pullback_pipeline_models import (
         AuthoritativeEntryIntent,
+        DailyBarColumns,
         DailyContext,
         PullbackEntryIntent,
         PullbackSetupCandidate,
@@ -44,6 +45,7 @@ except ImportError:
     from kis_trend_atr_trading.config import settings
     from kis_trend_atr_trading.engine.pullback_pipeline_models import (
         AuthoritativeEntryIntent,
+        DailyBarColumns,
         DailyContext,
         PullbackEntryIntent,
         PullbackSetupCandidate,
@@ -296,9 +298,8 @@ class DailyRefreshThread(threading.Thread):
         if indicator_df is None or getattr(indicator_df, "empty", True):
             return None
 
-        normalized = indicator_df.copy().reset_index(drop=True)
-        required_bars = self._required_daily_bars()
-        minimal = normalized.tail(required_bars).copy().reset_index(drop=True)
+        # 프레임 복사 없이 tail 구간만 컬럼별 연속 배열로 1회 복사
+        minimal = indicator_df.iloc[-self._required_daily_bars():]
         if minimal.empty:
             return None
 
@@ -307,31 +308,11 @@ class DailyRefreshThread(threading.Thread):
         trade_date = latest_date or self._executor._trade_date_key(refreshed_at)
         swing_window = minimal.tail(max(int(getattr(settings, "PULLBACK_SWING_LOOKBACK_BARS", 15) or 15), 5))
         pullback_window = minimal.tail(max(int(getattr(settings, "PULLBACK_LOOKBACK_BARS", 12) or 12), 5))
-        keep_columns = [
-            column
-            for column in (
-                "date",
-                "open",
-                "high",
-                "low",
-                "close",
-                "volume",
-                "atr",
-                "adx",
-                "ma",
-                "ma20",
-                "trend",
-                "prev_high",
-                "prev_close",
-            )
-            if column in minimal.columns
-        ]
-        minimal_records = tuple(minimal[keep_columns].to_dict(orient="records"))
         return DailyContext(
             symbol=str(symbol).zfill(6),
             trade_date=str(trade_date),
             context_version=self._build_context_version(minimal, str(trade_date)),
-            recent_bars=minimal_records,
+            recent_bars=DailyBarColumns.from_frame(minimal),
             prev_high=float(latest.get("prev_high", 0.0) or 0.0),
             prev_close=float(latest.get("prev_close", 0.0) or 0.0),
             atr=float(latest.get("atr", 0.0) or 0.0),
@@ -483,8 +464,12 @@ class PullbackSetupWorker(threading.Thread):
         )
         intraday_bars = []
         if strategy_tag == "opening_range_breakout":
+            # WS 누적 세션 상태가 있으면 adapter 가 그것을 읽으므로 분봉 리스트 조회를 생략
+            fetch_cached_session = getattr(self._executor, "fetch_cached_intraday_session_if_available", None)
             fetch_cached_intraday = getattr(self._executor, "fetch_cached_intraday_bars_if_available", None)
-            if callable(fetch_cached_intraday):
+            if callable(fetch_cached_intraday) and (
+                not callable(fetch_cached_session) or fetch_cached_session() is None
+            ):
                 intraday_bars = list(fetch_cached_intraday(n=120) or [])
         evaluation = registry_entry.setup_evaluator.evaluate_setup(
             daily_df=daily_df,
@@ -905,8 +890,19 @@ class PullbackTimingWorker(threading.Thread):
         on_error: Callable[[str, Exception], None],
         health_store: Optional[WorkerHealthStore] = None,
         degraded_controller: Optional[DegradedModeController] = None,
+        shard_index: int = 0,
+        shard_count: int = 1,
     ) -> None:
-        super().__init__(name="PullbackTimingWorker", daemon=True)
+        self._shard_index = max(int(shard_index or 0), 0)
+        self._shard_count = max(int(shard_count or 1), 1)
+        super().__init__(
+            name=(
+                "PullbackTimingWorker"
+                if self._shard_count == 1
+                else f"PullbackTimingWorker-{self._shard_index}"
+            ),
+            daemon=True,
+        )
         self._executor = executor
         self._candidate_store = candidate_store
         self._dirty_symbols = dirty_symbols
@@ -925,6 +921,8 @@ class PullbackTimingWorker(threading.Thread):
             self._health_store.ensure_worker(
                 self.name,
                 stall_after_sec=max(float(getattr(self._executor, "_pipeline_worker_stall_sec", 20.0) or 20.0), poll_sec * 8.0),
+                shard_group="timing" if self._shard_count > 1 else "",
+                shard_index=self._shard_index if self._shard_count > 1 else -1,
             )
         while not self._stop_event.is_set():
             try:
@@ -936,39 +934,54 @@ class PullbackTimingWorker(threading.Thread):
                         state_reason="idle" if not symbols else "timing_batch",
                     )
                 if not symbols:
-                    self._stop_event.wait(poll_sec)
+                    # mark 즉시 깨어남. poll_sec 는 heartbeat/stop 확인용 최대 대기시간
+                    wait_for_ready = getattr(self._dirty_symbols, "wait_for_ready", None)
+                    if callable(wait_for_ready):
+                        wait_for_ready(timeout=poll_sec)
+                    else:
+                        self._stop_event.wait(poll_sec)
                     continue
-                if _worker_is_degraded(self._degraded_controller):
-                    setattr(self._executor, "_pullback_timing_skip_reason", "degraded_mode")
+                evaluated = 0
+                try:
+                    if _worker_is_degraded(self._degraded_controller):
+                        setattr(self._executor, "_pullback_timing_skip_reason", "degraded_mode")
+                        if self._health_store is not None:
+                            self._health_store.mark_success(
+                                self.name,
+                                processed_delta=0,
+                                avg_eval_ms=0.0,
+                                queue_depth=self._entry_queue.qsize(),
+                                state_reason="degraded_mode",
+                            )
+                        continue
+                    processed = 0
+                    batch_elapsed_ms = 0.0
+                    for symbol in symbols:
+                        if self._stop_event.is_set():
+                            return
+                        started = time.perf_counter()
+                        try:
+                            self._process_symbol(symbol)
+                        finally:
+                            evaluated += 1
+                            self._mark_evaluated(symbol)
+                        elapsed_ms = (time.perf_counter() - started) * 1000.0
+                        batch_elapsed_ms += elapsed_ms
+                        processed += 1
+                        setattr(self._executor, "_pullback_timing_eval_ms", elapsed_ms)
+                        setattr(self._executor, "_strategy_timing_eval_ms", elapsed_ms)
                     if self._health_store is not None:
                         self._health_store.mark_success(
                             self.name,
-                            processed_delta=0,
-                            avg_eval_ms=0.0,
+                            processed_delta=max(processed, 1),
+                            avg_eval_ms=(batch_elapsed_ms / max(processed, 1)),
                             queue_depth=self._entry_queue.qsize(),
-                            state_reason="degraded_mode",
+                            state_reason="timing_batch",
                         )
-                    continue
-                processed = 0
-                batch_elapsed_ms = 0.0
-                for symbol in symbols:
-                    if self._stop_event.is_set():
-                        return
-                    started = time.perf_counter()
-                    self._process_symbol(symbol)
-                    elapsed_ms = (time.perf_counter() - started) * 1000.0
-                    batch_elapsed_ms += elapsed_ms
-                    processed += 1
-                    setattr(self._executor, "_pullback_timing_eval_ms", elapsed_ms)
-                    setattr(self._executor, "_strategy_timing_eval_ms", elapsed_ms)
-                if self._health_store is not None:
-                    self._health_store.mark_success(
-                        self.name,
-                        processed_delta=max(processed, 1),
-                        avg_eval_ms=(batch_elapsed_ms / max(processed, 1)),
-                        queue_depth=self._entry_queue.qsize(),
-                        state_reason="timing_batch",
-                    )
+                finally:
+                    # 열화 모드 skip / 중단 / 예외로 평가하지 못한 종목도 in-flight 에서 해제
+                    for symbol in symbols[evaluated:]:
+                        self._mark_evaluated(symbol)
             except Exception as exc:
                 if self._health_store is not None:
                     self._health_store.mark_error(self.name, exc)
@@ -977,6 +990,11 @@ class PullbackTimingWorker(threading.Thread):
         if self._health_store is not None:
             self._health_store.mark_stopped(self.name, state_reason="stop_event_set")
 
+    def _mark_evaluated(self, symbol: str) -> None:
+        mark_evaluated = getattr(self._dirty_symbols, "mark_evaluated", None)
+        if callable(mark_evaluated):
+            mark_evaluated(symbol)
+
     def _registry_entry(self):
         if self._strategy_registry is None:
             return None
@@ -1759,7 +1777,13 @@ class OrderExecutionWorker(threading.Thread):
         intraday_provider_ready = bool(
             getattr(self._executor, "is_cached_intraday_provider_ready", lambda: False)()
         )
-        intraday_bars = list(getattr(self._executor, "fetch_cached_intraday_bars_if_available", lambda n=120: [])(120) or [])
+        intraday_session = getattr(self._executor, "fetch_cached_intraday_session_if_available", lambda: None)()
+        intraday_bars = (
+            list(getattr(self._executor, "fetch_cached_intraday_bars_if_available", lambda n=120: [])(120) or [])
+            if intraday_session is None
+            else []
+        )
+        session_kwargs = {"intraday_session": intraday_session} if intraday_session is not None else {}
         orb_candidate, terminal = self._executor.strategy.orb_strategy.evaluate_setup_candidate(
             df=df_with_indicators,
             current_price=current_price,
@@ -1774,6 +1798,7 @@ class OrderExecutionWorker(threading.Thread):
             has_pending_order=self._executor._has_active_pending_buy_order(),
             market_regime_snapshot=getattr(self._executor, "market_regime_snapshot", None),
             intraday_provider_ready=intraday_provider_ready,
+            **session_kwargs,
         )
         if orb_candidate is None:
             return {
@@ -1793,6 +1818,7 @@ class OrderExecutionWorker(threading.Thread):
             has_existing_position=self._executor.strategy.has_position,
             has_pending_order=self._executor._has_active_pending_buy_order(),
             intraday_provider_ready=intraday_provider_ready,
+            **session_kwargs,
         )
         orb_state = str(
             (timing_decision.meta or {}).get("intraday_source_state", (orb_candidate.meta or {}).get("intraday_source_state", "missing"))
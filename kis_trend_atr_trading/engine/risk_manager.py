@@ -9,9 +9,11 @@ KIS Trend-ATR Trading System - 리스크 관리 모듈
 주문 실행 전 반드시 이 모듈의 체크를 통과해야 합니다.
 """
 
+import functools
 import sys
+import threading
 from datetime import datetime, date
-from typing import Dict, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 
 from utils.logger import get_logger
@@ -21,6 +23,33 @@ from utils.market_hours import KST
 logger = get_logger("risk_manager")
 
 
+def _synchronized(method):
+    """
+    공유 RiskManager 상태 변경/검사를 인스턴스 락으로 직렬화 (멀티종목 병렬 평가 대응)
+
+    락 안에서 예약된 텔레그램 알림은 가장 바깥 호출이 락을 놓은 뒤에 전송합니다
+    (느리거나 실패하는 알림이 주문 경로의 리스크 체크를 막지 않도록).
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._state_lock:
+            self._lock_depth += 1
+            try:
+                result = method(self, *args, **kwargs)
+            finally:
+                self._lock_depth -= 1
+                notifications = []
+                if self._lock_depth == 0 and self._pending_notifications:
+                    notifications, self._pending_notifications = self._pending_notifications, []
+        for notify in notifications:
+            try:
+                notify()
+            except Exception as e:
+                logger.warning(f"[RISK] 텔레그램 알림 전송 실패: {e}")
+        return result
+    return wrapper
+
+
 # ════════════════════════════════════════════════════════════════
 # 데이터 클래스
 # ════════════════════════════════════════════════════════════════
@@ -141,6 +170,9 @@ class RiskManager:
             api_error_reset_minutes: API 에러 카운터 리셋 시간 (분)
             kill_switch_file: 수동 Kill Switch 플래그 파일 경로
         """
+        self._state_lock = threading.RLock()
+        self._lock_depth = 0
+        self._pending_notifications: List[Callable[[], None]] = []
         self._enable_kill_switch = enable_kill_switch
         self._daily_max_loss_percent = daily_max_loss_percent
         
@@ -207,6 +239,7 @@ class RiskManager:
         """일일 손실 한도 도달 여부"""
         return self._daily_limit_reached
     
+    @_synchronized
     def enable_kill_switch(self, reason: str = "수동 활성화") -> None:
         """
         킬 스위치 활성화
@@ -219,9 +252,10 @@ class RiskManager:
             "[RISK] ⚠️ KILL SWITCH ACTIVATED - "
             "모든 신규 주문이 차단됩니다."
         )
-        # 📱 텔레그램 킬 스위치 알림
-        self._telegram.notify_kill_switch(reason)
+        # 📱 텔레그램 킬 스위치 알림 (락 해제 후 전송)
+        self._pending_notifications.append(functools.partial(self._telegram.notify_kill_switch, reason))
     
+    @_synchronized
     def disable_kill_switch(self) -> None:
         """킬 스위치 비활성화"""
         self._enable_kill_switch = False
@@ -258,6 +292,7 @@ class RiskManager:
         self._daily_pnl.starting_capital = capital
         logger.info(f"[RISK] 시작 자본금 설정: {capital:,.0f}원")
     
+    @_synchronized
     def record_trade_pnl(self, pnl: float) -> None:
         """
         거래 손익 기록
@@ -294,11 +329,14 @@ class RiskManager:
                     f"손실: {current_loss_pct:.2f}% | "
                     f"한도: -{self._daily_max_loss_percent}%"
                 )
-                # 📱 텔레그램 일일 손실 한도 알림
-                self._telegram.notify_daily_loss_limit(
-                    daily_loss=self._daily_pnl.realized_pnl,
-                    loss_pct=current_loss_pct,
-                    max_loss_pct=self._daily_max_loss_percent
+                # 📱 텔레그램 일일 손실 한도 알림 (락 해제 후 전송)
+                self._pending_notifications.append(
+                    functools.partial(
+                        self._telegram.notify_daily_loss_limit,
+                        daily_loss=self._daily_pnl.realized_pnl,
+                        loss_pct=current_loss_pct,
+                        max_loss_pct=self._daily_max_loss_percent,
+                    )
                 )
     
     def _reset_daily_tracking(self) -> None:
@@ -318,6 +356,7 @@ class RiskManager:
             f"금일 초기화 완료"
         )
     
+    @_synchronized
     def reset_daily_loss_limit(self) -> None:
         """
         일일 손실 한도 플래그 수동 리셋
@@ -335,6 +374,7 @@ class RiskManager:
     # API 에러 관리 (신규)
     # ════════════════════════════════════════════════════════════════
     
+    @_synchronized
     def record_api_error(self, reason: str = "") -> bool:
         """
         API 에러를 기록합니다.
@@ -384,6 +424,7 @@ class RiskManager:
         
         return False
     
+    @_synchronized
     def reset_api_error_count(self) -> None:
         """API 에러 카운터를 수동으로 리셋합니다."""
         self._api_error_count = 0
@@ -458,6 +499,7 @@ class RiskManager:
     # 리스크 체크 (핵심 기능)
     # ════════════════════════════════════════════════════════════════
     
+    @_synchronized
     def check_order_allowed(self, is_closing_position: bool = False) -> RiskCheckResult:
         """
         주문 허용 여부를 체크합니다.
@@ -534,6 +576,7 @@ class RiskManager:
             )
         return RiskCheckResult(passed=True)
     
+    @_synchronized
     def check_daily_loss_limit(self, is_closing_position: bool = False) -> RiskCheckResult:
         """
         일일 손실 한도만 체크합니다.
@@ -566,6 +609,7 @@ class RiskManager:
     # 상태 조회
     # ════════════════════════════════════════════════════════════════
     
+    @_synchronized
     def get_daily_pnl_summary(self) -> Dict:
         """
         당일 손익 요약을 반환합니다.
@@ -589,6 +633,7 @@ class RiskManager:
             "max_loss_percent": self._daily_max_loss_percent
         }
 
+    @_synchronized
     def update_account_snapshot(self, snapshot: Dict) -> None:
         """
         계좌 평가 스냅샷을 업데이트합니다.
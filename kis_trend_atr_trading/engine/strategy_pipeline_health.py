@@ -4,7 +4,7 @@ from dataclasses import dataclass, replace
 from datetime import datetime
 import threading
 import time
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 try:
     from utils.logger import get_logger
@@ -39,6 +39,8 @@ class WorkerHealthSnapshot:
     queue_depth_seen: int = 0
     lag_sec: float = 0.0
     stall_after_sec: float = 20.0
+    shard_group: str = ""
+    shard_index: int = -1
 
 
 class WorkerHealthStore:
@@ -46,7 +48,14 @@ class WorkerHealthStore:
         self._lock = threading.Lock()
         self._snapshots: Dict[str, WorkerHealthSnapshot] = {}
 
-    def ensure_worker(self, worker_name: str, *, stall_after_sec: float = 20.0) -> None:
+    def ensure_worker(
+        self,
+        worker_name: str,
+        *,
+        stall_after_sec: float = 20.0,
+        shard_group: str = "",
+        shard_index: int = -1,
+    ) -> None:
         now = datetime.now(KST)
         with self._lock:
             if worker_name in self._snapshots:
@@ -54,6 +63,8 @@ class WorkerHealthStore:
                 self._snapshots[worker_name] = replace(
                     current,
                     stall_after_sec=max(float(stall_after_sec or 0.0), 1.0),
+                    shard_group=str(shard_group or ""),
+                    shard_index=int(shard_index),
                 )
                 return
             self._snapshots[worker_name] = WorkerHealthSnapshot(
@@ -61,6 +72,8 @@ class WorkerHealthStore:
                 last_heartbeat_at=now,
                 last_success_at=None,
                 stall_after_sec=max(float(stall_after_sec or 0.0), 1.0),
+                shard_group=str(shard_group or ""),
+                shard_index=int(shard_index),
             )
 
     def _update_locked(
@@ -227,6 +240,15 @@ class WorkerHealthStore:
         with self._lock:
             return self._snapshots.get(worker_name)
 
+    def shard_states(self, shard_group: str) -> Dict[int, str]:
+        """샤드 워커 그룹의 샤드별 상태 (마지막 evaluate 기준)"""
+        with self._lock:
+            return {
+                int(snapshot.shard_index): str(snapshot.state)
+                for snapshot in self._snapshots.values()
+                if snapshot.shard_group and snapshot.shard_group == str(shard_group or "")
+            }
+
 
 @dataclass(frozen=True)
 class DegradedModeSnapshot:
@@ -235,6 +257,7 @@ class DegradedModeSnapshot:
     last_transition_at: Optional[datetime] = None
     state_reason: str = ""
     transitions: int = 0
+    stalled_shards: Tuple[str, ...] = ()
 
 
 class DegradedModeController:
@@ -261,6 +284,16 @@ class DegradedModeController:
         with self._lock:
             return bool(self._snapshot.is_degraded)
 
+    @staticmethod
+    def _stalled_shards(worker_snapshots: Dict[str, WorkerHealthSnapshot]) -> Tuple[str, ...]:
+        labels = []
+        for snapshot in dict(worker_snapshots or {}).values():
+            if not str(getattr(snapshot, "shard_group", "") or ""):
+                continue
+            if str(getattr(snapshot, "state", "") or "") == WorkerState.STALLED:
+                labels.append(f"{snapshot.shard_group}[{int(snapshot.shard_index)}]")
+        return tuple(sorted(labels))
+
     @staticmethod
     def _stalled_workers(worker_snapshots: Dict[str, WorkerHealthSnapshot]) -> list[str]:
         names = []
@@ -278,6 +311,7 @@ class DegradedModeController:
     ) -> DegradedModeSnapshot:
         current_now = now or datetime.now(KST)
         stalled_workers = self._stalled_workers(worker_snapshots)
+        stalled_shards = self._stalled_shards(worker_snapshots)
         enter_reason = ""
         if stalled_workers:
             enter_reason = f"worker_stalled:{','.join(stalled_workers)}"
@@ -304,6 +338,7 @@ class DegradedModeController:
                     last_transition_at=current_now,
                     state_reason=enter_reason,
                     transitions=int(snapshot.transitions or 0) + 1,
+                    stalled_shards=stalled_shards,
                 )
                 return self._snapshot
 
@@ -314,8 +349,12 @@ class DegradedModeController:
             if isinstance(snapshot.entered_at, datetime):
                 hold_elapsed_sec = max((current_now - snapshot.entered_at).total_seconds(), 0.0)
             if enter_reason:
-                if snapshot.state_reason != enter_reason:
-                    self._snapshot = replace(snapshot, state_reason=enter_reason)
+                if snapshot.state_reason != enter_reason or snapshot.stalled_shards != stalled_shards:
+                    self._snapshot = replace(
+                        snapshot,
+                        state_reason=enter_reason,
+                        stalled_shards=stalled_shards,
+                    )
                 return self._snapshot
             if hold_elapsed_sec < self._min_hold_sec:
                 return self._snapshot
@@ -328,6 +367,7 @@ class DegradedModeController:
                 last_transition_at=current_now,
                 state_reason="recovered",
                 transitions=int(snapshot.transitions or 0) + 1,
+                stalled_shards=stalled_shards,
             )
             return self._snapshot
 
@@ -412,6 +452,7 @@ class PipelineHealthMonitorThread(threading.Thread):
             {name: float(snapshot.lag_sec or 0.0) for name, snapshot in dict(worker_snapshots or {}).items()},
         )
         setattr(self._executor, "_dirty_symbol_count", int(dirty_count or 0))
+        setattr(self._executor, "_timing_shard_health", self._health_store.shard_states("timing"))
         dropped_count = int(getattr(self._entry_queue, "dropped_count", lambda: 0)() or 0)
         setattr(self._executor, "_dropped_intent_count", dropped_count)
         setattr(self._executor, "_candidate_cleanup_stats", dict(cleanup_stats or {}))
@@ -419,10 +460,12 @@ class PipelineHealthMonitorThread(threading.Thread):
             setattr(self._executor, "_degraded_mode_current", bool(degraded_snapshot.is_degraded))
             setattr(self._executor, "_degraded_mode_transitions", int(degraded_snapshot.transitions or 0))
             setattr(self._executor, "_degraded_mode_reason", str(degraded_snapshot.state_reason or ""))
+            setattr(self._executor, "_degraded_stalled_shards", list(degraded_snapshot.stalled_shards or ()))
         else:
             setattr(self._executor, "_degraded_mode_current", False)
             setattr(self._executor, "_degraded_mode_transitions", 0)
             setattr(self._executor, "_degraded_mode_reason", "")
+            setattr(self._executor, "_degraded_stalled_shards", [])
         setattr(self._executor, "_authoritative_intent_queue_depth", int(queue_depth or 0))
         queue_strategy_counts = getattr(self._entry_queue, "strategy_counts", None)
         if callable(queue_strategy_counts):
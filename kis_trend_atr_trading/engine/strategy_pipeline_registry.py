@@ -2,13 +2,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import timedelta
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Callable, Dict, Iterable, Optional
 
 try:
     from config import settings
     from engine.pullback_pipeline_models import (
         StrategySetupCandidate,
         StrategyTimingDecision,
+        daily_context_frame,
         pullback_setup_candidate_from_strategy,
         strategy_setup_candidate_from_pullback,
         strategy_timing_decision_from_pullback,
@@ -25,6 +26,7 @@ except ImportError:
     from kis_trend_atr_trading.engine.pullback_pipeline_models import (
         StrategySetupCandidate,
         StrategyTimingDecision,
+        daily_context_frame,
         pullback_setup_candidate_from_strategy,
         strategy_setup_candidate_from_pullback,
         strategy_timing_decision_from_pullback,
@@ -38,6 +40,18 @@ except ImportError:
     from kis_trend_atr_trading.strategy.opening_range_breakout import ORBSetupCandidate, ORBTimingDecision
 
 
+# stock_code -> 완성 분봉 누적 세션 스냅샷 (없으면 None → intraday_bars 사용)
+IntradaySessionSource = Callable[[str], Optional[Any]]
+
+
+def _intraday_session_kwargs(source: Optional[IntradaySessionSource], stock_code: str) -> Dict[str, Any]:
+    """세션 스냅샷이 있을 때만 intraday_session 인자를 넘김 (기존 ORB 구현과 시그니처 호환)"""
+    if source is None:
+        return {}
+    session = source(str(stock_code).zfill(6))
+    return {"intraday_session": session} if session is not None else {}
+
+
 @dataclass(frozen=True)
 class StrategyRegistryEntry:
     strategy_tag: str
@@ -172,9 +186,7 @@ class TrendATRSetupEvaluatorAdapter:
         daily_df: Optional[Any] = None,
     ) -> StrategySetupEvaluation:
         if daily_df is None and daily_context is not None:
-            import pandas as pd
-
-            daily_df = pd.DataFrame(list(getattr(daily_context, "recent_bars", ()) or []))
+            daily_df = daily_context_frame(daily_context)
         setup_result = self._trend_atr_strategy.evaluate_trend_atr_setup_candidate(
             df=daily_df,
             current_price=current_price,
@@ -266,9 +278,15 @@ def _orb_setup_candidate_from_strategy(candidate: StrategySetupCandidate) -> ORB
 class OpeningRangeBreakoutSetupEvaluatorAdapter:
     strategy_tag = "opening_range_breakout"
 
-    def __init__(self, orb_strategy: Any, indicator_strategy: Optional[Any] = None) -> None:
+    def __init__(
+        self,
+        orb_strategy: Any,
+        indicator_strategy: Optional[Any] = None,
+        session_source: Optional[IntradaySessionSource] = None,
+    ) -> None:
         self._orb_strategy = orb_strategy
         self._indicator_strategy = indicator_strategy
+        self._session_source = session_source
 
     def evaluate_setup(
         self,
@@ -289,9 +307,7 @@ class OpeningRangeBreakoutSetupEvaluatorAdapter:
         daily_df: Optional[Any] = None,
     ) -> StrategySetupEvaluation:
         if daily_df is None and daily_context is not None:
-            import pandas as pd
-
-            daily_df = pd.DataFrame(list(getattr(daily_context, "recent_bars", ()) or []))
+            daily_df = daily_context_frame(daily_context)
         if daily_df is None:
             return StrategySetupEvaluation(
                 strategy_tag=self.strategy_tag,
@@ -327,6 +343,7 @@ class OpeningRangeBreakoutSetupEvaluatorAdapter:
             has_pending_order=has_pending_order,
             market_regime_snapshot=market_regime_snapshot,
             intraday_provider_ready=intraday_provider_ready,
+            **_intraday_session_kwargs(self._session_source, stock_code),
         )
         if native_candidate is None:
             return StrategySetupEvaluation(
@@ -436,8 +453,9 @@ class TrendATRTimingEvaluatorAdapter:
 class OpeningRangeBreakoutTimingEvaluatorAdapter:
     strategy_tag = "opening_range_breakout"
 
-    def __init__(self, orb_strategy: Any) -> None:
+    def __init__(self, orb_strategy: Any, session_source: Optional[IntradaySessionSource] = None) -> None:
         self._orb_strategy = orb_strategy
+        self._session_source = session_source
 
     def evaluate_timing(
         self,
@@ -469,6 +487,7 @@ class OpeningRangeBreakoutTimingEvaluatorAdapter:
             has_existing_position=has_existing_position,
             has_pending_order=has_pending_order,
             intraday_provider_ready=True,
+            **_intraday_session_kwargs(self._session_source, stock_code),
         )
         return StrategyTimingDecision(
             strategy_tag=self.strategy_tag,
@@ -497,6 +516,7 @@ def build_default_strategy_registry(
     pullback_strategy: Any,
     trend_atr_strategy: Optional[Any] = None,
     orb_strategy: Optional[Any] = None,
+    orb_session_source: Optional[IntradaySessionSource] = None,
 ) -> StrategyRegistry:
     registry = StrategyRegistry()
     registry.register(
@@ -528,8 +548,12 @@ def build_default_strategy_registry(
             setup_evaluator=OpeningRangeBreakoutSetupEvaluatorAdapter(
                 orb_strategy,
                 indicator_strategy=trend_atr_strategy,
+                session_source=orb_session_source,
+            ),
+            timing_evaluator=OpeningRangeBreakoutTimingEvaluatorAdapter(
+                orb_strategy,
+                session_source=orb_session_source,
             ),
-            timing_evaluator=OpeningRangeBreakoutTimingEvaluatorAdapter(orb_strategy),
             capabilities=StrategyCapabilities(
                 uses_daily_context=True,
                 uses_intraday_timing=True,
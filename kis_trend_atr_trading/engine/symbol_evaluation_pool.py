@@ -0,0 +1,130 @@
+"""
+KIS Trend-ATR Trading System - 멀티종목 병렬 평가 풀
+
+멀티종목 런타임 루프에서 종목별 executor 평가(run_once / run_fast_cycle)를
+제한된 스레드 풀로 분산합니다. 느린 REST 시세/일봉 조회 1건이
+다른 종목의 Exit 체크를 지연시키지 않도록 하기 위함입니다.
+
+★ 동시성 규칙:
+    - 한 배치 안에서 종목당 작업은 1개만 허용 (종목 단위 직렬화)
+    - 배치는 전부 완료된 뒤 반환 → 다음 반복과 겹치지 않음
+    - 스케줄러/메트릭/bar gate 갱신은 호출 스레드(메인 루프)에서만 수행
+    - 작업 예외는 결과에 담아 반환 (재발생 여부는 호출자가 결정)
+
+★ 루프 지연 예산:
+    배치 소요시간이 budget_sec 를 넘으면 budget_exceeded 로 표시하고
+    가장 느린 종목을 함께 반환합니다 ([LOOP_METRIC] 로 보고).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+@dataclass(frozen=True)
+class SymbolEvaluationJob:
+    """종목 평가 작업 1건 (context 는 결과 후처리용으로 그대로 전달)"""
+    symbol: str
+    fn: Callable[[], Any]
+    context: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class SymbolEvaluationOutcome:
+    symbol: str
+    context: Dict[str, Any]
+    result: Any = None
+    error: Optional[BaseException] = None
+    elapsed_sec: float = 0.0
+
+
+@dataclass
+class SymbolEvaluationBatch:
+    outcomes: List[SymbolEvaluationOutcome]
+    elapsed_sec: float = 0.0
+    budget_sec: float = 0.0
+    budget_exceeded: bool = False
+    slowest_symbol: str = ""
+    slowest_sec: float = 0.0
+    workers: int = 1
+
+    @property
+    def first_error(self) -> Optional[BaseException]:
+        for outcome in self.outcomes:
+            if outcome.error is not None:
+                return outcome.error
+        return None
+
+
+class SymbolEvaluationPool:
+    """종목별 평가를 제한된 스레드 풀에서 실행 (max_workers<=1 이면 호출 스레드에서 순차 실행)"""
+
+    def __init__(self, max_workers: int, budget_sec: float = 0.0, thread_name_prefix: str = "symbol-eval"):
+        self.max_workers = max(int(max_workers), 1)
+        self.budget_sec = max(float(budget_sec), 0.0)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if self.max_workers > 1:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=thread_name_prefix,
+            )
+        self._symbol_locks: Dict[str, threading.Lock] = {}
+        self._symbol_locks_guard = threading.Lock()
+
+    def _lock_for(self, symbol: str) -> threading.Lock:
+        with self._symbol_locks_guard:
+            lock = self._symbol_locks.get(symbol)
+            if lock is None:
+                lock = threading.Lock()
+                self._symbol_locks[symbol] = lock
+            return lock
+
+    def _run_job(self, job: SymbolEvaluationJob) -> SymbolEvaluationOutcome:
+        outcome = SymbolEvaluationOutcome(symbol=job.symbol, context=job.context)
+        started = time.monotonic()
+        with self._lock_for(job.symbol):
+            try:
+                outcome.result = job.fn()
+            except BaseException as exc:  # 호출자에게 그대로 전달
+                outcome.error = exc
+        outcome.elapsed_sec = max(time.monotonic() - started, 0.0)
+        return outcome
+
+    def run_batch(self, jobs: Sequence[SymbolEvaluationJob]) -> SymbolEvaluationBatch:
+        """
+        작업 배치를 실행하고 제출 순서대로 결과를 반환합니다.
+
+        Raises:
+            ValueError: 같은 종목 작업이 배치에 2개 이상 있을 때
+        """
+        symbols = [job.symbol for job in jobs]
+        if len(set(symbols)) != len(symbols):
+            raise ValueError(f"종목별 평가는 배치당 1회만 허용됩니다: {symbols}")
+
+        started = time.monotonic()
+        if self._executor is None or len(jobs) <= 1:
+            outcomes = [self._run_job(job) for job in jobs]
+        else:
+            futures = [self._executor.submit(self._run_job, job) for job in jobs]
+            outcomes = [future.result() for future in futures]
+        elapsed = max(time.monotonic() - started, 0.0)
+
+        slowest = max(outcomes, key=lambda item: item.elapsed_sec, default=None)
+        return SymbolEvaluationBatch(
+            outcomes=outcomes,
+            elapsed_sec=elapsed,
+            budget_sec=self.budget_sec,
+            budget_exceeded=bool(self.budget_sec > 0 and elapsed > self.budget_sec),
+            slowest_symbol=slowest.symbol if slowest is not None else "",
+            slowest_sec=slowest.elapsed_sec if slowest is not None else 0.0,
+            workers=self.max_workers,
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -0,0 +1,137 @@
+"""
+KIS Trend-ATR Trading System - 낙폭(Drawdown) 분석 공통 모듈
+
+AccountSnapshotRepository / PerformanceTracker / CBT / TradeReporter 가
+같은 정의의 MDD 를 쓰도록 한 곳에 모은 모듈입니다.
+
+★ 정의 (기존 구현과 동일):
+    - 고점(peak): 지금까지의 최고 평가금액 (첫 포인트부터 시작)
+    - 낙폭: peak - equity (peak <= 0 이면 0)
+    - MDD: 낙폭 "금액"이 최대인 지점, mdd_percent 는 그 지점의 낙폭률
+    - 동률이면 먼저 나온 지점을 유지
+
+★ 두 가지 계산 경로:
+    1. DrawdownState.update(): 스냅샷 1건마다 O(1) 갱신 (상태를 저장해 두면
+       리포트는 전체 이력을 다시 읽지 않고 상태만 읽음)
+    2. compute_drawdown(): 임의 구간(최근 N일 등)을 NumPy 로 한 번에 계산
+
+두 경로는 같은 입력에 대해 같은 결과를 냅니다.
+
+사용 예시:
+    state = DrawdownState()
+    for ts, equity in snapshots:
+        state.update(equity, ts)
+    state.to_mdd_dict()  # {"mdd", "mdd_percent", "peak_time", "trough_time"}
+
+    window = compute_drawdown(equities, times)
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+@dataclass
+class DrawdownState:
+    """러닝 고점/MDD 상태"""
+
+    peak_equity: float = 0.0
+    peak_time: Any = None
+    mdd: float = 0.0
+    mdd_percent: float = 0.0
+    mdd_peak_time: Any = None  # MDD 구간이 시작된 고점 시각
+    trough_time: Any = None  # MDD 저점 시각
+    last_equity: Optional[float] = None
+    last_time: Any = None
+    count: int = 0
+
+    def update(self, equity: float, ts: Any = None) -> bool:
+        """포인트 1건 반영. MDD 가 갱신되면 True."""
+        equity = float(equity)
+        if self.count == 0 or equity > self.peak_equity:
+            self.peak_equity = equity
+            self.peak_time = ts
+        self.last_equity = equity
+        self.last_time = ts
+        self.count += 1
+
+        if self.peak_equity <= 0:
+            return False
+        drawdown = self.peak_equity - equity
+        if drawdown > self.mdd:
+            self.mdd = drawdown
+            self.mdd_percent = drawdown / self.peak_equity * 100
+            self.mdd_peak_time = self.peak_time
+            self.trough_time = ts
+            return True
+        return False
+
+    @property
+    def current_drawdown(self) -> float:
+        if self.last_equity is None or self.peak_equity <= 0:
+            return 0.0
+        return self.peak_equity - self.last_equity
+
+    @property
+    def current_drawdown_percent(self) -> float:
+        if self.peak_equity <= 0:
+            return 0.0
+        return self.current_drawdown / self.peak_equity * 100
+
+    def to_mdd_dict(self) -> Dict[str, Any]:
+        return {
+            "mdd": self.mdd,
+            "mdd_percent": self.mdd_percent,
+            "peak_time": self.mdd_peak_time,
+            "trough_time": self.trough_time,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "DrawdownState":
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in (data or {}).items() if k in names})
+
+
+def compute_drawdown(equity: Sequence[float], times: Optional[Sequence[Any]] = None) -> DrawdownState:
+    """
+    구간 전체를 NumPy 로 계산합니다 (DrawdownState.update 를 순서대로 호출한 것과 동일).
+
+    Args:
+        equity: 시간순 평가금액
+        times: equity 와 같은 길이의 시각 (없으면 시각 필드는 None)
+    """
+    values = np.asarray(equity, dtype=float)
+    state = DrawdownState()
+    if values.size == 0:
+        return state
+    time_at = (lambda idx: times[idx]) if times is not None else (lambda idx: None)
+
+    peaks = np.maximum.accumulate(values)
+    drawdowns = np.where(peaks > 0, peaks - values, 0.0)
+    peak_idx = int(np.argmax(values))  # 첫 최고점 = 러닝 고점이 마지막으로 갱신된 지점
+
+    state.peak_equity = float(peaks[-1])
+    state.peak_time = time_at(peak_idx)
+    state.last_equity = float(values[-1])
+    state.last_time = time_at(values.size - 1)
+    state.count = int(values.size)
+
+    trough_idx = int(np.argmax(drawdowns))
+    if drawdowns[trough_idx] > 0:
+        state.mdd = float(drawdowns[trough_idx])
+        state.mdd_percent = float(drawdowns[trough_idx] / peaks[trough_idx] * 100)
+        state.mdd_peak_time = time_at(int(np.argmax(values[: trough_idx + 1])))
+        state.trough_time = time_at(trough_idx)
+    return state
+
+
+def max_drawdown(equity: Sequence[float]) -> Tuple[float, float]:
+    """(MDD 금액, MDD %) 만 필요한 호출부용"""
+    state = compute_drawdown(equity)
+    return state.mdd, state.mdd_percent
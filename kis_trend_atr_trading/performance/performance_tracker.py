@@ -12,7 +12,7 @@ KIS Trend-ATR Trading System - 성과 추적기
   - 일일/월별 리포트 생성
 
 ★ 지원 데이터 소스:
-  - JSON 파일 (기본)
+  - 로컬 상태 저장소 (기본, data/state_store.sqlite3 — 거래/Equity 는 append 기록)
   - MySQL 데이터베이스
 
 사용 예시:
@@ -51,13 +51,23 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
+from performance.drawdown import DrawdownState, compute_drawdown
 from performance.trade_record import TradeRecord, DailyTradeStats
 from performance.position_snapshot import PositionSnapshot, AccountSnapshot
 from utils.logger import get_logger
 from utils.market_hours import KST
+from utils.state_store import STATE_STORE_FILENAME, StateStore, get_state_store
 
 logger = get_logger("performance_tracker")
 
+# 상태 저장소 append 기록 namespace
+TRADES_LOG_NAMESPACE = "performance_trades"
+EQUITY_LOG_NAMESPACE = "performance_equity_curve"
+EQUITY_CURVE_MAX_POINTS = 1000
+# 러닝 고점/MDD 상태 (kv, 스냅샷마다 갱신 → 전체 기간 MDD 는 O(1) 조회)
+DRAWDOWN_NAMESPACE = "performance_drawdown"
+DRAWDOWN_KEY = "equity_curve"
+
 
 @dataclass
 class PerformanceSummary:
@@ -130,13 +140,15 @@ class PerformanceTracker:
         self,
         data_dir: Path = None,
         initial_capital: float = 10_000_000,
-        commission_rate: float = 0.00015
+        commission_rate: float = 0.00015,
+        state_store: StateStore = None
     ):
         """
         Args:
             data_dir: 데이터 저장 디렉토리
             initial_capital: 초기 자본금
             commission_rate: 수수료율
+            state_store: 상태 저장소 (None이면 data_dir 의 공유 저장소)
         """
         self.data_dir = data_dir or Path(__file__).parent.parent / "data"
         self.data_dir.mkdir(parents=True, exist_ok=True)
@@ -144,7 +156,8 @@ class PerformanceTracker:
         self.initial_capital = initial_capital
         self.commission_rate = commission_rate
         
-        # 파일 경로
+        # 저장소 (기존 JSON 파일은 최초 1회 이관)
+        self._store = state_store or get_state_store(self.data_dir / STATE_STORE_FILENAME)
         self.trades_file = self.data_dir / "performance_trades.json"
         self.snapshots_file = self.data_dir / "performance_snapshots.json"
         self.equity_file = self.data_dir / "equity_curve.json"
@@ -153,6 +166,7 @@ class PerformanceTracker:
         self._trades: List[TradeRecord] = []
         self._positions: Dict[str, PositionSnapshot] = {}
         self._equity_curve: List[Dict] = []
+        self._drawdown = DrawdownState()
         self._realized_pnl: float = 0.0
         
         # 데이터 로드
@@ -166,50 +180,86 @@ class PerformanceTracker:
     
     def _load_data(self) -> None:
         """저장된 데이터 로드"""
+        self._migrate_legacy_files()
+
         # 거래 기록 로드
-        if self.trades_file.exists():
-            try:
-                data = json.loads(self.trades_file.read_text())
-                self._trades = [TradeRecord.from_dict(t) for t in data]
-                # 실현 손익 계산
-                self._realized_pnl = sum(
-                    t.pnl or 0 
-                    for t in self._trades 
-                    if t.side == "SELL"
-                )
+        try:
+            self._trades = [TradeRecord.from_dict(t) for t in self._store.read_log(TRADES_LOG_NAMESPACE)]
+            # 실현 손익 계산
+            self._realized_pnl = sum(
+                t.pnl or 0 
+                for t in self._trades 
+                if t.side == "SELL"
+            )
+            if self._trades:
                 logger.info(f"[PERF] {len(self._trades)}개 거래 기록 로드")
-            except Exception as e:
-                logger.warning(f"[PERF] 거래 기록 로드 실패: {e}")
+        except Exception as e:
+            logger.warning(f"[PERF] 거래 기록 로드 실패: {e}")
         
         # Equity Curve 로드
-        if self.equity_file.exists():
+        try:
+            self._equity_curve = self._store.read_log(EQUITY_LOG_NAMESPACE)[-EQUITY_CURVE_MAX_POINTS:]
+        except Exception as e:
+            logger.warning(f"[PERF] Equity Curve 로드 실패: {e}")
+
+        # MDD 상태 로드 (없으면 저장된 Equity Curve 로 1회 재구성)
+        try:
+            saved = self._store.get(DRAWDOWN_NAMESPACE, DRAWDOWN_KEY)
+            if saved is not None:
+                self._drawdown = DrawdownState.from_dict(saved)
+            elif self._equity_curve:
+                self._drawdown = self._compute_drawdown(self._equity_curve)
+        except Exception as e:
+            logger.warning(f"[PERF] MDD 상태 로드 실패: {e}")
+
+    def _migrate_legacy_files(self) -> None:
+        """기존 JSON 파일(전체 재기록 방식)을 append 기록으로 1회 이관 (원본 파일은 그대로 둠)"""
+        for path, namespace in (
+            (self.trades_file, TRADES_LOG_NAMESPACE),
+            (self.equity_file, EQUITY_LOG_NAMESPACE),
+        ):
+            if not path.exists() or self._store.is_legacy_migrated(path.name):
+                continue
+            if self._store.has_log(namespace):
+                self._store.mark_legacy_migrated(path.name)
+                continue
             try:
-                self._equity_curve = json.loads(self.equity_file.read_text())
+                data = json.loads(path.read_text())
             except Exception as e:
-                logger.warning(f"[PERF] Equity Curve 로드 실패: {e}")
-    
-    def _save_trades(self) -> None:
-        """거래 기록 저장"""
+                logger.warning(f"[PERF] 기존 파일 로드 실패 (이관 생략): {path} ({e})")
+                continue
+            # equity_curve.json 은 TradeReporter 도 같은 이름(dict 형식)으로 쓰므로 list 일 때만 이관
+            if not isinstance(data, list):
+                continue
+            for row in data:
+                self._store.append(namespace, row)
+            self._store.mark_legacy_migrated(path.name)
+            if self._store.flush():
+                logger.info(f"[PERF] 기존 파일 이관 완료: {path} ({len(data)}건)")
+    
+    def _save_trade(self, trade: TradeRecord) -> None:
+        """거래 기록 1건 저장 (append, 디스크 반영은 저장소 flusher 가 처리)"""
         try:
-            data = [t.to_dict() for t in self._trades]
-            self.trades_file.write_text(
-                json.dumps(data, ensure_ascii=False, indent=2, default=str)
-            )
+            self._store.append(TRADES_LOG_NAMESPACE, trade.to_dict())
         except Exception as e:
             logger.error(f"[PERF] 거래 기록 저장 실패: {e}")
     
-    def _save_equity_curve(self) -> None:
-        """Equity Curve 저장"""
+    def _save_equity_point(self, snapshot: Dict[str, Any]) -> None:
+        """Equity Curve 포인트 1건 저장"""
         try:
             # 최근 1000개만 유지
-            if len(self._equity_curve) > 1000:
-                self._equity_curve = self._equity_curve[-1000:]
+            if len(self._equity_curve) > EQUITY_CURVE_MAX_POINTS:
+                self._equity_curve = self._equity_curve[-EQUITY_CURVE_MAX_POINTS:]
             
-            self.equity_file.write_text(
-                json.dumps(self._equity_curve, ensure_ascii=False, indent=2, default=str)
-            )
+            self._store.append(EQUITY_LOG_NAMESPACE, snapshot)
+            self._store.trim(EQUITY_LOG_NAMESPACE, EQUITY_CURVE_MAX_POINTS)
+            self._store.put(DRAWDOWN_NAMESPACE, DRAWDOWN_KEY, self._drawdown.to_dict())
         except Exception as e:
             logger.error(f"[PERF] Equity Curve 저장 실패: {e}")
+
+    def flush(self) -> bool:
+        """대기 중인 저장분을 즉시 디스크에 반영"""
+        return self._store.flush()
     
     # ═══════════════════════════════════════════════════════════════════════════
     # 거래 기록 메서드
@@ -277,7 +327,7 @@ class PerformanceTracker:
             highest_price=price
         )
         
-        self._save_trades()
+        self._save_trade(trade)
         
         logger.info(
             f"[PERF] 매수 기록: {symbol} @ {price:,.0f}원 x {quantity}주 "
@@ -353,7 +403,7 @@ class PerformanceTracker:
         # 포지션 제거
         del self._positions[symbol]
         
-        self._save_trades()
+        self._save_trade(trade)
         
         logger.info(
             f"[PERF] 매도 기록: {symbol} @ {price:,.0f}원 x {quantity}주 | "
@@ -394,7 +444,8 @@ class PerformanceTracker:
         }
         
         self._equity_curve.append(snapshot)
-        self._save_equity_curve()
+        self._drawdown.update(total_equity, snapshot["timestamp"])
+        self._save_equity_point(snapshot)
     
     # ═══════════════════════════════════════════════════════════════════════════
     # 성과 조회 메서드
@@ -493,46 +544,31 @@ class PerformanceTracker:
         """종목별 거래 기록"""
         return [t for t in self._trades if t.symbol == symbol]
     
+    @staticmethod
+    def _compute_drawdown(equity_data: List[Dict]) -> DrawdownState:
+        ordered = sorted(equity_data, key=lambda x: x["timestamp"])
+        return compute_drawdown(
+            [float(e["total_equity"]) for e in ordered],
+            [e["timestamp"] for e in ordered],
+        )
+
     def calculate_mdd(self, days: int = None) -> Dict[str, Any]:
-        """MDD 계산"""
-        if not self._equity_curve:
-            return {"mdd": 0.0, "mdd_percent": 0.0}
-        
-        # 날짜 필터링
-        equity_data = self._equity_curve
-        if days:
-            cutoff = datetime.now(KST) - timedelta(days=days)
-            equity_data = [
-                e for e in equity_data 
-                if datetime.fromisoformat(e["timestamp"]) >= cutoff
-            ]
-        
-        if not equity_data:
-            return {"mdd": 0.0, "mdd_percent": 0.0}
-        
-        # MDD 계산
-        peak = 0.0
-        mdd = 0.0
-        mdd_percent = 0.0
-        
-        for e in sorted(equity_data, key=lambda x: x["timestamp"]):
-            equity = float(e["total_equity"])
-            
-            if equity > peak:
-                peak = equity
-            
-            if peak > 0:
-                drawdown = peak - equity
-                drawdown_pct = (drawdown / peak) * 100
-                
-                if drawdown > mdd:
-                    mdd = drawdown
-                    mdd_percent = drawdown_pct
-        
-        return {
-            "mdd": mdd,
-            "mdd_percent": mdd_percent
-        }
+        """
+        MDD 계산
+
+        - 전체 기간: 스냅샷마다 갱신되는 러닝 상태를 그대로 반환 (O(1))
+        - 최근 N일: 해당 구간만 NumPy 로 계산
+        """
+        if not days:
+            return {"mdd": self._drawdown.mdd, "mdd_percent": self._drawdown.mdd_percent}
+
+        cutoff = datetime.now(KST) - timedelta(days=days)
+        equity_data = [
+            e for e in self._equity_curve
+            if datetime.fromisoformat(e["timestamp"]) >= cutoff
+        ]
+        state = self._compute_drawdown(equity_data)
+        return {"mdd": state.mdd, "mdd_percent": state.mdd_percent}
     
     def get_equity_curve(self) -> List[Dict]:
         """Equity Curve 데이터 반환"""
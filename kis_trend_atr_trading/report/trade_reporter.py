@@ -31,6 +31,7 @@ from dataclasses import dataclass, field, asdict
 from enum import Enum
 import threading
 
+from performance.drawdown import DrawdownState, compute_drawdown
 from utils.logger import get_logger
 
 logger = get_logger("trade_reporter")
@@ -197,6 +198,7 @@ class TradeReporter:
         
         # 자산 추이
         self._equity_curve: List[EquityPoint] = []
+        self._drawdown = DrawdownState()  # 러닝 고점/MDD (추이 파일은 최근 1000개만 저장)
         
         # 현재 상태
         self._cash_balance = initial_capital
@@ -629,6 +631,7 @@ class TradeReporter:
         )
         
         self._equity_curve.append(point)
+        self._drawdown.update(equity, point.timestamp)
         
         # Peak/Valley 업데이트
         if equity > self._peak_equity:
@@ -644,28 +647,12 @@ class TradeReporter:
         """
         최대 낙폭(MDD)을 계산합니다.
         
+        자산 추이 포인트마다 갱신되는 러닝 상태를 읽습니다 (O(1)).
+        
         Returns:
             Tuple[float, float]: (MDD 금액, MDD 비율)
         """
-        if not self._equity_curve:
-            return 0.0, 0.0
-        
-        peak = self._equity_curve[0].equity
-        max_dd = 0.0
-        max_dd_pct = 0.0
-        
-        for point in self._equity_curve:
-            if point.equity > peak:
-                peak = point.equity
-            
-            dd = peak - point.equity
-            dd_pct = (dd / peak) * 100 if peak > 0 else 0
-            
-            if dd > max_dd:
-                max_dd = dd
-                max_dd_pct = dd_pct
-        
-        return max_dd, max_dd_pct
+        return self._drawdown.mdd, self._drawdown.mdd_percent
     
     # ═══════════════════════════════════════════════════════════════════════════
     # 리포트 생성
@@ -780,6 +767,7 @@ class TradeReporter:
                 "cash_balance": self._cash_balance,
                 "peak_equity": self._peak_equity,
                 "valley_equity": self._valley_equity,
+                "drawdown": self._drawdown.to_dict(),
                 "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             }
             
@@ -802,6 +790,7 @@ class TradeReporter:
     
     def _load_data(self) -> None:
         """저장된 데이터를 로드합니다."""
+        saved_drawdown = None
         try:
             # 거래 기록 로드
             if self._trades_file.exists():
@@ -820,6 +809,7 @@ class TradeReporter:
                 self._cash_balance = data.get("cash_balance", self.initial_capital)
                 self._peak_equity = data.get("peak_equity", self.initial_capital)
                 self._valley_equity = data.get("valley_equity", self.initial_capital)
+                saved_drawdown = data.get("drawdown")
             
             # 자산 추이 로드
             if self._equity_file.exists():
@@ -830,6 +820,15 @@ class TradeReporter:
                     EquityPoint(**p) for p in data.get("curve", [])
                 ]
             
+            # MDD 상태 (이전 버전 파일이면 자산 추이로 재구성)
+            if saved_drawdown:
+                self._drawdown = DrawdownState.from_dict(saved_drawdown)
+            else:
+                self._drawdown = compute_drawdown(
+                    [p.equity for p in self._equity_curve],
+                    [p.timestamp for p in self._equity_curve],
+                )
+            
             logger.info(
                 f"[REPORTER] 데이터 로드 완료: "
                 f"거래={len(self._trades)}건, "
@@ -845,6 +844,7 @@ class TradeReporter:
             self._trades = []
             self._stock_performances = {}
             self._equity_curve = []
+            self._drawdown = DrawdownState()
             self._cash_balance = self.initial_capital
             self._peak_equity = self.initial_capital
             self._valley_equity = self.initial_capital
@@ -14,6 +14,8 @@ from datetime import date, datetime
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from db.mysql import MySQLManager, get_db_manager
+from db.schema_catalog import get_schema_catalog
+from db.write_buffer import flush_db_write_buffers
 from env import get_db_namespace_mode
 from utils.logger import get_logger
 from utils.market_hours import KST
@@ -183,6 +185,8 @@ class DailyReportService:
 
     def build_report(self, trade_date: date, persist_daily_summary: bool = True) -> DailyReportResult:
         """Build a report payload from DB."""
+        # 같은 프로세스에서 버퍼링된 trades/account_snapshots 쓰기를 먼저 반영
+        flush_db_write_buffers()
         trades = self._load_trades(trade_date)
         computed = self.calculate_trade_metrics(trades)
         start_equity, end_equity = self._get_equity_bounds(trade_date)
@@ -523,6 +527,7 @@ class DailyReportService:
         attempts = max(int(attempts or 1), 1)
         interval_seconds = max(float(interval_seconds or 0.0), 0.0)
         stats["attempted_calls"] = attempts
+        flush_db_write_buffers()
 
         if api_client is None:
             from api.kis_api import KISApi
@@ -787,6 +792,9 @@ class DailyReportService:
         return self._to_float_or_none((row or {}).get("unrealized_pnl"))
 
     def _positions_has_unrealized_columns(self) -> bool:
+        catalog = get_schema_catalog(self._db)
+        if catalog is not None:
+            return {"current_price", "unrealized_pnl"} <= catalog.get_column_names("positions")
         db_name = self._get_db_name()
         result = self._db.execute_query(
             """
@@ -802,6 +810,9 @@ class DailyReportService:
         return int((result or {}).get("cnt", 0) or 0) >= 2
 
     def _get_table_columns(self, table_name: str) -> set:
+        catalog = get_schema_catalog(self._db)
+        if catalog is not None:
+            return catalog.get_column_names(table_name)
         db_name = self._get_db_name()
         rows = self._db.execute_query(
             """
@@ -968,6 +979,11 @@ class DailyReportService:
         if "mode" not in columns:
             return False
 
+        catalog = get_schema_catalog(self._db)
+        if catalog is not None:
+            pk_columns = [column.lower() for column in catalog.get_primary_key("daily_summary")]
+            return pk_columns == ["trade_date", "mode"]
+
         db_name = self._get_db_name()
         pk_rows = self._db.execute_query(
             """
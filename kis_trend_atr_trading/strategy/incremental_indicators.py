@@ -0,0 +1,269 @@
+"""
+KIS Trend-ATR Trading System - 증분 지표 엔진
+
+FAST_EVAL 경로에서 매 틱마다 전체 일봉(~100행)에 대해 rolling/ewm 지표를
+다시 계산하지 않도록, 완료된 일봉까지의 ATR/MA/MA20/ADX 상태를 보관하고
+당일 잠정(provisional) 봉 1개만 O(1)로 갱신합니다.
+
+★ 계산식은 MultidayTrendATRStrategy.add_indicators 와 동일해야 합니다.
+    - ATR/MA/MA20: 단순 이동평균 (pandas rolling(window).mean())
+    - ADX: Wilder 평활 (ewm(alpha=1/period, adjust=False)) 3회 적용
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+INCREMENTAL_INDICATOR_COLUMNS: Tuple[str, ...] = ("atr", "ma", "ma20", "adx")
+
+
+def _nan_div(numerator: float, denominator: float) -> float:
+    """pandas(IEEE) 나눗셈과 동일한 결과 (0/0=NaN, x/0=±inf)"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return float(np.float64(numerator) / np.float64(denominator))
+
+
+class _EwmState:
+    """
+    ewm(alpha, adjust=False, ignore_na=False).mean() 의 단일 시리즈 상태
+
+    pandas 구현과 동일하게 NaN 구간에서는 이전 가중치를 (1-alpha)^k 로 감쇠시킵니다.
+    """
+
+    __slots__ = ("alpha", "weighted", "old_wt")
+
+    def __init__(self, alpha: float):
+        self.alpha = float(alpha)
+        self.weighted = math.nan
+        self.old_wt = 1.0
+
+    def peek(self, value: float) -> Tuple[float, float]:
+        """상태를 바꾸지 않고 value 반영 후의 (weighted, old_wt) 반환"""
+        weighted = self.weighted
+        old_wt = self.old_wt
+        is_observation = value == value
+        if weighted == weighted:
+            old_wt *= 1.0 - self.alpha
+            if is_observation:
+                if weighted != value:
+                    weighted = (old_wt * weighted + self.alpha * value) / (old_wt + self.alpha)
+                old_wt = 1.0
+        elif is_observation:
+            weighted = value
+        return weighted, old_wt
+
+
+class _RollingMeanState:
+    """rolling(window).mean() 의 마지막 (window-1)개 값 합계 상태"""
+
+    __slots__ = ("window", "values", "total", "nan_count")
+
+    def __init__(self, window: int):
+        self.window = max(int(window), 1)
+        self.values: Deque[float] = deque()
+        self.total = 0.0
+        self.nan_count = 0
+
+    def push(self, value: float) -> None:
+        """완료 봉 값을 추가하고 잠정 봉 계산용으로 (window-1)개만 유지"""
+        self.values.append(value)
+        if value == value:
+            self.total += value
+        else:
+            self.nan_count += 1
+        while len(self.values) > self.window - 1:
+            removed = self.values.popleft()
+            if removed == removed:
+                self.total -= removed
+            else:
+                self.nan_count -= 1
+
+    def peek(self, value: float) -> float:
+        if len(self.values) < self.window - 1:
+            return math.nan
+        if self.nan_count > 0 or value != value:
+            return math.nan
+        return (self.total + value) / self.window
+
+
+class IncrementalIndicatorEngine:
+    """
+    종목별 증분 지표 엔진
+
+    사용법:
+        engine.seed(finalized_df, finalized_indicator_df)   # 완료 일봉 기준 1회
+        values = engine.update(high, low, close)            # 잠정 봉, O(1)
+
+    seed 에 넘긴 완료 일봉 지표 컬럼은 그대로 보관되어
+    전체 프레임 재구성 시 재사용됩니다.
+    """
+
+    def __init__(
+        self,
+        *,
+        atr_period: int,
+        ma_period: int,
+        adx_period: int,
+        ma20_period: int = 20,
+    ):
+        self.atr_period = max(int(atr_period), 1)
+        self.ma_period = max(int(ma_period), 1)
+        self.adx_period = max(int(adx_period), 1)
+        self.ma20_period = max(int(ma20_period), 1)
+        self._seed_key: Optional[Tuple[Any, ...]] = None
+        self._finalized_columns: Dict[str, np.ndarray] = {}
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        alpha = 1.0 / self.adx_period
+        self._tr_window = _RollingMeanState(self.atr_period)
+        self._close_window = _RollingMeanState(self.ma_period)
+        self._close20_window = _RollingMeanState(self.ma20_period)
+        self._atr_smooth = _EwmState(alpha)
+        self._plus_dm_smooth = _EwmState(alpha)
+        self._minus_dm_smooth = _EwmState(alpha)
+        self._adx_smooth = _EwmState(alpha)
+        self._prev_high = math.nan
+        self._prev_low = math.nan
+        self._prev_close = math.nan
+        self._rows = 0
+
+    # ════════════════════════════════════════════════════════════════
+    # 상태
+    # ════════════════════════════════════════════════════════════════
+
+    @property
+    def is_seeded(self) -> bool:
+        return self._seed_key is not None
+
+    @property
+    def finalized_rows(self) -> int:
+        return self._rows
+
+    @staticmethod
+    def seed_key_for(frame: pd.DataFrame) -> Tuple[Any, ...]:
+        """완료 일봉 프레임 식별 키 (행 수 + 마지막 봉)"""
+        if frame is None or frame.empty:
+            return (0,)
+        return (
+            len(frame),
+            str(frame["date"].iat[-1]) if "date" in frame.columns else "",
+            float(frame["high"].iat[-1]),
+            float(frame["low"].iat[-1]),
+            float(frame["close"].iat[-1]),
+        )
+
+    def matches(self, frame: pd.DataFrame) -> bool:
+        return self._seed_key is not None and self._seed_key == self.seed_key_for(frame)
+
+    def finalized_column(self, column: str) -> np.ndarray:
+        return self._finalized_columns[column]
+
+    # ════════════════════════════════════════════════════════════════
+    # 계산
+    # ════════════════════════════════════════════════════════════════
+
+    def _directional_move(self, high: float, low: float) -> Tuple[float, float]:
+        up_move = high - self._prev_high
+        down_move = self._prev_low - low
+        plus_dm = up_move if (up_move > down_move and up_move > 0) else 0.0
+        minus_dm = down_move if (down_move > up_move and down_move > 0) else 0.0
+        return plus_dm, minus_dm
+
+    def _true_range(self, high: float, low: float) -> float:
+        # pandas concat(...).max(axis=1) 는 NaN 을 건너뜀
+        candidates = [
+            value
+            for value in (
+                high - low,
+                abs(high - self._prev_close),
+                abs(low - self._prev_close),
+            )
+            if value == value
+        ]
+        return max(candidates) if candidates else math.nan
+
+    def seed(self, frame: pd.DataFrame, indicator_frame: pd.DataFrame) -> None:
+        """
+        완료된 일봉으로 상태를 초기화합니다.
+
+        Args:
+            frame: 완료 일봉 OHLC (잠정 봉 제외)
+            indicator_frame: add_indicators(frame) 결과 (완료 봉 지표 재사용용)
+        """
+        self._reset_state()
+        highs = frame["high"].to_numpy(dtype=float)
+        lows = frame["low"].to_numpy(dtype=float)
+        closes = frame["close"].to_numpy(dtype=float)
+
+        for high, low, close in zip(highs, lows, closes):
+            true_range = self._true_range(high, low)
+            plus_dm, minus_dm = self._directional_move(high, low)
+            self._tr_window.push(true_range)
+            self._close_window.push(close)
+            self._close20_window.push(close)
+            self._push_adx(true_range, plus_dm, minus_dm)
+            self._prev_high = high
+            self._prev_low = low
+            self._prev_close = close
+            self._rows += 1
+
+        self._finalized_columns = {
+            column: indicator_frame[column].to_numpy(dtype=float)
+            for column in INCREMENTAL_INDICATOR_COLUMNS
+        }
+        self._seed_key = self.seed_key_for(frame)
+
+    def _adx_step(
+        self,
+        true_range: float,
+        plus_dm: float,
+        minus_dm: float,
+    ) -> Tuple[Tuple[float, float], Tuple[float, float], Tuple[float, float], Tuple[float, float]]:
+        atr_state = self._atr_smooth.peek(true_range)
+        plus_state = self._plus_dm_smooth.peek(plus_dm)
+        minus_state = self._minus_dm_smooth.peek(minus_dm)
+
+        plus_di = 100 * _nan_div(plus_state[0], atr_state[0])
+        minus_di = 100 * _nan_div(minus_state[0], atr_state[0])
+        di_sum = plus_di + minus_di
+        di_diff = abs(plus_di - minus_di)
+        dx = 100 * _nan_div(di_diff, di_sum) if di_sum != 0 else math.nan
+        adx_state = self._adx_smooth.peek(dx)
+        return atr_state, plus_state, minus_state, adx_state
+
+    def _push_adx(self, true_range: float, plus_dm: float, minus_dm: float) -> float:
+        atr_state, plus_state, minus_state, adx_state = self._adx_step(true_range, plus_dm, minus_dm)
+        self._atr_smooth.weighted, self._atr_smooth.old_wt = atr_state
+        self._plus_dm_smooth.weighted, self._plus_dm_smooth.old_wt = plus_state
+        self._minus_dm_smooth.weighted, self._minus_dm_smooth.old_wt = minus_state
+        self._adx_smooth.weighted, self._adx_smooth.old_wt = adx_state
+        return adx_state[0]
+
+    def update(self, high: float, low: float, close: float) -> Dict[str, float]:
+        """
+        잠정 봉 지표 계산 (상태 불변, O(1))
+
+        Returns:
+            Dict: atr, ma, ma20, adx, prev_high, prev_close
+        """
+        high = float(high)
+        low = float(low)
+        close = float(close)
+        true_range = self._true_range(high, low)
+        plus_dm, minus_dm = self._directional_move(high, low)
+        adx = self._adx_step(true_range, plus_dm, minus_dm)[3][0]
+        return {
+            "atr": self._tr_window.peek(true_range),
+            "ma": self._close_window.peek(close),
+            "ma20": self._close20_window.peek(close),
+            "adx": adx,
+            "prev_high": self._prev_high,
+            "prev_close": self._prev_close,
+        }
@@ -46,6 +46,7 @@ from utils.entry_utils import (
     compute_extension_pct,
     detect_asset_type,
 )
+from strategy.incremental_indicators import IncrementalIndicatorEngine
 from strategy.opening_range_breakout import ORBCandidate, ORBDecision, OpeningRangeBreakoutStrategy
 from strategy.pullback_rebreakout import (
     PullbackCandidate,
@@ -313,6 +314,55 @@ class MultidayTrendATRStrategy:
         df['prev_close'] = df['close'].shift(1)
         
         return df
+
+    def create_indicator_engine(self) -> IncrementalIndicatorEngine:
+        """종목별 증분 지표 엔진 생성 (FAST_EVAL 잠정 봉 전용)"""
+        return IncrementalIndicatorEngine(
+            atr_period=self.atr_period,
+            ma_period=self.ma_period,
+            adx_period=settings.ADX_PERIOD,
+        )
+    
+    def add_indicators_incremental(
+        self,
+        df: pd.DataFrame,
+        engine: IncrementalIndicatorEngine,
+    ) -> pd.DataFrame:
+        """
+        마지막 행(당일 잠정 봉)만 증분 계산해 add_indicators 와 동일한 프레임 반환
+        
+        완료 일봉(df.iloc[:-1])이 바뀌었을 때만 엔진을 재시드하므로
+        틱마다 rolling/ewm 전체 재계산 비용이 발생하지 않습니다.
+        """
+        if df is None or len(df) < 2:
+            return self.add_indicators(df)
+        
+        finalized = df.iloc[:-1]
+        if not engine.matches(finalized):
+            engine.seed(finalized, self.add_indicators(finalized))
+        
+        provisional = engine.update(
+            df['high'].iat[-1],
+            df['low'].iat[-1],
+            df['close'].iat[-1],
+        )
+        
+        columns = {
+            column: np.append(engine.finalized_column(column), provisional[column])
+            for column in ('atr', 'ma', 'ma20', 'adx')
+        }
+        columns['trend'] = np.where(
+            df['close'].to_numpy() > columns['ma'],
+            TrendType.UPTREND.value,
+            TrendType.DOWNTREND.value
+        )
+        columns['prev_high'] = df['high'].shift(1)
+        columns['prev_close'] = df['close'].shift(1)
+        
+        # 컬럼별 __setitem__ 대신 한 번에 결합 (틱당 블록 삽입 비용 최소화)
+        existing = [column for column in columns if column in df.columns]
+        base = df.drop(columns=existing) if existing else df
+        return pd.concat([base, pd.DataFrame(columns, index=df.index)], axis=1)
     
     # ════════════════════════════════════════════════════════════════
     # 추세 판단
@@ -1176,6 +1226,7 @@ class MultidayTrendATRStrategy:
         market_regime_snapshot: Optional[object] = None,
         intraday_bars: Optional[list[dict]] = None,
         defer_pullback_buy: bool = False,
+        intraday_session: Optional[object] = None,
     ) -> TradingSignal:
         """
         매매 시그널 생성
@@ -1370,6 +1421,7 @@ class MultidayTrendATRStrategy:
             has_existing_position=self.has_position,
             has_pending_order=has_pending_order,
             market_regime_snapshot=market_regime_snapshot,
+            intraday_session=intraday_session,
         )
         if orb_candidate.decision == ORBDecision.BLOCKED:
             orb_meta = dict(orb_candidate.meta or {})
@@ -8,6 +8,7 @@ from typing import Any, Dict, Iterable, Optional
 import pandas as pd
 
 from config import settings
+from core.intraday_session import IntradaySessionAccumulator, IntradaySessionSnapshot
 from utils.entry_utils import ASSET_TYPE_ETF, ASSET_TYPE_STOCK, compute_extension_pct, detect_asset_type
 from utils.logger import get_logger
 from utils.market_hours import KST, MARKET_OPEN
@@ -166,24 +167,37 @@ class OpeningRangeBreakoutStrategy:
         normalized.sort(key=lambda item: item["start_at"])
         return normalized
 
-    @staticmethod
-    def _compute_vwap(bars: Iterable[dict]) -> float:
-        total_turnover = 0.0
-        total_volume = 0.0
-        for bar in list(bars or []):
-            volume = float(bar.get("volume", 0.0) or 0.0)
-            if volume <= 0:
-                continue
-            typical_price = (
-                float(bar.get("high", 0.0) or 0.0)
-                + float(bar.get("low", 0.0) or 0.0)
-                + float(bar.get("close", 0.0) or 0.0)
-            ) / 3.0
-            total_turnover += typical_price * volume
-            total_volume += volume
-        if total_volume <= 0:
-            return 0.0
-        return total_turnover / total_volume
+    def _resolve_intraday_session(
+        self,
+        *,
+        intraday_bars: Optional[Iterable[dict]],
+        intraday_session: Optional[IntradaySessionSnapshot],
+        decision_time: datetime,
+        range_minutes: int,
+        recent_lookback: int,
+    ) -> IntradaySessionSnapshot:
+        """
+        ORB 판단용 장중 세션 상태를 확정합니다.
+
+        provider 가 완성 분봉마다 누적한 세션 스냅샷(opening range / VWAP / 최근 종가)이
+        range/lookback 을 모두 담고 있으면 그대로 사용하고 (O(1)),
+        없거나 부족하면 분봉 리스트를 정규화해 같은 누적기로 1회 계산합니다.
+        """
+        if intraday_session is not None:
+            if intraday_session.trade_date != decision_time.date():
+                return IntradaySessionSnapshot(
+                    stock_code=intraday_session.stock_code,
+                    trade_date=decision_time.date(),
+                )
+            if intraday_session.covers(range_minutes, recent_lookback):
+                return intraday_session
+        accumulator = IntradaySessionAccumulator(
+            opening_range_bars=range_minutes,
+            recent_close_window=recent_lookback,
+        )
+        for bar in self._normalize_intraday_bars(intraday_bars or [], decision_time=decision_time):
+            accumulator.add_bar(bar)
+        return accumulator.snapshot()
 
     def _resolve_phase_context(
         self,
@@ -209,18 +223,18 @@ class OpeningRangeBreakoutStrategy:
     def _resolve_intraday_source_state(
         self,
         *,
-        bars: list[dict],
+        session: IntradaySessionSnapshot,
         decision_time: datetime,
         range_minutes: int,
         provider_ready: bool,
     ) -> str:
         if not provider_ready:
             return "unsupported"
-        if not bars:
+        if session.bar_count <= 0:
             return "missing"
-        if len(bars) < int(range_minutes):
+        if session.bar_count < int(range_minutes):
             return "insufficient"
-        last_bar_at = self._parse_bar_time(bars[-1].get("start_at") or bars[-1].get("date"))
+        last_bar_at = self._parse_bar_time(session.last_bar_at)
         if last_bar_at is None:
             return "missing"
         if (decision_time - last_bar_at).total_seconds() > 180.0:
@@ -243,6 +257,7 @@ class OpeningRangeBreakoutStrategy:
         has_pending_order: bool = False,
         market_regime_snapshot: Optional[object] = None,
         intraday_provider_ready: bool = True,
+        intraday_session: Optional[IntradaySessionSnapshot] = None,
     ) -> tuple[Optional[ORBSetupCandidate], Optional[ORBCandidate]]:
         if not bool(getattr(settings, "ENABLE_OPENING_RANGE_BREAKOUT_STRATEGY", False)):
             return None, ORBCandidate(decision=ORBDecision.NOOP)
@@ -331,10 +346,16 @@ class OpeningRangeBreakoutStrategy:
                 reason_code="orb_gap_too_large",
             )
 
-        bars = self._normalize_intraday_bars(intraday_bars or [], decision_time=now_kst)
         range_minutes = max(int(getattr(settings, "ORB_OPENING_RANGE_MINUTES", 5) or 5), 3)
+        session = self._resolve_intraday_session(
+            intraday_bars=intraday_bars,
+            intraday_session=intraday_session,
+            decision_time=now_kst,
+            range_minutes=range_minutes,
+            recent_lookback=max(int(getattr(settings, "ORB_RECENT_BREAKOUT_LOOKBACK_BARS", 3) or 3), 1),
+        )
         source_state = self._resolve_intraday_source_state(
-            bars=bars,
+            session=session,
             decision_time=now_kst,
             range_minutes=range_minutes,
             provider_ready=bool(intraday_provider_ready),
@@ -369,9 +390,15 @@ class OpeningRangeBreakoutStrategy:
         if minutes_since_open < entry_start_minutes or minutes_since_open > entry_cutoff_minutes:
             return None, ORBCandidate(decision=ORBDecision.NOOP)
 
-        opening_range_bars = bars[:range_minutes]
-        opening_range_high = max(float(bar["high"]) for bar in opening_range_bars)
-        opening_range_low = min(float(bar["low"]) for bar in opening_range_bars)
+        opening_range = session.opening_range(range_minutes)
+        if opening_range is None:
+            return None, ORBCandidate(
+                decision=ORBDecision.NOOP,
+                reason="orb_intraday_insufficient",
+                reason_code="orb_intraday_insufficient",
+                meta={"intraday_source_state": "insufficient"},
+            )
+        opening_range_high, opening_range_low = opening_range
         candidate = ORBSetupCandidate(
             symbol=str(stock_code).zfill(6),
             strategy_tag=self.strategy_tag,
@@ -419,6 +446,7 @@ class OpeningRangeBreakoutStrategy:
         has_existing_position: bool = False,
         has_pending_order: bool = False,
         intraday_provider_ready: bool = True,
+        intraday_session: Optional[IntradaySessionSnapshot] = None,
     ) -> ORBTimingDecision:
         now_kst = self._resolve_time(check_time)
         if candidate.expires_at <= now_kst:
@@ -470,10 +498,17 @@ class OpeningRangeBreakoutStrategy:
                 meta={"intraday_source_state": "fresh"},
             )
 
-        bars = self._normalize_intraday_bars(intraday_bars or [], decision_time=now_kst)
         range_minutes = max(int(candidate.meta.get("opening_range_minutes", getattr(settings, "ORB_OPENING_RANGE_MINUTES", 5)) or 5), 3)
+        recent_lookback = max(int(getattr(settings, "ORB_RECENT_BREAKOUT_LOOKBACK_BARS", 3) or 3), 1)
+        session = self._resolve_intraday_session(
+            intraday_bars=intraday_bars,
+            intraday_session=intraday_session,
+            decision_time=now_kst,
+            range_minutes=range_minutes,
+            recent_lookback=recent_lookback,
+        )
         source_state = self._resolve_intraday_source_state(
-            bars=bars,
+            session=session,
             decision_time=now_kst,
             range_minutes=range_minutes,
             provider_ready=bool(intraday_provider_ready),
@@ -520,11 +555,10 @@ class OpeningRangeBreakoutStrategy:
                 },
             )
 
-        recent_lookback = max(int(getattr(settings, "ORB_RECENT_BREAKOUT_LOOKBACK_BARS", 3) or 3), 1)
         rearm_band_pct = max(float(getattr(settings, "ORB_REARM_BAND_PCT", 0.002) or 0.0), 0.0)
-        recent_bars = bars[-recent_lookback:]
+        recent_closes = session.recent_closes[-recent_lookback:]
         rearm_threshold_price = float(candidate.opening_range_high or 0.0) * (1.0 + rearm_band_pct)
-        breakout_is_fresh = any(float(bar.get("close", 0.0) or 0.0) <= rearm_threshold_price for bar in recent_bars)
+        breakout_is_fresh = any(close <= rearm_threshold_price for close in recent_closes)
         if not breakout_is_fresh:
             return ORBTimingDecision(
                 should_emit_intent=False,
@@ -535,7 +569,7 @@ class OpeningRangeBreakoutStrategy:
                 meta={"intraday_source_state": source_state},
             )
 
-        vwap = self._compute_vwap(bars)
+        vwap = session.vwap
         if bool(getattr(settings, "ORB_REQUIRE_ABOVE_VWAP", True)) and vwap > 0 and current_price < vwap:
             return ORBTimingDecision(
                 should_emit_intent=False,
@@ -578,6 +612,7 @@ class OpeningRangeBreakoutStrategy:
         has_existing_position: bool = False,
         has_pending_order: bool = False,
         market_regime_snapshot: Optional[object] = None,
+        intraday_session: Optional[IntradaySessionSnapshot] = None,
     ) -> ORBCandidate:
         if not bool(getattr(settings, "ENABLE_OPENING_RANGE_BREAKOUT_STRATEGY", False)):
             return ORBCandidate(decision=ORBDecision.NOOP)
@@ -698,9 +733,16 @@ class OpeningRangeBreakoutStrategy:
                 reason_code="orb_gap_too_large",
             )
 
-        bars = self._normalize_intraday_bars(intraday_bars or [], decision_time=now_kst)
         range_minutes = max(int(getattr(settings, "ORB_OPENING_RANGE_MINUTES", 5) or 5), 3)
-        if len(bars) < range_minutes:
+        recent_lookback = max(int(getattr(settings, "ORB_RECENT_BREAKOUT_LOOKBACK_BARS", 3) or 3), 1)
+        session = self._resolve_intraday_session(
+            intraday_bars=intraday_bars,
+            intraday_session=intraday_session,
+            decision_time=now_kst,
+            range_minutes=range_minutes,
+            recent_lookback=recent_lookback,
+        )
+        if session.bar_count < range_minutes:
             return ORBCandidate(decision=ORBDecision.NOOP)
 
         market_open_at = now_kst.replace(
@@ -725,9 +767,10 @@ class OpeningRangeBreakoutStrategy:
         if minutes_since_open < entry_start_minutes or minutes_since_open > entry_cutoff_minutes:
             return ORBCandidate(decision=ORBDecision.NOOP)
 
-        opening_range_bars = bars[:range_minutes]
-        opening_range_high = max(float(bar["high"]) for bar in opening_range_bars)
-        opening_range_low = min(float(bar["low"]) for bar in opening_range_bars)
+        opening_range = session.opening_range(range_minutes)
+        if opening_range is None:
+            return ORBCandidate(decision=ORBDecision.NOOP)
+        opening_range_high, opening_range_low = opening_range
         if current_price <= opening_range_high:
             return ORBCandidate(decision=ORBDecision.NOOP)
 
@@ -757,11 +800,10 @@ class OpeningRangeBreakoutStrategy:
                 },
             )
 
-        recent_lookback = max(int(getattr(settings, "ORB_RECENT_BREAKOUT_LOOKBACK_BARS", 3) or 3), 1)
         rearm_band_pct = max(float(getattr(settings, "ORB_REARM_BAND_PCT", 0.002) or 0.0), 0.0)
-        recent_bars = bars[-recent_lookback:]
+        recent_closes = session.recent_closes[-recent_lookback:]
         rearm_threshold_price = opening_range_high * (1.0 + rearm_band_pct)
-        breakout_is_fresh = any(float(bar.get("close", 0.0) or 0.0) <= rearm_threshold_price for bar in recent_bars)
+        breakout_is_fresh = any(close <= rearm_threshold_price for close in recent_closes)
         if not breakout_is_fresh:
             self._entry_block(
                 "orb_breakout_not_fresh",
@@ -775,7 +817,7 @@ class OpeningRangeBreakoutStrategy:
                 reason_code="orb_breakout_not_fresh",
             )
 
-        vwap = self._compute_vwap(bars)
+        vwap = session.vwap
         if bool(getattr(settings, "ORB_REQUIRE_ABOVE_VWAP", True)) and vwap > 0 and current_price < vwap:
             self._entry_block(
                 "orb_below_vwap",
@@ -10,7 +10,12 @@ import pandas as pd
 
 try:
     from config import settings
-    from engine.pullback_pipeline_models import DailyContext, PullbackSetupCandidate, PullbackTimingDecision
+    from engine.pullback_pipeline_models import (
+        DailyContext,
+        PullbackSetupCandidate,
+        PullbackTimingDecision,
+        daily_context_frame,
+    )
     from utils.logger import get_logger
     from utils.market_hours import KST
     from utils.market_phase import (
@@ -26,6 +31,7 @@ except ImportError:
         DailyContext,
         PullbackSetupCandidate,
         PullbackTimingDecision,
+        daily_context_frame,
     )
     from kis_trend_atr_trading.utils.logger import get_logger
     from kis_trend_atr_trading.utils.market_hours import KST
@@ -416,10 +422,8 @@ class PullbackRebreakoutStrategy:
         has_pending_order: bool = False,
         market_regime_snapshot: Optional[object] = None,
     ) -> Tuple[Optional[PullbackSetupCandidate], Optional[PullbackCandidate]]:
-        recent_bars = [dict(bar) for bar in tuple(daily_context.recent_bars or ())]
-        df = pd.DataFrame(recent_bars)
         return self.evaluate_setup_candidate(
-            df=df,
+            df=daily_context_frame(daily_context),
             current_price=current_price,
             stock_code=stock_code,
             stock_name=stock_name,
@@ -83,7 +83,7 @@ class TestTokenManagement:
         assert api._token_prewarm_hour == 8
         assert api._token_prewarm_minute == 0
     
-    @patch('api.kis_api.requests.post')
+    @patch('api.kis_api.requests.Session.post')
     def test_get_access_token_success(self, mock_post, tmp_path):
         """토큰 발급 성공 테스트"""
         mock_response = Mock()
@@ -104,7 +104,7 @@ class TestTokenManagement:
         assert api.access_token == "test_token_12345"
         assert api.token_expires_at is not None
     
-    @patch('api.kis_api.requests.post')
+    @patch('api.kis_api.requests.Session.post')
     def test_token_reuse_when_valid(self, mock_post, tmp_path):
         """유효한 토큰 재사용 테스트"""
         mock_response = Mock()
@@ -129,7 +129,7 @@ class TestTokenManagement:
         # API는 첫 번째 호출에서만 호출됨
         assert mock_post.call_count == 1
     
-    @patch('api.kis_api.requests.post')
+    @patch('api.kis_api.requests.Session.post')
     def test_token_refresh_when_expired(self, mock_post, tmp_path):
         """만료된 토큰 갱신 테스트"""
         mock_response = Mock()
@@ -154,7 +154,7 @@ class TestTokenManagement:
         assert token == "new_token_67890"
 
     @patch('api.kis_api.time.sleep')
-    @patch('api.kis_api.requests.post')
+    @patch('api.kis_api.requests.Session.post')
     def test_get_access_token_retry_interval_fixed_61_seconds(self, mock_post, mock_sleep, tmp_path):
         """토큰 발급 재시도 간격이 61초 고정인지 테스트"""
         timeout_exc = requests.exceptions.Timeout("token timeout")
@@ -178,7 +178,7 @@ class TestTokenManagement:
         first_two = [c.args[0] for c in mock_sleep.call_args_list[:2]]
         assert first_two == [61.0, 61.0]
 
-    @patch("api.kis_api.requests.post")
+    @patch("api.kis_api.requests.Session.post")
     def test_get_access_token_reuses_persisted_cache_on_restart(self, mock_post, tmp_path):
         """재기동 시 영속 토큰 캐시를 재사용해 재발급을 피하는지 테스트"""
         with patch("api.kis_api.settings.DATA_DIR", tmp_path):
@@ -222,7 +222,7 @@ class TestRateLimiting:
 class TestRetryLogic:
     """재시도 로직 테스트"""
     
-    @patch('api.kis_api.requests.get')
+    @patch('api.kis_api.requests.Session.get')
     def test_retry_on_timeout(self, mock_get):
         """타임아웃 시 재시도 테스트"""
         # 처음 2번은 타임아웃, 3번째 성공
@@ -252,7 +252,7 @@ class TestRetryLogic:
         # 3번 호출됨 (초기 1회 + 재시도 2회)
         assert mock_get.call_count >= 2
     
-    @patch('api.kis_api.requests.get')
+    @patch('api.kis_api.requests.Session.get')
     def test_max_retries_exceeded(self, mock_get):
         """최대 재시도 횟수 초과 테스트"""
         mock_get.side_effect = requests.exceptions.Timeout("타임아웃")
@@ -279,7 +279,7 @@ class TestRetryLogic:
 class TestOrderAPIResponses:
     """주문 API 응답 처리 테스트"""
     
-    @patch('api.kis_api.requests.post')
+    @patch('api.kis_api.requests.Session.post')
     def test_buy_order_success_response(self, mock_post):
         """매수 주문 성공 응답 처리 테스트"""
         mock_response = Mock()
@@ -311,7 +311,7 @@ class TestOrderAPIResponses:
         assert result["order_no"] == "0001234567"
         assert result["branch_no"] == "00950"
     
-    @patch('api.kis_api.requests.post')
+    @patch('api.kis_api.requests.Session.post')
     def test_buy_order_failure_response(self, mock_post):
         """매수 주문 실패 응답 처리 테스트"""
         mock_response = Mock()
@@ -338,7 +338,7 @@ class TestOrderAPIResponses:
         assert result["success"] is False
         assert "잔고 부족" in result["message"]
     
-    @patch('api.kis_api.requests.post')
+    @patch('api.kis_api.requests.Session.post')
     def test_sell_order_success_response(self, mock_post):
         """매도 주문 성공 응답 처리 테스트"""
         mock_response = Mock()
@@ -370,7 +370,7 @@ class TestOrderAPIResponses:
         assert result["order_no"] == "0001234568"
         assert result["branch_no"] == "00950"
 
-    @patch('api.kis_api.requests.post')
+    @patch('api.kis_api.requests.Session.post')
     def test_buy_order_logs_request_when_debug_enabled(self, mock_post):
         """주문 요청 디버그 플래그가 켜지면 요청값 로그가 출력되어야 합니다."""
         mock_response = Mock()
@@ -407,7 +407,7 @@ class TestOrderAPIResponses:
         info_headers = [str(call.args[0]) for call in mock_info.call_args_list if call.args]
         assert any("[KIS][ORDER][REQ]" in header for header in info_headers)
 
-    @patch('api.kis_api.requests.post')
+    @patch('api.kis_api.requests.Session.post')
     def test_buy_order_logs_response_when_debug_enabled(self, mock_post):
         """주문 응답 디버그 플래그가 켜지면 응답값 로그가 출력되어야 합니다."""
         mock_response = Mock()
@@ -448,7 +448,7 @@ class TestOrderAPIResponses:
 class TestExecutionStatusResponses:
     """체결 조회/대기 응답 해석 테스트"""
 
-    @patch('api.kis_api.requests.get')
+    @patch('api.kis_api.requests.Session.get')
     def test_get_order_status_filters_target_order_no_with_zero_padding(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 200
@@ -493,7 +493,7 @@ class TestExecutionStatusResponses:
         assert result["orders"][0]["order_no"] == "15963"
         assert result["orders"][0]["exec_qty"] == 1
 
-    @patch('api.kis_api.requests.get')
+    @patch('api.kis_api.requests.Session.get')
     def test_get_order_status_accepts_custom_date_range(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 200
@@ -516,7 +516,7 @@ class TestExecutionStatusResponses:
         assert params.get("INQR_STRT_DT") == "20260222"
         assert params.get("INQR_END_DT") == "20260223"
 
-    @patch('api.kis_api.requests.get')
+    @patch('api.kis_api.requests.Session.get')
     def test_get_order_status_uses_recent_tr_id_within_3_months(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 200
@@ -540,7 +540,7 @@ class TestExecutionStatusResponses:
         headers = mock_get.call_args.kwargs.get("headers") or {}
         assert headers.get("tr_id") == "VTTC0081R"
 
-    @patch('api.kis_api.requests.get')
+    @patch('api.kis_api.requests.Session.get')
     def test_get_order_status_uses_historical_tr_id_over_3_months(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 200
@@ -564,7 +564,7 @@ class TestExecutionStatusResponses:
         headers = mock_get.call_args.kwargs.get("headers") or {}
         assert headers.get("tr_id") == "VTSC9215R"
 
-    @patch('api.kis_api.requests.get')
+    @patch('api.kis_api.requests.Session.get')
     def test_get_order_status_accepts_order_branch_no(self, mock_get):
         mock_response = Mock()
         mock_response.status_code = 200
@@ -585,7 +585,7 @@ class TestExecutionStatusResponses:
         assert params.get("ODNO") == "0000014023"
         assert params.get("ORD_GNO_BRNO") == "00950"
 
-    @patch('api.kis_api.requests.get')
+    @patch('api.kis_api.requests.Session.get')
     def test_get_order_status_parses_output2_alt_fields(self, mock_get):
         """output2/대체 키 포맷도 체결 행으로 파싱해야 합니다."""
         mock_response = Mock()
@@ -625,7 +625,7 @@ class TestExecutionStatusResponses:
         assert row["exec_qty"] == 1
         assert row["exec_price"] == 17960.0
 
-    @patch('api.kis_api.requests.get')
+    @patch('api.kis_api.requests.Session.get')
     def test_get_order_status_uses_requested_order_no_when_row_missing_odno(self, mock_get):
         """응답에 odno 키가 없더라도 요청 주문번호 기준으로 매칭되어야 합니다."""
         mock_response = Mock()
@@ -659,7 +659,7 @@ class TestExecutionStatusResponses:
         assert row["exec_qty"] == 51
         assert row["exec_price"] == 18180.0
 
-    @patch('api.kis_api.requests.get')
+    @patch('api.kis_api.requests.Session.get')
     def test_get_order_status_logs_request_when_debug_enabled(self, mock_get):
         """체결조회 요청 디버그 플래그가 켜지면 요청값 로그가 출력되어야 합니다."""
         mock_response = Mock()
@@ -689,7 +689,7 @@ class TestExecutionStatusResponses:
         info_headers = [str(call.args[0]) for call in mock_info.call_args_list if call.args]
         assert any("[KIS][ORDER_STATUS][REQ]" in header for header in info_headers)
 
-    @patch('api.kis_api.requests.get')
+    @patch('api.kis_api.requests.Session.get')
     def test_get_order_status_logs_response_when_debug_enabled(self, mock_get):
         """체결조회 응답 디버그 플래그가 켜지면 응답값 로그가 출력되어야 합니다."""
         mock_response = Mock()
@@ -1034,7 +1034,7 @@ class TestExecutionStatusResponses:
 class TestCurrentPriceAPI:
     """현재가 조회 API 테스트"""
     
-    @patch('api.kis_api.requests.get')
+    @patch('api.kis_api.requests.Session.get')
     def test_get_current_price_success(self, mock_get):
         """현재가 조회 성공 테스트"""
         mock_response = Mock()
@@ -1062,7 +1062,7 @@ class TestCurrentPriceAPI:
         assert result["change_rate"] == 1.50
         assert result["volume"] == 5000000
     
-    @patch('api.kis_api.requests.get')
+    @patch('api.kis_api.requests.Session.get')
     def test_get_current_price_failure(self, mock_get):
         """현재가 조회 실패 테스트"""
         mock_response = Mock()
@@ -1086,7 +1086,7 @@ class TestCurrentPriceAPI:
 class TestDailyOHLCVAPI:
     """일봉 데이터 조회 API 테스트"""
     
-    @patch('api.kis_api.requests.get')
+    @patch('api.kis_api.requests.Session.get')
     def test_get_daily_ohlcv_success(self, mock_get):
         """일봉 데이터 조회 성공 테스트"""
         mock_response = Mock()
@@ -1129,7 +1129,7 @@ class TestDailyOHLCVAPI:
         assert 'close' in df.columns
         assert 'volume' in df.columns
     
-    @patch('api.kis_api.requests.get')
+    @patch('api.kis_api.requests.Session.get')
     def test_get_daily_ohlcv_empty(self, mock_get):
         """일봉 데이터 없음 테스트"""
         mock_response = Mock()
@@ -1152,7 +1152,7 @@ class TestDailyOHLCVAPI:
 class TestAccountBalanceAPI:
     """계좌 잔고 조회 API 테스트"""
     
-    @patch('api.kis_api.requests.get')
+    @patch('api.kis_api.requests.Session.get')
     def test_get_account_balance_success(self, mock_get):
         """계좌 잔고 조회 성공 테스트"""
         mock_response = Mock()
@@ -1193,7 +1193,7 @@ class TestAccountBalanceAPI:
         assert result["holdings"][0]["quantity"] == 100
         assert result["total_eval"] == 16500000
 
-    @patch('api.kis_api.requests.get')
+    @patch('api.kis_api.requests.Session.get')
     def test_get_account_balance_prefers_sellable_qty_when_larger(self, mock_get):
         """hldg_qty보다 ord_psbl_qty가 클 때 보정 수량을 사용해야 합니다."""
         mock_response = Mock()
@@ -1238,7 +1238,7 @@ class TestAccountBalanceAPI:
         assert result["cash_balance"] == 9476354
         assert result["total_pnl"] == -7748
 
-    @patch('api.kis_api.requests.get')
+    @patch('api.kis_api.requests.Session.get')
     def test_get_account_balance_retries_invalid_check_acno_then_succeeds(self, mock_get):
         """INVALID_CHECK_ACNO 응답은 토큰 갱신 후 재시도하여 복구해야 합니다."""
         first = Mock()
@@ -1290,7 +1290,7 @@ class TestAccountBalanceAPI:
 class TestAuthHeaders:
     """인증 헤더 테스트"""
     
-    @patch('api.kis_api.requests.post')
+    @patch('api.kis_api.requests.Session.post')
     def test_auth_headers_generation(self, mock_post):
         """인증 헤더 생성 테스트"""
         mock_response = Mock()
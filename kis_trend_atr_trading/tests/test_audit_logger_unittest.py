@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import gzip
+import json
+from datetime import date, datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from kis_trend_atr_trading.utils import audit_logger as audit_module
+from kis_trend_atr_trading.utils.audit_logger import (
+    AuditLogIndex,
+    AuditEventType,
+    AuditLogger,
+    migrate_legacy_audit_logs,
+)
+from kis_trend_atr_trading.utils.market_hours import KST
+
+
+def _today_key() -> str:
+    return datetime.now(KST).strftime("%Y%m%d")
+
+
+def test_flush_appends_lines_without_rewriting_and_index_lookup(tmp_path: Path) -> None:
+    audit = AuditLogger(log_dir=tmp_path, session_id="s1", fsync_policy="none")
+    for idx in range(150):
+        audit.log_signal(stock_code="005930" if idx % 3 else "000660", signal_type="BUY", reason=f"r{idx}")
+    audit.log_order_submitted(stock_code="005930", order_type="BUY", price=70000, quantity=1, order_no="A1")
+    audit.log_api_error(endpoint="/quote", error_code="401", message="expired")
+    audit.close()
+
+    data_file = tmp_path / f"audit_{_today_key()}.jsonl"
+    lines = data_file.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 154  # start + 150 signals + order + api error + stop
+    assert all(json.loads(line)["session_id"] == "s1" for line in lines)
+
+    signals_000660 = audit.get_events(event_type=AuditEventType.SIGNAL_GENERATED, stock_code="000660")
+    assert len(signals_000660) == 50
+    assert [event.details["reason"] for event in signals_000660[:2]] == ["r0", "r3"]
+    assert [event.order_no for event in audit.get_events(stock_code="005930") if event.order_no] == ["A1"]
+    assert len(audit.get_events(event_type=AuditEventType.API_ERROR)) == 1
+    assert len(audit.get_events()) == 154
+
+
+def test_index_recovers_tail_missing_from_sidecar_and_torn_data_line(tmp_path: Path) -> None:
+    audit = AuditLogger(log_dir=tmp_path, session_id="s1", fsync_policy="none")
+    audit.log_signal(stock_code="005930", signal_type="BUY", reason="first")
+    audit.close()
+    data_file = tmp_path / f"audit_{_today_key()}.jsonl"
+    index_file = tmp_path / f"audit_{_today_key()}.idx"
+
+    # 데이터만 기록되고 인덱스 append 전에 중단된 상황 + 마지막 줄이 잘린 상황
+    extra = {**json.loads(data_file.read_text(encoding="utf-8").splitlines()[1]), "event_id": "lost-index"}
+    with open(data_file, "a", encoding="utf-8") as f:
+        f.write(json.dumps(extra) + "\n")
+        f.write('{"event_id": "torn')
+    indexed_before = len(index_file.read_text(encoding="utf-8").splitlines())
+
+    reopened = AuditLogger(log_dir=tmp_path, session_id="s2", fsync_policy="none")
+    reopened.log_signal(stock_code="005930", signal_type="SELL", reason="after-restart")
+    signals = reopened.get_events(event_type=AuditEventType.SIGNAL_GENERATED, stock_code="005930")
+    assert [event.event_id for event in signals] == ["s1_000002", "lost-index", "s2_000002"]
+    assert len(index_file.read_text(encoding="utf-8").splitlines()) == indexed_before + 2
+    reopened.close()
+
+
+def test_index_ignores_torn_sidecar_line_and_offsets_outside_data(tmp_path: Path) -> None:
+    audit = AuditLogger(log_dir=tmp_path, session_id="s1", fsync_policy="none")
+    audit.log_signal(stock_code="005930", signal_type="BUY", reason="first")
+    audit.close()
+    data_file = tmp_path / f"audit_{_today_key()}.jsonl"
+    index_file = tmp_path / f"audit_{_today_key()}.idx"
+
+    # 인덱스 append 도중 중단되어 오프셋 일부만 남은 상황
+    with open(index_file, "a", encoding="utf-8") as f:
+        f.write("12")
+
+    reopened = AuditLogger(log_dir=tmp_path, session_id="s2", fsync_policy="none")
+    reopened.log_signal(stock_code="005930", signal_type="SELL", reason="after-restart")
+    reopened.close()
+    assert "12\n" in index_file.read_text(encoding="utf-8")
+
+    third = AuditLogger(log_dir=tmp_path, session_id="s3", fsync_policy="none")
+    signals = third.get_events(event_type=AuditEventType.SIGNAL_GENERATED, stock_code="005930")
+    assert [event.event_id for event in signals] == ["s1_000002", "s2_000002"]
+    third.close()
+
+    # 데이터 범위 밖/줄 중간 오프셋은 버리고 데이터 스캔으로 대체
+    data_size = data_file.stat().st_size
+    index_file.write_text(f"0\tSYSTEM_START\t\n5\tSIGNAL_GENERATED\t005930\n{data_size + 10}\tX\t\n", encoding="utf-8")
+    index = AuditLogIndex.load(data_file, index_file)
+    assert 5 not in index.offsets and data_size + 10 not in index.offsets
+    assert len(index.offsets) == len(data_file.read_text(encoding="utf-8").splitlines())
+
+
+def test_always_policy_writes_each_event_and_fsyncs(tmp_path: Path) -> None:
+    with patch.object(audit_module.os, "fsync") as fsync:
+        audit = AuditLogger(log_dir=tmp_path, session_id="s1", fsync_policy="always")
+        audit.log_kill_switch(reason="manual")
+        data_file = tmp_path / f"audit_{_today_key()}.jsonl"
+        assert len(data_file.read_text(encoding="utf-8").splitlines()) == 2
+        assert fsync.call_count >= 4  # 데이터 + 인덱스, 이벤트 2건
+
+
+def test_daily_rollover_compresses_previous_day_and_scans_gzip(tmp_path: Path) -> None:
+    audit = AuditLogger(log_dir=tmp_path, session_id="s1", fsync_policy="none")
+    audit.log_signal(stock_code="005930", signal_type="BUY", reason="yesterday")
+    audit._flush_buffer()
+    # 지금까지 기록한 파일을 2000-01-01 자로 옮겨, 다음 기록 시점에 날짜가 바뀐 것처럼 만든다
+    audit._current_date = date(2000, 1, 1)
+    audit._current_file.replace(tmp_path / "audit_20000101.jsonl")
+    (tmp_path / f"audit_{_today_key()}.idx").replace(tmp_path / "audit_20000101.idx")
+    audit._current_file = tmp_path / "audit_20000101.jsonl"
+    audit.retention_days = 100000
+    audit.log_signal(stock_code="005930", signal_type="SELL", reason="today")
+    audit.close()
+
+    assert (tmp_path / "audit_20000101.jsonl.gz").exists()
+    assert not (tmp_path / "audit_20000101.jsonl").exists()
+    assert not (tmp_path / "audit_20000101.idx").exists()
+    old_events = audit.get_events(target_date=date(2000, 1, 1), stock_code="005930")
+    assert [event.details["reason"] for event in old_events] == ["yesterday"]
+    assert [event.details["reason"] for event in audit.get_events(stock_code="005930")] == ["today"]
+
+
+def test_legacy_json_migration(tmp_path: Path) -> None:
+    legacy_events = [
+        {
+            "event_id": f"old_{idx}",
+            "event_type": "ORDER_FILLED" if idx % 2 else "SIGNAL_GENERATED",
+            "timestamp": "2026-03-10 09:00:00.000",
+            "severity": "INFO",
+            "stock_code": "005930",
+            "order_no": "",
+            "session_id": "old",
+            "message": "",
+            "details": {"idx": idx},
+            "source": "",
+            "user": "",
+        }
+        for idx in range(4)
+    ]
+    document = {"session_id": "old", "date": "2026-03-10", "event_count": 4, "events": legacy_events}
+    (tmp_path / "audit_20260310.json").write_text(json.dumps(document, indent=2), encoding="utf-8")
+    with gzip.open(tmp_path / "audit_20260309.json.gz", "wt", encoding="utf-8") as f:
+        json.dump({**document, "events": legacy_events[:1]}, f)
+
+    assert migrate_legacy_audit_logs(tmp_path) == {"audit_20260310.json": 4, "audit_20260309.json.gz": 1}
+    assert (tmp_path / "audit_20260310.json.migrated").exists()
+    assert (tmp_path / "audit_20260309.jsonl.gz").exists()
+
+    audit = AuditLogger(log_dir=tmp_path, session_id="new", fsync_policy="none", compress_old_logs=False)
+    fills = audit.get_events(target_date=date(2026, 3, 10), event_type=AuditEventType.ORDER_FILLED)
+    assert [event.event_id for event in fills] == ["old_1", "old_3"]
+    assert [event.event_id for event in audit.get_events(target_date=date(2026, 3, 9))] == ["old_0"]
+    audit.close()
+
+
+def test_same_day_legacy_file_is_migrated_in_front_of_new_lines(tmp_path: Path) -> None:
+    today = _today_key()
+    legacy = {
+        "events": [
+            {
+                "event_id": "old_0",
+                "event_type": "SYSTEM_START",
+                "timestamp": "",
+                "severity": "INFO",
+                "stock_code": "",
+                "order_no": "",
+                "session_id": "old",
+                "message": "",
+                "details": {},
+                "source": "",
+                "user": "",
+            }
+        ]
+    }
+    (tmp_path / f"audit_{today}.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+    audit = AuditLogger(log_dir=tmp_path, session_id="new", fsync_policy="none")
+    starts = audit.get_events(event_type=AuditEventType.SYSTEM_START)
+    assert [event.event_id for event in starts] == ["old_0", "new_000001"]
+    audit.close()
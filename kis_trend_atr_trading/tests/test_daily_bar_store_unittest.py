@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from api.kis_api import KISApi
+from utils.bar_store import DailyBarStore
+from utils.market_hours import KST
+
+
+def _bars(dates):
+    return pd.DataFrame(
+        {
+            "date": pd.to_datetime(list(dates), format="%Y%m%d"),
+            "open": [100.0] * len(dates),
+            "high": [110.0] * len(dates),
+            "low": [90.0] * len(dates),
+            "close": [105.0 + idx for idx in range(len(dates))],
+            "volume": [1000] * len(dates),
+        }
+    )
+
+
+def _trading_days(start: str, end: str):
+    day = datetime.strptime(start, "%Y%m%d")
+    last = datetime.strptime(end, "%Y%m%d")
+    out = []
+    while day <= last:
+        if day.weekday() < 5:
+            out.append(day.strftime("%Y%m%d"))
+        day += timedelta(days=1)
+    return out
+
+
+def test_missing_ranges_fetches_only_head_and_stale_tail(tmp_path):
+    store = DailyBarStore(tmp_path / "bars.sqlite3", tail_ttl_sec=30)
+    after_close = datetime(2026, 4, 10, 16, 0, tzinfo=KST)
+
+    assert store.missing_ranges("005930", "D", "20260301", "20260410", now=after_close) == [
+        ("20260301", "20260410")
+    ]
+    store.save_fetched(
+        "005930", "D", "20260301", "20260410", _bars(_trading_days("20260301", "20260410")),
+        now=after_close,
+    )
+
+    # 장 마감 후 조회분은 확정 → 같은 날 재요청 시 REST 조회 없음
+    assert store.missing_ranges("005930", "D", "20260301", "20260410", now=after_close) == []
+    # 더 과거 구간만 추가 요청
+    assert store.missing_ranges("005930", "D", "20260201", "20260410", now=after_close) == [
+        ("20260201", "20260228")
+    ]
+    # 다음 거래일 장 시작 전에는 당일 구간 조회 생략
+    next_pre_open = datetime(2026, 4, 13, 8, 30, tzinfo=KST)
+    assert store.missing_ranges("005930", "D", "20260301", "20260413", now=next_pre_open) == [
+        ("20260411", "20260413")
+    ]
+
+
+def test_intraday_tail_is_not_finalized_and_respects_ttl(tmp_path):
+    store = DailyBarStore(tmp_path / "bars.sqlite3", tail_ttl_sec=30)
+    intraday = datetime(2026, 4, 10, 10, 0, tzinfo=KST)
+    store.save_fetched(
+        "005930", "D", "20260401", "20260410", _bars(_trading_days("20260401", "20260410")),
+        now=intraday,
+    )
+
+    coverage = store.get_coverage("005930", "D")
+    assert coverage.final_through == "20260409"
+    assert store.missing_ranges("005930", "D", "20260401", "20260410", now=intraday) == []
+    assert store.missing_ranges(
+        "005930", "D", "20260401", "20260410", now=intraday + timedelta(seconds=31)
+    ) == [("20260410", "20260410")]
+
+
+def test_get_daily_ohlcv_serves_from_store_and_fills_gaps(tmp_path, monkeypatch):
+    api = KISApi(app_key="k", app_secret="s", account_no="00000000", is_paper_trading=True)
+    api._daily_bar_store = DailyBarStore(tmp_path / "bars.sqlite3", tail_ttl_sec=3600)
+    calls = []
+
+    def _fake_remote(stock_code, start_date, end_date, period_type="D"):
+        calls.append((start_date, end_date))
+        return _bars(_trading_days(start_date, end_date))
+
+    monkeypatch.setattr(api, "_fetch_daily_ohlcv_remote", _fake_remote)
+
+    first = api.get_daily_ohlcv("005930", start_date="20260302", end_date="20260320")
+    second = api.get_daily_ohlcv("005930", start_date="20260302", end_date="20260320")
+    wider = api.get_daily_ohlcv("005930", start_date="20260223", end_date="20260320")
+
+    assert calls == [("20260302", "20260320"), ("20260223", "20260301")]
+    pd.testing.assert_frame_equal(first, second)
+    assert len(first) == 15
+    assert len(wider) == 20
+    assert wider["date"].is_monotonic_increasing
+    assert list(wider.columns) == ["date", "open", "high", "low", "close", "volume"]
+
+
+def test_get_daily_ohlcv_without_store_calls_remote_directly(monkeypatch):
+    api = KISApi(app_key="k", app_secret="s", account_no="00000000", is_paper_trading=True)
+    api._daily_bar_store = None
+    calls = []
+
+    def _fake_remote(stock_code, start_date, end_date, period_type="D"):
+        calls.append(period_type)
+        return _bars(["20260302"])
+
+    monkeypatch.setattr(api, "_fetch_daily_ohlcv_remote", _fake_remote)
+    api.get_daily_ohlcv("005930", start_date="20260302", end_date="20260302")
+    api.get_daily_ohlcv("005930", start_date="20260302", end_date="20260302")
+
+    assert calls == ["D", "D"]
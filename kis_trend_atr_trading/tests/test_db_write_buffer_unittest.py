@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Dict, List, Sequence
+
+from db.mysql import QueryError
+from db.repository import AccountSnapshotRepository, TradeRepository
+from db.write_buffer import BufferedDbWriter
+from utils.market_hours import KST
+
+
+_SCHEMA = """
+CREATE TABLE trades (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    symbol TEXT, side TEXT, price REAL, quantity INTEGER, executed_at TEXT,
+    reason TEXT, pnl REAL, pnl_percent REAL, entry_price REAL, holding_days INTEGER,
+    order_no TEXT, mode TEXT, idempotency_key TEXT UNIQUE
+);
+CREATE TABLE account_snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    snapshot_time TEXT, total_equity REAL, cash REAL, unrealized_pnl REAL,
+    realized_pnl REAL, mode TEXT, position_count INTEGER,
+    UNIQUE (snapshot_time, mode)
+);
+"""
+
+
+def _to_sqlite(sql: str) -> str:
+    """MySQL 문법을 SQLite 로 옮긴다 (%s → ?, ON DUPLICATE KEY UPDATE → OR IGNORE/OR REPLACE)."""
+    sql = sql.replace("%s", "?")
+    if "ON DUPLICATE KEY UPDATE" in sql:
+        insert, update = sql.split("ON DUPLICATE KEY UPDATE")
+        # idempotency_key 자기 갱신은 MySQL 에서 rowcount 0 인 no-op
+        verb = "INSERT OR IGNORE INTO" if update.strip().startswith("idempotency_key") else "INSERT OR REPLACE INTO"
+        sql = insert.replace("INSERT INTO", verb, 1)
+    return sql
+
+
+def _to_sqlite_params(params: Sequence[Any]) -> tuple:
+    return tuple(value.isoformat() if isinstance(value, datetime) else value for value in params)
+
+
+class _SqliteCursor:
+    def __init__(self, cursor: sqlite3.Cursor, db: "_SqliteDb") -> None:
+        self._cursor = cursor
+        self._db = db
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> None:
+        self._db.statements.append(("execute", sql))
+        self._cursor.execute(_to_sqlite(sql), _to_sqlite_params(params))
+
+    def executemany(self, sql: str, rows: List[Sequence[Any]]) -> None:
+        self._db.statements.append(("executemany", sql))
+        if "broken_table" in sql:
+            raise sqlite3.OperationalError("no such table: broken_table")
+        self._cursor.executemany(_to_sqlite(sql), [_to_sqlite_params(row) for row in rows])
+
+
+class _SqliteDb:
+    """MySQLManager 인터페이스 일부를 흉내 내는 in-process SQLite (DB 왕복 횟수 기록)."""
+
+    def __init__(self) -> None:
+        self.config = SimpleNamespace(enabled=True, database="test")
+        self.conn = sqlite3.connect(":memory:", check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(_SCHEMA)
+        self.lock = threading.Lock()
+        self.round_trips = 0
+        self.fail_transactions = 0
+        self.statements: List[tuple] = []
+
+    @contextmanager
+    def transaction(self):
+        with self.lock:
+            self.round_trips += 1
+            if self.fail_transactions > 0:
+                self.fail_transactions -= 1
+                raise QueryError("connection lost")
+            cursor = self.conn.cursor()
+            try:
+                yield _SqliteCursor(cursor, self)
+                self.conn.commit()
+            except Exception as exc:
+                self.conn.rollback()
+                raise QueryError(str(exc))
+
+    def execute_query(self, query: str, params: Sequence[Any] = (), fetch_one: bool = False):
+        with self.lock:
+            self.round_trips += 1
+            rows = [dict(row) for row in self.conn.execute(_to_sqlite(query), _to_sqlite_params(params))]
+        if fetch_one:
+            return rows[0] if rows else None
+        return rows
+
+    def execute_command(self, command: str, params: Sequence[Any] = ()) -> int:
+        with self.transaction() as cursor:
+            cursor.execute(command, params)
+            return cursor.rowcount
+
+    def rows(self, table: str) -> List[Dict[str, Any]]:
+        with self.lock:
+            return [dict(row) for row in self.conn.execute(f"SELECT * FROM {table} ORDER BY id")]
+
+
+def _save_fill(repo: TradeRepository, exec_id: str, executed_at: datetime):
+    return repo.save_execution_fill(
+        symbol="005930",
+        side="BUY",
+        price=70000,
+        quantity=1,
+        executed_at=executed_at,
+        order_no="A0001",
+        exec_id=exec_id,
+    )
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_fills_stay_synchronous_with_writer_attached() -> None:
+    executed_at = datetime.now(KST)
+    db = _SqliteDb()
+    writer = BufferedDbWriter(db, batch_rows=1000, flush_interval_sec=60.0, max_pending_rows=1)
+    repo = TradeRepository(db=db, writer=writer)
+
+    exec_ids = ["E001", "E002", "E001"]
+    results = [_save_fill(repo, exec_id, executed_at) for exec_id in exec_ids]
+
+    # 체결 행은 created 반환 시점에 이미 DB 에 있고, 버퍼 overflow 로 폐기되지 않는다
+    assert [created for _record, created in results] == [True, True, False]
+    assert [row["idempotency_key"] for row in db.rows("trades")] == [
+        results[0][0].idempotency_key,
+        results[1][0].idempotency_key,
+    ]
+    assert writer.metrics()["submitted"] == 0
+    writer.close()
+
+
+def test_idempotency_key_blocks_refill_after_restart() -> None:
+    executed_at = datetime.now(KST)
+    db = _SqliteDb()
+    first = TradeRepository(db=db, writer=BufferedDbWriter(db, flush_interval_sec=60.0))
+    assert _save_fill(first, "E001", executed_at)[1] is True
+    first.writer.close()
+
+    # 재시작 후 새 저장소: DB UNIQUE 키로 같은 체결을 다시 적용하지 않는다
+    restarted = TradeRepository(db=db, writer=BufferedDbWriter(db, flush_interval_sec=60.0))
+    assert _save_fill(restarted, "E001", executed_at)[1] is False
+    assert _save_fill(restarted, "E002", executed_at)[1] is True
+    restarted.writer.close()
+    assert [row["idempotency_key"] is not None for row in db.rows("trades")] == [True, True]
+
+
+def test_size_and_time_thresholds_trigger_background_flush() -> None:
+    db = _SqliteDb()
+    writer = BufferedDbWriter(db, batch_rows=5, flush_interval_sec=60.0)
+    snapshots = AccountSnapshotRepository(db=db, writer=writer)
+    for idx in range(5):
+        snapshots.save(total_equity=1_000_000 + idx, cash=500_000, snapshot_time=datetime(2026, 3, 11, 9, idx))
+    assert _wait_until(lambda: len(db.rows("account_snapshots")) == 5)
+    writer.close()
+
+    db = _SqliteDb()
+    writer = BufferedDbWriter(db, batch_rows=1000, flush_interval_sec=0.05)
+    AccountSnapshotRepository(db=db, writer=writer).save(total_equity=1.0, cash=1.0)
+    assert _wait_until(lambda: len(db.rows("account_snapshots")) == 1)
+    writer.close()
+
+
+def test_snapshot_reads_act_as_barrier() -> None:
+    db = _SqliteDb()
+    writer = BufferedDbWriter(db, batch_rows=1000, flush_interval_sec=60.0)
+    snapshots = AccountSnapshotRepository(db=db, writer=writer)
+    snapshots.save(total_equity=1_000_000, cash=400_000, snapshot_time=datetime(2026, 3, 11, 15, 30))
+    snapshots.save(total_equity=1_010_000, cash=400_000, snapshot_time=datetime(2026, 3, 11, 15, 30))
+    assert db.rows("account_snapshots") == []
+
+    latest = snapshots.get_latest()
+    assert latest is not None and latest.total_equity == 1_010_000  # 같은 키는 마지막 값으로 upsert
+    assert len(db.rows("account_snapshots")) == 1
+    writer.close()
+
+
+def test_failed_transactions_are_retried_in_order() -> None:
+    db = _SqliteDb()
+    db.fail_transactions = 2
+    writer = BufferedDbWriter(db, batch_rows=1000, flush_interval_sec=0.01, max_attempts=5)
+    snapshots = AccountSnapshotRepository(db=db, writer=writer)
+    for idx in range(3):
+        snapshots.save(total_equity=float(idx), cash=0.0, snapshot_time=datetime(2026, 3, 11, 9, idx))
+
+    assert writer.flush(timeout=5.0)
+    assert [row["total_equity"] for row in db.rows("account_snapshots")] == [0.0, 1.0, 2.0]
+    metrics = writer.metrics()
+    assert metrics["failed_transactions"] == 2
+    assert metrics["written"] == 3 and metrics["dropped_failed"] == 0
+    writer.close()
+
+
+def test_poison_statement_is_isolated_and_dropped_after_max_attempts() -> None:
+    db = _SqliteDb()
+    writer = BufferedDbWriter(db, batch_rows=1000, flush_interval_sec=0.01, max_attempts=2)
+    writer.submit("INSERT INTO broken_table (x) VALUES (%s)", (1,))
+    AccountSnapshotRepository(db=db, writer=writer).save(total_equity=1.0, cash=1.0)
+
+    assert writer.flush(timeout=5.0)
+    assert len(db.rows("account_snapshots")) == 1
+    metrics = writer.metrics()
+    assert metrics["written"] == 1
+    assert metrics["dropped_failed"] == 1
+    assert "broken_table" in metrics["last_error"]
+    writer.close()
+
+
+def test_bad_row_is_isolated_from_valid_rows_of_same_statement() -> None:
+    db = _SqliteDb()
+    writer = BufferedDbWriter(db, batch_rows=1000, flush_interval_sec=0.01, max_attempts=3)
+    sql = (
+        "INSERT INTO account_snapshots (snapshot_time, total_equity, cash, mode) "
+        "VALUES (%s, %s, %s, %s)"
+    )
+    for idx in range(5):
+        writer.submit(sql, (datetime(2026, 3, 11, 9, idx), float(idx), 0.0, "PAPER"))
+    writer.submit(sql, (datetime(2026, 3, 11, 9, 0), 99.0, 0.0, "PAPER"))  # UNIQUE 위반
+
+    assert writer.flush(timeout=5.0)
+    assert [row["total_equity"] for row in db.rows("account_snapshots")] == [0.0, 1.0, 2.0, 3.0, 4.0]
+    metrics = writer.metrics()
+    assert metrics["written"] == 5
+    assert metrics["dropped_failed"] == 1
+    writer.close()
+
+
+def test_overflow_drops_oldest_rows() -> None:
+    db = _SqliteDb()
+    db.lock.acquire()  # writer 가 첫 배치를 든 채 DB 에서 대기하도록 잡아 둔다
+    writer = BufferedDbWriter(db, batch_rows=1000, flush_interval_sec=0.01, max_pending_rows=3)
+    snapshots = AccountSnapshotRepository(db=db, writer=writer)
+    snapshots.save(total_equity=-1.0, cash=0.0, snapshot_time=datetime(2026, 3, 11, 8, 0))
+    assert _wait_until(lambda: writer.metrics()["in_flight"] == 1)
+    for idx in range(5):
+        snapshots.save(total_equity=float(idx), cash=0.0, snapshot_time=datetime(2026, 3, 11, 9, idx))
+    db.lock.release()
+
+    assert writer.flush(timeout=5.0)
+    assert [row["total_equity"] for row in db.rows("account_snapshots")] == [-1.0, 2.0, 3.0, 4.0]
+    assert writer.metrics()["dropped_overflow"] == 2
+    writer.close()
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import random
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, List, Sequence
+
+from db.mysql import QueryError
+from db.repository import AccountDrawdownRepository, AccountSnapshotRepository
+from db.write_buffer import BufferedDbWriter
+from performance.drawdown import DrawdownState, compute_drawdown, max_drawdown
+
+
+_SCHEMA = """
+CREATE TABLE account_snapshots (
+    snapshot_time TEXT, total_equity REAL, cash REAL, unrealized_pnl REAL,
+    realized_pnl REAL, mode TEXT, position_count INTEGER,
+    PRIMARY KEY (snapshot_time, mode)
+);
+"""
+
+
+def _to_sqlite(sql: str) -> str:
+    """MySQL 문법을 SQLite 로 옮긴다 (%s → ?, ON DUPLICATE KEY UPDATE → ON CONFLICT DO UPDATE, 테이블 옵션 제거)."""
+    sql = sql.replace("%s", "?")
+    sql = re.sub(r"ON UPDATE CURRENT_TIMESTAMP", "", sql)
+    sql = re.sub(r"\)\s*ENGINE=.*$", ")", sql, flags=re.S)
+    sql = sql.replace("ON DUPLICATE KEY UPDATE", "ON CONFLICT DO UPDATE SET")
+    return re.sub(r"VALUES\((\w+)\)", r"excluded.\1", sql)
+
+
+def _to_sqlite_params(params: Sequence[Any]) -> tuple:
+    return tuple(value.isoformat() if isinstance(value, datetime) else value for value in params)
+
+
+class _SqliteDb:
+    """MySQLManager 인터페이스 일부를 흉내 내는 in-process SQLite (조회 문장 기록)."""
+
+    def __init__(self) -> None:
+        self.config = SimpleNamespace(enabled=True, database="test")
+        self.conn = sqlite3.connect(":memory:", check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(_SCHEMA)
+        self.lock = threading.Lock()
+        self.queries: List[str] = []
+
+    @contextmanager
+    def transaction(self):
+        with self.lock:
+            cursor = self.conn.cursor()
+
+            class _Cursor:
+                @property
+                def rowcount(self) -> int:
+                    return cursor.rowcount
+
+                def execute(self, sql: str, params: Sequence[Any] = ()) -> None:
+                    cursor.execute(_to_sqlite(sql), _to_sqlite_params(params))
+
+                def executemany(self, sql: str, rows: List[Sequence[Any]]) -> None:
+                    cursor.executemany(_to_sqlite(sql), [_to_sqlite_params(row) for row in rows])
+
+            try:
+                yield _Cursor()
+                self.conn.commit()
+            except Exception as exc:
+                self.conn.rollback()
+                raise QueryError(str(exc))
+
+    def execute_query(self, query: str, params: Sequence[Any] = (), fetch_one: bool = False):
+        with self.lock:
+            self.queries.append(" ".join(query.split()))
+            rows = [dict(row) for row in self.conn.execute(_to_sqlite(query), _to_sqlite_params(params))]
+        if fetch_one:
+            return rows[0] if rows else None
+        return rows
+
+    def execute_command(self, command: str, params: Sequence[Any] = ()) -> int:
+        with self.transaction() as cursor:
+            cursor.execute(command, params)
+            return cursor.rowcount
+
+    def snapshot_scans(self) -> int:
+        return sum(1 for query in self.queries if query.startswith("SELECT snapshot_time, total_equity"))
+
+
+def _reference_mdd(equity: Sequence[float]) -> tuple:
+    """기존 루프 구현 (peak=0 에서 시작, 금액 기준 최대 낙폭)"""
+    peak = mdd = mdd_pct = 0.0
+    for value in equity:
+        peak = max(peak, value)
+        if peak > 0 and peak - value > mdd:
+            mdd = peak - value
+            mdd_pct = mdd / peak * 100
+    return mdd, mdd_pct
+
+
+def test_incremental_and_vectorized_paths_match_reference() -> None:
+    rng = random.Random(7)
+    for size in (0, 1, 2, 17, 500):
+        equity = [10_000_000.0]
+        for _ in range(max(size - 1, 0)):
+            equity.append(max(equity[-1] * (1 + rng.gauss(0, 0.02)), 1.0))
+        equity = equity[:size]
+        times = [datetime(2026, 1, 1) + timedelta(minutes=idx) for idx in range(size)]
+
+        running = DrawdownState()
+        for ts, value in zip(times, equity):
+            running.update(value, ts)
+        vectorized = compute_drawdown(equity, times)
+
+        assert running.to_dict() == vectorized.to_dict()
+        assert max_drawdown(equity) == _reference_mdd(equity)
+        restored = DrawdownState.from_dict(running.to_dict())
+        assert restored == running
+
+
+def test_mdd_reports_episode_peak_and_trough() -> None:
+    times = [datetime(2026, 1, 1, 9, idx) for idx in range(6)]
+    state = compute_drawdown([100, 120, 90, 130, 125, 110], times)
+    assert state.mdd == 30 and state.mdd_percent == 25.0
+    assert state.mdd_peak_time == times[1] and state.trough_time == times[2]
+    assert state.peak_equity == 130 and state.peak_time == times[3]
+    assert state.current_drawdown == 20
+
+
+def test_repository_full_period_mdd_skips_snapshot_scan() -> None:
+    db = _SqliteDb()
+    writer = BufferedDbWriter(db, batch_rows=1000, flush_interval_sec=60.0)
+    drawdown = AccountDrawdownRepository(db=db, writer=writer, mode="PAPER")
+    snapshots = AccountSnapshotRepository(db=db, writer=writer, drawdown=drawdown)
+    snapshots.mode = "PAPER"
+    equity = [100.0, 120.0, 90.0, 130.0, 125.0, 110.0]
+    for idx, value in enumerate(equity):
+        snapshots.save(total_equity=value, cash=0.0, snapshot_time=datetime(2026, 3, 11, 9, idx))
+
+    scans_after_writes = db.snapshot_scans()  # 최초 상태 행이 없을 때의 재구성 1회
+    for _ in range(3):
+        assert snapshots.calculate_mdd()["mdd"] == 30.0
+    assert db.snapshot_scans() == scans_after_writes
+
+    # 새 프로세스: 저장된 상태 행만 읽는다
+    writer.flush(timeout=5.0)
+    restarted = AccountDrawdownRepository(db=db, mode="PAPER")
+    assert restarted.get_state().to_dict() == drawdown.get_state().to_dict()
+    assert db.snapshot_scans() == scans_after_writes
+
+    # 구간 조회와 전체 조회는 같은 정의를 쓴다
+    windowed = AccountSnapshotRepository(db=db, writer=writer)
+    windowed.mode = "PAPER"
+    assert windowed.calculate_mdd()["mdd"] == 30.0
+    writer.close()
+
+
+def test_out_of_order_snapshot_triggers_rebuild() -> None:
+    db = _SqliteDb()
+    drawdown = AccountDrawdownRepository(db=db, mode="PAPER")
+    snapshots = AccountSnapshotRepository(db=db, drawdown=drawdown)
+    snapshots.mode = "PAPER"
+    snapshots.save(total_equity=100.0, cash=0.0, snapshot_time=datetime(2026, 3, 11, 9, 0))
+    snapshots.save(total_equity=110.0, cash=0.0, snapshot_time=datetime(2026, 3, 11, 9, 2))
+    # 같은 시각 덮어쓰기 + 과거 시각 삽입 → 러닝 상태로는 반영 불가
+    snapshots.save(total_equity=80.0, cash=0.0, snapshot_time=datetime(2026, 3, 11, 9, 2))
+    snapshots.save(total_equity=50.0, cash=0.0, snapshot_time=datetime(2026, 3, 11, 9, 1))
+
+    expected = compute_drawdown([100.0, 50.0, 80.0])
+    state = drawdown.get_state()
+    assert (state.mdd, state.mdd_percent, state.count) == (expected.mdd, expected.mdd_percent, 3)
+
+
+def test_snapshot_dropped_by_writer_invalidates_running_state() -> None:
+    db = _SqliteDb()
+    writer = BufferedDbWriter(db, batch_rows=1000, flush_interval_sec=0.01, max_attempts=3)
+    drawdown = AccountDrawdownRepository(db=db, writer=writer, mode="PAPER")
+    snapshots = AccountSnapshotRepository(db=db, writer=writer, drawdown=drawdown)
+    snapshots.mode = "PAPER"
+    snapshots.save(total_equity=100.0, cash=0.0, snapshot_time=datetime(2026, 3, 11, 9, 0))
+    assert writer.flush(timeout=5.0)
+
+    with db.lock:
+        db.conn.execute("CREATE TRIGGER reject_low BEFORE INSERT ON account_snapshots "
+                        "WHEN NEW.total_equity < 60 BEGIN SELECT RAISE(ABORT, 'rejected'); END")
+    snapshots.save(total_equity=50.0, cash=0.0, snapshot_time=datetime(2026, 3, 11, 9, 1))
+    snapshots.save(total_equity=120.0, cash=0.0, snapshot_time=datetime(2026, 3, 11, 9, 2))
+    assert writer.flush(timeout=5.0)
+    assert writer.metrics()["dropped_failed"] == 1
+
+    # 재시작: 저장된 상태 행은 폐기 전 50 을 반영했지만 needs_rebuild 표시로 재구성된다
+    restarted = AccountDrawdownRepository(db=db, mode="PAPER").get_state()
+    assert (restarted.mdd, restarted.count) == (0.0, 2)
+
+    # 폐기된 50 스냅샷은 DB 에 없으므로 MDD 는 재구성 결과(0)와 같아야 한다
+    state = drawdown.get_state()
+    assert (state.mdd, state.count) == (0.0, 2)
+    writer.close()
+
+
+def test_stale_state_is_rebuilt_before_next_record_is_persisted() -> None:
+    db = _SqliteDb()
+    writer = BufferedDbWriter(db, batch_rows=1000, flush_interval_sec=60.0)
+    drawdown = AccountDrawdownRepository(db=db, writer=writer, mode="PAPER")
+    snapshots = AccountSnapshotRepository(db=db, writer=writer, drawdown=drawdown)
+    snapshots.mode = "PAPER"
+    snapshots.save(total_equity=100.0, cash=0.0, snapshot_time=datetime(2026, 3, 11, 9, 0))
+    snapshots.save(total_equity=120.0, cash=0.0, snapshot_time=datetime(2026, 3, 11, 9, 2))
+    # 같은 시각 덮어쓰기 → stale, 이후 record() 는 재구성한 상태에만 점을 이어 붙인다
+    snapshots.save(total_equity=60.0, cash=0.0, snapshot_time=datetime(2026, 3, 11, 9, 2))
+    snapshots.save(total_equity=90.0, cash=0.0, snapshot_time=datetime(2026, 3, 11, 9, 3))
+    assert writer.flush(timeout=5.0)
+
+    expected = compute_drawdown([100.0, 60.0, 90.0])
+    restarted = AccountDrawdownRepository(db=db, mode="PAPER")
+    for state in (drawdown.get_state(), restarted.get_state()):
+        assert (state.mdd, state.mdd_percent, state.count) == (expected.mdd, expected.mdd_percent, 3)
+    row = db.execute_query("SELECT needs_rebuild FROM account_drawdown_state WHERE mode = ?", ("PAPER",), fetch_one=True)
+    assert row["needs_rebuild"] == 0
+    writer.close()
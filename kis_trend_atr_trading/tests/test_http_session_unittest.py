@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import sys
+import threading
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.http_session import PooledHttpSession
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        body = b'{"rt_cd": "0"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        return
+
+
+def _serve():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_pooled_session_reuses_keep_alive_connection():
+    server, base_url = _serve()
+    pooled = PooledHttpSession(base_url, keepalive_idle_sec=60)
+    try:
+        reused_flags = []
+        for _ in range(5):
+            response, reused = pooled.request("GET", f"{base_url}/quote", timeout=5)
+            assert response.status_code == 200
+            reused_flags.append(reused)
+    finally:
+        pooled.close()
+        server.shutdown()
+        server.server_close()
+
+    assert reused_flags == [False, True, True, True, True]
+    metrics = pooled.metrics()
+    assert metrics["requests"] == 5
+    assert metrics["new_connections"] == 1
+    assert metrics["reused_connections"] == 4
+    assert metrics["latency_p99_ms"] >= metrics["latency_p50_ms"] > 0
+
+
+def test_pooled_session_recycles_after_idle_timeout():
+    server, base_url = _serve()
+    pooled = PooledHttpSession(base_url, keepalive_idle_sec=60)
+    try:
+        pooled.request("GET", f"{base_url}/a", timeout=5)
+        pooled._last_used_at -= 120  # 유휴 시간 초과 상황 재현
+        _, reused = pooled.request("GET", f"{base_url}/b", timeout=5)
+    finally:
+        pooled.close()
+        server.shutdown()
+        server.server_close()
+
+    assert reused is False
+    assert pooled.metrics()["session_recycles"] == 1
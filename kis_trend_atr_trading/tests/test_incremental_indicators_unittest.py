@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from strategy.multiday_trend_atr import MultidayTrendATRStrategy
+
+
+def _make_daily_frame(rows: int, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 10000 + np.cumsum(rng.normal(0, 120, rows))
+    high = close + rng.uniform(10, 200, rows)
+    low = close - rng.uniform(10, 200, rows)
+    open_price = close + rng.uniform(-80, 80, rows)
+    dates = [datetime(2026, 1, 1) + timedelta(days=idx) for idx in range(rows)]
+    return pd.DataFrame(
+        {
+            "date": dates,
+            "open": open_price,
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": rng.integers(1000, 100000, rows).astype(float),
+        }
+    )
+
+
+def _assert_indicator_parity(actual: pd.DataFrame, expected: pd.DataFrame) -> None:
+    for column in ("atr", "ma", "ma20", "adx", "prev_high", "prev_close"):
+        np.testing.assert_allclose(
+            actual[column].to_numpy(dtype=float),
+            expected[column].to_numpy(dtype=float),
+            rtol=1e-9,
+            equal_nan=True,
+            err_msg=column,
+        )
+    assert list(actual["trend"]) == list(expected["trend"])
+    assert list(actual.columns) == list(expected.columns)
+
+
+def test_incremental_indicators_match_full_recompute_for_each_tick():
+    strategy = MultidayTrendATRStrategy()
+    engine = strategy.create_indicator_engine()
+    frame = _make_daily_frame(100)
+
+    for tick_price in (9800.0, 10050.5, 10400.0, 9500.0):
+        live = frame.copy()
+        live.loc[live.index[-1], "close"] = tick_price
+        live.loc[live.index[-1], "high"] = max(float(live["high"].iloc[-1]), tick_price)
+        live.loc[live.index[-1], "low"] = min(float(live["low"].iloc[-1]), tick_price)
+
+        _assert_indicator_parity(
+            strategy.add_indicators_incremental(live, engine),
+            strategy.add_indicators(live),
+        )
+
+    assert engine.finalized_rows == 99
+
+
+def test_incremental_engine_reseeds_when_finalized_bars_change():
+    strategy = MultidayTrendATRStrategy()
+    engine = strategy.create_indicator_engine()
+    frame = _make_daily_frame(80, seed=11)
+
+    strategy.add_indicators_incremental(frame.iloc[:60], engine)
+    assert engine.finalized_rows == 59
+
+    _assert_indicator_parity(
+        strategy.add_indicators_incremental(frame, engine),
+        strategy.add_indicators(frame),
+    )
+    assert engine.finalized_rows == 79
+
+
+def test_incremental_indicators_handle_short_history_and_flat_bars():
+    strategy = MultidayTrendATRStrategy()
+    engine = strategy.create_indicator_engine()
+    flat = pd.DataFrame(
+        {
+            "date": [datetime(2026, 2, 1) + timedelta(days=idx) for idx in range(6)],
+            "open": [100.0] * 6,
+            "high": [100.0] * 6,
+            "low": [100.0] * 6,
+            "close": [100.0] * 6,
+            "volume": [0.0] * 6,
+        }
+    )
+
+    _assert_indicator_parity(
+        strategy.add_indicators_incremental(flat, engine),
+        strategy.add_indicators(flat),
+    )
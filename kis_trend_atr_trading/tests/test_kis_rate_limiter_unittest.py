@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import threading
+import time
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from api.kis_api import KISApi
+from api.rate_limiter import (
+    RATE_LANE_BULK,
+    RATE_LANE_ORDER,
+    TokenBucketRateLimiter,
+)
+
+
+def test_token_bucket_paces_calls_across_threads():
+    limiter = TokenBucketRateLimiter(rate_per_sec=50, burst=1)
+    started = time.monotonic()
+    threads = [threading.Thread(target=limiter.acquire) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    # 버킷 1개 + 5회 보충(20ms 간격)
+    assert time.monotonic() - started >= 0.09
+    assert limiter.metrics()["lanes"]["default"]["count"] == 6
+
+
+def test_order_lane_is_served_before_queued_bulk_requests():
+    limiter = TokenBucketRateLimiter(rate_per_sec=10, burst=1)
+    limiter.acquire(RATE_LANE_BULK)  # 버킷 소진
+    served = []
+    served_lock = threading.Lock()
+
+    def _worker(lane: str, name: str) -> None:
+        limiter.acquire(lane)
+        with served_lock:
+            served.append(name)
+
+    bulk_threads = [
+        threading.Thread(target=_worker, args=(RATE_LANE_BULK, f"bulk{idx}")) for idx in range(3)
+    ]
+    for thread in bulk_threads:
+        thread.start()
+    time.sleep(0.02)
+    order_thread = threading.Thread(target=_worker, args=(RATE_LANE_ORDER, "order"))
+    order_thread.start()
+
+    for thread in bulk_threads + [order_thread]:
+        thread.join(timeout=5)
+
+    assert served[0] == "order"
+    metrics = limiter.metrics()
+    assert metrics["lanes"][RATE_LANE_ORDER]["count"] == 1
+    assert metrics["lanes"][RATE_LANE_BULK]["count"] == 4
+    assert sum(metrics["lanes"][RATE_LANE_BULK]["buckets"].values()) == 4
+
+
+def test_kis_api_instances_share_limiter_and_expose_metrics():
+    api1 = KISApi(app_key="k", app_secret="s", account_no="00000000", is_paper_trading=True)
+    api2 = KISApi(app_key="k", app_secret="s", account_no="00000000", is_paper_trading=True)
+
+    assert api1._rate_limiter is api2._rate_limiter
+    before = api1.metrics()["rate_limiter"]["lanes"][RATE_LANE_ORDER]["count"]
+    api2._wait_for_rate_limit(RATE_LANE_ORDER)
+    after = api1.metrics()["rate_limiter"]["lanes"][RATE_LANE_ORDER]["count"]
+    assert after == before + 1
@@ -61,7 +61,7 @@ def _ensure_fake_dependencies() -> None:
 _ensure_fake_dependencies()
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
-from api.kis_api import KISApi  # type: ignore  # noqa: E402
+from api.kis_api import KISApi, KISApiError  # type: ignore  # noqa: E402
 
 
 class _Response:
@@ -102,6 +102,108 @@ class TestKISVolumeRank(unittest.TestCase):
         codes = api.get_market_universe_codes(limit=10)
         self.assertEqual(codes, [])
 
+    def test_get_market_snapshot_bulk_uses_multi_price_chunks(self):
+        api = KISApi(app_key="k", app_secret="s", account_no="00000000", is_paper_trading=False)
+        api.access_token = "token"
+        api.token_expires_at = dt.datetime.now() + dt.timedelta(hours=23)
+        codes = [f"{idx:06d}" for idx in range(1, 36)]
+        calls = []
+
+        def _fake_request(method, url, headers, params=None, **kwargs):
+            requested = [params[f"FID_INPUT_ISCD_{idx}"] for idx in range(1, len(params) // 2 + 1)]
+            calls.append((url, requested, kwargs.get("lane")))
+            output = [
+                {
+                    "inter_shrn_iscd": code,
+                    "inter_kor_isnm": f"name{code}",
+                    "inter2_prpr": "1,100",
+                    "inter2_oprc": "1000",
+                    "acml_vol": "10",
+                }
+                for code in requested
+            ]
+            return _Response({"rt_cd": "0", "output": output})
+
+        api._request_with_retry = _fake_request  # type: ignore
+
+        rows = api.get_market_snapshot_bulk(codes + ["000001", "bad"])
+        self.assertEqual([row["code"] for row in rows], codes)
+        self.assertEqual([len(requested) for _, requested, _ in calls], [30, 5])
+        self.assertTrue(all(url.endswith("intstock-multprice") for url, _, _ in calls))
+        self.assertTrue(all(lane == "bulk" for _, _, lane in calls))
+        self.assertAlmostEqual(rows[0]["trade_value"], 11000.0)
+        self.assertAlmostEqual(rows[0]["pct_from_open"], 10.0)
+        self.assertEqual(rows[0]["stock_name"], "name000001")
+
+    def test_get_market_snapshot_bulk_falls_back_to_parallel_single_quotes(self):
+        api = KISApi(app_key="k", app_secret="s", account_no="00000000", is_paper_trading=True)
+        api.access_token = "token"
+        api.token_expires_at = dt.datetime.now() + dt.timedelta(hours=23)
+        lanes = []
+
+        def _fake_price(code, lane="default"):
+            lanes.append(lane)
+            if code == "000660":
+                raise RuntimeError("quote failed")
+            return {"stock_name": "x", "current_price": 200.0, "open_price": 100.0, "volume": 5}
+
+        api._fetch_current_price = _fake_price  # type: ignore
+
+        rows = api.get_market_snapshot_bulk(["005930", "000660", "035720"], max_workers=3)
+        self.assertEqual([row["code"] for row in rows], ["005930", "035720"])
+        self.assertEqual(rows[0]["trade_value"], 1000.0)
+        self.assertEqual(rows[0]["pct_from_open"], 100.0)
+        self.assertEqual(lanes, ["bulk", "bulk", "bulk"])
+
+    def test_get_market_snapshot_bulk_keeps_multi_price_after_transient_error(self):
+        api = KISApi(app_key="k", app_secret="s", account_no="00000000", is_paper_trading=False)
+        api.access_token = "token"
+        api.token_expires_at = dt.datetime.now() + dt.timedelta(hours=23)
+        codes = [f"{idx:06d}" for idx in range(1, 36)]
+        multi_calls = []
+
+        def _fake_request(method, url, headers, params=None, **kwargs):
+            requested = [params[f"FID_INPUT_ISCD_{idx}"] for idx in range(1, len(params) // 2 + 1)]
+            multi_calls.append(requested)
+            if len(multi_calls) == 1:
+                raise KISApiError("API 타임아웃: read timed out")
+            output = [{"inter_shrn_iscd": code, "inter2_prpr": "1100", "inter2_oprc": "1000"} for code in requested]
+            return _Response({"rt_cd": "0", "output": output})
+
+        single_codes = []
+
+        def _fake_price(code, lane="default"):
+            single_codes.append(code)
+            return {"current_price": 200.0, "open_price": 100.0, "volume": 5}
+
+        api._request_with_retry = _fake_request  # type: ignore
+        api._fetch_current_price = _fake_price  # type: ignore
+
+        rows = api.get_market_snapshot_bulk(codes, max_workers=1)
+        self.assertEqual([row["code"] for row in rows], codes)
+        self.assertEqual(sorted(single_codes), codes[:30])
+        self.assertEqual([len(requested) for requested in multi_calls], [30, 5])
+        self.assertTrue(api._multi_price_supported)
+
+    def test_get_market_snapshot_bulk_disables_multi_price_on_unsupported_rejection(self):
+        api = KISApi(app_key="k", app_secret="s", account_no="00000000", is_paper_trading=False)
+        api.access_token = "token"
+        api.token_expires_at = dt.datetime.now() + dt.timedelta(hours=23)
+        multi_calls = []
+
+        def _fake_request(method, url, headers, params=None, **kwargs):
+            multi_calls.append(url)
+            return _Response({"rt_cd": "1", "msg_cd": "OPSQ0002", "msg1": "없는 서비스 코드 입니다"})
+
+        api._request_with_retry = _fake_request  # type: ignore
+        api._fetch_current_price = lambda code, lane="default": {"current_price": 200.0, "open_price": 100.0}  # type: ignore
+
+        codes = [f"{idx:06d}" for idx in range(1, 36)]
+        rows = api.get_market_snapshot_bulk(codes, max_workers=1)
+        self.assertEqual([row["code"] for row in rows], codes)
+        self.assertEqual(len(multi_calls), 1)
+        self.assertFalse(api._multi_price_supported)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 import datetime as dt
 import sys
+import tempfile
 import types
 import unittest
 from pathlib import Path
@@ -79,6 +80,7 @@ _ensure_fake_dependencies()
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 import main_multiday  # type: ignore  # noqa: E402
+from utils.state_store import STATE_STORE_FILENAME, StateStore  # type: ignore  # noqa: E402
 
 
 class _DummyAPI:
@@ -181,6 +183,35 @@ class _DummyMarketRegimeWorker:
 
 
 class TestMainMultidayMultiSymbols(unittest.TestCase):
+    def setUp(self):
+        # 종목별 PositionStore 가 저장소의 data/state_store.sqlite3 를 만들지 않도록 임시 디렉토리 사용
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        state_store = StateStore(Path(temp_dir.name) / STATE_STORE_FILENAME)
+        self.addCleanup(state_store.close)
+        real_position_store = main_multiday.PositionStore
+        position_store_patch = patch.object(
+            main_multiday,
+            "PositionStore",
+            lambda file_path: real_position_store(
+                file_path=Path(temp_dir.name) / Path(file_path).name,
+                state_store=state_store,
+            ),
+        )
+        position_store_patch.start()
+        self.addCleanup(position_store_patch.stop)
+        # 유니버스 캐시/보유 종목 조회도 저장소의 data/ 대신 임시 디렉토리 사용
+        real_universe_service = main_multiday.UniverseService
+
+        def _universe_service(*args, **kwargs):
+            service = real_universe_service(*args, data_dir=Path(temp_dir.name), **kwargs)
+            service.policy.cache_file = Path(temp_dir.name) / "universe_cache.json"
+            return service
+
+        universe_service_patch = patch.object(main_multiday, "UniverseService", _universe_service)
+        universe_service_patch.start()
+        self.addCleanup(universe_service_patch.stop)
+
     def test_run_trade_executes_all_selected_symbols_once(self):
         _DummyExecutor.created_symbols = []
         _DummyExecutor.run_once_calls = []
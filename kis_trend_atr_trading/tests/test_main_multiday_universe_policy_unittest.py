@@ -1,6 +1,7 @@
 import datetime as dt
 import io
 import sys
+import tempfile
 import types
 import unittest
 from pathlib import Path
@@ -80,6 +81,7 @@ _ensure_fake_dependencies()
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 import main_multiday  # type: ignore  # noqa: E402
+from utils.state_store import STATE_STORE_FILENAME, StateStore  # type: ignore  # noqa: E402
 
 
 class _DummyAPI:
@@ -262,6 +264,22 @@ class _DummyPositionStoreMismatchedState:
 
 class TestMainMultidayUniversePolicy(unittest.TestCase):
     def setUp(self):
+        # 종목별 PositionStore 가 저장소의 data/state_store.sqlite3 를 만들지 않도록 임시 디렉토리 사용
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        state_store = StateStore(Path(temp_dir.name) / STATE_STORE_FILENAME)
+        self.addCleanup(state_store.close)
+        real_position_store = main_multiday.PositionStore
+        position_store_patch = patch.object(
+            main_multiday,
+            "PositionStore",
+            lambda file_path: real_position_store(
+                file_path=Path(temp_dir.name) / Path(file_path).name,
+                state_store=state_store,
+            ),
+        )
+        position_store_patch.start()
+        self.addCleanup(position_store_patch.stop)
         _DummyExecutor.created_symbols = []
         _DummyExecutor.run_once_calls = []
         _DummyExecutor.entry_controls = []
@@ -175,6 +175,34 @@ def test_ws_client_parse_tick_keeps_legacy_payload_format():
     assert tick.volume == 300.0
 
 
+def test_ws_client_parse_ticks_yields_every_record_in_multi_record_frame():
+    def _record(code, hhmmss, price, volume):
+        fields = ["0"] * 46
+        fields[0], fields[1], fields[2], fields[12] = code, hhmmss, price, volume
+        return "^".join(fields)
+
+    msg = "0|H0STCNT0|003|" + "^".join(
+        [
+            _record("005930", "090001", "71000", "10"),
+            _record("000660", "090001", "905000", "3"),
+            _record("005930", "090002", "71100", "7"),
+        ]
+    )
+
+    ticks = KISWSClient._parse_ticks(msg)
+
+    assert [(t.stock_code, t.price, t.volume) for t in ticks] == [
+        ("005930", 71000.0, 10.0),
+        ("000660", 905000.0, 3.0),
+        ("005930", 71100.0, 7.0),
+    ]
+    # Same-second ticks share the cached timestamp object.
+    assert ticks[0].timestamp is ticks[1].timestamp
+    assert ticks[2].timestamp.second == 2
+    assert not hasattr(ticks[0], "__dict__")
+    assert KISWSClient._parse_tick(msg).stock_code == "005930"
+
+
 class _CountingRestProvider:
     def __init__(self):
         self.calls = 0
@@ -4,12 +4,15 @@ from contextlib import ExitStack
 from datetime import datetime, timedelta
 from pathlib import Path
 import sys
+from types import SimpleNamespace
 from unittest.mock import patch
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+import engine.multiday_executor as multiday_executor
 import strategy.multiday_trend_atr as multiday_trend_atr
+from core.intraday_session import IntradaySessionStore
 from engine.strategy_pipeline_registry import build_default_strategy_registry
 from strategy.multiday_trend_atr import MultidayTrendATRStrategy, SignalType
 from utils.market_hours import KST
@@ -383,3 +386,142 @@ def test_strategy_candidate_max_age_does_not_override_orb_native_expiry(sample_u
     assert evaluation.candidate is not None
     assert evaluation.candidate.expires_at == decision_time.replace(hour=9, minute=0, second=0, microsecond=0) + timedelta(minutes=90)
     assert evaluation.candidate.meta["entry_meta"]["expiry_authority"] == "orb_entry_cutoff"
+
+
+def test_intraday_session_store_tracks_opening_range_vwap_and_rejects_replays():
+    decision_time = _kst_dt(2026, 2, 16, 9, 31)
+    intraday_bars = _make_intraday_bars(
+        day=decision_time,
+        opening_range_high=10_180.0,
+        opening_range_low=10_060.0,
+    )
+    store = IntradaySessionStore(opening_range_bars=10, recent_close_window=4)
+    pre_market = dict(intraday_bars[0], start_at=decision_time.replace(hour=8, minute=59))
+    assert store.add_bar({**pre_market, "stock_code": "5930"}) is False
+    for bar in intraday_bars:
+        assert store.add_bar({**bar, "stock_code": "005930"}) is True
+    assert store.add_bar({**intraday_bars[10], "stock_code": "005930"}) is False
+
+    session = store.snapshot("005930")
+    expected_turnover = sum((bar["high"] + bar["low"] + bar["close"]) / 3.0 * bar["volume"] for bar in intraday_bars)
+    expected_volume = sum(bar["volume"] for bar in intraday_bars)
+    assert session.bar_count == len(intraday_bars)
+    assert session.opening_range(5) == (
+        max(bar["high"] for bar in intraday_bars[:5]),
+        min(bar["low"] for bar in intraday_bars[:5]),
+    )
+    assert session.opening_range(11) is None
+    assert abs(session.vwap - expected_turnover / expected_volume) < 1e-9
+    assert session.recent_closes == tuple(bar["close"] for bar in intraday_bars[-4:])
+    assert session.last_bar_at == intraday_bars[-1]["start_at"]
+
+    next_day_bar = dict(intraday_bars[0], start_at=intraday_bars[0]["start_at"] + timedelta(days=1))
+    assert store.add_bar({**next_day_bar, "stock_code": "005930"}) is True
+    rolled = store.snapshot("005930")
+    assert rolled.bar_count == 1
+    assert rolled.trade_date == next_day_bar["start_at"].date()
+    assert store.metrics()["intraday_session_bars_ignored"] == 2
+
+
+def test_orb_registry_adapters_read_session_source_instead_of_bar_lists(sample_uptrend_df):
+    strategy = MultidayTrendATRStrategy()
+    prepared_df = strategy.add_indicators(sample_uptrend_df)
+    prev_high = float(prepared_df.iloc[-1]["prev_high"])
+    decision_time = _kst_dt(2026, 2, 16, 9, 31)
+    opening_range_high = prev_high * 1.018
+    intraday_bars = _make_intraday_bars(
+        day=decision_time,
+        opening_range_high=opening_range_high,
+        opening_range_low=prev_high * 1.006,
+    )
+    store = IntradaySessionStore()
+    for bar in intraday_bars:
+        store.add_bar({**bar, "stock_code": "005930"})
+    requested_codes: list[str] = []
+
+    def _session_source(stock_code: str):
+        requested_codes.append(stock_code)
+        return store.snapshot(stock_code)
+
+    bar_registry = build_default_strategy_registry(
+        pullback_strategy=strategy.pullback_strategy,
+        trend_atr_strategy=strategy,
+        orb_strategy=strategy.orb_strategy,
+    )
+    session_registry = build_default_strategy_registry(
+        pullback_strategy=strategy.pullback_strategy,
+        trend_atr_strategy=strategy,
+        orb_strategy=strategy.orb_strategy,
+        orb_session_source=_session_source,
+    )
+
+    results = []
+    with ExitStack() as stack:
+        for ctx in _orb_settings_patches():
+            stack.enter_context(ctx)
+        for registry, bars in ((bar_registry, intraday_bars), (session_registry, [])):
+            entry = registry.get("opening_range_breakout")
+            evaluation = entry.setup_evaluator.evaluate_setup(
+                daily_df=prepared_df,
+                daily_context=None,
+                current_price=opening_range_high * 1.004,
+                open_price=prev_high * 1.015,
+                intraday_bars=bars,
+                intraday_provider_ready=True,
+                stock_code="005930",
+                stock_name="삼성전자",
+                check_time=decision_time,
+                market_phase=VenueMarketPhase.KRX_CONTINUOUS,
+                market_venue="KRX",
+                has_existing_position=False,
+                has_pending_order=False,
+                market_regime_snapshot=None,
+            )
+            decision = entry.timing_evaluator.evaluate_timing(
+                candidate=evaluation.candidate,
+                native_candidate=evaluation.native_candidate,
+                current_price=opening_range_high * 1.004,
+                stock_code="005930",
+                check_time=decision_time,
+                market_phase=VenueMarketPhase.KRX_CONTINUOUS,
+                market_venue="KRX",
+                intraday_bars=bars,
+                has_existing_position=False,
+                has_pending_order=False,
+                current_context_version=None,
+            )
+            results.append((evaluation, decision))
+
+    (bar_evaluation, bar_decision), (session_evaluation, session_decision) = results
+    assert requested_codes == ["005930", "005930"]
+    assert session_evaluation.candidate is not None
+    assert session_decision.should_emit_intent is True
+    assert session_evaluation.candidate.entry_reference_price == bar_evaluation.candidate.entry_reference_price
+    assert (
+        session_evaluation.native_candidate.opening_range_low
+        == bar_evaluation.native_candidate.opening_range_low
+    )
+    assert session_decision.meta["decision_meta"]["orb_vwap"] == bar_decision.meta["decision_meta"]["orb_vwap"]
+    assert session_decision.meta["decision_meta"]["intraday_source_state"] == "fresh"
+
+
+def test_executor_falls_back_to_bar_fetch_when_session_store_is_shorter_than_orb_range():
+    decision_time = _kst_dt(2026, 2, 16, 9, 31)
+    intraday_bars = _make_intraday_bars(
+        day=decision_time,
+        opening_range_high=10_180.0,
+        opening_range_low=10_060.0,
+    )
+    store = IntradaySessionStore(opening_range_bars=5)
+    for bar in intraday_bars:
+        store.add_bar({**bar, "stock_code": "005930"})
+    executor = SimpleNamespace(
+        stock_code="005930",
+        market_data_provider=SimpleNamespace(get_intraday_session=store.snapshot),
+    )
+
+    with patch.object(multiday_executor.settings, "ORB_OPENING_RANGE_MINUTES", 5):
+        assert multiday_executor.MultidayExecutor.fetch_intraday_session(executor) is not None
+    # 저장소 용량(5봉)을 넘는 opening range 는 None → 호출자가 분봉 리스트를 조회
+    with patch.object(multiday_executor.settings, "ORB_OPENING_RANGE_MINUTES", 10):
+        assert multiday_executor.MultidayExecutor.fetch_intraday_session(executor) is None
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import backtest.parameter_sweep as parameter_sweep
+from backtest.parameter_sweep import (
+    ParameterSweepRunner,
+    build_parameter_grid,
+    build_walk_forward_windows,
+    sample_random_parameters,
+)
+from backtest.portfolio_backtester import PortfolioBacktester
+from strategy.trend_atr import TrendATRStrategy
+
+
+def _make_ohlcv(seed: int, rows: int = 400) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 10000 * np.exp(np.cumsum(rng.normal(0.0005, 0.02, rows)))
+    return pd.DataFrame(
+        {
+            "date": pd.bdate_range("2021-01-01", periods=rows),
+            "open": close,
+            "high": close * (1 + rng.uniform(0, 0.02, rows)),
+            "low": close * (1 - rng.uniform(0, 0.02, rows)),
+            "close": close,
+            "volume": 1000.0,
+        }
+    )
+
+
+def _panel() -> dict:
+    return {f"{idx:06d}": _make_ohlcv(idx) for idx in range(3)}
+
+
+def test_grid_and_random_search_build_unique_params():
+    grid = build_parameter_grid({"atr_multiplier_sl": [1.5, 2.0], "ma_period": [20, 50]})
+    sampled = sample_random_parameters(
+        {"atr_multiplier_sl": [1.5, 2.0], "ma_period": [20, 50]}, n_samples=10, seed=1
+    )
+
+    assert len(grid) == 4
+    assert len({params.key() for params in sampled}) == 4
+    with pytest.raises(ValueError):
+        build_parameter_grid({"unknown": [1]})
+
+
+def test_walk_forward_windows_do_not_overlap_train_and_test():
+    windows = build_walk_forward_windows(pd.bdate_range("2021-01-01", periods=300), 200, 50)
+
+    assert len(windows) == 2
+    for window in windows:
+        assert window.train_end < window.test_start <= window.test_end
+
+
+def test_sweep_ranks_results_and_precomputes_indicators_once_per_period_pair(tmp_path, monkeypatch):
+    calls = []
+    original = parameter_sweep.ParameterSweepRunner._precompute_indicators
+
+    def _tracking(self, params_list):
+        result = original(self, params_list)
+        calls.append(sorted(result))
+        return result
+
+    monkeypatch.setattr(parameter_sweep.ParameterSweepRunner, "_precompute_indicators", _tracking)
+    grid = build_parameter_grid(
+        {"atr_multiplier_sl": [1.5, 2.0], "atr_multiplier_tp": [2.0, 3.0], "ma_period": [20, 50]}
+    )
+    output = tmp_path / "sweep.csv"
+
+    table = ParameterSweepRunner(_panel(), max_workers=1).run(grid, output_path=str(output))
+
+    assert calls == [[(14, 20), (14, 50)]]
+    assert len(table) == len(grid)
+    assert list(table["rank"]) == list(range(1, len(grid) + 1))
+    assert table["sharpe"].is_monotonic_decreasing
+    assert {"max_drawdown", "profit_factor", "total_trades"} <= set(table.columns)
+    assert output.exists()
+
+
+def test_sweep_resumes_from_checkpoint_without_rerunning(tmp_path, monkeypatch):
+    checkpoint = tmp_path / "checkpoint.jsonl"
+    grid = build_parameter_grid({"atr_multiplier_sl": [1.5, 2.0], "ma_period": [20]})
+    windows = build_walk_forward_windows(pd.bdate_range("2021-01-01", periods=400), 250, 100)
+
+    first = ParameterSweepRunner(_panel(), checkpoint_path=str(checkpoint), max_workers=1).run(grid, windows)
+    lines = checkpoint.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == len(grid) * len(windows) + len(windows)
+    # 크래시로 잘린 마지막 줄은 무시되어야 함
+    checkpoint.write_text("\n".join(lines[:-1]) + "\n" + lines[-1][:10], encoding="utf-8")
+
+    executed = []
+    original = parameter_sweep._run_sweep_task
+
+    def _tracking(task):
+        executed.append(task.key())
+        return original(task)
+
+    monkeypatch.setattr(parameter_sweep, "_run_sweep_task", _tracking)
+    second = ParameterSweepRunner(_panel(), checkpoint_path=str(checkpoint), max_workers=1).run(grid, windows)
+
+    assert len(executed) == 1
+    assert json.loads(lines[-1])["task_key"] == executed[0]
+    pd.testing.assert_frame_equal(first, second)
+    assert set(second["phase"]) == {"IS", "OOS"}
+
+
+def test_oos_window_trades_from_its_first_bar_with_full_history_signals():
+    grid = build_parameter_grid({"ma_period": [50]})
+    params = grid[0]
+    runner = ParameterSweepRunner(_panel(), max_workers=1)
+    indicators = runner._precompute_indicators(grid)[params.indicator_key]
+    window = build_walk_forward_windows(pd.bdate_range("2021-01-01", periods=400), 300, 64)[0]
+
+    frames, offsets = parameter_sweep._slice_frames(indicators, window.test_start, window.test_end)
+    backtester = PortfolioBacktester(
+        strategy=TrendATRStrategy(atr_period=params.atr_period, ma_period=params.ma_period),
+        adx_threshold=params.adx_threshold,
+        atr_spike_threshold=params.atr_spike_threshold,
+    )
+    result = backtester.run(frames, print_summary=False, warmup_offsets=offsets)
+
+    # 초기 자본 + OOS 64거래일 전부 (ma_period 만큼 앞부분이 잘리지 않음)
+    assert offsets == {code: 300 for code in indicators}
+    assert len(result.equity_curve) == 64 + 1
+
+    # 잘라낸 구간의 거래 가능/진입 신호는 전체 기간 패널의 같은 날짜와 동일
+    full = backtester._build_panel(dict(indicators))
+    sliced = backtester._build_panel(frames, offsets)
+    rows = full.dates.get_indexer(sliced.dates)
+    np.testing.assert_array_equal(sliced.tradable, full.tradable[rows])
+    np.testing.assert_array_equal(sliced.entry_signal, full.entry_signal[rows])
+
+
+def test_checkpoint_is_not_reused_for_other_data_or_window_dates(tmp_path, monkeypatch):
+    checkpoint = tmp_path / "checkpoint.jsonl"
+    grid = build_parameter_grid({"ma_period": [20]})
+    dates = pd.bdate_range("2021-01-01", periods=400)
+    ParameterSweepRunner(_panel(), checkpoint_path=str(checkpoint), max_workers=1).run(
+        grid, build_walk_forward_windows(dates, 250, 100)
+    )
+
+    executed = []
+    original = parameter_sweep._run_sweep_task
+
+    def _tracking(task):
+        executed.append(task)
+        return original(task)
+
+    monkeypatch.setattr(parameter_sweep, "_run_sweep_task", _tracking)
+
+    # 같은 윈도우 번호라도 기간이 다르면 다시 실행
+    ParameterSweepRunner(_panel(), checkpoint_path=str(checkpoint), max_workers=1).run(
+        grid, build_walk_forward_windows(dates, 200, 100)
+    )
+    assert {task.phase for task in executed} == {"IS", "OOS"}
+
+    # 같은 기간이라도 입력 데이터가 바뀌면 다시 실행
+    executed.clear()
+    changed = _panel()
+    changed["000000"].loc[0, "close"] *= 1.01
+    ParameterSweepRunner(changed, checkpoint_path=str(checkpoint), max_workers=1).run(
+        grid, build_walk_forward_windows(dates, 250, 100)
+    )
+    assert len(executed) == 2
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from backtest.backtester import Backtester
+from backtest.portfolio_backtester import PortfolioBacktester
+
+
+def _make_ohlcv(seed: int, rows: int = 600) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 10000 * np.exp(np.cumsum(rng.normal(0.0005, 0.02, rows)))
+    return pd.DataFrame(
+        {
+            "date": pd.bdate_range("2020-01-01", periods=rows),
+            "open": close,
+            "high": close * (1 + rng.uniform(0, 0.02, rows)),
+            "low": close * (1 - rng.uniform(0, 0.02, rows)),
+            "close": close,
+            "volume": 1000.0,
+        }
+    )
+
+
+def _trade_keys(trades):
+    return [
+        (t.entry_date, t.exit_date, t.quantity, t.exit_reason, t.holding_days)
+        for t in trades
+    ]
+
+
+@pytest.mark.parametrize("seed", [0, 3, 4])
+def test_single_symbol_matches_backtester(seed):
+    df = _make_ohlcv(seed)
+
+    expected = Backtester().run(df, stock_code="005930")
+    actual = PortfolioBacktester(max_positions=1).run({"005930": df}, print_summary=False)
+
+    assert expected.total_trades > 0
+    assert _trade_keys(actual.trades) == _trade_keys(expected.trades)
+    assert [t.pnl for t in actual.trades] == pytest.approx([t.pnl for t in expected.trades])
+    assert actual.equity_curve == pytest.approx(expected.equity_curve)
+    assert actual.final_capital == pytest.approx(expected.final_capital)
+    assert actual.max_drawdown == pytest.approx(expected.max_drawdown)
+    assert actual.win_rate == expected.win_rate
+    assert (actual.start_date, actual.end_date) == (expected.start_date, expected.end_date)
+
+
+def test_max_positions_limits_concurrent_holdings_and_shares_capital():
+    panel = {f"{idx:06d}": _make_ohlcv(100 + idx) for idx in range(12)}
+
+    result = PortfolioBacktester(max_positions=3).run(panel, print_summary=False)
+
+    assert result.total_trades > 0
+    assert result.max_concurrent_positions <= 3
+    assert {t.stock_code for t in result.trades} <= set(panel)
+    assert len(result.equity_curve) == len(result.equity_dates) + 1
+
+
+def test_multiindex_panel_matches_dict_panel():
+    panel = {f"{idx:06d}": _make_ohlcv(200 + idx) for idx in range(4)}
+    stacked = pd.concat(
+        {code: frame.set_index("date") for code, frame in panel.items()},
+        names=["stock_code", "date"],
+    )
+
+    from_dict = PortfolioBacktester(max_positions=2).run(panel, print_summary=False)
+    from_multiindex = PortfolioBacktester(max_positions=2).run(stacked, print_summary=False)
+
+    assert _trade_keys(from_multiindex.trades) == _trade_keys(from_dict.trades)
+    assert from_multiindex.final_capital == pytest.approx(from_dict.final_capital)
@@ -4,6 +4,7 @@ from dataclasses import replace
 from datetime import datetime, timedelta
 from pathlib import Path
 import threading
+import time
 import sys
 from unittest.mock import patch
 
@@ -16,6 +17,7 @@ sys.path.insert(0, str(PROJECT_ROOT))
 import strategy.multiday_trend_atr as multiday_trend_atr
 from engine.pullback_pipeline_models import (
     AccountRiskSnapshot,
+    DailyBarColumns,
     DailyContext,
     HoldingsRiskSnapshot,
     PullbackEntryIntent,
@@ -676,6 +678,53 @@ def test_dirty_symbol_set_dedupes_duplicate_marks():
     assert dirty.size() == 0
 
 
+def test_dirty_symbol_set_drains_priority_symbols_first_in_insertion_order():
+    armed = {"000660"}
+    dirty = DirtySymbolSet(priority_fn=lambda symbol: symbol in armed)
+    dirty.mark("035720")
+    dirty.mark("005930")
+    dirty.mark("000660")
+    dirty.mark("035720")
+
+    assert dirty.drain(max_items=2) == ["000660", "035720"]
+    assert dirty.drain() == ["005930"]
+    metrics = dirty.metrics()
+    assert metrics["dirty_coalesced_count"] == 1
+    assert metrics["dirty_priority_drain_count"] == 1
+    assert metrics["dirty_mark_to_drain_ms"]["count"] == 3
+
+
+def test_dirty_symbol_set_wakes_waiter_on_mark_and_honors_coalesce_window():
+    dirty = DirtySymbolSet()
+    woke = threading.Event()
+
+    def _waiter():
+        if dirty.wait_for_ready(timeout=5.0):
+            woke.set()
+
+    thread = threading.Thread(target=_waiter, daemon=True)
+    thread.start()
+    time.sleep(0.05)
+    started = time.monotonic()
+    dirty.mark("005930")
+    assert woke.wait(1.0)
+    assert time.monotonic() - started < 0.5
+    thread.join(timeout=1.0)
+
+    coalescing = DirtySymbolSet(coalesce_window_sec=0.1)
+    coalescing.mark("005930")
+    started = time.monotonic()
+    assert coalescing.wait_for_ready(timeout=2.0) is True
+    assert time.monotonic() - started >= 0.05
+    assert coalescing.drain() == ["005930"]
+    coalescing.mark_evaluated("005930")
+    assert coalescing.metrics()["dirty_mark_to_eval_ms"]["count"] == 1
+
+    idle = DirtySymbolSet()
+    idle.wake()
+    assert idle.wait_for_ready(timeout=2.0) is False
+
+
 def test_timing_worker_skips_symbol_without_armed_candidate():
     executor = _TimingExecutorStub()
     worker = PullbackTimingWorker(
@@ -694,6 +743,48 @@ def test_timing_worker_skips_symbol_without_armed_candidate():
     assert executor._pullback_timing_skip_reason == "no_candidate"
 
 
+def test_timing_worker_releases_in_flight_symbols_on_degraded_skip_and_error():
+    def _run_worker(dirty: DirtySymbolSet, **kwargs) -> PullbackTimingWorker:
+        stop_event = threading.Event()
+        worker = PullbackTimingWorker(
+            executor=_TimingExecutorStub(),
+            candidate_store=ArmedCandidateStore(),
+            dirty_symbols=dirty,
+            entry_queue=EntryIntentQueue(maxsize=8),
+            strategy_registry=None,
+            enabled_strategy_tags=(),
+            stop_event=stop_event,
+            **kwargs,
+        )
+        for symbol in ("005930", "000660", "035420"):
+            dirty.mark(symbol)
+        worker.start()
+        deadline = time.monotonic() + 5.0
+        while (dirty.size() or dirty._in_flight) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        stop_event.set()
+        dirty.wake()
+        worker.join(timeout=2.0)
+        return worker
+
+    degraded = DirtySymbolSet()
+    _run_worker(
+        degraded,
+        on_error=lambda *_args: None,
+        degraded_controller=type("_Degraded", (), {"is_degraded": lambda self: True})(),
+    )
+    assert degraded._in_flight == {}
+    assert degraded.metrics()["dirty_mark_to_eval_ms"]["count"] == 3
+
+    failing = DirtySymbolSet()
+    errors = []
+    with patch.object(PullbackTimingWorker, "_process_symbol", side_effect=RuntimeError("boom")):
+        _run_worker(failing, on_error=lambda _name, exc: errors.append(exc))
+    assert len(errors) == 1
+    assert failing._in_flight == {}
+    assert failing.metrics()["dirty_mark_to_eval_ms"]["count"] == 3
+
+
 def test_duplicate_dirty_events_do_not_create_duplicate_pullback_intents():
     executor = _TimingExecutorStub()
     store = ArmedCandidateStore()
@@ -719,6 +810,42 @@ def test_duplicate_dirty_events_do_not_create_duplicate_pullback_intents():
     assert entry_queue.qsize() == 1
 
 
+def test_daily_bar_columns_slices_without_copy_and_matches_row_records():
+    df = _make_pullback_indicator_df().tail(50)
+    bars = DailyBarColumns.from_frame(df)
+
+    assert len(bars) == 50
+    assert list(bars) == df.to_dict(orient="records")
+    assert bars[-1]["close"] == float(df["close"].iloc[-1])
+    tail = bars.tail(5)
+    assert len(tail) == 5
+    assert np.shares_memory(tail.column("close"), bars.column("close"))
+    assert not bars.column("close").flags.writeable
+    frame = tail.as_frame()
+    assert np.shares_memory(frame["close"].to_numpy(), bars.column("close"))
+    pd.testing.assert_frame_equal(frame, df.tail(5).reset_index(drop=True), check_dtype=False)
+
+    legacy = DailyContext(
+        symbol="005930",
+        trade_date=_today_trade_date(),
+        context_version="ctx-1",
+        recent_bars=tuple(df.to_dict(orient="records")),
+        prev_high=0.0,
+        prev_close=0.0,
+        atr=2.0,
+        adx=32.0,
+        trend="UPTREND",
+        ma20=171.0,
+        ma50=160.0,
+        swing_high=0.0,
+        swing_low=0.0,
+        refreshed_at=datetime.now(KST),
+        source="test",
+    )
+    assert isinstance(legacy.recent_bars, DailyBarColumns)
+    assert legacy.recent_bars == bars
+
+
 def test_daily_context_store_validates_stale_trade_date_and_version():
     store = DailyContextStore(max_symbols=8)
     trade_date = _today_trade_date()
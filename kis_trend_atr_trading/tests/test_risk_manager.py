@@ -5,6 +5,7 @@ Kill Switch 및 Daily Loss Limit 기능 테스트
 """
 
 import sys
+import threading
 from pathlib import Path
 from datetime import date
 from unittest.mock import patch, MagicMock
@@ -515,6 +516,37 @@ class TestEdgeCases:
         result = rm.check_order_allowed()
         assert result.passed is True
 
+    def test_킬스위치_알림은_락_해제_후_전송(self):
+        """느린 텔레그램 알림이 다른 스레드의 리스크 체크를 막지 않아야 함"""
+        lock_free_during_notify = []
+        telegram = MagicMock()
+
+        def _notify(_reason):
+            # 다른 스레드가 락을 잡을 수 있어야 주문 경로가 막히지 않는다
+            probe = threading.Thread(
+                target=lambda: lock_free_during_notify.append(rm._state_lock.acquire(timeout=1.0))
+                or rm._state_lock.release()
+            )
+            probe.start()
+            probe.join()
+
+        telegram.notify_kill_switch.side_effect = _notify
+        rm = RiskManager(
+            enable_kill_switch=False,
+            daily_max_loss_percent=3.0,
+            starting_capital=10_000_000,
+            telegram_notifier=telegram,
+            max_api_errors=2,
+            kill_switch_file="/nonexistent/KILL_SWITCH",
+        )
+
+        rm.enable_kill_switch("manual")
+        rm.record_api_error("e1")
+        assert rm.record_api_error("e2") is True  # 락 안에서 중첩 호출된 enable_kill_switch
+
+        assert telegram.notify_kill_switch.call_count == 2
+        assert lock_free_during_notify == [True, True]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
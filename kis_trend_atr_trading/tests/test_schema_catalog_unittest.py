@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, Dict, List
+from unittest.mock import Mock
+
+from db.mysql import DatabaseConfig, MySQLManager
+from db.repository import PositionRepository
+from db.schema_catalog import SchemaCatalog, get_schema_catalog
+from engine.multiday_executor import MultidayExecutor
+from reporting.daily_report_service import DailyReportService
+
+
+def _column(table: str, column: str, position: int, data_type: str = "varchar") -> Dict[str, Any]:
+    return {
+        "entry_kind": "COLUMN",
+        "entry_table": table,
+        "entry_column": column,
+        "entry_position": position,
+        "entry_index": None,
+        "entry_data_type": data_type,
+        "entry_nullable": "NO",
+        "entry_default": None,
+        "entry_extra": "",
+    }
+
+
+def _index(table: str, index: str, column: str, position: int) -> Dict[str, Any]:
+    # MySQL 8 은 information_schema 키를 대문자로 돌려주는 경우가 있다
+    return {
+        "ENTRY_KIND": "INDEX",
+        "ENTRY_TABLE": table,
+        "ENTRY_COLUMN": column,
+        "ENTRY_POSITION": position,
+        "ENTRY_INDEX": index,
+    }
+
+
+class _CatalogManager(MySQLManager):
+    """information_schema 조회를 메모리 스키마로 응답하는 MySQLManager (조회 횟수 기록)."""
+
+    def __init__(self, tables: Dict[str, List[str]], indexes: Dict[str, Dict[str, List[str]]]):
+        super().__init__(DatabaseConfig(database="kis_trading_test"))
+        self.config.enabled = True  # DB_ENABLED 환경변수와 무관하게 활성
+        self.tables = tables
+        self.indexes = indexes
+        self.queries: List[str] = []
+
+    def execute_query(self, query, params=None, fetch_one=False):
+        self.queries.append(" ".join(query.split()))
+        assert "information_schema" in query
+        rows: List[Dict[str, Any]] = []
+        for table, columns in self.tables.items():
+            rows.extend(_column(table, name, idx + 1) for idx, name in enumerate(columns))
+            for index, index_columns in self.indexes.get(table, {}).items():
+                rows.extend(_index(table, index, name, idx + 1) for idx, name in enumerate(index_columns))
+        return rows
+
+    def introspection_queries(self) -> int:
+        return sum(1 for query in self.queries if "information_schema" in query)
+
+
+def _manager() -> _CatalogManager:
+    return _CatalogManager(
+        tables={
+            "positions": ["symbol", "entry_price", "quantity", "mode", "status", "current_price", "unrealized_pnl"],
+            "trades": ["id", "symbol", "side", "price", "quantity", "executed_at", "mode", "idempotency_key"],
+            "account_snapshots": ["snapshot_time", "total_equity", "cash", "mode"],
+            "daily_summary": ["trade_date", "mode", "total_trades"],
+        },
+        indexes={
+            "positions": {"PRIMARY": ["symbol", "mode"], "idx_positions_status": ["status"]},
+            "trades": {"PRIMARY": ["id"], "uq_trades_idempotency_key": ["idempotency_key"]},
+            "account_snapshots": {"PRIMARY": ["snapshot_time", "mode"]},
+            "daily_summary": {"PRIMARY": ["trade_date", "mode"]},
+        },
+    )
+
+
+def test_manager_lookups_share_one_catalog_query() -> None:
+    manager = _manager()
+
+    assert manager.table_exists("positions") and not manager.table_exists("order_state")
+    assert manager._column_exists("trades", "IDEMPOTENCY_KEY")
+    assert not manager._column_exists("trades", "pnl")
+    assert manager._index_exists("positions", "idx_positions_status")
+    assert not manager._index_exists("trades", "idx_trades_symbol")
+    assert manager._get_primary_key_columns("positions") == ["symbol", "mode"]
+    assert manager._get_primary_key_columns("account_snapshots") == ["snapshot_time", "mode"]
+    assert manager._get_primary_key_columns("order_state") == []
+
+    assert manager.introspection_queries() == 1
+    assert get_schema_catalog(manager) is manager.schema_catalog
+    assert get_schema_catalog(Mock()) is None
+
+
+def test_migration_ddl_invalidates_catalog() -> None:
+    manager = _manager()
+    cursor = Mock()
+
+    def _execute(sql):
+        if "ADD COLUMN" in sql:
+            table, column = sql.split()[2], sql.split()[5]
+            manager.tables[table].append(column)
+
+    cursor.execute.side_effect = _execute
+    assert not manager._column_exists("trades", "pnl")
+
+    manager._execute_schema_ddl(cursor, "ALTER TABLE trades ADD COLUMN pnl DECIMAL(15, 2) NULL")
+    assert manager._column_exists("trades", "pnl")
+    assert manager.introspection_queries() == 2
+
+    # 이미 있는 테이블의 CREATE TABLE IF NOT EXISTS 는 무효화하지 않는다
+    manager._invalidate_schema_catalog_for("CREATE TABLE IF NOT EXISTS trades (id INT)")
+    manager._invalidate_schema_catalog_for("INSERT INTO trades (id) VALUES (1)")
+    assert manager.schema_catalog.loaded
+    manager._invalidate_schema_catalog_for("CREATE TABLE IF NOT EXISTS symbol_cache (stock_code VARCHAR(20))")
+    assert not manager.schema_catalog.loaded
+    assert manager.schema_catalog.metrics()["invalidation_count"] == 2
+
+
+def test_repositories_executors_and_reports_share_catalog() -> None:
+    PositionRepository.clear_schema_cache_for_tests()
+    manager = _manager()
+
+    repo = PositionRepository(db=manager)
+    assert repo._positions_symbol_column == "symbol"
+    assert PositionRepository._repository_schema_introspection_count == 0
+
+    for _ in range(50):
+        executor = SimpleNamespace(_report_db=manager, _report_table_columns={})
+        assert "total_equity" in MultidayExecutor._get_report_table_columns(executor, "account_snapshots")
+        assert "idempotency_key" in MultidayExecutor._get_report_table_columns(executor, "trades")
+
+    service = DailyReportService(db=manager, notifier=Mock(), symbol_resolver=Mock(), mode="PAPER")
+    assert service._positions_has_unrealized_columns()
+    assert service._daily_summary_mode_isolated()
+    assert "mode" in service._get_table_columns("account_snapshots")
+
+    assert manager.introspection_queries() == 1
+    assert isinstance(manager.schema_catalog, SchemaCatalog)
+    PositionRepository.clear_schema_cache_for_tests()
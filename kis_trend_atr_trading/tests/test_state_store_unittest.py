@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import json
+import os
+import signal
+import sqlite3
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from performance.performance_tracker import EQUITY_CURVE_MAX_POINTS, PerformanceTracker
+from utils.position_store import DailyTradeStore, PositionStore, StoredPosition
+from utils.state_store import STATE_STORE_FILENAME, StateStore
+
+
+def _position(stock_code: str = "005930", quantity: int = 10) -> StoredPosition:
+    return StoredPosition(
+        stock_code=stock_code,
+        entry_price=70000.0,
+        quantity=quantity,
+        stop_loss=67000.0,
+        take_profit=75000.0,
+        entry_date="2026-03-11",
+        atr_at_entry=1500.0,
+    )
+
+
+def _run_child(tmp_path: Path, body: str, flush_sec: str = "30") -> subprocess.Popen:
+    script = textwrap.dedent(
+        f"""
+        import os, sys
+        sys.path.insert(0, {str(PROJECT_ROOT)!r})
+        from pathlib import Path
+        from utils.position_store import PositionStore, StoredPosition
+        data_dir = Path({str(tmp_path)!r})
+        """
+    ) + textwrap.dedent(body)
+    env = {**os.environ, "STATE_STORE_FLUSH_SEC": flush_sec}
+    return subprocess.Popen([sys.executable, "-c", script], env=env, stdout=subprocess.PIPE, text=True)
+
+
+def test_put_coalesces_and_reads_own_writes_before_flush(tmp_path: Path) -> None:
+    store = StateStore(tmp_path / STATE_STORE_FILENAME, flush_interval_sec=30)
+    for qty in range(100):
+        store.put("positions", "positions.json", {"qty": qty})
+    store.append("trades", {"n": 1})
+    assert store.get("positions", "positions.json") == {"qty": 99}
+    assert store.read_log("trades") == [{"n": 1}]
+    assert store.metrics()["pending_records"] == 1
+
+    with sqlite3.connect(str(tmp_path / STATE_STORE_FILENAME)) as other:
+        assert other.execute("SELECT COUNT(*) FROM kv").fetchone()[0] == 0
+
+    assert store.flush() is True
+    with sqlite3.connect(str(tmp_path / STATE_STORE_FILENAME)) as other:
+        rows = other.execute("SELECT value FROM kv").fetchall()
+    assert [json.loads(row[0]) for row in rows] == [{"qty": 99}]
+    assert store.metrics()["flushes"] == 1
+    store.close()
+
+
+def test_background_flusher_commits_without_explicit_flush(tmp_path: Path) -> None:
+    store = StateStore(tmp_path / STATE_STORE_FILENAME, flush_interval_sec=0.01)
+    store.put("positions", "a", {"qty": 1})
+    deadline = time.monotonic() + 5.0
+    while time.monotonic() < deadline and store.metrics()["flushes"] == 0:
+        time.sleep(0.01)
+    reopened = StateStore(tmp_path / STATE_STORE_FILENAME, flush_interval_sec=30)
+    assert reopened.get("positions", "a") == {"qty": 1}
+    reopened.close()
+    store.close()
+
+
+def test_failed_flush_rolls_back_whole_batch_and_retries(tmp_path: Path) -> None:
+    store = StateStore(tmp_path / STATE_STORE_FILENAME, flush_interval_sec=30)
+    store.put("positions", "a", {"qty": 1})
+    store.append("trades", {"n": 1})
+    with patch.object(StateStore, "_apply_log_ops", side_effect=sqlite3.OperationalError("disk I/O error")):
+        assert store.flush() is False
+    # 같은 키에 더 최신 값이 들어오면 재시도 시 최신 값이 우선
+    store.put("positions", "a", {"qty": 2})
+
+    reopened = StateStore(tmp_path / STATE_STORE_FILENAME, flush_interval_sec=30)
+    assert reopened.get("positions", "a") is None  # kv upsert 도 함께 롤백
+    assert store.metrics()["flush_errors"] == 1
+
+    assert store.flush() is True
+    reopened_again = StateStore(tmp_path / STATE_STORE_FILENAME, flush_interval_sec=30)
+    assert reopened_again.get("positions", "a") == {"qty": 2}
+    assert reopened_again.read_log("trades") == [{"n": 1}]
+    for s in (reopened, reopened_again, store):
+        s.close()
+
+
+def test_log_truncate_and_trim_preserve_call_order(tmp_path: Path) -> None:
+    store = StateStore(tmp_path / STATE_STORE_FILENAME, flush_interval_sec=30)
+    for n in range(3):
+        store.append("log", n)
+    store.flush()
+    store.truncate("log")
+    for n in range(3, 10):
+        store.append("log", n)
+        store.trim("log", 4)
+    assert store.read_log("log") == [6, 7, 8, 9]
+    store.flush()
+    assert StateStore(tmp_path / STATE_STORE_FILENAME, flush_interval_sec=30).read_log("log") == [6, 7, 8, 9]
+    store.append("log", 10)
+    assert store.read_log("log") == [6, 7, 8, 9, 10]
+    store.close()
+
+
+def test_position_store_keeps_per_file_records_in_one_shared_store(tmp_path: Path) -> None:
+    store = StateStore(tmp_path / STATE_STORE_FILENAME, flush_interval_sec=30)
+    samsung = PositionStore(tmp_path / "positions_real_005930.json", state_store=store)
+    hynix = PositionStore(tmp_path / "positions_real_000660.json", state_store=store)
+
+    assert samsung.save_position(_position("005930"))
+    assert samsung.save_pending_exit({"reason": "ATR_STOP"})
+    assert hynix.save_position(_position("000660", quantity=3))
+    assert samsung.save_position(_position("005930", quantity=7))
+    store.flush()
+
+    assert samsung.load_position().quantity == 7
+    assert samsung.load_pending_exit() == {"reason": "ATR_STOP"}  # 재저장 시 pending_exit 유지
+    assert hynix.load_position().stock_code == "000660"
+    assert hynix.clear_position()
+    assert hynix.load_position() is None
+    assert samsung.has_position()
+    assert not list(tmp_path.glob("positions_*.json"))
+    store.close()
+
+
+def test_position_and_daily_trade_legacy_json_is_migrated_once(tmp_path: Path) -> None:
+    legacy_position = {"position": {**vars(_position()), "quantity": 4}, "version": "1.0", "pending_exit": None}
+    (tmp_path / "positions.json").write_text(json.dumps(legacy_position), encoding="utf-8")
+    legacy_days = {"2026-03-10": {"trades": [{"pnl": -100}], "total_pnl": -100, "consecutive_losses": 1}}
+    (tmp_path / "daily_trades.json").write_text(json.dumps(legacy_days), encoding="utf-8")
+    originals = {name: (tmp_path / name).read_bytes() for name in ("positions.json", "daily_trades.json")}
+    # 비원자적 쓰기 도중 중단돼 잘린 파일은 이관하지 않고 남겨둔다
+    (tmp_path / "positions_torn.json").write_text('{"position": {"stock_code": "0059', encoding="utf-8")
+
+    store = StateStore(tmp_path / STATE_STORE_FILENAME, flush_interval_sec=30)
+    assert PositionStore(tmp_path / "positions.json", state_store=store).load_position().quantity == 4
+    assert PositionStore(tmp_path / "positions_torn.json", state_store=store).load_position() is None
+    daily = DailyTradeStore(tmp_path / "daily_trades.json", state_store=store)
+    with patch.object(DailyTradeStore, "_get_today_str", return_value="2026-03-10"):
+        assert daily.get_daily_stats()["consecutive_losses"] == 1
+        daily.save_trade({"pnl": -50})
+        stats = daily.get_daily_stats()
+    assert (stats["trade_count"], stats["total_pnl"], stats["consecutive_losses"]) == (2, -150, 2)
+
+    # 원본(배포 체크아웃의 git 추적 파일)은 그대로 두고, 이관 표시로 재이관을 막는다
+    assert {name: (tmp_path / name).read_bytes() for name in originals} == originals
+    assert not list(tmp_path.glob("*.migrated"))
+    assert (tmp_path / "positions_torn.json").exists()
+    assert PositionStore(tmp_path / "positions.json", state_store=store).clear_position()
+    with patch.object(DailyTradeStore, "_get_today_str", return_value="2026-03-10"):
+        assert daily.clear_today()
+    store.close()
+
+    reopened = StateStore(tmp_path / STATE_STORE_FILENAME, flush_interval_sec=30)
+    assert PositionStore(tmp_path / "positions.json", state_store=reopened).load_position() is None
+    with patch.object(DailyTradeStore, "_get_today_str", return_value="2026-03-10"):
+        restarted_daily = DailyTradeStore(tmp_path / "daily_trades.json", state_store=reopened)
+        assert restarted_daily.get_daily_stats()["trade_count"] == 0
+    reopened.close()
+
+
+def test_daily_trade_store_clear_today(tmp_path: Path) -> None:
+    store = StateStore(tmp_path / STATE_STORE_FILENAME, flush_interval_sec=30)
+    daily = DailyTradeStore(tmp_path / "daily_trades.json", state_store=store)
+    daily.save_trade({"pnl": 10, "type": "SELL"})
+    daily.save_trade({"pnl": -5, "type": "SELL"})
+    assert daily.is_daily_limit_reached(max_loss_pct=5.0, max_trades=2, max_consecutive_losses=5)[0]
+    assert daily.clear_today()
+    assert daily.get_daily_stats()["trade_count"] == 0
+    store.close()
+
+
+def test_performance_tracker_appends_trades_and_bounds_equity_curve(tmp_path: Path) -> None:
+    (tmp_path / "performance_trades.json").write_text(
+        json.dumps([{"symbol": "000660", "side": "SELL", "price": 100.0, "quantity": 1, "pnl": 500.0}]),
+        encoding="utf-8",
+    )
+    store = StateStore(tmp_path / STATE_STORE_FILENAME, flush_interval_sec=30)
+    tracker = PerformanceTracker(data_dir=tmp_path, state_store=store)
+    assert tracker._realized_pnl == 500.0
+    tracker.record_buy(symbol="005930", price=70000, quantity=10)
+    tracker.record_sell(symbol="005930", price=71000, quantity=10, reason="TAKE_PROFIT")
+    for _ in range(EQUITY_CURVE_MAX_POINTS + 5):
+        tracker.record_equity_snapshot()
+    store.flush()
+
+    reloaded = PerformanceTracker(data_dir=tmp_path, state_store=StateStore(tmp_path / STATE_STORE_FILENAME))
+    assert [(t.symbol, t.side) for t in reloaded._trades] == [("000660", "SELL"), ("005930", "BUY"), ("005930", "SELL")]
+    assert len(reloaded.get_equity_curve()) == EQUITY_CURVE_MAX_POINTS
+    assert (tmp_path / "performance_trades.json").exists()
+    assert not list(tmp_path.glob("*.migrated"))
+    with sqlite3.connect(str(tmp_path / STATE_STORE_FILENAME)) as conn:
+        rows = conn.execute("SELECT COUNT(*) FROM log WHERE namespace='performance_equity_curve'").fetchone()[0]
+    assert rows == EQUITY_CURVE_MAX_POINTS
+    store.close()
+
+
+def test_crash_right_after_position_save_keeps_position_and_pending_exit(tmp_path: Path) -> None:
+    child = _run_child(
+        tmp_path,
+        """
+        store = PositionStore(data_dir / "positions.json")
+        assert store.save_position(StoredPosition(stock_code="005930", entry_price=70000.0, quantity=10,
+                                                  stop_loss=67000.0, take_profit=None, entry_date="2026-03-11",
+                                                  atr_at_entry=1500.0))
+        assert store.save_pending_exit({"reason": "ATR_STOP", "qty": 10})
+        os._exit(1)  # 명시적 flush / atexit flush 없이 중단 (flush 주기 30초)
+        """,
+    )
+    assert child.wait(timeout=30) == 1
+
+    store = StateStore(tmp_path / STATE_STORE_FILENAME, flush_interval_sec=30)
+    recovered = PositionStore(tmp_path / "positions.json", state_store=store)
+    assert recovered.load_position().quantity == 10
+    assert recovered.load_pending_exit() == {"reason": "ATR_STOP", "qty": 10}
+    store.close()
+
+
+def test_killed_writer_leaves_consistent_database(tmp_path: Path) -> None:
+    child = _run_child(
+        tmp_path,
+        """
+        stores = [PositionStore(data_dir / f"positions_{idx}.json") for idx in range(20)]
+        qty = 0
+        while True:
+            qty += 1
+            for store in stores:
+                store.save_position(StoredPosition(stock_code="005930", entry_price=70000.0, quantity=qty,
+                                                   stop_loss=67000.0, take_profit=None, entry_date="2026-03-11",
+                                                   atr_at_entry=1500.0))
+            if qty == 50:
+                print("ready", flush=True)
+        """,
+        flush_sec="0.001",
+    )
+    for line in child.stdout:  # import 시 배너 출력은 건너뛴다
+        if line.strip() == "ready":
+            break
+    time.sleep(0.2)
+    child.send_signal(signal.SIGKILL)
+    child.wait(timeout=30)
+
+    with sqlite3.connect(str(tmp_path / STATE_STORE_FILENAME)) as conn:
+        assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+    store = StateStore(tmp_path / STATE_STORE_FILENAME, flush_interval_sec=30)
+    quantities = [
+        PositionStore(tmp_path / f"positions_{idx}.json", state_store=store).load_position().quantity
+        for idx in range(20)
+    ]
+    # 한 묶음이 통째로 반영되므로 종목 간 차이는 최대 한 라운드
+    assert min(quantities) >= 1
+    assert max(quantities) - min(quantities) <= 1
+    store.close()
+
+
+def test_unbuffered_mode_commits_each_write(tmp_path: Path) -> None:
+    store = StateStore(tmp_path / STATE_STORE_FILENAME, flush_interval_sec=0)
+    store.put("positions", "a", {"qty": 1})
+    with sqlite3.connect(str(tmp_path / STATE_STORE_FILENAME)) as other:
+        assert other.execute("SELECT COUNT(*) FROM kv").fetchone()[0] == 1
+    store.close()
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+from kis_trend_atr_trading.analytics.async_writer import AnalyticsWriteQueue
+from kis_trend_atr_trading.analytics.event_logger import StrategyAnalyticsEventLogger, load_strategy_events
+
+
+def _log_events(logger: StrategyAnalyticsEventLogger, count: int, trade_date: str = "2026-03-11") -> None:
+    base = datetime.fromisoformat(f"{trade_date}T09:00:00+09:00")
+    for idx in range(count):
+        logger.log_event(
+            event_ts=base + timedelta(seconds=idx),
+            trade_date=trade_date,
+            strategy_tag="pullback_rebreakout",
+            symbol="005930",
+            intent_id=f"intent-{idx}",
+            event_type="candidate_created",
+            stage="setup",
+            decision="accepted",
+            source_component="unit_test",
+            payload_json={"current_price": 70000.0 + idx},
+        )
+
+
+class _GatedSink:
+    def __init__(self) -> None:
+        self.gate = threading.Event()
+        self.entered = threading.Event()
+        self.batches: List[List[Any]] = []
+
+    def __call__(self, batch: List[Any]) -> None:
+        self.entered.set()
+        self.gate.wait(timeout=5.0)
+        self.batches.append(list(batch))
+
+    @property
+    def delivered(self) -> List[Any]:
+        return [item for batch in self.batches for item in batch]
+
+
+@pytest.mark.parametrize("event_format", ["jsonl", "msgpack"])
+def test_async_logger_batches_writes_and_matches_sync_output(tmp_path: Path, event_format: str) -> None:
+    if event_format == "msgpack":
+        pytest.importorskip("msgpack")
+    sync_logger = StrategyAnalyticsEventLogger(
+        event_dir=str(tmp_path / "sync"), enabled=True, event_format=event_format, async_write=False
+    )
+    _log_events(sync_logger, 50)
+    _log_events(sync_logger, 5, trade_date="2026-03-12")
+    sync_logger.close()
+
+    async_logger = StrategyAnalyticsEventLogger(
+        event_dir=str(tmp_path / "async"),
+        enabled=True,
+        event_format=event_format,
+        async_write=True,
+        writer_batch_events=16,
+        writer_flush_sec=5.0,
+    )
+    assert async_logger.async_write is True
+    _log_events(async_logger, 50)
+    _log_events(async_logger, 5, trade_date="2026-03-12")
+    async_logger.close()
+
+    metrics = async_logger.metrics()
+    assert metrics["writer_enqueued"] == 55
+    assert metrics["writer_delivered"] == 55
+    assert metrics["writer_batches"] < 55
+    assert metrics["writer_dropped_oldest"] == metrics["writer_dropped_new"] == 0
+    for trade_date in ("2026-03-11", "2026-03-12"):
+        assert load_strategy_events(event_dir=str(tmp_path / "async"), trade_date=trade_date) == load_strategy_events(
+            event_dir=str(tmp_path / "sync"), trade_date=trade_date
+        )
+
+
+def test_async_logger_flushes_on_time_threshold_before_close(tmp_path: Path) -> None:
+    logger = StrategyAnalyticsEventLogger(
+        event_dir=str(tmp_path),
+        enabled=True,
+        async_write=True,
+        writer_batch_events=1000,
+        writer_flush_sec=0.05,
+    )
+    _log_events(logger, 3)
+    deadline = time.monotonic() + 5.0
+    while time.monotonic() < deadline:
+        if len(load_strategy_events(event_dir=str(tmp_path), trade_date="2026-03-11")) == 3:
+            break
+        time.sleep(0.02)
+    assert len(load_strategy_events(event_dir=str(tmp_path), trade_date="2026-03-11")) == 3
+    logger.close()
+
+
+def test_write_queue_drop_new_and_drop_oldest_policies_count_drops() -> None:
+    for policy, expected in (("drop_new", [0, 1, 2]), ("drop_oldest", [0, 3, 4])):
+        sink = _GatedSink()
+        queue = AnalyticsWriteQueue(sink=sink, maxsize=2, batch_events=1, flush_interval_sec=0.01, overflow_policy=policy)
+        queue.put(0)
+        assert sink.entered.wait(timeout=5.0)  # writer 가 0 을 들고 sink 에서 대기 중
+        results = [queue.put(item) for item in (1, 2, 3, 4)]
+        sink.gate.set()
+        queue.stop(drain=True)
+
+        metrics = queue.metrics()
+        assert sink.delivered == expected
+        if policy == "drop_new":
+            assert results == [True, True, False, False]
+            assert metrics["writer_dropped_new"] == 2
+        else:
+            assert results == [True, True, True, True]
+            assert metrics["writer_dropped_oldest"] == 2
+        assert metrics["writer_enqueued"] == (3 if policy == "drop_new" else 5)
+
+
+def test_write_queue_block_policy_waits_for_room_and_drains_on_stop() -> None:
+    sink = _GatedSink()
+    queue = AnalyticsWriteQueue(sink=sink, maxsize=1, batch_events=1, flush_interval_sec=0.01, overflow_policy="block")
+    queue.put(0)
+    assert sink.entered.wait(timeout=5.0)
+    queue.put(1)
+    producer = threading.Thread(target=queue.put, args=(2,))
+    producer.start()
+    producer.join(timeout=0.2)
+    assert producer.is_alive()  # 큐가 가득 차 생산자가 대기
+
+    sink.gate.set()
+    producer.join(timeout=5.0)
+    assert not producer.is_alive()
+    queue.stop(drain=True)
+    assert sink.delivered == [0, 1, 2]
+    assert queue.metrics()["writer_blocked"] == 1
+
+
+def test_write_queue_rejects_unknown_overflow_policy() -> None:
+    with pytest.raises(ValueError):
+        AnalyticsWriteQueue(sink=lambda batch: None, overflow_policy="spill")
+
+
+def test_write_queue_rejects_puts_after_stop_without_restarting_writer() -> None:
+    sink = _GatedSink()
+    sink.gate.set()
+    queue = AnalyticsWriteQueue(sink=sink, batch_events=1, flush_interval_sec=0.01)
+    assert queue.put(0) is True
+    queue.stop(drain=True)
+    writers_before = sum(thread.name == "strategy-analytics-writer" for thread in threading.enumerate())
+
+    assert queue.put(1) is False
+    assert sum(thread.name == "strategy-analytics-writer" for thread in threading.enumerate()) == writers_before
+    assert sink.delivered == [0]
+    assert queue.metrics()["writer_rejected_closed"] == 1
+
+
+def test_async_logger_snapshots_nested_payload_at_enqueue(tmp_path: Path) -> None:
+    logger = StrategyAnalyticsEventLogger(
+        event_dir=str(tmp_path), enabled=True, async_write=True, writer_batch_events=1000, writer_flush_sec=5.0
+    )
+    payload = {"quote": {"price": 70000.0}}
+    logger.log_event(
+        event_ts=datetime.fromisoformat("2026-03-11T09:00:00+09:00"),
+        trade_date="2026-03-11",
+        strategy_tag="pullback_rebreakout",
+        symbol="005930",
+        event_type="candidate_created",
+        stage="setup",
+        payload_json=dict(payload),
+    )
+    payload["quote"]["price"] = 1.0  # writer 가 build_event 를 실행하기 전에 호출자가 중첩 dict 변경
+    logger.close()
+
+    events = load_strategy_events(event_dir=str(tmp_path), trade_date="2026-03-11")
+    assert [event["payload_json"]["quote"]["price"] for event in events] == [70000.0]
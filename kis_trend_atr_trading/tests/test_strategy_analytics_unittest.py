@@ -7,10 +7,13 @@ from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import patch
 
+import pytest
+
 from kis_trend_atr_trading.analytics.event_logger import (
     StrategyAnalyticsEventLogger,
     analytics_events_from_replay_report,
     inspect_strategy_event_input,
+    iter_strategy_events,
     load_strategy_events,
 )
 from kis_trend_atr_trading.analytics.materializer import StrategyAnalyticsMaterializer
@@ -419,3 +422,195 @@ def test_materializer_surfaces_missing_dir_file_and_empty_file_diagnostics(tmp_p
 
     inspected = inspect_strategy_event_input(event_dir=str(live_dir), trade_date="2026-03-11")
     assert inspected["missing_input_state"] == "trade_date_file_empty"
+
+
+def test_streaming_materializer_matches_batch_builders_across_spilled_runs(tmp_path: Path) -> None:
+    logger = StrategyAnalyticsEventLogger(event_dir=str(tmp_path), enabled=True)
+    base = datetime.fromisoformat("2026-03-11T09:00:00+09:00")
+    # 파일에 시간 역순/뒤섞인 순서로 기록 → 청크 정렬 + merge 가 필요
+    offsets = [37, 5, 61, 5, 240, 12, 190, 3, 75, 400, 130, 18]
+    specs = [
+        ("candidate_created", "setup", "accepted", "", "pullback_rebreakout", {"current_price": 100.0}),
+        ("intent_ingressed", "ingress", "accepted", "", "opening_range_breakout", {}),
+        ("order_filled", "order", "filled", "", "pullback_rebreakout", {"fill_price": 100.0, "side": "BUY"}),
+        ("intent_ingressed", "ingress", "accepted", "", "pullback_rebreakout", {}),
+        ("candidate_created", "setup", "accepted", "", "opening_range_breakout", {"current_price": 103.0}),
+        ("precheck_rejected", "precheck", "rejected", "existing_position", "opening_range_breakout", {}),
+        ("order_submitted", "order", "submitted", "", "pullback_rebreakout", {"price": 101.0}),
+        ("timing_rejected", "timing", "rejected", "orb_intraday_stale", "opening_range_breakout", {}),
+        ("candidate_created", "setup", "accepted", "", "pullback_rebreakout", {"current_price": 102.0}),
+        ("order_filled", "order", "filled", "", "opening_range_breakout", {"fill_price": 104.0, "side": "BUY"}),
+        ("precheck_rejected", "precheck", "rejected", "pending_order", "pullback_rebreakout", {}),
+        ("intent_ingressed", "ingress", "rejected", "queue_full", "pullback_rebreakout", {}),
+    ]
+    for idx, (offset, spec) in enumerate(zip(offsets, specs)):
+        event_type, stage, decision, reject_reason, strategy_tag, payload = spec
+        logger.log_event(
+            event_ts=base + timedelta(seconds=offset),
+            trade_date="2026-03-11",
+            strategy_tag=strategy_tag,
+            symbol="005930",
+            intent_id=f"intent-{idx}",
+            event_type=event_type,
+            stage=stage,
+            decision=decision,
+            reject_reason=reject_reason,
+            source_component="unit_test",
+            payload_json=payload,
+        )
+    logger.close()
+
+    from kis_trend_atr_trading.analytics.event_logger import iter_strategy_events
+
+    loaded = load_strategy_events(event_dir=str(tmp_path), trade_date="2026-03-11")
+    assert list(iter_strategy_events(event_dir=str(tmp_path), trade_date="2026-03-11", chunk_size=5)) == loaded
+
+    materializer = StrategyAnalyticsMaterializer(
+        event_dir=str(tmp_path),
+        markout_horizons_sec=[30, 180],
+        enable_markouts=True,
+    )
+    with patch("kis_trend_atr_trading.analytics.event_logger.settings.STRATEGY_ANALYTICS_SORT_CHUNK_EVENTS", 4):
+        streamed = materializer.materialize_trade_date(trade_date="2026-03-11", persist=False)
+
+    reject_rows = materializer.build_reject_reason_rows("2026-03-11", loaded)
+    markout_rows = materializer.build_markout_rows("2026-03-11", loaded)
+    assert streamed["event_count"] == len(loaded)
+    assert streamed["reject_rows"] == reject_rows
+    assert streamed["markout_rows"] == markout_rows
+    assert streamed["funnel_rows"] == materializer.build_funnel_rows("2026-03-11", loaded)
+    assert streamed["attribution_rows"] == materializer.build_attribution_rows("2026-03-11", loaded)
+    assert streamed["summary_rows"] == materializer.build_daily_summary_rows(
+        "2026-03-11", loaded, reject_rows, markout_rows
+    )
+    assert any(row["reason_group"] == "tie_break_loser" for row in streamed["attribution_rows"])
+    assert any(row["mark_price"] is not None for row in streamed["markout_rows"])
+
+
+def _log_binary_fixture_events(logger: StrategyAnalyticsEventLogger, specs) -> None:
+    base = datetime.fromisoformat("2026-03-11T09:00:00+09:00")
+    for idx, (offset, event_type, stage, decision, reject_reason, payload) in enumerate(specs):
+        logger.log_event(
+            event_ts=base + timedelta(seconds=offset),
+            trade_date="2026-03-11",
+            strategy_tag="pullback_rebreakout" if idx % 2 == 0 else "opening_range_breakout",
+            symbol="005930",
+            intent_id=f"intent-{idx}",
+            event_type=event_type,
+            stage=stage,
+            decision=decision,
+            reject_reason=reject_reason,
+            source_component="unit_test",
+            payload_json=payload,
+        )
+
+
+_BINARY_FIXTURE_SPECS = [
+    (30, "candidate_created", "setup", "accepted", "", {"current_price": 100.0, "levels": [1, 2.5, None]}),
+    (5, "intent_ingressed", "ingress", "rejected", "queue_full", {}),
+    (30, "precheck_rejected", "precheck", "rejected", "existing_position", {"nested": {"a": "가"}}),
+    (90, "order_filled", "order", "filled", "", {"fill_price": 101.0, "side": "BUY"}),
+]
+
+
+def test_binary_event_format_loads_identically_to_jsonl(tmp_path: Path) -> None:
+    pytest.importorskip("msgpack")
+    for event_format in ("jsonl", "msgpack"):
+        logger = StrategyAnalyticsEventLogger(
+            event_dir=str(tmp_path / event_format), enabled=True, event_format=event_format
+        )
+        assert logger.event_format == event_format
+        _log_binary_fixture_events(logger, _BINARY_FIXTURE_SPECS)
+        # 스키마 밖 키 / 사전 컬럼의 비문자열 값도 그대로 왕복해야 한다
+        event = logger.build_event(
+            event_ts=datetime.fromisoformat("2026-03-11T10:00:00+09:00"),
+            strategy_tag="trend_atr",
+            symbol="000660",
+            event_type="candidate_created",
+            stage="setup",
+        )
+        logger.append({**event, "custom_field": "extra", "reject_reason": None})
+        logger.close()
+
+    assert (tmp_path / "msgpack" / "strategy_events_2026-03-11.msgpack").exists()
+    assert not (tmp_path / "msgpack" / "strategy_events_2026-03-11.jsonl").exists()
+    from_jsonl = load_strategy_events(event_dir=str(tmp_path / "jsonl"), trade_date="2026-03-11")
+    from_binary = load_strategy_events(event_dir=str(tmp_path / "msgpack"), trade_date="2026-03-11")
+    assert len(from_binary) == 5
+    assert from_binary == from_jsonl
+    assert from_binary[-1]["custom_field"] == "extra"
+    assert from_binary[-1]["reject_reason"] is None
+    assert load_strategy_events(event_dir=str(tmp_path / "msgpack")) == from_binary
+
+    inspected = inspect_strategy_event_input(event_dir=str(tmp_path / "msgpack"), trade_date="2026-03-11")
+    assert inspected["event_file_format"] == "msgpack"
+    assert inspected["missing_input_state"] == "ok"
+
+
+def test_binary_event_logger_resumes_dictionary_and_drops_torn_tail(tmp_path: Path, caplog) -> None:
+    pytest.importorskip("msgpack")
+    logger = StrategyAnalyticsEventLogger(event_dir=str(tmp_path), enabled=True, event_format="msgpack")
+    _log_binary_fixture_events(logger, _BINARY_FIXTURE_SPECS[:2])
+    logger.close()
+    path = tmp_path / "strategy_events_2026-03-11.msgpack"
+    intact_size = path.stat().st_size
+    with path.open("ab") as fh:
+        fh.write(b"\x02\xff\x00")  # 프레임 헤더 도중에 끊긴 꼬리
+
+    with caplog.at_level(logging.WARNING):
+        assert len(load_strategy_events(event_dir=str(tmp_path), trade_date="2026-03-11")) == 2
+    assert "corrupt binary tail ignored" in caplog.text
+
+    # 재시작 후 이어 쓰기: 잘린 꼬리는 잘라내고 기존 사전 코드(strategy_tag 등)를 재사용
+    resumed = StrategyAnalyticsEventLogger(event_dir=str(tmp_path), enabled=True, event_format="msgpack")
+    _log_binary_fixture_events(resumed, _BINARY_FIXTURE_SPECS)
+    resumed.close()
+    assert path.stat().st_size > intact_size
+
+    loaded = load_strategy_events(event_dir=str(tmp_path), trade_date="2026-03-11")
+    assert len(loaded) == 6
+    assert [event["strategy_tag"] for event in loaded].count("pullback_rebreakout") == 3
+    assert {event["reject_reason"] for event in loaded} == {"", "queue_full", "existing_position"}
+
+
+def test_convert_jsonl_archive_to_binary_preserves_materialized_output(tmp_path: Path) -> None:
+    pytest.importorskip("msgpack")
+    from kis_trend_atr_trading.analytics.event_logger import convert_strategy_event_file
+
+    logger = StrategyAnalyticsEventLogger(event_dir=str(tmp_path), enabled=True, event_format="jsonl")
+    _log_binary_fixture_events(logger, _BINARY_FIXTURE_SPECS)
+    logger.close()
+    materializer = StrategyAnalyticsMaterializer(event_dir=str(tmp_path))
+    before = materializer.materialize_trade_date(trade_date="2026-03-11", persist=False)
+
+    result = convert_strategy_event_file(event_dir=str(tmp_path), trade_date="2026-03-11")
+    assert result["converted"] is True
+    assert result["event_count"] == 4
+    assert result["target_size_bytes"] < result["source_size_bytes"]
+    assert not (tmp_path / "strategy_events_2026-03-11.jsonl").exists()
+    assert (tmp_path / "strategy_events_2026-03-11.jsonl.migrated").exists()
+    assert convert_strategy_event_file(event_dir=str(tmp_path), trade_date="2026-03-11")["reason"] == "source_missing"
+
+    after = materializer.materialize_trade_date(trade_date="2026-03-11", persist=False)
+    for key in ("event_count", "summary_rows", "reject_rows", "funnel_rows", "attribution_rows"):
+        assert after[key] == before[key]
+
+
+def test_mixed_formats_for_one_trade_date_keep_write_order(tmp_path: Path) -> None:
+    pytest.importorskip("msgpack")
+    jsonl_logger = StrategyAnalyticsEventLogger(event_dir=str(tmp_path), enabled=True, event_format="jsonl")
+    _log_binary_fixture_events(jsonl_logger, _BINARY_FIXTURE_SPECS[:3])
+    jsonl_logger.close()
+    binary_logger = StrategyAnalyticsEventLogger(event_dir=str(tmp_path), enabled=True, event_format="msgpack")
+    _log_binary_fixture_events(binary_logger, _BINARY_FIXTURE_SPECS[:1])
+    binary_logger.close()
+
+    loaded = load_strategy_events(event_dir=str(tmp_path), trade_date="2026-03-11")
+    assert [event["_line_index"] for event in loaded] == [1, 0, 2, 3]
+    assert [event["event_type"] for event in loaded] == [
+        "intent_ingressed",
+        "candidate_created",
+        "precheck_rejected",
+        "candidate_created",
+    ]
+    assert list(iter_strategy_events(event_dir=str(tmp_path), trade_date="2026-03-11", chunk_size=2)) == loaded
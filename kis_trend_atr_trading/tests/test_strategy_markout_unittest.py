@@ -60,3 +60,66 @@ def test_markout_calculation_and_na_rows(tmp_path: Path) -> None:
     assert round(rows[(180, "quote")]["markout_bps"], 2) == 100.0
     assert rows[(300, "quote")]["mark_price"] == 102.0
     assert round(rows[(300, "quote")]["markout_bps"], 2) == 200.0
+
+
+def _naive_markouts(events, horizons):
+    """이전 선형 탐색 구현과 동일한 기준값"""
+    quotes = {}
+    for event in events:
+        payload = event["payload_json"]
+        price = payload.get("current_price") or payload.get("fill_price")
+        quotes.setdefault(event["symbol"], []).append((event["event_ts"], float(price)))
+    for series in quotes.values():
+        series.sort(key=lambda item: item[0])
+    expected = []
+    for event in events:
+        if event["event_type"] != "order_filled":
+            continue
+        ref_price = float(event["payload_json"]["fill_price"])
+        for horizon in horizons:
+            target = event["event_ts"] + timedelta(seconds=horizon)
+            mark = next((price for ts, price in quotes[event["symbol"]] if ts >= target), None)
+            bps = None if mark is None else ((mark / ref_price) - 1.0) * 10000.0
+            expected.append((event["symbol"], event["event_ts"], horizon, mark, bps))
+    return expected
+
+
+def test_vectorized_markouts_match_linear_scan_with_ties_and_tail() -> None:
+    base = datetime.fromisoformat("2026-03-11T09:00:00+09:00")
+    events = []
+    for idx, (symbol, offset, price) in enumerate(
+        [
+            ("069500", 0, 100.0),
+            ("069500", 60, 101.0),
+            ("069500", 60, 99.0),  # 동일 시각: 먼저 기록된 관측치가 선택되어야 함
+            ("005930", 30, 50.0),
+            ("069500", 200, 103.0),
+            ("005930", 90, 51.5),
+        ]
+    ):
+        events.append(
+            {
+                "event_ts": base + timedelta(seconds=offset),
+                "symbol": symbol,
+                "event_type": "candidate_created",
+                "payload_json": {"current_price": price},
+            }
+        )
+    for symbol, offset, price in [("069500", 0, 100.0), ("005930", 30, 50.0), ("069500", 150, 102.0)]:
+        events.append(
+            {
+                "event_ts": base + timedelta(seconds=offset),
+                "symbol": symbol,
+                "event_type": "order_filled",
+                "payload_json": {"fill_price": price, "side": "BUY"},
+            }
+        )
+
+    materializer = StrategyAnalyticsMaterializer(markout_horizons_sec=[1, 60, 300], enable_markouts=True)
+    rows = materializer.build_markout_rows("2026-03-11", events)
+    actual = [
+        (row["symbol"], row["entry_ts"], row["horizon_sec"], row["mark_price"], row["markout_bps"]) for row in rows
+    ]
+    assert actual == _naive_markouts(events, [1, 60, 300])
+    assert rows[1]["mark_price"] == 101.0
+    assert rows[-1]["source_type"] == "na"
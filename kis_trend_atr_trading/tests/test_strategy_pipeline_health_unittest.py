@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import threading
 import sys
+import time
 from types import SimpleNamespace
 
 import pandas as pd
@@ -12,7 +13,13 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from engine.pullback_pipeline_models import AuthoritativeEntryIntent, PullbackEntryIntent, PullbackSetupCandidate
-from engine.pullback_pipeline_stores import ArmedCandidateStore, DirtySymbolSet, EntryIntentQueue
+from engine.pullback_pipeline_stores import (
+    ArmedCandidateStore,
+    DirtySymbolSet,
+    EntryIntentQueue,
+    ExpiringMap,
+    ShardedDirtySymbolSet,
+)
 from engine.pullback_pipeline_workers import OrderExecutionWorker, PullbackTimingWorker
 from engine.strategy_pipeline_health import (
     DegradedModeController,
@@ -216,6 +223,98 @@ def test_worker_health_store_detects_stalled_worker():
     assert "stall_lag" in snapshots["TimingWorker"].state_reason
 
 
+def test_sharded_dirty_symbol_set_routes_each_symbol_to_a_stable_shard():
+    symbols = [f"{idx:06d}" for idx in range(1, 201)]
+    dirty = ShardedDirtySymbolSet(4)
+    again = ShardedDirtySymbolSet(4)
+
+    assignments = {symbol: dirty.shard_for(symbol) for symbol in symbols}
+    assert assignments == {symbol: again.shard_for(symbol) for symbol in symbols}
+    assert set(assignments.values()) == {0, 1, 2, 3}
+
+    for symbol in symbols:
+        dirty.mark(symbol)
+    assert dirty.size() == len(symbols)
+    for shard_index in range(4):
+        drained = dirty.shard(shard_index).drain()
+        assert drained and all(assignments[symbol] == shard_index for symbol in drained)
+
+    grown = ShardedDirtySymbolSet(5)
+    moved = sum(1 for symbol in symbols if grown.shard_for(symbol) != assignments[symbol])
+    assert moved < len(symbols) // 2
+
+
+def test_timing_worker_shards_feed_single_queue_with_stable_symbol_ownership():
+    class _RecordingTimingWorker(PullbackTimingWorker):
+        def _process_symbol(self, symbol: str) -> None:
+            with seen_lock:
+                seen.setdefault(symbol, set()).add(self.name)
+            self._entry_queue.put_if_absent(
+                _make_authoritative_intent(strategy_tag="pullback_rebreakout", symbol=symbol)
+            )
+
+    seen: dict[str, set[str]] = {}
+    seen_lock = threading.Lock()
+    stop_event = threading.Event()
+    dirty = ShardedDirtySymbolSet(3)
+    queue = EntryIntentQueue(maxsize=64, authoritative=True)
+    health = WorkerHealthStore()
+    workers = [
+        _RecordingTimingWorker(
+            executor=SimpleNamespace(_pipeline_worker_stall_sec=20.0),
+            candidate_store=ArmedCandidateStore(),
+            dirty_symbols=dirty.shard(shard_index),
+            entry_queue=queue,
+            strategy_registry=None,
+            enabled_strategy_tags=("pullback_rebreakout",),
+            health_store=health,
+            stop_event=stop_event,
+            on_error=lambda *_args: None,
+            shard_index=shard_index,
+            shard_count=3,
+        )
+        for shard_index in range(3)
+    ]
+    for worker in workers:
+        worker.start()
+    symbols = [f"{idx:06d}" for idx in range(1, 31)]
+    try:
+        for _ in range(2):
+            for symbol in symbols:
+                dirty.mark(symbol)
+        deadline = datetime.now() + timedelta(seconds=5)
+        while queue.qsize() < len(symbols) and datetime.now() < deadline:
+            time.sleep(0.01)
+    finally:
+        stop_event.set()
+        dirty.wake()
+        for worker in workers:
+            worker.join(timeout=2.0)
+
+    assert queue.qsize() == len(symbols)
+    for symbol, names in seen.items():
+        assert names == {f"PullbackTimingWorker-{dirty.shard_for(symbol)}"}
+    assert set(health.shard_states("timing")) == {0, 1, 2}
+
+
+def test_degraded_mode_controller_reports_stalled_timing_shard():
+    store = WorkerHealthStore()
+    store.ensure_worker("PullbackTimingWorker-0", stall_after_sec=1.0, shard_group="timing", shard_index=0)
+    store.ensure_worker("PullbackTimingWorker-1", stall_after_sec=30.0, shard_group="timing", shard_index=1)
+    snapshots = store.evaluate(now=datetime.now(KST) + timedelta(seconds=2))
+
+    assert store.shard_states("timing") == {0: WorkerState.STALLED, 1: WorkerState.HEALTHY}
+    controller = DegradedModeController(
+        enabled=True,
+        enter_queue_depth=100,
+        exit_queue_depth=0,
+        min_hold_sec=0.0,
+    )
+    degraded = controller.evaluate(queue_depth=0, worker_snapshots=snapshots, now=_kst_dt(9, 0))
+    assert degraded.is_degraded is True
+    assert degraded.stalled_shards == ("timing[0]",)
+
+
 def test_degraded_mode_controller_enters_and_exits_with_hysteresis():
     controller = DegradedModeController(
         enabled=True,
@@ -362,6 +461,30 @@ def test_candidate_cleanup_uses_native_expires_at_authority_only():
     assert store.get("000660") is None
 
 
+def test_expiring_map_pops_in_expiry_order_skips_stale_heap_entries_and_evicts_on_capacity():
+    evicted = []
+    mapping = ExpiringMap(max_size=3, on_evict=lambda key, value, reason: evicted.append((key, reason)))
+    mapping["a"] = SimpleNamespace(expires_at=_kst_dt(9, 30))
+    mapping["b"] = SimpleNamespace(expires_at=_kst_dt(9, 10))
+    mapping["c"] = SimpleNamespace(expires_at=None)
+    # 덮어쓰기 후 예전 만료시각(09:30) heap 항목은 무시되어야 함
+    mapping["a"] = SimpleNamespace(expires_at=_kst_dt(11, 0))
+
+    expired = mapping.pop_expired(_kst_dt(10, 0))
+    assert [key for key, _ in expired] == ["b"]
+    assert "b" not in mapping and "a" in mapping
+    assert evicted == [("b", "expired")]
+
+    mapping["d"] = SimpleNamespace(expires_at=_kst_dt(12, 0))
+    mapping["e"] = SimpleNamespace(expires_at=_kst_dt(13, 0))
+    assert set(mapping.keys()) == {"c", "d", "e"}
+    assert evicted[-1] == ("a", "capacity")
+    assert [key for key, _ in mapping.pop_expired(_kst_dt(12, 30))] == ["d"]
+    assert set(mapping.keys()) == {"c", "e"}
+    assert mapping.metrics()["capacity_evicted_count"] == 1
+    assert mapping.metrics()["expired_count"] == 2
+
+
 def test_mixed_strategy_tiebreak_metric_is_preserved_outside_degraded_rejects():
     queue = EntryIntentQueue(maxsize=8, authoritative=True, max_pending_per_symbol=0)
     first = _make_authoritative_intent(strategy_tag="pullback_rebreakout", symbol="005930", created_at=_future_kst(0))
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import threading
+import time
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from engine.symbol_evaluation_pool import SymbolEvaluationJob, SymbolEvaluationPool
+
+
+def _sleeping_job(symbol: str, delay: float, result=None):
+    def _fn():
+        time.sleep(delay)
+        return result if result is not None else {"symbol": symbol}
+
+    return SymbolEvaluationJob(symbol=symbol, fn=_fn, context={"symbol": symbol})
+
+
+def test_pool_runs_symbols_concurrently_and_keeps_submit_order():
+    pool = SymbolEvaluationPool(max_workers=4, budget_sec=5.0)
+    try:
+        jobs = [_sleeping_job(code, 0.1) for code in ("005930", "000660", "035420", "069500")]
+        started = time.monotonic()
+        batch = pool.run_batch(jobs)
+        elapsed = time.monotonic() - started
+    finally:
+        pool.shutdown()
+
+    assert elapsed < 0.3  # 순차 실행이면 0.4초 이상
+    assert [item.symbol for item in batch.outcomes] == ["005930", "000660", "035420", "069500"]
+    assert [item.result["symbol"] for item in batch.outcomes] == ["005930", "000660", "035420", "069500"]
+    assert batch.workers == 4
+    assert batch.budget_exceeded is False
+
+
+def test_pool_rejects_duplicate_symbol_in_batch():
+    pool = SymbolEvaluationPool(max_workers=2)
+    try:
+        with pytest.raises(ValueError):
+            pool.run_batch([_sleeping_job("005930", 0), _sleeping_job("005930", 0)])
+    finally:
+        pool.shutdown()
+
+
+def test_pool_captures_job_error_without_dropping_other_results():
+    def _boom():
+        raise RuntimeError("quote timeout")
+
+    pool = SymbolEvaluationPool(max_workers=2)
+    try:
+        batch = pool.run_batch(
+            [
+                SymbolEvaluationJob(symbol="005930", fn=_boom),
+                _sleeping_job("000660", 0.01),
+            ]
+        )
+    finally:
+        pool.shutdown()
+
+    assert isinstance(batch.outcomes[0].error, RuntimeError)
+    assert batch.outcomes[1].error is None
+    assert batch.outcomes[1].result == {"symbol": "000660"}
+    assert batch.first_error is batch.outcomes[0].error
+
+
+def test_pool_reports_budget_exceeded_with_slowest_symbol():
+    pool = SymbolEvaluationPool(max_workers=2, budget_sec=0.05)
+    try:
+        batch = pool.run_batch([_sleeping_job("005930", 0.01), _sleeping_job("000660", 0.12)])
+    finally:
+        pool.shutdown()
+
+    assert batch.budget_exceeded is True
+    assert batch.slowest_symbol == "000660"
+    assert batch.slowest_sec >= 0.1
+
+
+def test_single_worker_pool_runs_inline_on_caller_thread():
+    caller = threading.get_ident()
+    seen = []
+    pool = SymbolEvaluationPool(max_workers=1)
+    batch = pool.run_batch(
+        [
+            SymbolEvaluationJob(symbol="005930", fn=lambda: seen.append(threading.get_ident())),
+            SymbolEvaluationJob(symbol="000660", fn=lambda: seen.append(threading.get_ident())),
+        ]
+    )
+    pool.shutdown()
+
+    assert seen == [caller, caller]
+    assert batch.workers == 1
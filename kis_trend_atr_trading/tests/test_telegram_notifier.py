@@ -71,8 +71,8 @@ def disabled_notifier(mock_symbol_resolver):
 
 @pytest.fixture
 def mock_requests_post():
-    """requests.post를 Mock합니다."""
-    with patch('utils.telegram_notifier.requests.post') as mock_post:
+    """requests.Session.post를 Mock합니다."""
+    with patch('utils.telegram_notifier.requests.Session.post') as mock_post:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"ok": True, "result": {}}
@@ -179,7 +179,7 @@ class TestSendMessage:
     
     def test_send_message_api_failure(self, mock_telegram_notifier):
         """API 실패 시 재시도 테스트"""
-        with patch('utils.telegram_notifier.requests.post') as mock_post:
+        with patch('utils.telegram_notifier.requests.Session.post') as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 500
             mock_post.return_value = mock_response
@@ -197,7 +197,7 @@ class TestSendMessage:
         """타임아웃 발생 시 재시도 테스트"""
         from requests.exceptions import Timeout
         
-        with patch('utils.telegram_notifier.requests.post') as mock_post:
+        with patch('utils.telegram_notifier.requests.Session.post') as mock_post:
             mock_post.side_effect = Timeout("Connection timed out")
             
             # 재시도 대기 시간 최소화
@@ -211,7 +211,7 @@ class TestSendMessage:
 
     def test_send_message_client_error_stops_retry(self, mock_telegram_notifier):
         """4xx 오류는 즉시 실패 처리(재시도 안 함) 테스트"""
-        with patch('utils.telegram_notifier.requests.post') as mock_post:
+        with patch('utils.telegram_notifier.requests.Session.post') as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 400
             mock_response.json.return_value = {"description": "Bad Request: chat not found"}
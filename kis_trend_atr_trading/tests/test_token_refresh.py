@@ -9,7 +9,7 @@ from api.kis_api import KISApi, KISApiError
 from utils.market_hours import KST
 
 
-@patch("api.kis_api.requests.post")
+@patch("api.kis_api.requests.Session.post")
 def test_access_token_refresh_called_when_expiry_is_near(mock_post, tmp_path):
     mock_response = Mock()
     mock_response.status_code = 200
@@ -66,7 +66,7 @@ def test_auth_error_refresh_once_then_retry(status_code):
 
     with patch.object(KISApi, "_wait_for_rate_limit", return_value=None):
         with patch("api.kis_api.time.sleep", return_value=None):
-            with patch("api.kis_api.requests.get", side_effect=[first_response, second_response]) as mock_get:
+            with patch("api.kis_api.requests.Session.get", side_effect=[first_response, second_response]) as mock_get:
                 with patch.object(api, "get_access_token", side_effect=_refresh):
                     headers = {"authorization": "Bearer old_token"}
                     response = api._request_with_retry(
@@ -83,7 +83,7 @@ def test_auth_error_refresh_once_then_retry(status_code):
     assert second_headers["authorization"] == "Bearer new_token"
 
 
-@patch("api.kis_api.requests.post")
+@patch("api.kis_api.requests.Session.post")
 def test_missing_credentials_blocks_external_token_request(mock_post, tmp_path):
     with patch("api.kis_api.settings.APP_KEY", ""):
         with patch("api.kis_api.settings.APP_SECRET", ""):
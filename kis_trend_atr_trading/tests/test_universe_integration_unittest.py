@@ -30,6 +30,8 @@ ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
 from universe.universe_service import UniverseService  # type: ignore
+from utils.position_store import PositionStore, StoredPosition  # type: ignore
+from utils.state_store import close_state_stores  # type: ignore
 
 
 class _DummyKISWithBalance:
@@ -43,14 +45,16 @@ class _DummyKISWithBalance:
 class UniverseFlowIntegrationTests(unittest.TestCase):
     def _write_yaml(self, root: Path) -> Path:
         yaml_path = root / "universe.yaml"
+        # 셀렉터 캐시도 임시 디렉토리에 쓰도록 절대 경로 지정 (저장소 data/ 오염 방지)
+        cache_path = (root / "data" / "universe_cache.json").as_posix()
         yaml_path.write_text(
-            """
+            f"""
 universe:
   selection_method: "fixed"
   max_stocks: 5
   universe_size: 3
   max_positions: 3
-  universe_cache_file: "data/universe_cache.json"
+  universe_cache_file: "{cache_path}"
 stocks:
   - "005930"
   - "000660"
@@ -66,10 +70,23 @@ stocks:
             root = Path(td)
             data_dir = root / "data"
             data_dir.mkdir(parents=True, exist_ok=True)
-            (data_dir / "positions_REAL_051910.json").write_text(
-                json.dumps({"position": {"stock_code": "051910", "quantity": 1}}),
-                encoding="utf-8",
-            )
+            # 종목별 PositionStore 는 data/state_store.sqlite3 에 저장 (JSON 파일 없음)
+            for mode, code in (("REAL", "051910"), ("PAPER", "035720")):
+                store = PositionStore(file_path=data_dir / f"positions_{mode}_{code}.json")
+                store.save_position(
+                    StoredPosition(
+                        stock_code=code,
+                        entry_price=100.0,
+                        quantity=1,
+                        stop_loss=90.0,
+                        take_profit=120.0,
+                        entry_date="2026-03-04",
+                        atr_at_entry=1.0,
+                    )
+                )
+                store.flush()
+            self.assertEqual(list(data_dir.glob("positions_*.json")), [])
+            self.addCleanup(close_state_stores)
             yaml_path = self._write_yaml(root)
             service = UniverseService(
                 str(yaml_path),
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+websockets_server = pytest.importorskip("websockets.asyncio.server")
+crypto_aes = pytest.importorskip("Crypto.Cipher.AES")
+from Crypto.Util.Padding import pad  # noqa: E402
+
+from adapters.kis_ws.market_data import KISWSMarketDataProvider  # noqa: E402
+from adapters.kis_ws.ws_client import (  # noqa: E402
+    TR_EXECUTION_NOTICE_PAPER,
+    KISWSClient,
+    decrypt_execution_notice,
+)
+from api.fill_event_bus import FillEvent, FillEventBus  # noqa: E402
+from api.kis_api import KISApi  # noqa: E402
+
+AES_KEY = "k" * 32
+AES_IV = "i" * 16
+
+
+def _encrypt(text: str) -> str:
+    cipher = crypto_aes.new(AES_KEY.encode(), crypto_aes.MODE_CBC, AES_IV.encode())
+    return base64.b64encode(cipher.encrypt(pad(text.encode("utf-8"), crypto_aes.block_size))).decode()
+
+
+def _notice_record(order_no: str, qty: int, price: int, side_code: str = "02", cntg_yn: str = "2") -> str:
+    fields = [""] * 26
+    fields[0] = "testid"
+    fields[2] = order_no
+    fields[4] = side_code
+    fields[8] = "005930"
+    fields[9] = str(qty)
+    fields[10] = str(price)
+    fields[11] = "090105"
+    fields[12] = "0"
+    fields[13] = cntg_yn
+    fields[16] = "10"
+    return "^".join(fields)
+
+
+class FakeKISWSServer:
+    """로컬 WS 서버: 체결통보 구독 응답(AES key/iv) 후 준비된 통보 프레임을 재생"""
+
+    def __init__(self, notice_frames):
+        self._notice_frames = list(notice_frames)
+        self._loop = asyncio.new_event_loop()
+        self._server = None
+        self._release = None
+        self.subscriptions = []
+        self.url = ""
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    async def _handler(self, ws):
+        async for raw in ws:
+            body = json.loads(raw)["body"]["input"]
+            self.subscriptions.append((body["tr_id"], body["tr_key"]))
+            if body["tr_id"] != TR_EXECUTION_NOTICE_PAPER:
+                continue
+            await ws.send(
+                json.dumps(
+                    {
+                        "header": {"tr_id": body["tr_id"], "tr_key": body["tr_key"], "encrypt": "N"},
+                        "body": {
+                            "rt_cd": "0",
+                            "msg_cd": "OPSP0000",
+                            "msg1": "SUBSCRIBE SUCCESS",
+                            "output": {"iv": AES_IV, "key": AES_KEY},
+                        },
+                    }
+                )
+            )
+            await self._release.wait()
+            for frame in self._notice_frames:
+                await ws.send(frame)
+
+    def start(self) -> "FakeKISWSServer":
+        self._thread.start()
+
+        async def _start():
+            self._release = asyncio.Event()
+            self._server = await websockets_server.serve(self._handler, "127.0.0.1", 0)
+            return self._server.sockets[0].getsockname()[1]
+
+        port = asyncio.run_coroutine_threadsafe(_start(), self._loop).result(timeout=5)
+        self.url = f"ws://127.0.0.1:{port}"
+        return self
+
+    def replay(self) -> None:
+        self._loop.call_soon_threadsafe(self._release.set)
+
+    def close(self) -> None:
+        async def _close():
+            self._server.close()
+            await self._server.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(_close(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_decrypt_and_parse_execution_notice_records():
+    payload = _notice_record("0000012345", 4, 71000) + "^" + _notice_record("0000012345", 6, 71100)
+    plain = decrypt_execution_notice(_encrypt(payload), AES_KEY, AES_IV)
+
+    events = KISWSClient._parse_execution_notices(plain, record_count=2)
+
+    assert [(e.order_no, e.side, e.exec_qty, e.exec_price, e.is_fill) for e in events] == [
+        ("0000012345", "BUY", 4, 71000.0, True),
+        ("0000012345", "BUY", 6, 71100.0, True),
+    ]
+    assert events[0].executed_at.endswith("09:01:05+09:00")
+
+
+def test_fill_event_bus_accumulates_partial_fills_and_wakes_waiter():
+    bus = FillEventBus()
+    bus.publish(FillEvent(order_no="0000012345", stock_code="005930", side="BUY", exec_qty=4, exec_price=100.0))
+
+    threading.Timer(
+        0.05,
+        bus.publish,
+        args=(FillEvent(order_no="12345", stock_code="005930", side="BUY", exec_qty=6, exec_price=110.0),),
+    ).start()
+    summary = bus.wait_for("12345", expected_qty=10, timeout=2.0)
+
+    assert summary is not None
+    assert summary.filled_qty == 10
+    assert summary.avg_price == pytest.approx(106.0)
+    assert len(summary.fills) == 2
+
+
+def test_fill_event_bus_scopes_orders_by_trade_date_and_checks_symbol_side():
+    today = ["2026-03-11"]
+    bus = FillEventBus(trade_date_fn=lambda: today[0])
+    bus.publish(FillEvent(order_no="0000000001", stock_code="005930", side="BUY", exec_qty=10, exec_price=100.0))
+
+    # 다른 종목/매매구분 주문의 누적 현황은 받지 않는다
+    assert bus.wait_for("1", expected_qty=10, timeout=0.01, stock_code="000660", side="BUY") is None
+    assert bus.wait_for("1", expected_qty=10, timeout=0.01, stock_code="005930", side="SELL") is None
+    assert bus.wait_for("1", expected_qty=10, timeout=0.01, stock_code="005930", side="BUY").filled_qty == 10
+
+    # 주문번호는 매일 다시 시작: 다음 거래일의 같은 번호는 어제 체결로 완료되지 않는다
+    today[0] = "2026-03-12"
+    assert bus.wait_for("1", expected_qty=10, timeout=0.01) is None
+    assert bus.metrics()["tracked_orders"] == 0
+    bus.publish(FillEvent(order_no="1", stock_code="000660", side="SELL", exec_qty=3, exec_price=200.0))
+    summary = bus.wait_for("1", expected_qty=3, timeout=0.01, stock_code="000660", side="SELL")
+    assert (summary.filled_qty, summary.stock_code) == (3, "000660")
+
+
+def test_wait_for_execution_completes_on_ws_notice_without_rest_polling():
+    order_no = "0000012345"
+    frames = [
+        f"1|{TR_EXECUTION_NOTICE_PAPER}|001|" + _encrypt(_notice_record(order_no, 0, 0, cntg_yn="1")),
+        f"1|{TR_EXECUTION_NOTICE_PAPER}|002|"
+        + _encrypt(_notice_record(order_no, 4, 71000) + "^" + _notice_record(order_no, 6, 71100)),
+    ]
+    server = FakeKISWSServer(frames).start()
+    bus = FillEventBus()
+    ws_client = KISWSClient(
+        app_key="k",
+        app_secret="s",
+        is_paper_trading=True,
+        hts_id="testid",
+        execution_notice=True,
+        ws_url=server.url,
+    )
+    ws_client._approval_key = "approval"
+    ws_client._approval_key_expires_at = datetime.now() + timedelta(hours=12)
+    provider = KISWSMarketDataProvider(ws_client=ws_client, fill_event_bus=bus, tick_dispatch_workers=0)
+
+    api = KISApi(app_key="k", app_secret="s", account_no="00000000", is_paper_trading=True)
+    api._fill_event_bus = bus
+    api.get_order_status = MagicMock(side_effect=AssertionError("REST polling must not run"))
+
+    provider.subscribe_bars(["005930"], "1m", lambda _bar: None)
+    try:
+        assert _wait_until(bus.is_live)
+        threading.Timer(0.05, server.replay).start()
+        started = time.monotonic()
+        result = api.wait_for_execution(order_no=order_no, expected_qty=10, timeout_seconds=5)
+        elapsed = time.monotonic() - started
+    finally:
+        ws_client.stop()
+        server.close()
+        provider.stop()
+
+    assert result["status"] == "FILLED"
+    assert result["source"] == "ws_execution_notice"
+    assert result["exec_qty"] == 10
+    assert result["exec_price"] == pytest.approx(71060.0)
+    assert elapsed < 2.0
+    api.get_order_status.assert_not_called()
+    assert (TR_EXECUTION_NOTICE_PAPER, "testid") in server.subscriptions
+    assert provider.metrics()["ws_execution_notices"] == 3
+    assert _wait_until(lambda: not bus.is_live())
+
+
+def test_wait_for_execution_returns_immediately_on_rejection_notice(monkeypatch):
+    from config import settings
+
+    monkeypatch.setattr(settings, "WS_EXECUTION_NOTICE_REST_FALLBACK_SEC", 30.0, raising=False)
+    order_no = "0000012346"
+    bus = FillEventBus()
+    bus.set_live(True)
+    api = KISApi(app_key="k", app_secret="s", account_no="00000000", is_paper_trading=True)
+    api._fill_event_bus = bus
+    api.get_order_status = MagicMock(side_effect=AssertionError("REST polling must not run"))
+
+    bus.publish(FillEvent(order_no=order_no, stock_code="005930", side="BUY", exec_qty=3, exec_price=100.0))
+    threading.Timer(
+        0.05,
+        bus.publish,
+        args=(
+            FillEvent(
+                order_no=order_no,
+                stock_code="005930",
+                side="BUY",
+                exec_qty=0,
+                exec_price=0.0,
+                is_fill=False,
+                rejected=True,
+            ),
+        ),
+    ).start()
+    started = time.monotonic()
+    result = api.wait_for_execution(order_no=order_no, expected_qty=10, timeout_seconds=60)
+    elapsed = time.monotonic() - started
+
+    assert result["success"] is False
+    assert result["rejected"] is True
+    assert result["status"] == "PARTIAL"
+    assert result["exec_qty"] == 3
+    assert result["source"] == "ws_execution_notice"
+    assert elapsed < 2.0
+    api.get_order_status.assert_not_called()
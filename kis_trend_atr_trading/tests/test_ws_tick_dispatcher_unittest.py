@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+import sys
+import threading
+import time
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from adapters.kis_ws.bar_aggregator import MarketTick
+from adapters.kis_ws.market_data import KISWSMarketDataProvider
+from adapters.kis_ws.tick_dispatcher import TickDispatchQueue
+
+
+def test_dispatch_queue_coalesces_quotes_while_consumer_is_busy():
+    release = threading.Event()
+    delivered = []
+
+    def _slow_quote(code, snapshot):
+        delivered.append((code, snapshot["price"]))
+        if snapshot["price"] == 1:
+            release.wait(timeout=5)
+
+    queue = TickDispatchQueue(on_quote=_slow_quote, on_bar=lambda *_: None, workers=1)
+    queue.start()
+    try:
+        queue.put_quote("005930", {"price": 1})
+        time.sleep(0.05)  # 첫 시세 처리 중(consumer blocked)
+        for price in (2, 3, 4):
+            queue.put_quote("005930", {"price": price})
+        release.set()
+    finally:
+        queue.stop(drain=True)
+
+    assert delivered == [("005930", 1), ("005930", 4)]
+    metrics = queue.metrics()
+    assert metrics["dispatch_quotes_enqueued"] == 4
+    assert metrics["dispatch_quotes_coalesced"] == 2
+    assert metrics["dispatch_quotes_delivered"] == 2
+
+
+def test_dispatch_queue_drops_oldest_bars_when_symbol_backlog_is_full():
+    release = threading.Event()
+    delivered = []
+
+    def _bar(code, bar):
+        delivered.append(bar)
+        if bar == 0:
+            release.wait(timeout=5)
+
+    queue = TickDispatchQueue(
+        on_quote=lambda *_: None,
+        on_bar=_bar,
+        workers=2,
+        max_pending_bars_per_symbol=2,
+    )
+    queue.start()
+    try:
+        queue.put_bar("005930", 0)
+        time.sleep(0.05)
+        for bar in (1, 2, 3):
+            queue.put_bar("005930", bar)
+        release.set()
+    finally:
+        queue.stop(drain=True)
+
+    # 같은 종목은 worker 가 2개여도 순서대로 1개씩 처리
+    assert delivered == [0, 2, 3]
+    assert queue.metrics()["dispatch_bars_dropped"] == 1
+
+
+def test_ws_provider_recv_path_does_not_wait_for_slow_bar_callback():
+    provider = KISWSMarketDataProvider(tick_dispatch_workers=1)
+    release = threading.Event()
+    emitted = []
+
+    def _slow_bar(bar):
+        release.wait(timeout=5)
+        emitted.append(bar.start_at)
+
+    provider._on_bar_callback = _slow_bar
+    provider._dispatcher.start()
+    try:
+        started = time.monotonic()
+        for ts in (
+            datetime(2026, 2, 16, 9, 0, 5),
+            datetime(2026, 2, 16, 9, 1, 2),
+            datetime(2026, 2, 16, 9, 2, 2),
+        ):
+            provider._enqueue_tick(MarketTick("005930", price=100.0, volume=1, timestamp=ts))
+        enqueue_elapsed = time.monotonic() - started
+        # 완성봉 상태는 콜백 처리와 무관하게 즉시 반영
+        assert len(provider.get_recent_bars("005930", n=10, timeframe="1m")) == 2
+        release.set()
+    finally:
+        provider._dispatcher.stop(drain=True)
+
+    assert enqueue_elapsed < 0.5
+    assert emitted == [datetime(2026, 2, 16, 9, 0), datetime(2026, 2, 16, 9, 1)]
+    assert provider.metrics()["dispatch_bars_delivered"] == 2
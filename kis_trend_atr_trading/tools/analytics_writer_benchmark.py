@@ -0,0 +1,107 @@
+"""Caller-side cost of StrategyAnalyticsEventLogger.log_event: sync vs async writer.
+
+Measures the time the calling thread (timing / order worker in live) spends in
+`log_event`, then the time `close()` needs to drain the async queue. Written
+files are compared event for event.
+
+Example:
+  python tools/analytics_writer_benchmark.py --events 50000 --flush-each-write
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from analytics.event_logger import StrategyAnalyticsEventLogger, load_strategy_events
+
+TRADE_DATE = "2026-03-11"
+
+
+def _run(event_dir: str, events: int, *, async_write: bool, flush_each_write: bool, event_format: str) -> Dict[str, Any]:
+    logger = StrategyAnalyticsEventLogger(
+        event_dir=event_dir,
+        enabled=True,
+        flush_each_write=flush_each_write,
+        event_format=event_format,
+        async_write=async_write,
+        writer_queue_size=max(events, 1),
+        writer_overflow_policy="block",
+    )
+    base = datetime.fromisoformat(f"{TRADE_DATE}T09:00:00+09:00")
+    call_ns: List[int] = []
+    for idx in range(events):
+        started = time.perf_counter_ns()
+        logger.log_event(
+            event_ts=base + timedelta(milliseconds=idx),
+            trade_date=TRADE_DATE,
+            strategy_tag="pullback_rebreakout",
+            symbol=f"{idx % 200:06d}",
+            intent_id=f"intent-{idx // 5}",
+            event_type="timing_rejected",
+            stage="timing",
+            decision="rejected",
+            reject_reason="orb_intraday_stale",
+            source_component="benchmark",
+            payload_json={"current_price": 10_000 + idx % 50, "atr": 250.0},
+        )
+        call_ns.append(time.perf_counter_ns() - started)
+    started = time.perf_counter()
+    logger.close()
+    close_sec = time.perf_counter() - started
+    call_ns.sort()
+    result = {
+        "caller_total_sec": round(sum(call_ns) / 1e9, 3),
+        "caller_mean_us": round(sum(call_ns) / len(call_ns) / 1000, 2),
+        "caller_p99_us": round(call_ns[int(len(call_ns) * 0.99) - 1] / 1000, 2),
+        "close_drain_sec": round(close_sec, 3),
+    }
+    if async_write:
+        metrics = logger.metrics()
+        result["writer_batches"] = metrics["writer_batches"]
+        result["writer_dropped"] = metrics["writer_dropped_oldest"] + metrics["writer_dropped_new"]
+    return result
+
+
+def run_benchmark(events: int, flush_each_write: bool, event_format: str) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as sync_dir, tempfile.TemporaryDirectory() as async_dir:
+        sync = _run(sync_dir, events, async_write=False, flush_each_write=flush_each_write, event_format=event_format)
+        queued = _run(async_dir, events, async_write=True, flush_each_write=flush_each_write, event_format=event_format)
+        identical = load_strategy_events(event_dir=sync_dir, trade_date=TRADE_DATE) == load_strategy_events(
+            event_dir=async_dir, trade_date=TRADE_DATE
+        )
+    return {
+        "events": events,
+        "event_format": event_format,
+        "flush_each_write": flush_each_write,
+        "identical": identical,
+        "sync": sync,
+        "async": queued,
+        "caller_speedup": round(sync["caller_total_sec"] / max(queued["caller_total_sec"], 1e-9), 2),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=50_000)
+    parser.add_argument("--format", choices=("jsonl", "msgpack"), default="jsonl")
+    parser.add_argument("--flush-each-write", action="store_true")
+    args = parser.parse_args(argv)
+
+    result = run_benchmark(events=max(args.events, 1), flush_each_write=args.flush_each_write, event_format=args.format)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,214 @@
+"""Benchmark for the DailyContext recent_bars representation.
+
+Compares the previous row-dict tuple (`indicator_df.copy()` + `.tail().copy()`
++ `to_dict(orient="records")`) with the columnar `DailyBarColumns` container on:
+
+- memory retained per context (tracemalloc, includes NumPy buffers)
+- context build time
+- setup evaluation time via
+  `PullbackRebreakoutStrategy.evaluate_setup_candidate_from_daily_context`
+  (frame materialization + evaluator)
+
+Example:
+  python tools/daily_context_benchmark.py --symbols 256 --rows 120 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from config import settings
+from engine.pullback_pipeline_models import DAILY_BAR_COLUMNS, DailyBarColumns, DailyContext
+from strategy.pullback_rebreakout import PullbackRebreakoutStrategy
+from utils.market_hours import KST
+
+
+def make_indicator_frame(rows: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.normal(0.2, 1.0, rows))
+    frame = pd.DataFrame(
+        {
+            "date": pd.date_range(end=datetime(2026, 2, 20), periods=rows, freq="D"),
+            "open": close - 0.3,
+            "high": close + 1.2,
+            "low": close - 1.0,
+            "close": close,
+            "volume": rng.integers(100_000, 900_000, rows),
+        }
+    )
+    frame["atr"] = 2.0
+    frame["adx"] = 32.0
+    frame["ma"] = frame["close"].rolling(50, min_periods=1).mean()
+    frame["ma20"] = frame["close"].rolling(20, min_periods=1).mean()
+    frame["trend"] = np.where(frame["close"] > frame["ma"], "UPTREND", "DOWNTREND")
+    frame["prev_high"] = frame["high"].shift(1)
+    frame["prev_close"] = frame["close"].shift(1)
+    return frame
+
+
+def legacy_recent_bars(indicator_df: pd.DataFrame, required_bars: int) -> tuple:
+    """Local copy of the previous DailyRefreshThread._build_daily_context record path."""
+    normalized = indicator_df.copy().reset_index(drop=True)
+    minimal = normalized.tail(required_bars).copy().reset_index(drop=True)
+    keep_columns = [column for column in DAILY_BAR_COLUMNS if column in minimal.columns]
+    return tuple(minimal[keep_columns].to_dict(orient="records"))
+
+
+def columnar_recent_bars(indicator_df: pd.DataFrame, required_bars: int) -> DailyBarColumns:
+    return DailyBarColumns.from_frame(indicator_df.iloc[-required_bars:])
+
+
+def _context(symbol: str, recent_bars: Any) -> DailyContext:
+    return DailyContext(
+        symbol=symbol,
+        trade_date="2026-02-20",
+        context_version="bench",
+        recent_bars=recent_bars,
+        prev_high=0.0,
+        prev_close=0.0,
+        atr=2.0,
+        adx=32.0,
+        trend="UPTREND",
+        ma20=0.0,
+        ma50=0.0,
+        swing_high=0.0,
+        swing_low=0.0,
+        refreshed_at=datetime.now(KST),
+        source="benchmark",
+    )
+
+
+def _measure_build(
+    frames: Sequence[pd.DataFrame],
+    build: Callable[[pd.DataFrame, int], Any],
+    required_bars: int,
+) -> Dict[str, Any]:
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    started = time.perf_counter()
+    retained = [build(frame, required_bars) for frame in frames]
+    elapsed = time.perf_counter() - started
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "retained": retained,
+        "bytes_per_context": (current - baseline) / max(len(frames), 1),
+        "build_us_per_context": elapsed / max(len(frames), 1) * 1_000_000.0,
+    }
+
+
+def _time_setup_eval(
+    contexts: Sequence[DailyContext],
+    strategy: PullbackRebreakoutStrategy,
+    repeat: int,
+) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for context in contexts:
+            strategy.evaluate_setup_candidate_from_daily_context(
+                daily_context=context,
+                current_price=float(context.recent_bars[-1]["close"]),
+                stock_code=context.symbol,
+                check_time=datetime(2026, 2, 20, 10, 0),
+            )
+    elapsed = time.perf_counter() - started
+    return elapsed / max(len(contexts) * repeat, 1) * 1_000_000.0
+
+
+def _time_frame_only(contexts: Sequence[Any], to_frame: Callable[[Any], pd.DataFrame], repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for context in contexts:
+            to_frame(context)
+    elapsed = time.perf_counter() - started
+    return elapsed / max(len(contexts) * repeat, 1) * 1_000_000.0
+
+
+def run_benchmark(symbols: int, rows: int, required_bars: int, repeat: int) -> Dict[str, Any]:
+    frames = [make_indicator_frame(rows, seed) for seed in range(symbols)]
+    legacy = _measure_build(frames, legacy_recent_bars, required_bars)
+    columnar = _measure_build(frames, columnar_recent_bars, required_bars)
+
+    legacy_records = legacy.pop("retained")
+    columnar_bars = columnar.pop("retained")
+    legacy_frame_us = _time_frame_only(
+        legacy_records,
+        lambda records: pd.DataFrame([dict(bar) for bar in records]),
+        repeat,
+    )
+    columnar_frame_us = _time_frame_only(columnar_bars, lambda bars: bars.as_frame(), repeat)
+
+    previous_enabled = getattr(settings, "ENABLE_PULLBACK_REBREAKOUT_STRATEGY", False)
+    setattr(settings, "ENABLE_PULLBACK_REBREAKOUT_STRATEGY", True)
+    logging.disable(logging.CRITICAL)
+    try:
+        strategy = PullbackRebreakoutStrategy()
+        # Previous path: rebuild a DataFrame from row dicts, then evaluate.
+        legacy_eval_us = _time_frame_only(
+            legacy_records,
+            lambda records: strategy.evaluate_setup_candidate(
+                df=pd.DataFrame([dict(bar) for bar in records]),
+                current_price=float(records[-1]["close"]),
+                stock_code="005930",
+                check_time=datetime(2026, 2, 20, 10, 0),
+            ),
+            repeat,
+        )
+        contexts = [_context(f"{idx:06d}", bars) for idx, bars in enumerate(columnar_bars)]
+        columnar_eval_us = _time_setup_eval(contexts, strategy, repeat)
+    finally:
+        logging.disable(logging.NOTSET)
+        setattr(settings, "ENABLE_PULLBACK_REBREAKOUT_STRATEGY", previous_enabled)
+
+    return {
+        "symbols": symbols,
+        "rows_per_frame": rows,
+        "bars_per_context": required_bars,
+        "legacy_bytes_per_context": round(legacy["bytes_per_context"], 1),
+        "columnar_bytes_per_context": round(columnar["bytes_per_context"], 1),
+        "legacy_build_us": round(legacy["build_us_per_context"], 2),
+        "columnar_build_us": round(columnar["build_us_per_context"], 2),
+        "legacy_frame_us": round(legacy_frame_us, 2),
+        "columnar_frame_us": round(columnar_frame_us, 2),
+        "legacy_setup_eval_us": round(legacy_eval_us, 2),
+        "columnar_setup_eval_us": round(columnar_eval_us, 2),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--symbols", type=int, default=256, help="contexts to build (DailyContextStore default cap)")
+    parser.add_argument("--rows", type=int, default=120, help="indicator frame rows per symbol")
+    parser.add_argument("--bars", type=int, default=50, help="bars kept per context (TREND_MA_PERIOD default)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    result = run_benchmark(
+        symbols=max(args.symbols, 1),
+        rows=max(args.rows, args.bars),
+        required_bars=max(args.bars, 1),
+        repeat=max(args.repeat, 1),
+    )
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,196 @@
+"""Order-path DB write benchmark: per-row execute_command vs BufferedDbWriter.
+
+Simulates the multi-symbol loop recording one fill and one account snapshot
+per symbol per round against an in-process SQLite database that sleeps
+`--rtt-ms` for every round trip (a stand-in for the network hop to MySQL).
+
+- sync: TradeRepository/AccountSnapshotRepository without a writer
+        (one transaction per row on the trading thread)
+- buffered: the same repositories with a BufferedDbWriter
+        (snapshot rows grouped into executemany batches on a background
+        thread; fills stay synchronous in both modes because their INSERT
+        result decides whether the position is updated)
+
+Reports caller-side time (what the trading thread pays), the final flush
+barrier, and the number of DB round trips.
+
+Example:
+  python tools/db_write_buffer_benchmark.py --symbols 50 --rounds 20 --rtt-ms 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Sequence
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from db.repository import AccountSnapshotRepository, TradeRepository
+from db.write_buffer import BufferedDbWriter
+from utils.market_hours import KST
+
+_SCHEMA = """
+CREATE TABLE trades (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    symbol TEXT, side TEXT, price REAL, quantity INTEGER, executed_at TEXT,
+    reason TEXT, pnl REAL, pnl_percent REAL, entry_price REAL, holding_days INTEGER,
+    order_no TEXT, mode TEXT, idempotency_key TEXT UNIQUE
+);
+CREATE TABLE account_snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    snapshot_time TEXT, total_equity REAL, cash REAL, unrealized_pnl REAL,
+    realized_pnl REAL, mode TEXT, position_count INTEGER,
+    UNIQUE (snapshot_time, mode)
+);
+"""
+
+
+def _to_sqlite(sql: str) -> str:
+    sql = sql.replace("%s", "?")
+    if "ON DUPLICATE KEY UPDATE" in sql:
+        insert, update = sql.split("ON DUPLICATE KEY UPDATE")
+        verb = "INSERT OR IGNORE INTO" if update.strip().startswith("idempotency_key") else "INSERT OR REPLACE INTO"
+        sql = insert.replace("INSERT INTO", verb, 1)
+    return sql
+
+
+def _params(params: Sequence[Any]) -> tuple:
+    return tuple(value.isoformat() if isinstance(value, datetime) else value for value in params)
+
+
+class _LatencyDb:
+    """SQLite + 왕복마다 rtt 만큼 지연 (MySQLManager 인터페이스 일부)."""
+
+    def __init__(self, rtt_sec: float) -> None:
+        self.config = SimpleNamespace(enabled=True, database="bench")
+        self.conn = sqlite3.connect(":memory:", check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(_SCHEMA)
+        self.rtt_sec = rtt_sec
+        self.round_trips = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def transaction(self):
+        with self._lock:
+            self.round_trips += 1
+            time.sleep(self.rtt_sec)
+            sqlite_cursor = self.conn.cursor()
+            outer = self
+
+            class _Cursor:
+                @property
+                def rowcount(self) -> int:
+                    return sqlite_cursor.rowcount
+
+                def execute(self, sql: str, params: Sequence[Any] = ()) -> None:
+                    sqlite_cursor.execute(_to_sqlite(sql), _params(params))
+
+                def executemany(self, sql: str, rows: List[Sequence[Any]]) -> None:
+                    sqlite_cursor.executemany(_to_sqlite(sql), [_params(row) for row in rows])
+
+            try:
+                yield _Cursor()
+                outer.conn.commit()
+            except Exception:
+                outer.conn.rollback()
+                raise
+
+    def execute_query(self, query: str, params: Sequence[Any] = (), fetch_one: bool = False):
+        with self._lock:
+            self.round_trips += 1
+            time.sleep(self.rtt_sec)
+            rows = [dict(row) for row in self.conn.execute(_to_sqlite(query), _params(params))]
+        if fetch_one:
+            return rows[0] if rows else None
+        return rows
+
+    def execute_command(self, command: str, params: Sequence[Any] = ()) -> int:
+        with self.transaction() as cursor:
+            cursor.execute(command, params)
+            return cursor.rowcount
+
+    def count(self, table: str) -> int:
+        with self._lock:
+            return int(self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0])
+
+
+def run(symbols: List[str], rounds: int, rtt_sec: float, buffered: bool) -> Dict[str, Any]:
+    db = _LatencyDb(rtt_sec)
+    writer = BufferedDbWriter(db, batch_rows=200, flush_interval_sec=1.0) if buffered else None
+    trades = TradeRepository(db=db, writer=writer)
+    snapshots = AccountSnapshotRepository(db=db, writer=writer)
+    base = datetime(2026, 3, 11, 9, 0, tzinfo=KST)
+
+    started = time.perf_counter()
+    for round_idx in range(rounds):
+        for symbol_idx, symbol in enumerate(symbols):
+            seq = round_idx * len(symbols) + symbol_idx
+            trades.save_execution_fill(
+                symbol=symbol,
+                side="BUY",
+                price=70000,
+                quantity=1,
+                executed_at=base + timedelta(seconds=seq),
+                order_no=f"A{seq:06d}",
+                exec_id=f"E{seq:06d}",
+            )
+            snapshots.save(
+                total_equity=10_000_000 + seq,
+                cash=5_000_000,
+                snapshot_time=(base + timedelta(seconds=seq)).replace(tzinfo=None),
+            )
+    caller_sec = time.perf_counter() - started
+
+    started = time.perf_counter()
+    if writer is not None:
+        writer.flush(timeout=60.0)
+        writer.close()
+    barrier_sec = time.perf_counter() - started
+    return {
+        "caller_sec": round(caller_sec, 3),
+        "barrier_sec": round(barrier_sec, 3),
+        "round_trips": db.round_trips,
+        "rows": db.count("trades") + db.count("account_snapshots"),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--rtt-ms", type=float, default=2.0)
+    args = parser.parse_args(argv)
+
+    symbols = [f"{idx:06d}" for idx in range(max(args.symbols, 1))]
+    rounds = max(args.rounds, 1)
+    rtt_sec = max(args.rtt_ms, 0.0) / 1000.0
+    sync = run(symbols, rounds, rtt_sec, buffered=False)
+    buffered = run(symbols, rounds, rtt_sec, buffered=True)
+    writes = rounds * len(symbols) * 2
+    result = {
+        "symbols": len(symbols),
+        "rounds": rounds,
+        "writes": writes,
+        "rtt_ms": args.rtt_ms,
+        "sync": {**sync, "us_per_write": round(sync["caller_sec"] / writes * 1_000_000, 1)},
+        "buffered": {**buffered, "us_per_write": round(buffered["caller_sec"] / writes * 1_000_000, 1)},
+        "caller_speedup": round(sync["caller_sec"] / max(buffered["caller_sec"], 1e-9), 1),
+    }
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,153 @@
+"""Write/read benchmark for strategy analytics event formats (jsonl vs msgpack).
+
+Builds a synthetic day of events once (build_event is format independent),
+then for each format measures:
+
+- append: `StrategyAnalyticsEventLogger.append` per event (hot-path write cost)
+- load: `load_strategy_events` for the trade date (offline read cost)
+- file size on disk
+
+Loaded events are compared across formats record for record (via a digest).
+
+Example:
+  python tools/event_codec_benchmark.py --events 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import hashlib
+import json
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from analytics.event_logger import (
+    EVENT_FORMAT_JSONL,
+    EVENT_FORMAT_MSGPACK,
+    StrategyAnalyticsEventLogger,
+    load_strategy_events,
+    strategy_event_file_path,
+)
+
+TRADE_DATE = "2026-03-11"
+EVENT_SPECS = (
+    ("candidate_created", "setup", "accepted", ""),
+    ("timing_confirmed", "timing", "accepted", ""),
+    ("timing_rejected", "timing", "rejected", "orb_intraday_stale"),
+    ("intent_ingressed", "ingress", "accepted", ""),
+    ("precheck_rejected", "precheck", "rejected", "existing_position"),
+    ("order_submitted", "order", "submitted", ""),
+    ("order_filled", "order", "filled", ""),
+)
+STRATEGIES = ("pullback_rebreakout", "opening_range_breakout", "trend_atr")
+
+
+def build_events(events: int, symbols: int, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    builder = StrategyAnalyticsEventLogger(enabled=False)
+    session_start = datetime.fromisoformat(f"{TRADE_DATE}T09:00:00+09:00")
+    rows: List[Dict[str, Any]] = []
+    for idx in range(events):
+        event_type, stage, decision, reject_reason = EVENT_SPECS[idx % len(EVENT_SPECS)]
+        payload: Dict[str, Any] = {
+            "current_price": 10_000 + rng.randint(-50, 50),
+            "atr": round(rng.uniform(100.0, 400.0), 2),
+            "queue_wait_ms": rng.randint(0, 50),
+        }
+        if event_type == "order_filled":
+            payload = {"fill_price": 10_000 + rng.randint(-50, 50), "side": "BUY", "qty": rng.randint(1, 20)}
+        rows.append(
+            builder.build_event(
+                event_ts=session_start + timedelta(microseconds=rng.randint(0, 390 * 60 * 1_000_000)),
+                trade_date=TRADE_DATE,
+                strategy_tag=STRATEGIES[idx % len(STRATEGIES)],
+                symbol=f"{rng.randrange(symbols):06d}",
+                intent_id=f"intent-{idx // 7}",
+                event_type=event_type,
+                stage=stage,
+                decision=decision,
+                reject_reason=reject_reason,
+                regime_state="bull",
+                source_component="benchmark",
+                payload_json=payload,
+            )
+        )
+    return rows
+
+
+def _digest(events: List[Dict[str, Any]]) -> str:
+    """Loaded-event fingerprint, so one format's result is not kept alive (and GC-scanned) during the next run."""
+    digest = hashlib.sha1()
+    for event in events:
+        row = {key: value for key, value in event.items() if key != "_line_index"}
+        digest.update(json.dumps(row, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def measure_format(event_format: str, events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as event_dir:
+        writer = StrategyAnalyticsEventLogger(event_dir=event_dir, enabled=True, event_format=event_format)
+        gc.collect()
+        started = time.perf_counter()
+        for event in events:
+            writer.append(event)
+        writer.close()
+        append_sec = time.perf_counter() - started
+        size_bytes = strategy_event_file_path(Path(event_dir), TRADE_DATE, event_format).stat().st_size
+
+        gc.collect()
+        started = time.perf_counter()
+        loaded = load_strategy_events(event_dir=event_dir, trade_date=TRADE_DATE)
+        load_sec = time.perf_counter() - started
+        digest = _digest(loaded)
+        del loaded
+    return {
+        "append_sec": round(append_sec, 3),
+        "append_us_per_event": round(append_sec / max(len(events), 1) * 1_000_000, 2),
+        "load_sec": round(load_sec, 3),
+        "size_mb": round(size_bytes / 1_048_576, 2),
+        "digest": digest,
+    }
+
+
+def run_benchmark(events: int, symbols: int, seed: int) -> Dict[str, Any]:
+    rows = build_events(events, symbols, seed)
+    jsonl = measure_format(EVENT_FORMAT_JSONL, rows)
+    binary = measure_format(EVENT_FORMAT_MSGPACK, rows)
+    identical = jsonl.pop("digest") == binary.pop("digest")
+    return {
+        "events": events,
+        "symbols": symbols,
+        "identical": identical,
+        "jsonl": jsonl,
+        "msgpack": binary,
+        "append_speedup": round(jsonl["append_sec"] / max(binary["append_sec"], 1e-9), 2),
+        "load_speedup": round(jsonl["load_sec"] / max(binary["load_sec"], 1e-9), 2),
+        "size_ratio": round(binary["size_mb"] / max(jsonl["size_mb"], 1e-9), 3),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    result = run_benchmark(events=max(args.events, 1), symbols=max(args.symbols, 1), seed=args.seed)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
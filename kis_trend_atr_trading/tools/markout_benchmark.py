@@ -0,0 +1,176 @@
+"""Benchmark for StrategyAnalyticsMaterializer.build_markout_rows.
+
+Builds a synthetic trading day (quote events spread over many symbols plus a
+share of BUY fills) and compares the previous per-row linear scan with the
+per-symbol sorted NumPy arrays + `searchsorted` path:
+
+- index build time
+- markout computation time
+- row-for-row parity of the two outputs
+
+Example:
+  python tools/markout_benchmark.py --events 1000000 --symbols 200 --fill-ratio 0.002
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from analytics.materializer import StrategyAnalyticsMaterializer, _parse_ts, _safe_float
+
+
+def make_events(events: int, symbols: int, fill_ratio: float, seed: int) -> List[Dict[str, Any]]:
+    """Quotes over one 09:00-15:30 KST session; `fill_ratio` of events are BUY fills."""
+    rng = np.random.default_rng(seed)
+    session_start = datetime.fromisoformat("2026-03-11T09:00:00+09:00")
+    offsets_us = np.sort(rng.integers(0, 390 * 60 * 1_000_000, events))
+    symbol_ids = rng.integers(0, symbols, events)
+    prices = 10_000.0 + np.round(rng.normal(0.0, 50.0, events), 0)
+    is_fill = rng.random(events) < fill_ratio
+    rows: List[Dict[str, Any]] = []
+    for offset_us, symbol_id, price, fill in zip(offsets_us.tolist(), symbol_ids.tolist(), prices.tolist(), is_fill.tolist()):
+        event_ts = (session_start + timedelta(microseconds=offset_us)).isoformat()
+        symbol = f"{symbol_id:06d}"
+        if fill:
+            rows.append(
+                {
+                    "event_ts": event_ts,
+                    "symbol": symbol,
+                    "event_type": "order_filled",
+                    "strategy_tag": "opening_range_breakout",
+                    "payload_json": {"fill_price": price, "side": "BUY"},
+                }
+            )
+        else:
+            rows.append(
+                {
+                    "event_ts": event_ts,
+                    "symbol": symbol,
+                    "event_type": "quote_observed",
+                    "payload_json": {"current_price": price},
+                }
+            )
+    return rows
+
+
+def legacy_markout_rows(
+    trade_date: str,
+    events: Sequence[Dict[str, Any]],
+    horizons_sec: Sequence[int],
+    materializer: StrategyAnalyticsMaterializer,
+) -> List[Dict[str, Any]]:
+    """Local copy of the previous list index + `_next_observation` linear scan."""
+    index: Dict[str, List[Any]] = defaultdict(list)
+    for event in events:
+        observation = materializer._extract_price_observation(event)
+        if observation is not None:
+            index[observation.symbol].append(observation)
+    for symbol in list(index.keys()):
+        index[symbol].sort(key=lambda item: item.ts)
+
+    rows: List[Dict[str, Any]] = []
+    for event in events:
+        if str(event.get("event_type") or "") != "order_filled":
+            continue
+        payload = dict(event.get("payload_json") or {})
+        if str(payload.get("side") or "BUY").upper() != "BUY":
+            continue
+        entry_ts = _parse_ts(event.get("event_ts"))
+        symbol = str(event.get("symbol") or "").zfill(6)
+        ref_price = _safe_float(payload.get("fill_price") or payload.get("exec_price") or payload.get("price"))
+        if entry_ts is None or not symbol or ref_price is None or ref_price <= 0.0:
+            continue
+        for horizon_sec in horizons_sec:
+            target_ts = entry_ts + timedelta(seconds=int(horizon_sec))
+            observation = next((item for item in index.get(symbol, []) if item.ts >= target_ts), None)
+            rows.append(
+                {
+                    "trade_date": trade_date,
+                    "strategy_tag": str(event.get("strategy_tag") or ""),
+                    "symbol": symbol,
+                    "entry_ts": entry_ts,
+                    "horizon_sec": int(horizon_sec),
+                    "intent_id": str(event.get("intent_id") or ""),
+                    "broker_order_id": str(event.get("broker_order_id") or ""),
+                    "ref_price": float(ref_price),
+                    "mark_price": None if observation is None else float(observation.price),
+                    "markout_bps": (
+                        None
+                        if observation is None
+                        else ((float(observation.price) / float(ref_price)) - 1.0) * 10000.0
+                    ),
+                    "source_type": "na" if observation is None else str(observation.source_type or "quote"),
+                }
+            )
+    return rows
+
+
+def run_benchmark(events: int, symbols: int, fill_ratio: float, horizons_sec: Sequence[int], seed: int) -> Dict[str, Any]:
+    materializer = StrategyAnalyticsMaterializer(
+        db_manager=object(),
+        markout_horizons_sec=list(horizons_sec),
+        enable_markouts=True,
+    )
+    horizons = materializer._markout_horizons_sec
+    rows = make_events(events, symbols, fill_ratio, seed)
+
+    started = time.perf_counter()
+    materializer._build_price_index(rows)
+    index_sec = time.perf_counter() - started
+
+    started = time.perf_counter()
+    vectorized = materializer.build_markout_rows("2026-03-11", rows)
+    vectorized_sec = time.perf_counter() - started
+
+    started = time.perf_counter()
+    legacy = legacy_markout_rows("2026-03-11", rows, horizons, materializer)
+    legacy_sec = time.perf_counter() - started
+
+    return {
+        "events": events,
+        "symbols": symbols,
+        "fills": sum(1 for row in rows if row["event_type"] == "order_filled"),
+        "horizons_sec": list(horizons),
+        "markout_rows": len(vectorized),
+        "identical": vectorized == legacy,
+        "price_index_sec": round(index_sec, 3),
+        "legacy_markout_sec": round(legacy_sec, 3),
+        "vectorized_markout_sec": round(vectorized_sec, 3),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=1_000_000, help="synthetic events in the day")
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--fill-ratio", type=float, default=0.002, help="share of events that are BUY fills")
+    parser.add_argument("--horizons", default="60,180,300,600", help="comma-separated markout horizons (sec)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    result = run_benchmark(
+        events=max(args.events, 1),
+        symbols=max(args.symbols, 1),
+        fill_ratio=min(max(args.fill_ratio, 0.0), 1.0),
+        horizons_sec=[int(token) for token in str(args.horizons).split(",") if token.strip()],
+        seed=args.seed,
+    )
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,156 @@
+"""Peak-memory benchmark for StrategyAnalyticsMaterializer.materialize_trade_date.
+
+Writes a synthetic strategy_events_<date>.jsonl (shuffled event_ts order, so
+the loader really has to sort), then compares:
+
+- batch: `load_strategy_events` + the per-builder `build_*` passes (previous path)
+- stream: `materialize_trade_date` (chunked sort runs + k-way merge, single pass)
+
+Peak Python heap is measured with tracemalloc (separately from wall time);
+outputs are compared row for row.
+
+Example:
+  python tools/materializer_stream_benchmark.py --events 200000 --chunk 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from analytics.event_logger import StrategyAnalyticsEventLogger, load_strategy_events
+from analytics.materializer import StrategyAnalyticsMaterializer
+from config import settings
+
+TRADE_DATE = "2026-03-11"
+EVENT_SPECS = (
+    ("candidate_created", "setup", "accepted", ""),
+    ("timing_confirmed", "timing", "accepted", ""),
+    ("timing_rejected", "timing", "rejected", "orb_intraday_stale"),
+    ("intent_ingressed", "ingress", "accepted", ""),
+    ("precheck_rejected", "precheck", "rejected", "existing_position"),
+    ("order_submitted", "order", "submitted", ""),
+    ("order_filled", "order", "filled", ""),
+)
+STRATEGIES = ("pullback_rebreakout", "opening_range_breakout", "trend_atr")
+
+
+def write_events(event_dir: str, events: int, symbols: int, seed: int) -> None:
+    rng = random.Random(seed)
+    writer = StrategyAnalyticsEventLogger(event_dir=event_dir, enabled=True)
+    session_start = datetime.fromisoformat(f"{TRADE_DATE}T09:00:00+09:00")
+    for idx in range(events):
+        event_type, stage, decision, reject_reason = EVENT_SPECS[idx % len(EVENT_SPECS)]
+        payload: Dict[str, Any] = {"current_price": 10_000 + rng.randint(-50, 50)}
+        if event_type == "order_filled":
+            payload = {"fill_price": 10_000 + rng.randint(-50, 50), "side": "BUY"}
+        writer.log_event(
+            event_ts=session_start + timedelta(microseconds=rng.randint(0, 390 * 60 * 1_000_000)),
+            trade_date=TRADE_DATE,
+            strategy_tag=STRATEGIES[idx % len(STRATEGIES)],
+            symbol=f"{rng.randrange(symbols):06d}",
+            intent_id=f"intent-{idx // 7}",
+            event_type=event_type,
+            stage=stage,
+            decision=decision,
+            reject_reason=reject_reason,
+            source_component="benchmark",
+            payload_json=payload,
+        )
+    writer.close()
+
+
+def batch_materialize(materializer: StrategyAnalyticsMaterializer, event_dir: str) -> Dict[str, Any]:
+    """Previous path: whole day in a list, one pass per builder."""
+    events = load_strategy_events(event_dir=event_dir, trade_date=TRADE_DATE)
+    reject_rows = materializer.build_reject_reason_rows(TRADE_DATE, events)
+    markout_rows = materializer.build_markout_rows(TRADE_DATE, events)
+    return {
+        "event_count": len(events),
+        "summary_rows": materializer.build_daily_summary_rows(TRADE_DATE, events, reject_rows, markout_rows),
+        "reject_rows": reject_rows,
+        "funnel_rows": materializer.build_funnel_rows(TRADE_DATE, events),
+        "attribution_rows": materializer.build_attribution_rows(TRADE_DATE, events),
+        "markout_rows": markout_rows,
+    }
+
+
+def _measure(fn: Callable[[], Dict[str, Any]]) -> Tuple[Dict[str, Any], float, int]:
+    """Wall time from an untraced run, peak heap from a second tracemalloc run."""
+    gc.collect()
+    started = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - started
+    del result
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def run_benchmark(events: int, symbols: int, chunk: int, seed: int) -> Dict[str, Any]:
+    previous_chunk = getattr(settings, "STRATEGY_ANALYTICS_SORT_CHUNK_EVENTS", 100000)
+    setattr(settings, "STRATEGY_ANALYTICS_SORT_CHUNK_EVENTS", chunk)
+    try:
+        with tempfile.TemporaryDirectory() as event_dir:
+            write_events(event_dir, events, symbols, seed)
+            materializer = StrategyAnalyticsMaterializer(
+                event_dir=event_dir,
+                db_manager=object(),
+                markout_horizons_sec=[60, 180, 300, 600],
+                enable_markouts=True,
+            )
+            batch, batch_sec, batch_peak = _measure(lambda: batch_materialize(materializer, event_dir))
+            stream, stream_sec, stream_peak = _measure(
+                lambda: materializer.materialize_trade_date(trade_date=TRADE_DATE, persist=False)
+            )
+    finally:
+        setattr(settings, "STRATEGY_ANALYTICS_SORT_CHUNK_EVENTS", previous_chunk)
+
+    return {
+        "events": events,
+        "symbols": symbols,
+        "chunk_events": chunk,
+        "identical": all(stream[key] == value for key, value in batch.items()),
+        "batch_sec": round(batch_sec, 3),
+        "stream_sec": round(stream_sec, 3),
+        "batch_peak_mb": round(batch_peak / 1_048_576, 1),
+        "stream_peak_mb": round(stream_peak / 1_048_576, 1),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--chunk", type=int, default=20_000, help="STRATEGY_ANALYTICS_SORT_CHUNK_EVENTS for the run")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    result = run_benchmark(
+        events=max(args.events, 1),
+        symbols=max(args.symbols, 1),
+        chunk=max(args.chunk, 1),
+        seed=args.seed,
+    )
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,103 @@
+"""Parallel parameter sweep / walk-forward optimizer over PortfolioBacktester.
+
+Input is a directory of per-symbol CSV files (``<stock_code>.csv``) with
+``date, open, high, low, close, volume`` columns.
+
+Example:
+  python tools/parameter_sweep.py --data-dir data/ohlcv \
+      --grid atr_multiplier_sl=1.5,2.0 --grid ma_period=20,50 \
+      --train-days 500 --test-days 120 \
+      --checkpoint data/sweep_checkpoint.jsonl --output data/sweep_results.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backtest.parameter_sweep import (
+    ParameterSweepRunner,
+    build_parameter_grid,
+    build_walk_forward_windows,
+    sample_random_parameters,
+)
+
+
+def _parse_space(tokens: Sequence[str]) -> Dict[str, List[float]]:
+    space: Dict[str, List[float]] = {}
+    for token in tokens:
+        name, _, raw_values = str(token).partition("=")
+        if not name or not raw_values:
+            raise ValueError(f"invalid --grid token: {token!r} (expected name=v1,v2)")
+        space[name.strip()] = [float(value) for value in raw_values.split(",") if value.strip()]
+    return space
+
+
+def _load_frames(data_dir: Path) -> Dict[str, pd.DataFrame]:
+    frames: Dict[str, pd.DataFrame] = {}
+    for path in sorted(data_dir.glob("*.csv")):
+        frame = pd.read_csv(path, parse_dates=["date"])
+        frames[path.stem.zfill(6)] = frame
+    return frames
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Parallel parameter sweep over PortfolioBacktester")
+    parser.add_argument("--data-dir", required=True, help="Directory of <stock_code>.csv OHLCV files")
+    parser.add_argument("--grid", action="append", default=[], help="Parameter values: name=v1,v2,...")
+    parser.add_argument("--random-samples", type=int, default=0, help="Random search size (0 = full grid)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--train-days", type=int, default=0, help="Walk-forward in-sample trading days")
+    parser.add_argument("--test-days", type=int, default=0, help="Walk-forward out-of-sample trading days")
+    parser.add_argument("--step-days", type=int, default=0)
+    parser.add_argument("--max-positions", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--checkpoint", help="Results checkpoint JSONL (resume after crash)")
+    parser.add_argument("--output", required=True, help="Ranked results CSV path")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _build_parser().parse_args(argv)
+    frames = _load_frames(Path(args.data_dir))
+    if not frames:
+        sys.stderr.write(f"no CSV files found in {args.data_dir}\n")
+        return 1
+
+    space = _parse_space(args.grid)
+    if args.random_samples > 0:
+        params_list = sample_random_parameters(space, args.random_samples, seed=args.seed)
+    else:
+        params_list = build_parameter_grid(space)
+
+    windows = None
+    if args.train_days > 0 and args.test_days > 0:
+        all_dates = pd.concat([frame["date"] for frame in frames.values()])
+        windows = build_walk_forward_windows(
+            all_dates,
+            train_days=args.train_days,
+            test_days=args.test_days,
+            step_days=args.step_days or None,
+        )
+
+    runner = ParameterSweepRunner(
+        frames,
+        checkpoint_path=args.checkpoint,
+        max_workers=args.workers,
+        max_positions=args.max_positions,
+    )
+    table = runner.run(params_list, windows=windows, output_path=args.output)
+    sys.stdout.write(table.head(20).to_string(index=False) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,228 @@
+"""Startup schema-introspection benchmark: per-call information_schema vs SchemaCatalog.
+
+Replays the schema checks a process performs at startup against an in-memory
+MySQL stand-in that sleeps `--rtt-ms` for every round trip:
+
+- MySQLManager.initialize_schema() (column/index/PK migration checks)
+- PositionRepository() positions schema detection
+- `--symbols` MultidayExecutor report-table column lookups (trades, account_snapshots)
+- DailyReportService schema checks
+
+Modes:
+- before: every lookup issues its own information_schema query (the catalog is
+          reloaded per lookup, and executors/daily report use their direct
+          per-instance queries), which matches the pre-catalog query pattern
+- catalog: one shared SchemaCatalog load serves every lookup
+
+Each mode runs twice: on an empty database ("fresh", migrations create
+everything) and again on the migrated database ("restart").
+
+Example:
+  python tools/schema_catalog_benchmark.py --symbols 50 --rtt-ms 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+from unittest.mock import Mock
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from db.mysql import DatabaseConfig, MySQLError, MySQLManager
+from db.repository import PositionRepository
+from db.schema_catalog import SchemaCatalog
+from engine.multiday_executor import MultidayExecutor
+from reporting.daily_report_service import DailyReportService
+
+
+class _FakeSchema:
+    """CREATE/ALTER/CREATE INDEX 만 해석하는 메모리 스키마."""
+
+    def __init__(self) -> None:
+        self.columns: Dict[str, List[str]] = {}
+        self.indexes: Dict[str, Dict[str, List[str]]] = {}
+
+    def _table(self, name: str) -> str:
+        if name not in self.columns:
+            raise MySQLError(f"1146: Table 'bench.{name}' doesn't exist")
+        return name
+
+    def apply(self, sql: str) -> None:
+        text = " ".join(sql.replace("`", "").split())
+        create = re.match(r"CREATE TABLE IF NOT EXISTS (\w+) \((.*)\)", text, re.I)
+        if create:
+            table = create.group(1)
+            if table in self.columns:
+                return
+            self.columns[table], self.indexes[table] = [], {}
+            for part in re.split(r",(?![^()]*\))", create.group(2)):
+                tokens = part.strip().split()
+                head = tokens[0].upper()
+                if head == "PRIMARY":
+                    self.indexes[table]["PRIMARY"] = re.findall(r"\w+", part.split("(", 1)[1])
+                elif head in ("UNIQUE", "KEY", "INDEX"):
+                    name = tokens[2] if head == "UNIQUE" else tokens[1]
+                    self.indexes[table][name] = re.findall(r"\w+", part.split("(", 1)[1])
+                else:
+                    self.columns[table].append(tokens[0])
+                    if "PRIMARY KEY" in part.upper():
+                        self.indexes[table]["PRIMARY"] = [tokens[0]]
+            return
+        add_column = re.match(r"ALTER TABLE (\w+) ADD COLUMN (\w+)", text, re.I)
+        if add_column:
+            self.columns[self._table(add_column.group(1))].append(add_column.group(2))
+            return
+        add_pk = re.match(r"ALTER TABLE (\w+) .*ADD PRIMARY KEY \((.*)\)", text, re.I)
+        if add_pk:
+            self.indexes[self._table(add_pk.group(1))]["PRIMARY"] = re.findall(r"\w+", add_pk.group(2))
+            return
+        add_index = re.match(r"CREATE (?:UNIQUE )?INDEX (\w+) ON (\w+)\((.*)\)", text, re.I)
+        if add_index:
+            self.indexes[self._table(add_index.group(2))][add_index.group(1)] = re.findall(r"\w+", add_index.group(3))
+
+
+class _LatencyManager(MySQLManager):
+    """information_schema 를 메모리 스키마로 응답 + 왕복마다 rtt 지연."""
+
+    def __init__(self, schema: _FakeSchema, rtt_sec: float) -> None:
+        super().__init__(DatabaseConfig(database="bench"))
+        self.config.enabled = True  # DB_ENABLED 환경변수와 무관하게 활성
+        self.schema = schema
+        self.rtt_sec = rtt_sec
+        self.round_trips = 0
+        self.introspection_queries = 0
+        self._connected = True
+        self._pool = object()
+
+    def _round_trip(self, sql: str) -> None:
+        self.round_trips += 1
+        if "information_schema" in sql:
+            self.introspection_queries += 1
+        time.sleep(self.rtt_sec)
+
+    def _get_connection(self):
+        manager = self
+
+        class _Cursor:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def execute(self, sql, params=None):
+                manager._round_trip(sql)
+                manager.schema.apply(sql)
+
+        return SimpleNamespace(cursor=lambda **_: _Cursor(), commit=lambda: None, rollback=lambda: None, close=lambda: None)
+
+    def execute_query(self, query, params=None, fetch_one=False):
+        self._round_trip(query)
+        text = " ".join(query.split())
+        rows: List[Dict[str, Any]]
+        if "entry_kind" in text:
+            rows = []
+            for table, columns in self.schema.columns.items():
+                rows.extend(
+                    {"entry_kind": "COLUMN", "entry_table": table, "entry_column": name,
+                     "entry_position": idx + 1, "entry_index": None, "entry_data_type": "varchar",
+                     "entry_nullable": "YES", "entry_default": None, "entry_extra": ""}
+                    for idx, name in enumerate(columns)
+                )
+                for index, index_columns in self.schema.indexes[table].items():
+                    rows.extend(
+                        {"entry_kind": "INDEX", "entry_table": table, "entry_column": name,
+                         "entry_position": idx + 1, "entry_index": index}
+                        for idx, name in enumerate(index_columns)
+                    )
+        elif "information_schema.columns" in text:
+            table = "positions" if "'positions'" in text else params[1]
+            names = self.schema.columns.get(table, [])
+            if "COUNT(*)" in text:
+                rows = [{"cnt": sum(1 for name in names if name in ("current_price", "unrealized_pnl"))}]
+            else:
+                rows = [{"column_name": name} for name in names]
+        elif "information_schema.key_column_usage" in text:
+            rows = [{"column_name": name} for name in self.schema.indexes.get("daily_summary", {}).get("PRIMARY", [])]
+        else:
+            rows = []
+        if fetch_one:
+            return rows[0] if rows else None
+        return rows
+
+
+class _PerLookupCatalog(SchemaCatalog):
+    """비교용: 조회마다 다시 로드 (조회 1회 = information_schema 쿼리 1회)."""
+
+    def _get_table(self, table_name):
+        self.invalidate()
+        return super()._get_table(table_name)
+
+
+def _legacy_view(db: _LatencyManager) -> Any:
+    # 카탈로그가 없는 DB 객체 → 실행기/일일 리포트는 기존 직접 조회 경로를 사용
+    return SimpleNamespace(config=db.config, execute_query=db.execute_query, table_exists=db.table_exists)
+
+
+def run(schema: _FakeSchema, symbols: int, rtt_sec: float, use_catalog: bool) -> Dict[str, Any]:
+    db = _LatencyManager(schema, rtt_sec)
+    if not use_catalog:
+        db.schema_catalog = _PerLookupCatalog(db)
+    lookup_db = db if use_catalog else _legacy_view(db)
+    PositionRepository.clear_schema_cache_for_tests()
+
+    started = time.perf_counter()
+    db.initialize_schema()
+    PositionRepository(db=db)
+    for _ in range(symbols):
+        executor = SimpleNamespace(
+            _report_db=lookup_db,
+            _report_table_columns={},
+            _report_db_available=lambda: True,
+        )
+        MultidayExecutor._get_report_table_columns(executor, "trades")
+        MultidayExecutor._get_report_table_columns(executor, "account_snapshots")
+    service = DailyReportService(db=lookup_db, notifier=Mock(), symbol_resolver=Mock(), mode="PAPER")
+    service._daily_summary_mode_isolated()
+    service._positions_has_unrealized_columns()
+    service._get_table_columns("account_snapshots")
+    service._get_table_columns("trades")
+    elapsed = time.perf_counter() - started
+
+    return {
+        "startup_sec": round(elapsed, 3),
+        "introspection_queries": db.introspection_queries,
+        "round_trips": db.round_trips,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--rtt-ms", type=float, default=2.0)
+    args = parser.parse_args(argv)
+
+    symbols = max(args.symbols, 1)
+    rtt_sec = max(args.rtt_ms, 0.0) / 1000.0
+    result: Dict[str, Any] = {"symbols": symbols, "rtt_ms": args.rtt_ms}
+    for mode, use_catalog in (("before", False), ("catalog", True)):
+        schema = _FakeSchema()
+        result[mode] = {
+            "fresh": run(schema, symbols, rtt_sec, use_catalog),
+            "restart": run(schema, symbols, rtt_sec, use_catalog),
+        }
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
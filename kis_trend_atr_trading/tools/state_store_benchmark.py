@@ -0,0 +1,133 @@
+"""Order-path write benchmark: legacy JSON rewrite vs SQLite state store.
+
+Simulates the multi-symbol loop: one PositionStore per symbol, and on each
+round every symbol saves its position, one DailyTradeStore trade is recorded
+and the PerformanceTracker records a fill.
+
+- legacy: the previous implementation (read whole file + rewrite with indent=2)
+- state_store: current stores (position saves commit synchronously, trade and
+               performance logs are coalesced and flushed in the background)
+
+Reports caller-side time (what the trading thread pays) plus the time of the
+final flush barrier for the state store.
+
+Example:
+  python tools/state_store_benchmark.py --symbols 50 --rounds 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from performance.trade_record import TradeRecord
+from utils.position_store import DailyTradeStore, PositionStore, StoredPosition
+from utils.state_store import STATE_STORE_FILENAME, StateStore
+
+
+def _position(symbol: str, qty: int) -> StoredPosition:
+    return StoredPosition(
+        stock_code=symbol,
+        entry_price=70000.0,
+        quantity=qty,
+        stop_loss=67000.0,
+        take_profit=None,
+        entry_date="2026-03-11",
+        atr_at_entry=1500.0,
+    )
+
+
+def _legacy_rewrite(path: Path, update) -> None:
+    data: Any = {}
+    if path.exists():
+        data = json.loads(path.read_text(encoding="utf-8"))
+    data = update(data)
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2, default=str), encoding="utf-8")
+
+
+def run_legacy(data_dir: Path, symbols: List[str], rounds: int) -> Dict[str, Any]:
+    trades: List[Dict[str, Any]] = []
+    started = time.perf_counter()
+    for qty in range(1, rounds + 1):
+        for symbol in symbols:
+            position = asdict(_position(symbol, qty))
+            _legacy_rewrite(
+                data_dir / f"positions_{symbol}.json",
+                lambda prev: {"position": position, "version": "1.0", "pending_exit": prev.get("pending_exit")},
+            )
+
+        def add_trade(days, qty=qty):
+            day = days.setdefault("2026-03-11", {"trades": [], "total_pnl": 0.0, "consecutive_losses": 0})
+            day["trades"].append({"pnl": -qty})
+            day["total_pnl"] -= qty
+            return days
+
+        _legacy_rewrite(data_dir / "daily_trades.json", add_trade)
+        trades.append(TradeRecord(symbol=symbols[qty % len(symbols)], side="BUY", price=70000.0, quantity=qty).to_dict())
+        (data_dir / "performance_trades.json").write_text(
+            json.dumps(trades, ensure_ascii=False, indent=2, default=str)
+        )
+    return {"caller_sec": round(time.perf_counter() - started, 3), "barrier_sec": 0.0}
+
+
+def run_state_store(data_dir: Path, symbols: List[str], rounds: int, flush_sec: float) -> Dict[str, Any]:
+    store = StateStore(data_dir / STATE_STORE_FILENAME, flush_interval_sec=flush_sec)
+    positions = [PositionStore(data_dir / f"positions_{symbol}.json", state_store=store) for symbol in symbols]
+    daily = DailyTradeStore(data_dir / "daily_trades.json", state_store=store)
+    started = time.perf_counter()
+    for qty in range(1, rounds + 1):
+        for position_store, symbol in zip(positions, symbols):
+            position_store.save_position(_position(symbol, qty))
+        daily.save_trade({"pnl": -qty})
+        trade = TradeRecord(symbol=symbols[qty % len(symbols)], side="BUY", price=70000.0, quantity=qty)
+        store.append("performance_trades", trade.to_dict())
+    caller_sec = time.perf_counter() - started
+    started = time.perf_counter()
+    store.flush()
+    barrier_sec = time.perf_counter() - started
+    metrics = store.metrics()
+    store.close()
+    return {
+        "caller_sec": round(caller_sec, 3),
+        "barrier_sec": round(barrier_sec, 3),
+        "flushes": metrics["flushes"],
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--flush-sec", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    symbols = [f"{idx:06d}" for idx in range(max(args.symbols, 1))]
+    rounds = max(args.rounds, 1)
+    with tempfile.TemporaryDirectory() as legacy_dir, tempfile.TemporaryDirectory() as store_dir:
+        legacy = run_legacy(Path(legacy_dir), symbols, rounds)
+        state = run_state_store(Path(store_dir), symbols, rounds, args.flush_sec)
+    writes = rounds * (len(symbols) + 2)
+    result = {
+        "symbols": len(symbols),
+        "rounds": rounds,
+        "writes": writes,
+        "legacy": {**legacy, "us_per_write": round(legacy["caller_sec"] / writes * 1_000_000, 1)},
+        "state_store": {**state, "us_per_write": round(state["caller_sec"] / writes * 1_000_000, 1)},
+        "caller_speedup": round(legacy["caller_sec"] / max(state["caller_sec"], 1e-9), 1),
+    }
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
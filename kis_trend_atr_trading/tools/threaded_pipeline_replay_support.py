@@ -21,6 +21,7 @@ try:
         PullbackEntryIntent,
         StrategyEntryIntent,
         StrategySetupCandidate,
+        daily_context_frame,
         pullback_timing_decision_from_strategy,
         strategy_setup_candidate_from_pullback,
     )
@@ -38,6 +39,7 @@ except ImportError:
         PullbackEntryIntent,
         StrategyEntryIntent,
         StrategySetupCandidate,
+        daily_context_frame,
         pullback_timing_decision_from_strategy,
         strategy_setup_candidate_from_pullback,
     )
@@ -180,7 +182,7 @@ class _ReplayExecutor:
         if daily_df is not None:
             self._daily_df_by_symbol[normalized] = daily_df.copy()
         else:
-            self._daily_df_by_symbol[normalized] = pd.DataFrame(list(context.recent_bars or ()))
+            self._daily_df_by_symbol[normalized] = daily_context_frame(context)
 
     def set_intraday_bar(self, symbol: str, bar: Dict[str, Any], *, provider_ready: bool = True) -> None:
         normalized = _normalize_symbol(symbol)
@@ -264,7 +266,7 @@ class _ReplayExecutor:
         context = self._daily_context_by_symbol.get(self.stock_code)
         if context is None:
             return pd.DataFrame()
-        return pd.DataFrame(list(context.recent_bars or ()))
+        return daily_context_frame(context).copy()
 
     def fetch_market_data_for_symbol(self, symbol: str) -> pd.DataFrame:
         previous_symbol = self.stock_code
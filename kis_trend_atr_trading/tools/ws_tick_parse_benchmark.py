@@ -0,0 +1,150 @@
+"""Microbenchmark for KIS WebSocket H0STCNT0 frame parsing.
+
+Compares the legacy first-record-only parser with the multi-record parser
+(`KISWSClient._parse_ticks`) on recorded frames, or on synthetic frames when
+no recording is given.
+
+Input format (optional): text file with one raw WS frame per line, e.g.
+  0|H0STCNT0|004|005930^090001^71000^...
+
+Example:
+  python tools/ws_tick_parse_benchmark.py --frames 20000 --records-per-frame 4
+  python tools/ws_tick_parse_benchmark.py --input data/ws_frames.txt --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from adapters.kis_ws.bar_aggregator import MarketTick
+from adapters.kis_ws.ws_client import TR_SUBSCRIBE, KISWSClient
+
+# Real H0STCNT0 records carry 46 fields; only the first 13 are parsed.
+RECORD_FIELD_COUNT = 46
+
+
+def legacy_parse_first_tick(message: str) -> Optional[MarketTick]:
+    """Local copy of the previous parser (first record only, datetime per tick)."""
+    if not message or message.startswith("{") or "|" not in message:
+        return None
+    parts = message.split("|")
+    if len(parts) < 3 or parts[1] != TR_SUBSCRIBE:
+        return None
+    payload_parts = parts[2:]
+    if len(payload_parts) >= 2 and "^" not in payload_parts[0] and "^" in payload_parts[1]:
+        payload_parts = payload_parts[1:]
+    raw = next((seg for seg in payload_parts if "^" in seg), "")
+    if not raw:
+        return None
+    fields = raw.split("^")
+    if len(fields) < 13:
+        return None
+    stock_code = str(fields[0]).zfill(6)
+    if len(stock_code) != 6 or not stock_code.isdigit():
+        return None
+    hhmmss = str(fields[1] or "000000")
+    try:
+        price = float(fields[2] or 0.0)
+        best_ask = float(fields[10] or 0.0)
+        best_bid = float(fields[11] or 0.0)
+        volume = float(fields[12] or 0.0)
+    except (TypeError, ValueError):
+        return None
+    now = datetime.now()
+    try:
+        ts = now.replace(
+            hour=int(hhmmss[0:2]),
+            minute=int(hhmmss[2:4]),
+            second=int(hhmmss[4:6]),
+            microsecond=0,
+        )
+    except Exception:
+        ts = now
+    return MarketTick(
+        stock_code=stock_code,
+        price=price,
+        volume=volume,
+        timestamp=ts,
+        best_ask=best_ask,
+        best_bid=best_bid,
+        received_at=now,
+    )
+
+
+def build_synthetic_frames(frame_count: int, records_per_frame: int) -> List[str]:
+    codes = ["005930", "000660", "035420", "069500", "005380", "051910"]
+    frames: List[str] = []
+    for idx in range(max(int(frame_count), 1)):
+        records: List[str] = []
+        second = 9 * 3600 + (idx // 20)
+        hhmmss = f"{second // 3600:02d}{(second // 60) % 60:02d}{second % 60:02d}"
+        for rec in range(max(int(records_per_frame), 1)):
+            fields = ["0"] * RECORD_FIELD_COUNT
+            fields[0] = codes[(idx + rec) % len(codes)]
+            fields[1] = hhmmss
+            fields[2] = str(70000 + (idx % 50) * 10)
+            fields[10] = str(70010 + (idx % 50) * 10)
+            fields[11] = str(69990 + (idx % 50) * 10)
+            fields[12] = str(1 + rec)
+            records.append("^".join(fields))
+        frames.append(f"0|{TR_SUBSCRIBE}|{len(records):03d}|" + "^".join(records))
+    return frames
+
+
+def load_frames(path: Path) -> List[str]:
+    return [line.rstrip("\n") for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+
+def _measure(frames: Sequence[str], parse: Callable[[str], List[MarketTick]], repeat: int) -> Dict[str, float]:
+    best_sec = float("inf")
+    ticks = 0
+    for _ in range(max(int(repeat), 1)):
+        started = time.perf_counter()
+        ticks = 0
+        for frame in frames:
+            ticks += len(parse(frame))
+        best_sec = min(best_sec, time.perf_counter() - started)
+    return {
+        "ticks": int(ticks),
+        "elapsed_sec": round(best_sec, 6),
+        "ticks_per_sec": round(ticks / best_sec, 1) if best_sec > 0 else 0.0,
+    }
+
+
+def run_benchmark(frames: Sequence[str], repeat: int = 3) -> Dict[str, Dict[str, float]]:
+    def _legacy(frame: str) -> List[MarketTick]:
+        tick = legacy_parse_first_tick(frame)
+        return [tick] if tick is not None else []
+
+    return {
+        "frames": {"count": len(frames)},
+        "legacy_first_record": _measure(frames, _legacy, repeat),
+        "multi_record": _measure(frames, KISWSClient._parse_ticks, repeat),
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input", type=Path, default=None, help="recorded frames (one per line)")
+    parser.add_argument("--frames", type=int, default=20000, help="synthetic frame count")
+    parser.add_argument("--records-per-frame", type=int, default=4, help="synthetic records per frame")
+    parser.add_argument("--repeat", type=int, default=3, help="best-of-N repetitions")
+    args = parser.parse_args(argv)
+
+    frames = load_frames(args.input) if args.input else build_synthetic_frames(args.frames, args.records_per_frame)
+    print(json.dumps(run_benchmark(frames, repeat=args.repeat), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -14,6 +14,8 @@ except Exception:  # pragma: no cover
 
 from utils.logger import get_logger
 from utils.market_hours import KST, is_holiday, is_weekend
+from utils.position_store import POSITION_NAMESPACE
+from utils.state_store import STATE_STORE_FILENAME, get_state_store
 try:
     from kis_trend_atr_trading.env import get_db_namespace_mode
 except Exception:  # pragma: no cover
@@ -131,20 +133,36 @@ class UniverseService:
         # 계좌 동기화 모드(PAPER/REAL)는 API 보유를 우선 반영
         symbols.update(self._load_holdings_symbols_from_api(mode))
 
-        # 모드 네임스페이스 파일만 로드 (예: positions_REAL_005930.json)
-        for path in self.data_dir.glob(f"positions_{mode}_*.json"):
+        # 모드 네임스페이스 레코드만 로드 (예: positions_REAL_005930.json)
+        prefix = f"positions_{mode}_"
+        payloads: Dict[str, Any] = {}
+        store_path = self.data_dir / STATE_STORE_FILENAME
+        try:
+            store = get_state_store(store_path) if store_path.exists() else None
+            for key in store.list_keys(POSITION_NAMESPACE) if store is not None else []:
+                if key.startswith(prefix) and key.endswith(".json"):
+                    payloads[key] = store.get(POSITION_NAMESPACE, key)
+        except Exception as e:
+            logger.warning(f"[UNIVERSE] state store holdings load failed: {e}")
+        # 아직 이관되지 않은 기존 JSON 파일
+        for path in self.data_dir.glob(f"{prefix}*.json"):
+            if path.name in payloads:
+                continue
+            try:
+                payloads[path.name] = json.loads(path.read_text(encoding="utf-8"))
+            except Exception:
+                continue
+        for payload in payloads.values():
+            pos = payload.get("position") if isinstance(payload, dict) else None
+            if not isinstance(pos, dict):
+                continue
             try:
-                payload = json.loads(path.read_text(encoding="utf-8"))
-                pos = payload.get("position") if isinstance(payload, dict) else None
-                if not isinstance(pos, dict):
-                    continue
                 code = str(pos.get("stock_code") or "").strip()
                 qty = int(pos.get("quantity") or 0)
-                if len(code) == 6 and code.isdigit() and qty > 0:
-                    symbols.add(code)
-            except Exception:
+            except (TypeError, ValueError):
                 continue
-
+            if len(code) == 6 and code.isdigit() and qty > 0:
+                symbols.add(code)
         logger.info(f"[UNIVERSE] holdings symbols loaded: mode={mode}, count={len(symbols)}")
         return sorted(symbols)
 
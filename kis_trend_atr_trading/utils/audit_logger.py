@@ -13,8 +13,9 @@ KIS Trend-ATR Trading System - 감사 추적 로거
     - 리스크 이벤트 (Kill Switch, Daily Loss 등)
 
 ★ 저장 형식:
-    - JSON 파일 (날짜별)
-    - 구조화된 이벤트 데이터
+    - append-only JSONL 파일 (날짜별, 한 줄 = 한 이벤트)
+    - 이벤트 타입/종목 코드별 바이트 오프셋 인덱스 (audit_YYYYMMDD.idx)
+    - 구 형식(audit_YYYYMMDD.json 단일 문서)은 migrate_legacy_audit_logs() 로 1회 변환
 
 ★ 목적:
     - "왜 이 매매가 발생했는지" 역추적 가능
@@ -54,6 +55,26 @@ def _resolve_audit_log_dir() -> Path:
 # 하위 호환용 스냅샷 상수 (실제 설정 시에는 _resolve_audit_log_dir() 재평가 사용)
 AUDIT_LOG_DIR = _resolve_audit_log_dir()
 
+# fsync 정책: always(이벤트마다 기록+fsync) | batch(버퍼 플러시마다 fsync) | none(OS 에 위임)
+AUDIT_FSYNC_POLICIES = ("always", "batch", "none")
+
+
+def _resolve_audit_fsync_policy(policy: Optional[str] = None) -> str:
+    resolved = str(policy or os.getenv("AUTO_TRADE_AUDIT_FSYNC", "batch") or "batch").strip().lower()
+    if resolved not in AUDIT_FSYNC_POLICIES:
+        logger.warning(f"[AUDIT] 알 수 없는 fsync 정책 {resolved!r} → batch 사용")
+        return "batch"
+    return resolved
+
+
+def _audit_file_date(file_path: Path) -> Optional[date]:
+    """audit_YYYYMMDD.<확장자...> 파일명에서 날짜를 추출합니다."""
+    token = file_path.name.split(".", 1)[0].replace("audit_", "")
+    try:
+        return datetime.strptime(token, "%Y%m%d").date()
+    except ValueError:
+        return None
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # 열거형 및 데이터 클래스
@@ -152,6 +173,87 @@ class AuditEvent:
         return cls(**data)
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# 오프셋 인덱스
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class AuditLogIndex:
+    """
+    JSONL 감사 로그의 이벤트 타입/종목 코드별 줄 시작 오프셋 인덱스
+
+    사이드카 파일(audit_YYYYMMDD.idx)에 "offset<TAB>event_type<TAB>stock_code" 를
+    데이터와 같은 시점에 append 합니다. 비정상 종료로 인덱스가 데이터보다 짧거나
+    잘린 줄·데이터 범위 밖/줄 중간 오프셋을 만나면, load() 는 그 앞까지만 신뢰하고
+    마지막 유효 위치 이후의 데이터 꼬리를 스캔해 보충합니다.
+    """
+
+    def __init__(self) -> None:
+        self.by_type: Dict[str, List[int]] = {}
+        self.by_stock: Dict[str, List[int]] = {}
+        self.offsets: List[int] = []
+
+    def add(self, offset: int, event_type: str, stock_code: str) -> None:
+        self.offsets.append(offset)
+        self.by_type.setdefault(event_type, []).append(offset)
+        if stock_code:
+            self.by_stock.setdefault(stock_code, []).append(offset)
+
+    def lookup(self, event_type: Optional[str] = None, stock_code: Optional[str] = None) -> List[int]:
+        """조건에 맞는 오프셋 (파일 순서)"""
+        if event_type is None and stock_code is None:
+            return list(self.offsets)
+        candidates: Optional[set] = None
+        if event_type is not None:
+            candidates = set(self.by_type.get(event_type, ()))
+        if stock_code is not None:
+            stock_offsets = set(self.by_stock.get(stock_code, ()))
+            candidates = stock_offsets if candidates is None else candidates & stock_offsets
+        return sorted(candidates or ())
+
+    @staticmethod
+    def format_entry(offset: int, event_type: str, stock_code: str) -> str:
+        return f"{offset}\t{event_type}\t{stock_code}\n"
+
+    @classmethod
+    def load(cls, data_path: Path, index_path: Path) -> "AuditLogIndex":
+        index = cls()
+        if not data_path.exists():
+            return index
+        data_size = data_path.stat().st_size
+        if index_path.exists():
+            with open(index_path, "r", encoding="utf-8") as f, open(data_path, "rb") as data:
+                for raw in f:
+                    parts = raw.rstrip("\n").split("\t")
+                    if not raw.endswith("\n") or len(parts) != 3 or not parts[0].isdigit():
+                        break  # 잘린 꼬리
+                    offset = int(parts[0])
+                    if offset >= data_size or not cls._at_line_start(data, offset):
+                        break  # 데이터와 맞지 않는 항목 이후는 데이터 스캔으로 대체
+                    index.add(offset, parts[1], parts[2])
+        with open(data_path, "rb") as f:
+            if index.offsets:
+                f.seek(index.offsets[-1])
+                f.readline()
+            while True:
+                offset = f.tell()
+                raw = f.readline()
+                if not raw:
+                    break
+                try:
+                    record = json.loads(raw)
+                except ValueError:
+                    continue
+                index.add(offset, str(record.get("event_type", "")), str(record.get("stock_code", "") or ""))
+        return index
+
+    @staticmethod
+    def _at_line_start(data, offset: int) -> bool:
+        if offset == 0:
+            return True
+        data.seek(offset - 1)
+        return data.read(1) == b"\n"
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # 감사 로거 클래스
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -197,7 +299,8 @@ class AuditLogger:
         session_id: str = None,
         max_events_per_file: int = 10000,
         compress_old_logs: bool = True,
-        retention_days: int = 90
+        retention_days: int = 90,
+        fsync_policy: str = None
     ):
         """
         감사 로거 초기화
@@ -208,6 +311,7 @@ class AuditLogger:
             max_events_per_file: 파일당 최대 이벤트 수
             compress_old_logs: 과거 로그 압축 여부
             retention_days: 로그 보관 기간 (일)
+            fsync_policy: always | batch | none (None이면 AUTO_TRADE_AUDIT_FSYNC, 기본 batch)
         """
         self.log_dir = log_dir or _resolve_audit_log_dir()
         self.log_dir.mkdir(parents=True, exist_ok=True)
@@ -216,14 +320,17 @@ class AuditLogger:
         self.max_events_per_file = max_events_per_file
         self.compress_old_logs = compress_old_logs
         self.retention_days = retention_days
+        self.fsync_policy = _resolve_audit_fsync_policy(fsync_policy)
         
-        self._lock = threading.Lock()
+        self._lock = threading.RLock()
         self._event_counter = 0
         self._current_date = datetime.now(KST).date()
         self._events_buffer: List[AuditEvent] = []
         
-        # 현재 날짜 파일
+        # 현재 날짜 파일 (업그레이드 당일의 구 형식 파일은 먼저 JSONL 로 옮긴다)
         self._current_file = self._get_log_file_path()
+        _migrate_legacy_audit_file(self._legacy_log_file_path(self._current_date), self._current_file)
+        self._current_index = AuditLogIndex.load(self._current_file, self._get_index_file_path(self._current_file))
         
         # 시작 이벤트 기록
         self.log_system_start()
@@ -237,8 +344,16 @@ class AuditLogger:
     def _get_log_file_path(self, target_date: date = None) -> Path:
         """로그 파일 경로를 반환합니다."""
         target_date = target_date or datetime.now(KST).date()
+        return self.log_dir / f"audit_{target_date.strftime('%Y%m%d')}.jsonl"
+    
+    def _legacy_log_file_path(self, target_date: date) -> Path:
+        """구 형식(단일 JSON 문서) 로그 파일 경로"""
         return self.log_dir / f"audit_{target_date.strftime('%Y%m%d')}.json"
     
+    @staticmethod
+    def _get_index_file_path(log_file: Path) -> Path:
+        return log_file.with_suffix(".idx")
+    
     def _generate_event_id(self) -> str:
         """이벤트 ID를 생성합니다."""
         self._event_counter += 1
@@ -251,12 +366,17 @@ class AuditLogger:
             # 이전 날짜 파일 저장
             self._flush_buffer()
             
-            # 압축 및 정리
+            # 압축 및 정리 (압축본은 순차 스캔으로 조회하므로 인덱스는 함께 제거)
             if self.compress_old_logs:
                 self._compress_old_log(self._current_file)
+                if not self._current_file.exists():
+                    self._get_index_file_path(self._current_file).unlink(missing_ok=True)
             
             self._current_date = today
             self._current_file = self._get_log_file_path()
+            self._current_index = AuditLogIndex.load(
+                self._current_file, self._get_index_file_path(self._current_file)
+            )
             
             # 보관 기간 초과 로그 삭제
             self._cleanup_old_logs()
@@ -308,45 +428,68 @@ class AuditLogger:
             
             self._events_buffer.append(event)
             
-            # 버퍼가 가득 차면 플러시
-            if len(self._events_buffer) >= 100:
+            # 버퍼가 가득 차면 플러시 (always 정책은 이벤트마다)
+            if self.fsync_policy == "always" or len(self._events_buffer) >= 100:
                 self._flush_buffer()
             
             return event
     
     def _flush_buffer(self) -> None:
-        """버퍼를 파일에 기록합니다."""
-        if not self._events_buffer:
-            return
+        """
+        버퍼를 파일 끝에 append 합니다.
         
-        try:
-            # 기존 이벤트 로드
-            existing_events = []
-            if self._current_file.exists():
-                with open(self._current_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    existing_events = data.get("events", [])
-            
-            # 새 이벤트 추가
-            for event in self._events_buffer:
-                existing_events.append(event.to_dict())
-            
-            # 파일 저장
-            data = {
-                "session_id": self.session_id,
-                "date": str(self._current_date),
-                "event_count": len(existing_events),
-                "events": existing_events,
-                "updated_at": datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S")
-            }
-            
-            with open(self._current_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            
-            self._events_buffer.clear()
+        기존 내용을 다시 읽거나 다시 쓰지 않으므로 플러시 비용은 버퍼 크기에만 비례합니다.
+        """
+        with self._lock:
+            if not self._events_buffer:
+                return
             
-        except Exception as e:
-            logger.error(f"[AUDIT] 버퍼 플러시 실패: {e}")
+            try:
+                offset = self._current_file.stat().st_size if self._current_file.exists() else 0
+                lines: List[bytes] = []
+                index_entries: List[str] = []
+                indexed: List[tuple] = []
+                if offset and not self._ends_with_newline(self._current_file, offset):
+                    # 이전 프로세스가 줄 중간에서 끊겼다면 새 줄부터 시작
+                    lines.append(b"\n")
+                    offset += 1
+                for event in self._events_buffer:
+                    record = event.to_dict()
+                    line = (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+                    index_entries.append(AuditLogIndex.format_entry(offset, record["event_type"], event.stock_code or ""))
+                    indexed.append((offset, record["event_type"], event.stock_code or ""))
+                    lines.append(line)
+                    offset += len(line)
+                
+                with open(self._current_file, 'ab') as f:
+                    f.write(b"".join(lines))
+                    self._sync(f)
+                index_path = self._get_index_file_path(self._current_file)
+                index_size = index_path.stat().st_size if index_path.exists() else 0
+                if index_size and not self._ends_with_newline(index_path, index_size):
+                    # 인덱스도 줄 중간에서 끊겼다면 다음 항목과 이어 붙지 않도록 새 줄부터
+                    index_entries.insert(0, "\n")
+                with open(index_path, 'a', encoding='utf-8') as f:
+                    f.write("".join(index_entries))
+                    self._sync(f)
+                
+                for entry in indexed:
+                    self._current_index.add(*entry)
+                self._events_buffer.clear()
+                
+            except Exception as e:
+                logger.error(f"[AUDIT] 버퍼 플러시 실패: {e}")
+    
+    def _sync(self, handle) -> None:
+        handle.flush()
+        if self.fsync_policy != "none":
+            os.fsync(handle.fileno())
+    
+    @staticmethod
+    def _ends_with_newline(file_path: Path, size: int) -> bool:
+        with open(file_path, 'rb') as f:
+            f.seek(size - 1)
+            return f.read(1) == b"\n"
     
     # ═══════════════════════════════════════════════════════════════════════════
     # 시스템 이벤트
@@ -659,7 +802,7 @@ class AuditLogger:
             return
         
         try:
-            gz_path = file_path.with_suffix('.json.gz')
+            gz_path = file_path.with_name(file_path.name + '.gz')
             with open(file_path, 'rb') as f_in:
                 with gzip.open(gz_path, 'wb') as f_out:
                     shutil.copyfileobj(f_in, f_out)
@@ -672,13 +815,12 @@ class AuditLogger:
         """보관 기간 초과 로그를 삭제합니다."""
         cutoff_date = datetime.now(KST).date() - timedelta(days=self.retention_days)
         
-        for file_path in self.log_dir.glob("audit_*.json*"):
+        for file_path in self.log_dir.glob("audit_*"):
             try:
-                # 파일명에서 날짜 추출
-                date_str = file_path.stem.replace("audit_", "").replace(".json", "")
-                file_date = datetime.strptime(date_str, "%Y%m%d").date()
+                # 파일명에서 날짜 추출 (.jsonl / .jsonl.gz / .idx / 구 형식 .json(.gz))
+                file_date = _audit_file_date(file_path)
                 
-                if file_date < cutoff_date:
+                if file_date is not None and file_date < cutoff_date:
                     file_path.unlink()
                     logger.debug(f"[AUDIT] 오래된 로그 삭제: {file_path.name}")
             except:
@@ -703,28 +845,58 @@ class AuditLogger:
         """
         self._flush_buffer()
         
-        file_path = self._get_log_file_path(target_date)
-        if not file_path.exists():
-            return []
+        target_date = target_date or datetime.now(KST).date()
+        type_key = event_type.value if event_type else None
+        stock_key = stock_code or None
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with self._lock:
+                file_path = self._get_log_file_path(target_date)
+                if file_path.exists():
+                    if file_path == self._current_file:
+                        offsets = self._current_index.lookup(type_key, stock_key)
+                    else:
+                        offsets = AuditLogIndex.load(file_path, self._get_index_file_path(file_path)).lookup(
+                            type_key, stock_key
+                        )
+                    return self._read_events_at(file_path, offsets)
             
-            events = [AuditEvent.from_dict(e) for e in data.get("events", [])]
-            
-            # 필터 적용
-            if event_type:
-                events = [e for e in events if e.event_type == event_type]
-            if stock_code:
-                events = [e for e in events if e.stock_code == stock_code]
-            
-            return events
+            # 인덱스가 없는 압축본/구 형식 파일은 순차 스캔
+            records = self._scan_records(target_date)
+            return [
+                AuditEvent.from_dict(record)
+                for record in records
+                if (type_key is None or record.get("event_type") == type_key)
+                and (stock_key is None or record.get("stock_code") == stock_key)
+            ]
             
         except Exception as e:
             logger.error(f"[AUDIT] 이벤트 조회 실패: {e}")
             return []
     
+    @staticmethod
+    def _read_events_at(file_path: Path, offsets: List[int]) -> List[AuditEvent]:
+        events: List[AuditEvent] = []
+        with open(file_path, 'rb') as f:
+            for offset in offsets:
+                f.seek(offset)
+                events.append(AuditEvent.from_dict(json.loads(f.readline())))
+        return events
+    
+    def _scan_records(self, target_date: date) -> List[Dict[str, Any]]:
+        compressed = self._get_log_file_path(target_date).with_name(
+            self._get_log_file_path(target_date).name + ".gz"
+        )
+        if compressed.exists():
+            with gzip.open(compressed, 'rt', encoding='utf-8') as f:
+                return [json.loads(line) for line in f if line.strip()]
+        legacy = self._legacy_log_file_path(target_date)
+        for candidate, opener in ((legacy, open), (legacy.with_name(legacy.name + ".gz"), gzip.open)):
+            if candidate.exists():
+                with opener(candidate, 'rt', encoding='utf-8') as f:
+                    return list(json.load(f).get("events", []))
+        return []
+    
     def close(self) -> None:
         """감사 로거를 종료합니다."""
         self.log_system_stop("Normal shutdown")
@@ -737,6 +909,74 @@ class AuditLogger:
 _audit_logger: Optional[AuditLogger] = None
 
 
+def _migrate_legacy_audit_file(legacy_path: Path, target_path: Path) -> int:
+    """
+    구 형식 audit_YYYYMMDD.json(.gz) 을 JSONL 로 변환합니다.
+    
+    대상 JSONL 이 이미 있으면 구 이벤트를 앞에 두고 기존 줄을 이어 붙입니다 (시간 순서 유지).
+    인덱스는 새로 만들고, 원본은 `.migrated` 접미사로 이름을 바꿔 보존합니다.
+    
+    Returns:
+        int: 변환된 구 형식 이벤트 수 (원본이 없으면 0)
+    """
+    if not legacy_path.exists():
+        return 0
+    opener = gzip.open if legacy_path.suffix == ".gz" else open
+    with opener(legacy_path, 'rt', encoding='utf-8') as f:
+        legacy_events = list(json.load(f).get("events", []))
+    
+    staging = target_path.with_name(target_path.name + ".tmp")
+    index_entries: List[str] = []
+    offset = 0
+    with open(staging, 'wb') as out:
+        for record in legacy_events:
+            line = (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+            index_entries.append(
+                AuditLogIndex.format_entry(offset, str(record.get("event_type", "")), str(record.get("stock_code", "") or ""))
+            )
+            out.write(line)
+            offset += len(line)
+        if target_path.exists():
+            with open(target_path, 'rb') as existing:
+                shutil.copyfileobj(existing, out)
+        out.flush()
+        os.fsync(out.fileno())
+    os.replace(staging, target_path)
+    # 구 이벤트 구간만 인덱스에 쓰고, 뒤에 이어 붙인 기존 줄은 AuditLogIndex.load() 의 꼬리 스캔으로 보충
+    with open(AuditLogger._get_index_file_path(target_path), 'w', encoding='utf-8') as f:
+        f.write("".join(index_entries))
+    legacy_path.replace(legacy_path.with_name(legacy_path.name + ".migrated"))
+    logger.info(f"[AUDIT] 구 형식 로그 변환: {legacy_path.name} → {target_path.name} ({len(legacy_events)}건)")
+    return len(legacy_events)
+
+
+def migrate_legacy_audit_logs(log_dir: Path = None) -> Dict[str, int]:
+    """
+    로그 디렉토리의 구 형식 감사 로그를 모두 JSONL 로 변환합니다 (1회성).
+    
+    - audit_YYYYMMDD.json → audit_YYYYMMDD.jsonl (+ .idx)
+    - audit_YYYYMMDD.json.gz → audit_YYYYMMDD.jsonl.gz (압축 유지, 인덱스 없음)
+    
+    Returns:
+        Dict[str, int]: 원본 파일명별 변환 이벤트 수
+    """
+    log_dir = Path(log_dir or _resolve_audit_log_dir())
+    results: Dict[str, int] = {}
+    for legacy_path in sorted(log_dir.glob("audit_*.json")):
+        target = legacy_path.with_suffix(".jsonl")
+        results[legacy_path.name] = _migrate_legacy_audit_file(legacy_path, target)
+    for legacy_path in sorted(log_dir.glob("audit_*.json.gz")):
+        name = legacy_path.name
+        plain_target = log_dir / name.replace(".json.gz", ".jsonl")
+        results[name] = _migrate_legacy_audit_file(legacy_path, plain_target)
+        with open(plain_target, 'rb') as f_in:
+            with gzip.open(plain_target.with_name(plain_target.name + ".gz"), 'wb') as f_out:
+                shutil.copyfileobj(f_in, f_out)
+        plain_target.unlink()
+        AuditLogger._get_index_file_path(plain_target).unlink(missing_ok=True)
+    return results
+
+
 def get_audit_logger(**kwargs) -> AuditLogger:
     """
     싱글톤 AuditLogger를 반환합니다.
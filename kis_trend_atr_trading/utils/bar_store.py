@@ -0,0 +1,345 @@
+"""
+KIS Trend-ATR Trading System - 로컬 일봉 저장소
+
+KISApi.get_daily_ohlcv 결과를 SQLite 에 영속화하여, 재시작/재평가 시
+이미 받은 확정 일봉을 다시 조회하지 않고 비어 있는 구간만 REST 로 채웁니다.
+
+★ 저장 구조:
+    - bars: (종목, 주기, 거래일) 기본키 OHLCV
+    - coverage: 종목/주기별 연속 조회 구간
+        · fetched_from  : 조회 완료 구간 시작일
+        · final_through : 확정(장 마감 후 조회)된 마지막 거래일
+        · fetched_through / fetched_at : 마지막 꼬리 조회 범위/시각
+
+★ 갭 채우기 규칙:
+    - 요청 시작일이 fetched_from 이전이면 앞쪽 구간만 조회
+    - final_through 이후(당일 잠정봉 포함)는 TTL 경과 시에만 다시 조회
+    - 장 시작 전 당일 구간 / 휴장일 당일은 조회하지 않음
+    - 당일 봉은 장 마감 + 여유시간 이후 조회분부터 확정으로 기록
+
+저장 위치: data/daily_bars.sqlite3 (DAILY_BAR_STORE_PATH)
+"""
+
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from utils.market_hours import KST, MARKET_OPEN, is_holiday, is_weekend
+
+DATE_FORMAT = "%Y%m%d"
+
+# 장 마감(15:20) 이후 종가 확정까지 여유를 둔 확정 기준 시각
+DEFAULT_FINALIZE_TIME = time(15, 40, 0)
+DEFAULT_TAIL_TTL_SEC = 30.0
+
+BAR_COLUMNS: Tuple[str, ...] = ("date", "open", "high", "low", "close", "volume")
+
+
+def _parse_day(value: str) -> date:
+    return datetime.strptime(str(value), DATE_FORMAT).date()
+
+
+def _format_day(value: date) -> str:
+    return value.strftime(DATE_FORMAT)
+
+
+def _shift_day(value: str, days: int) -> str:
+    return _format_day(_parse_day(value) + timedelta(days=days))
+
+
+@dataclass
+class BarCoverage:
+    """종목/주기별 조회 완료 구간 (날짜는 YYYYMMDD)"""
+    fetched_from: str
+    final_through: str
+    fetched_through: str
+    fetched_at: float
+
+
+class DailyBarStore:
+    """
+    SQLite(WAL) 기반 일봉 저장소
+
+    사용 예시:
+        store = DailyBarStore("data/daily_bars.sqlite3")
+        for start, end in store.missing_ranges("005930", "D", "20260101", "20260410"):
+            store.save_fetched("005930", "D", start, end, fetch_remote(start, end))
+        df = store.load_bars("005930", "D", "20260101", "20260410")
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        tail_ttl_sec: float = DEFAULT_TAIL_TTL_SEC,
+        finalize_time: time = DEFAULT_FINALIZE_TIME,
+    ):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            tail_ttl_sec: 미확정 꼬리 구간(당일 잠정봉) 재조회 최소 간격(초)
+            finalize_time: 당일 봉을 확정으로 간주하는 시각 (KST)
+        """
+        self.db_path = Path(db_path)
+        self.tail_ttl_sec = max(float(tail_ttl_sec), 0.0)
+        self.finalize_time = finalize_time
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS bars (
+                    symbol TEXT NOT NULL,
+                    timeframe TEXT NOT NULL,
+                    trade_date TEXT NOT NULL,
+                    open REAL NOT NULL,
+                    high REAL NOT NULL,
+                    low REAL NOT NULL,
+                    close REAL NOT NULL,
+                    volume INTEGER NOT NULL,
+                    PRIMARY KEY (symbol, timeframe, trade_date)
+                ) WITHOUT ROWID;
+
+                CREATE TABLE IF NOT EXISTS coverage (
+                    symbol TEXT NOT NULL,
+                    timeframe TEXT NOT NULL,
+                    fetched_from TEXT NOT NULL,
+                    final_through TEXT NOT NULL,
+                    fetched_through TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (symbol, timeframe)
+                ) WITHOUT ROWID;
+                """
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ════════════════════════════════════════════════════════════════
+    # 조회 구간 계획
+    # ════════════════════════════════════════════════════════════════
+
+    def get_coverage(self, symbol: str, timeframe: str) -> Optional[BarCoverage]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_from, final_through, fetched_through, fetched_at "
+                "FROM coverage WHERE symbol=? AND timeframe=?",
+                (str(symbol), str(timeframe)),
+            ).fetchone()
+        if row is None:
+            return None
+        return BarCoverage(
+            fetched_from=row[0],
+            final_through=row[1],
+            fetched_through=row[2],
+            fetched_at=float(row[3]),
+        )
+
+    def _final_cutoff(self, now: datetime) -> str:
+        """now 시점에 확정으로 간주할 수 있는 마지막 거래일"""
+        today = now.date()
+        if is_weekend(today) or is_holiday(today) or now.time() >= self.finalize_time:
+            return _format_day(today)
+        return _format_day(today - timedelta(days=1))
+
+    def missing_ranges(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: str,
+        end_date: str,
+        now: Optional[datetime] = None,
+    ) -> List[Tuple[str, str]]:
+        """
+        REST 로 조회해야 하는 구간 목록을 반환합니다.
+
+        Args:
+            symbol: 종목 코드
+            timeframe: 주기 (D)
+            start_date: 요청 시작일 (YYYYMMDD)
+            end_date: 요청 종료일 (YYYYMMDD)
+            now: 기준 시각 (기본: 현재 KST)
+
+        Returns:
+            List[Tuple[str, str]]: [(시작일, 종료일), ...] (양끝 포함)
+        """
+        now = now or datetime.now(KST)
+        if start_date > end_date:
+            return []
+        coverage = self.get_coverage(symbol, timeframe)
+        if coverage is None:
+            return [(start_date, end_date)]
+
+        ranges: List[Tuple[str, str]] = []
+        if start_date < coverage.fetched_from:
+            ranges.append((start_date, min(end_date, _shift_day(coverage.fetched_from, -1))))
+
+        tail_start = max(start_date, _shift_day(coverage.final_through, 1))
+        if tail_start > end_date:
+            return ranges
+
+        today = _format_day(now.date())
+        if tail_start >= today and now.time() < MARKET_OPEN:
+            # 장 시작 전: 당일 봉이 아직 없음
+            return ranges
+        tail_fresh = (
+            coverage.fetched_through >= end_date
+            and now.timestamp() - coverage.fetched_at < self.tail_ttl_sec
+        )
+        if not tail_fresh:
+            ranges.append((tail_start, end_date))
+        return ranges
+
+    # ════════════════════════════════════════════════════════════════
+    # 저장 / 로드
+    # ════════════════════════════════════════════════════════════════
+
+    def save_fetched(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: str,
+        end_date: str,
+        df: Optional[pd.DataFrame],
+        now: Optional[datetime] = None,
+    ) -> None:
+        """
+        REST 조회 결과를 저장하고 조회 완료 구간을 갱신합니다.
+
+        빈 결과도 "해당 구간에 봉 없음"으로 기록하여 재조회하지 않습니다.
+        """
+        now = now or datetime.now(KST)
+        symbol = str(symbol)
+        timeframe = str(timeframe)
+        rows: List[Tuple] = []
+        if df is not None and not df.empty:
+            for trade_date, open_, high, low, close, volume in zip(
+                pd.to_datetime(df["date"]).dt.strftime(DATE_FORMAT),
+                df["open"],
+                df["high"],
+                df["low"],
+                df["close"],
+                df["volume"],
+            ):
+                rows.append(
+                    (symbol, timeframe, trade_date, float(open_), float(high),
+                     float(low), float(close), int(volume))
+                )
+
+        final_cutoff = self._final_cutoff(now)
+        with self._lock:
+            coverage_row = self._conn.execute(
+                "SELECT fetched_from, final_through, fetched_through, fetched_at "
+                "FROM coverage WHERE symbol=? AND timeframe=?",
+                (symbol, timeframe),
+            ).fetchone()
+            coverage = self._merge_coverage(
+                BarCoverage(*coverage_row) if coverage_row else None,
+                start_date,
+                end_date,
+                final_cutoff,
+                now.timestamp(),
+            )
+            with self._conn:
+                if rows:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO bars "
+                        "(symbol, timeframe, trade_date, open, high, low, close, volume) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO coverage "
+                    "(symbol, timeframe, fetched_from, final_through, fetched_through, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        symbol,
+                        timeframe,
+                        coverage.fetched_from,
+                        coverage.final_through,
+                        coverage.fetched_through,
+                        coverage.fetched_at,
+                    ),
+                )
+
+    @staticmethod
+    def _merge_coverage(
+        coverage: Optional[BarCoverage],
+        start_date: str,
+        end_date: str,
+        final_cutoff: str,
+        fetched_at: float,
+    ) -> BarCoverage:
+        final_through = min(end_date, final_cutoff)
+        disjoint = coverage is None or (
+            start_date > _shift_day(coverage.final_through, 1)
+            or end_date < _shift_day(coverage.fetched_from, -1)
+        )
+        if disjoint:
+            # 기존 구간과 이어지지 않으면 새 구간으로 교체 (중간 공백을 확정으로 오인하지 않음)
+            return BarCoverage(
+                fetched_from=start_date,
+                final_through=max(final_through, _shift_day(start_date, -1)),
+                fetched_through=end_date,
+                fetched_at=fetched_at,
+            )
+        is_tail = end_date >= coverage.fetched_through
+        return BarCoverage(
+            fetched_from=min(coverage.fetched_from, start_date),
+            final_through=max(coverage.final_through, final_through),
+            fetched_through=max(coverage.fetched_through, end_date),
+            fetched_at=fetched_at if is_tail else coverage.fetched_at,
+        )
+
+    def load_bars(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: str,
+        end_date: str,
+    ) -> pd.DataFrame:
+        """저장된 봉을 get_daily_ohlcv 와 같은 형식으로 반환합니다 (없으면 빈 프레임)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT trade_date, open, high, low, close, volume FROM bars "
+                "WHERE symbol=? AND timeframe=? AND trade_date BETWEEN ? AND ? "
+                "ORDER BY trade_date",
+                (str(symbol), str(timeframe), str(start_date), str(end_date)),
+            ).fetchall()
+        if not rows:
+            return pd.DataFrame()
+        df = pd.DataFrame(rows, columns=list(BAR_COLUMNS))
+        df["date"] = pd.to_datetime(df["date"], format=DATE_FORMAT)
+        df["volume"] = df["volume"].astype(int)
+        return df
+
+
+_store_lock = threading.Lock()
+_stores: Dict[str, DailyBarStore] = {}
+
+
+def get_daily_bar_store(
+    db_path: Path,
+    tail_ttl_sec: float = DEFAULT_TAIL_TTL_SEC,
+) -> DailyBarStore:
+    """경로별 프로세스 공용 저장소를 반환합니다 (KISApi 인스턴스 간 공유)."""
+    key = str(Path(db_path).resolve())
+    with _store_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = DailyBarStore(Path(db_path), tail_ttl_sec=tail_ttl_sec)
+            _stores[key] = store
+        return store
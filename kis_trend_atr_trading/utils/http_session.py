@@ -0,0 +1,217 @@
+"""
+KIS Trend-ATR Trading System - keep-alive HTTP 세션 풀
+
+KIS REST / 텔레그램 호출마다 새 TCP+TLS 연결을 맺지 않도록
+origin(scheme://host:port) 별로 requests.Session 을 1개씩 공유합니다.
+
+★ 구성:
+    - HTTPAdapter 연결 풀 (HTTP_POOL_SIZE)
+    - 연결 단계 재시도만 허용 (요청 전송 후 재시도 없음 → 주문 중복 방지)
+    - 유휴 시간이 HTTP_KEEPALIVE_IDLE_SEC 를 넘으면 세션을 새로 만듦
+      (서버/LB 가 이미 끊은 연결을 재사용하다 실패하는 것을 방지)
+
+★ metrics(): 요청 수, 연결 재사용/신규 연결 수, 최근 지연시간 p50/p99
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_RETRIES = 1
+DEFAULT_KEEPALIVE_IDLE_SEC = 55.0
+LATENCY_WINDOW = 1024
+
+
+def _origin_of(url: str) -> str:
+    parts = urlsplit(str(url))
+    return f"{parts.scheme}://{parts.netloc}" if parts.scheme else str(url)
+
+
+def _percentile(sorted_values: list, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(pct / 100.0 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return float(sorted_values[index])
+
+
+_connection_events = threading.local()
+
+
+def _note_new_connection() -> None:
+    _connection_events.new_connections = getattr(_connection_events, "new_connections", 0) + 1
+
+
+def _build_counting_adapter(pool_size: int, retry: Any) -> Any:
+    """신규 연결 생성 시 현재 스레드 카운터를 올리는 HTTPAdapter"""
+    # 테스트용 가짜 requests 모듈에서도 임포트가 깨지지 않도록 지연 임포트
+    from requests.adapters import HTTPAdapter
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+    class _CountingHTTPConnectionPool(HTTPConnectionPool):
+        def _new_conn(self):
+            _note_new_connection()
+            return super()._new_conn()
+
+    class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+        def _new_conn(self):
+            _note_new_connection()
+            return super()._new_conn()
+
+    class _CountingHTTPAdapter(HTTPAdapter):
+        def init_poolmanager(self, *args, **kwargs):
+            super().init_poolmanager(*args, **kwargs)
+            self.poolmanager.pool_classes_by_scheme = {
+                "http": _CountingHTTPConnectionPool,
+                "https": _CountingHTTPSConnectionPool,
+            }
+
+    return _CountingHTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+
+
+class PooledHttpSession:
+    """
+    origin 1개에 대한 keep-alive 세션
+
+    사용 예시:
+        pool = get_pooled_session("https://openapivts.koreainvestment.com:29443")
+        response, reused = pool.request("GET", url, headers=headers, params=params, timeout=10)
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        connect_retries: int = DEFAULT_CONNECT_RETRIES,
+        keepalive_idle_sec: float = DEFAULT_KEEPALIVE_IDLE_SEC,
+    ):
+        self.base_url = _origin_of(base_url)
+        self.pool_size = max(int(pool_size), 1)
+        self.connect_retries = max(int(connect_retries), 0)
+        self.keepalive_idle_sec = max(float(keepalive_idle_sec), 0.0)
+        self._lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+        self._last_used_at = 0.0
+        self._request_count = 0
+        self._reused_count = 0
+        self._new_connection_count = 0
+        self._session_recycle_count = 0
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    def _build_session(self) -> requests.Session:
+        from urllib3.util.retry import Retry
+
+        retry = Retry(
+            total=self.connect_retries,
+            connect=self.connect_retries,
+            read=0,
+            status=0,
+            other=0,
+            backoff_factor=0.1,
+            raise_on_status=False,
+        )
+        adapter = _build_counting_adapter(self.pool_size, retry)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _acquire_session(self) -> requests.Session:
+        with self._lock:
+            now = time.monotonic()
+            if self._session is not None and self.keepalive_idle_sec > 0:
+                if now - self._last_used_at > self.keepalive_idle_sec:
+                    self._session.close()
+                    self._session = None
+                    self._session_recycle_count += 1
+            if self._session is None:
+                self._session = self._build_session()
+            self._last_used_at = now
+            return self._session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Tuple[requests.Response, bool]:
+        """
+        HTTP 요청을 전송합니다.
+
+        Returns:
+            Tuple[requests.Response, bool]: (응답, 기존 연결 재사용 여부)
+        """
+        session = self._acquire_session()
+        _connection_events.new_connections = 0
+        started = time.perf_counter()
+        try:
+            if method.upper() == "GET":
+                response = session.get(url, **kwargs)
+            elif method.upper() == "POST":
+                response = session.post(url, **kwargs)
+            else:
+                response = session.request(method.upper(), url, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            new_connections = int(getattr(_connection_events, "new_connections", 0))
+            with self._lock:
+                self._request_count += 1
+                if new_connections == 0:
+                    self._reused_count += 1
+                self._new_connection_count += new_connections
+                self._latencies.append(elapsed)
+        return response, new_connections == 0
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            return {
+                "base_url": self.base_url,
+                "requests": int(self._request_count),
+                "reused_connections": int(self._reused_count),
+                "new_connections": int(self._new_connection_count),
+                "session_recycles": int(self._session_recycle_count),
+                "latency_p50_ms": round(_percentile(latencies, 50) * 1000.0, 3),
+                "latency_p99_ms": round(_percentile(latencies, 99) * 1000.0, 3),
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+_pool_lock = threading.Lock()
+_pooled_sessions: Dict[str, PooledHttpSession] = {}
+
+
+def get_pooled_session(
+    base_url: str,
+    *,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    connect_retries: int = DEFAULT_CONNECT_RETRIES,
+    keepalive_idle_sec: float = DEFAULT_KEEPALIVE_IDLE_SEC,
+) -> PooledHttpSession:
+    """origin 별 프로세스 공용 세션을 반환합니다 (설정값은 최초 생성 시에만 적용)."""
+    origin = _origin_of(base_url)
+    with _pool_lock:
+        pooled = _pooled_sessions.get(origin)
+        if pooled is None:
+            pooled = PooledHttpSession(
+                origin,
+                pool_size=pool_size,
+                connect_retries=connect_retries,
+                keepalive_idle_sec=keepalive_idle_sec,
+            )
+            _pooled_sessions[origin] = pooled
+        return pooled
+
+
+def close_pooled_sessions() -> None:
+    """프로세스 종료 시 모든 공용 세션을 닫습니다."""
+    with _pool_lock:
+        sessions = list(_pooled_sessions.values())
+        _pooled_sessions.clear()
+    for pooled in sessions:
+        pooled.close()
@@ -5,16 +5,17 @@ KIS Trend-ATR Trading System - 포지션 영속화 모듈
 프로그램 재시작 시 포지션 손실을 방지합니다.
 
 ★ 핵심 기능:
-    1. 포지션 상태 영속화 (JSON)
+    1. 포지션 상태 영속화 (SQLite 상태 저장소, 레코드 단위 원자적 upsert)
     2. 프로그램 종료 시 자동 저장
     3. 프로그램 시작 시 자동 로드
     4. API를 통한 실제 보유 확인
 
-저장 위치: data/positions.json
+저장 위치: data/state_store.sqlite3 (utils/state_store.py)
+    - 저장소 키는 기존 파일명(positions.json 등)을 그대로 사용
+    - 기존 JSON 파일은 최초 로드 시 1회 이관 (원본은 그대로 두고 저장소에 이관 표시)
 """
 
 import json
-import os
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any, Tuple
@@ -22,6 +23,7 @@ import logging
 from dataclasses import dataclass, asdict
 
 from .market_hours import KST
+from .state_store import STATE_STORE_FILENAME, StateStore, get_state_store
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +31,22 @@ logger = logging.getLogger(__name__)
 DATA_DIR = Path(__file__).parent.parent / "data"
 POSITION_FILE = DATA_DIR / "positions.json"
 
+# 상태 저장소 namespace
+POSITION_NAMESPACE = "positions"
+DAILY_TRADE_NAMESPACE = "daily_trades"
+
+
+def _load_legacy_json(file_path: Path) -> Optional[Any]:
+    """기존 JSON 파일을 읽습니다 (없거나 깨졌으면 None)."""
+    if not file_path.exists():
+        return None
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.warning(f"기존 상태 파일 로드 실패 (이관 생략): {file_path} ({e})")
+        return None
+
 
 @dataclass
 class StoredPosition:
@@ -122,26 +140,54 @@ class PositionStore:
     """
     포지션 영속화 클래스
     
-    포지션 정보를 JSON 파일에 저장하고 복구합니다.
+    포지션 정보를 상태 저장소에 레코드 하나로 저장하고 복구합니다.
+    포지션/pending_exit 저장은 드물고 유실되면 안 되므로 upsert 직후 flush 하여
+    디스크 반영까지 기다립니다 (쓰기 합치기는 거래/자산 기록에만 적용).
     """
     
-    def __init__(self, file_path: Path = None):
+    def __init__(self, file_path: Path = None, state_store: StateStore = None):
         """
         PositionStore 초기화
         
         Args:
-            file_path: 저장 파일 경로 (None이면 기본 경로)
+            file_path: 기존 JSON 파일 경로 (None이면 기본 경로). 저장소 키와 이관 대상으로 사용
+            state_store: 상태 저장소 (None이면 file_path 디렉토리의 공유 저장소)
         """
         self.file_path = file_path or POSITION_FILE
         self._ensure_data_dir()
+        self._store = state_store or get_state_store(self.file_path.parent / STATE_STORE_FILENAME)
+        self._key = self.file_path.name
+        self._migrate_legacy_file()
     
     def _ensure_data_dir(self) -> None:
         """데이터 디렉토리를 생성합니다."""
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _migrate_legacy_file(self) -> None:
+        """기존 JSON 파일을 저장소로 1회 이관합니다 (원본 파일은 삭제/이름변경하지 않음)."""
+        if not self.file_path.exists() or self._store.is_legacy_migrated(self._key):
+            return
+        if self._store.get(POSITION_NAMESPACE, self._key) is None:
+            data = _load_legacy_json(self.file_path)
+            if not isinstance(data, dict):
+                return
+            self._store.put(POSITION_NAMESPACE, self._key, data)
+        self._store.mark_legacy_migrated(self._key)
+        if self._store.flush():
+            logger.info(f"포지션 파일 이관 완료: {self.file_path}")
+
+    def _write_raw_data(self, data: Dict[str, Any]) -> bool:
+        # 체결/청산 직후 프로세스가 죽어도 포지션이 남도록 동기 기록
+        self._store.put(POSITION_NAMESPACE, self._key, data)
+        return self._store.flush()
+
+    def flush(self) -> bool:
+        """대기 중인 저장분을 즉시 디스크에 반영합니다."""
+        return self._store.flush()
     
     def save_position(self, position: StoredPosition) -> bool:
         """
-        포지션을 파일에 저장합니다.
+        포지션을 저장합니다.
         
         Args:
             position: 저장할 포지션
@@ -157,9 +203,9 @@ class PositionStore:
                 "updated_at": datetime.now(KST).isoformat(),
                 "pending_exit": previous.get("pending_exit")
             }
-            
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            if not self._write_raw_data(data):
+                logger.error(f"포지션 저장 실패 (디스크 반영 실패): {position.stock_code}")
+                return False
             
             logger.info(f"포지션 저장 완료: {position.stock_code}")
             return True
@@ -175,16 +221,10 @@ class PositionStore:
         Returns:
             Optional[StoredPosition]: 저장된 포지션 (없으면 None)
         """
-        if not self.file_path.exists():
-            logger.debug("저장된 포지션 없음")
-            return None
-        
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            position_data = data.get("position")
+            position_data = self._load_raw_data().get("position")
             if not position_data:
+                logger.debug("저장된 포지션 없음")
                 return None
             
             position = StoredPosition(**position_data)
@@ -203,7 +243,7 @@ class PositionStore:
             bool: 삭제 성공 여부
         """
         try:
-            if self.file_path.exists():
+            if self._load_raw_data():
                 # 완전 삭제 대신 빈 데이터로 덮어쓰기 (히스토리 보존)
                 data = {
                     "position": None,
@@ -212,9 +252,9 @@ class PositionStore:
                     "cleared_at": datetime.now(KST).isoformat(),
                     "pending_exit": None,
                 }
-                
-                with open(self.file_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                if not self._write_raw_data(data):
+                    logger.error("포지션 삭제 실패 (디스크 반영 실패)")
+                    return False
                 
                 logger.info("포지션 정보 삭제 완료")
             return True
@@ -230,8 +270,9 @@ class PositionStore:
             data["pending_exit"] = pending_exit
             data["version"] = data.get("version", "1.0")
             data["updated_at"] = datetime.now(KST).isoformat()
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            if not self._write_raw_data(data):
+                logger.error("pending_exit 저장 실패 (디스크 반영 실패)")
+                return False
             return True
         except Exception as e:
             logger.error(f"pending_exit 저장 실패: {e}")
@@ -248,12 +289,9 @@ class PositionStore:
         return self.save_pending_exit(None)
 
     def _load_raw_data(self) -> Dict[str, Any]:
-        """포지션 파일 원문 payload를 로드합니다."""
-        if not self.file_path.exists():
-            return {}
+        """저장된 포지션 레코드 원문 payload를 로드합니다."""
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._store.get(POSITION_NAMESPACE, self._key)
             return data if isinstance(data, dict) else {}
         except Exception:
             return {}
@@ -374,17 +412,22 @@ class DailyTradeStore:
     일일 거래 기록 저장 클래스
     
     일일 손실 한도 체크를 위해 당일 거래 기록을 저장합니다.
+    날짜별 레코드(거래 목록 + 손익 합계 + 연속 손실)를 원자적으로 upsert 하므로
+    거래 1건 저장 시 지난 날짜 기록을 다시 쓰지 않습니다.
     """
     
-    def __init__(self, file_path: Path = None):
+    def __init__(self, file_path: Path = None, state_store: StateStore = None):
         """
         DailyTradeStore 초기화
         
         Args:
-            file_path: 저장 파일 경로
+            file_path: 기존 JSON 파일 경로. 저장소 키와 이관 대상으로 사용
+            state_store: 상태 저장소 (None이면 file_path 디렉토리의 공유 저장소)
         """
         self.file_path = file_path or (DATA_DIR / "daily_trades.json")
         self._ensure_data_dir()
+        self._store = state_store or get_state_store(self.file_path.parent / STATE_STORE_FILENAME)
+        self._migrate_legacy_file()
     
     def _ensure_data_dir(self) -> None:
         """데이터 디렉토리를 생성합니다."""
@@ -393,6 +436,31 @@ class DailyTradeStore:
     def _get_today_str(self) -> str:
         """오늘 날짜 문자열을 반환합니다."""
         return datetime.now(KST).strftime("%Y-%m-%d")
+
+    def _day_key(self, day: str) -> str:
+        return f"{self.file_path.name}:{day}"
+
+    def _load_day(self, day: str) -> Optional[Dict[str, Any]]:
+        day_data = self._store.get(DAILY_TRADE_NAMESPACE, self._day_key(day))
+        return day_data if isinstance(day_data, dict) else None
+
+    def _migrate_legacy_file(self) -> None:
+        """기존 JSON 파일(날짜별 전체 기록)을 저장소로 1회 이관합니다 (원본 파일은 그대로 둠)."""
+        if self._store.is_legacy_migrated(self.file_path.name):
+            return
+        data = _load_legacy_json(self.file_path)
+        if not isinstance(data, dict):
+            return
+        for day, day_data in data.items():
+            if isinstance(day_data, dict) and self._load_day(day) is None:
+                self._store.put(DAILY_TRADE_NAMESPACE, self._day_key(day), day_data)
+        self._store.mark_legacy_migrated(self.file_path.name)
+        if self._store.flush():
+            logger.info(f"일일 거래 기록 파일 이관 완료: {self.file_path}")
+
+    def flush(self) -> bool:
+        """대기 중인 저장분을 즉시 디스크에 반영합니다."""
+        return self._store.flush()
     
     def save_trade(self, trade: Dict[str, Any]) -> bool:
         """
@@ -405,29 +473,26 @@ class DailyTradeStore:
             bool: 저장 성공 여부
         """
         try:
-            data = self._load_data()
             today = self._get_today_str()
+            day_data = self._load_day(today) or {
+                "trades": [],
+                "total_pnl": 0.0,
+                "consecutive_losses": 0
+            }
             
-            if today not in data:
-                data[today] = {
-                    "trades": [],
-                    "total_pnl": 0.0,
-                    "consecutive_losses": 0
-                }
-            
-            data[today]["trades"].append(trade)
+            day_data["trades"].append(trade)
             
             # 손익 업데이트
             pnl = trade.get("pnl", 0)
-            data[today]["total_pnl"] += pnl
+            day_data["total_pnl"] += pnl
             
             # 연속 손실 카운트
             if pnl < 0:
-                data[today]["consecutive_losses"] += 1
+                day_data["consecutive_losses"] += 1
             else:
-                data[today]["consecutive_losses"] = 0
+                day_data["consecutive_losses"] = 0
             
-            self._save_data(data)
+            self._store.put(DAILY_TRADE_NAMESPACE, self._day_key(today), day_data)
             return True
             
         except Exception as e:
@@ -441,10 +506,10 @@ class DailyTradeStore:
         Returns:
             Dict: 거래 통계
         """
-        data = self._load_data()
         today = self._get_today_str()
+        today_data = self._load_day(today)
         
-        if today not in data:
+        if today_data is None:
             return {
                 "trade_count": 0,
                 "total_pnl": 0.0,
@@ -453,7 +518,6 @@ class DailyTradeStore:
                 "trades": []
             }
         
-        today_data = data[today]
         trades = today_data.get("trades", [])
         
         # 손익률 계산 (진입금액 기준)
@@ -511,33 +575,12 @@ class DailyTradeStore:
     def clear_today(self) -> bool:
         """당일 기록을 초기화합니다."""
         try:
-            data = self._load_data()
             today = self._get_today_str()
-            
-            if today in data:
-                del data[today]
-                self._save_data(data)
-            
+            self._store.delete(DAILY_TRADE_NAMESPACE, self._day_key(today))
             return True
         except Exception as e:
             logger.error(f"당일 기록 초기화 실패: {e}")
             return False
-    
-    def _load_data(self) -> Dict:
-        """데이터 파일을 로드합니다."""
-        if not self.file_path.exists():
-            return {}
-        
-        try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
-            return {}
-
-    def _save_data(self, data: Dict) -> None:
-        """데이터를 파일에 저장합니다."""
-        with open(self.file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
 
 
 # ════════════════════════════════════════════════════════════════
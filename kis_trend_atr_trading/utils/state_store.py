@@ -0,0 +1,452 @@
+"""
+KIS Trend-ATR Trading System - 로컬 상태 저장소
+
+PositionStore / DailyTradeStore / PerformanceTracker 가 공유하는 SQLite(WAL) 저장소입니다.
+주문 경로에서는 메모리 대기열에만 기록하고, 디스크 반영은 백그라운드 flusher 가
+모아서 한 트랜잭션으로 처리합니다.
+
+★ 저장 구조:
+    - kv  : (namespace, key) 기본키 JSON 값 — 레코드 단위 원자적 upsert
+    - log : (namespace, seq) 기본키 JSON 값 — append 전용 기록 (거래 내역 등)
+
+★ 쓰기 합치기 (write coalescing):
+    - put/delete: 같은 키는 마지막 값만 남김 (flush 전 여러 번 저장해도 1회 기록)
+    - append/truncate/trim: 호출 순서대로 대기열에 쌓임
+    - flush 주기(STATE_STORE_FLUSH_SEC, 기본 0.2초)마다 대기분 전체를 한 트랜잭션으로 commit
+    - flush() 는 대기분이 디스크에 반영될 때까지 기다리는 barrier
+    - PositionStore 는 포지션/pending_exit 저장마다 flush() 로 동기 기록
+
+★ 장애 복구:
+    - 트랜잭션 단위 원자성: 중단 시 마지막 commit 상태로 복구 (반쯤 쓴 파일 없음)
+    - commit 실패 시 대기분을 되돌려 다음 주기에 재시도
+    - 프로세스 종료 시 atexit 에서 남은 대기분 flush
+
+★ 읽기:
+    - 대기열 → 반영 중인 묶음 → 커밋된 값 캐시 → DB 순으로 조회 (자기 쓰기 즉시 조회)
+
+★ 기존 JSON 이관:
+    - 이관 완료는 legacy_migrations namespace 의 표시 레코드로 기록 (원본 파일은 그대로 둠)
+    - 배포 체크아웃에서 git 추적 파일(data/positions.json 등)을 건드리지 않기 위함
+
+저장 위치: 기존 JSON 파일과 같은 디렉토리의 state_store.sqlite3
+"""
+
+import atexit
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STATE_STORE_FILENAME = "state_store.sqlite3"
+LEGACY_MIGRATION_NAMESPACE = "legacy_migrations"
+DEFAULT_FLUSH_INTERVAL_SEC = 0.2
+
+# 대기열 op 종류 (log 테이블)
+_OP_APPEND = "append"
+_OP_TRUNCATE = "truncate"
+_OP_TRIM = "trim"
+
+_MISSING = object()
+
+KvKey = Tuple[str, str]
+
+
+def _resolve_flush_interval(value: Optional[float] = None) -> float:
+    if value is None:
+        try:
+            value = float(os.getenv("STATE_STORE_FLUSH_SEC", str(DEFAULT_FLUSH_INTERVAL_SEC)))
+        except ValueError:
+            value = DEFAULT_FLUSH_INTERVAL_SEC
+    return max(float(value), 0.0)
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+class StateStore:
+    """
+    SQLite(WAL) 기반 상태 저장소 (쓰기 합치기 + 백그라운드 flush)
+
+    사용 예시:
+        store = get_state_store(Path("data") / STATE_STORE_FILENAME)
+        store.put("positions", "positions.json", {"position": {...}})
+        store.append("daily_trades.json:2026-03-11", {"pnl": -1200})
+        store.flush()  # 필요 시 barrier
+    """
+
+    def __init__(self, db_path: Path, *, flush_interval_sec: Optional[float] = None):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            flush_interval_sec: 대기분 flush 주기(초). 0 이면 쓰기마다 즉시 commit
+                (None이면 STATE_STORE_FLUSH_SEC, 기본 0.2초)
+        """
+        self.db_path = Path(db_path)
+        self.flush_interval_sec = _resolve_flush_interval(flush_interval_sec)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # _db_lock: DB 접근(쿼리/flush) 직렬화, _cond: 대기열 보호 (디스크 I/O 동안 잡지 않음)
+        self._db_lock = threading.Lock()
+        self._cond = threading.Condition(threading.Lock())
+        self._pending_kv: Dict[KvKey, Optional[str]] = {}
+        self._pending_ops: List[Tuple[Any, ...]] = []
+        self._inflight_kv: Dict[KvKey, Optional[str]] = {}
+        self._committed_kv: Dict[KvKey, Optional[str]] = {}
+        self._next_seq: Dict[str, int] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._closed = False
+        self._flushes = 0
+        self._flush_errors = 0
+
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        with self._db_lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            # flush 가 묶음 단위라 commit 마다 fsync 해도 주문 경로 비용과 무관
+            self._conn.execute("PRAGMA synchronous=FULL")
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS kv (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                ) WITHOUT ROWID;
+
+                CREATE TABLE IF NOT EXISTS log (
+                    namespace TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    value TEXT NOT NULL,
+                    PRIMARY KEY (namespace, seq)
+                ) WITHOUT ROWID;
+                """
+            )
+
+    # ════════════════════════════════════════════════════════════════
+    # 쓰기 (대기열)
+    # ════════════════════════════════════════════════════════════════
+
+    def put(self, namespace: str, key: str, value: Any) -> None:
+        """레코드 하나를 upsert 합니다 (flush 전까지 같은 키는 마지막 값만 기록)."""
+        self._enqueue_kv((str(namespace), str(key)), _dumps(value))
+
+    def delete(self, namespace: str, key: str) -> None:
+        self._enqueue_kv((str(namespace), str(key)), None)
+
+    def append(self, namespace: str, value: Any) -> int:
+        """append 전용 기록에 값을 추가하고 순번을 반환합니다."""
+        namespace = str(namespace)
+        text = _dumps(value)
+        next_seq = None
+        if namespace not in self._next_seq:
+            next_seq = self._load_next_seq(namespace)
+        with self._cond:
+            self._check_open()
+            if namespace not in self._next_seq:
+                self._next_seq[namespace] = next_seq
+            seq = self._next_seq[namespace]
+            self._next_seq[namespace] = seq + 1
+            self._pending_ops.append((_OP_APPEND, namespace, seq, text))
+            self._schedule_locked()
+        self._flush_if_unbuffered()
+        return seq
+
+    def truncate(self, namespace: str) -> None:
+        """append 기록 전체를 삭제합니다."""
+        self._enqueue_op((_OP_TRUNCATE, str(namespace)))
+
+    def trim(self, namespace: str, keep_last: int) -> None:
+        """append 기록을 최근 keep_last 건만 남기고 삭제합니다."""
+        self._enqueue_op((_OP_TRIM, str(namespace), max(int(keep_last), 0)))
+
+    def _enqueue_kv(self, kv_key: KvKey, text: Optional[str]) -> None:
+        with self._cond:
+            self._check_open()
+            self._pending_kv[kv_key] = text
+            self._schedule_locked()
+        self._flush_if_unbuffered()
+
+    def _enqueue_op(self, op: Tuple[Any, ...]) -> None:
+        with self._cond:
+            self._check_open()
+            if op[0] == _OP_TRIM:
+                # 같은 trim 은 마지막 한 번만 적용해도 결과가 같다 (append 마다 trim 하는 호출 측 합치기)
+                self._pending_ops = [pending for pending in self._pending_ops if pending != op]
+            elif self._pending_ops and self._pending_ops[-1] == op:
+                return
+            self._pending_ops.append(op)
+            self._schedule_locked()
+        self._flush_if_unbuffered()
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise RuntimeError(f"state store is closed: {self.db_path}")
+
+    def _schedule_locked(self) -> None:
+        if self.flush_interval_sec <= 0:
+            return
+        if not self._running:
+            self._running = True
+            self._thread = threading.Thread(target=self._run, daemon=True, name="state-store-flusher")
+            self._thread.start()
+        self._cond.notify_all()
+
+    def _flush_if_unbuffered(self) -> None:
+        if self.flush_interval_sec <= 0:
+            self._flush_pending()
+
+    def _load_next_seq(self, namespace: str) -> int:
+        with self._db_lock:
+            row = self._conn.execute("SELECT MAX(seq) FROM log WHERE namespace=?", (namespace,)).fetchone()
+        return int(row[0]) + 1 if row and row[0] is not None else 1
+
+    # ════════════════════════════════════════════════════════════════
+    # flush
+    # ════════════════════════════════════════════════════════════════
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._running and not (self._pending_kv or self._pending_ops):
+                    self._cond.wait()
+                # 짧은 시간 동안 들어오는 쓰기를 한 묶음으로 모은다 (close 시 즉시 종료, 남은 분은 close 가 flush)
+                deadline = time.monotonic() + self.flush_interval_sec
+                while self._running:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(timeout=remaining)
+                if not self._running:
+                    return
+            self._flush_pending()
+
+    def _flush_pending(self) -> bool:
+        with self._db_lock:
+            with self._cond:
+                kv_batch = self._pending_kv
+                ops_batch = self._pending_ops
+                if not kv_batch and not ops_batch:
+                    return True
+                self._pending_kv = {}
+                self._pending_ops = []
+                self._inflight_kv = kv_batch
+            try:
+                self._write_batch(kv_batch, ops_batch)
+            except Exception as exc:
+                with self._cond:
+                    # 실패분을 되돌린다 (그 사이 새로 들어온 값이 우선)
+                    kv_batch.update(self._pending_kv)
+                    self._pending_kv = kv_batch
+                    self._pending_ops = ops_batch + self._pending_ops
+                    self._inflight_kv = {}
+                    self._flush_errors += 1
+                    self._cond.notify_all()
+                logger.error(f"상태 저장소 flush 실패 (다음 주기 재시도): {exc}")
+                return False
+            with self._cond:
+                self._committed_kv.update(kv_batch)
+                self._inflight_kv = {}
+                self._flushes += 1
+                self._cond.notify_all()
+        return True
+
+    def _write_batch(self, kv_batch: Dict[KvKey, Optional[str]], ops_batch: List[Tuple[Any, ...]]) -> None:
+        conn = self._conn
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            upserts = [(ns, key, text, now) for (ns, key), text in kv_batch.items() if text is not None]
+            deletes = [(ns, key) for (ns, key), text in kv_batch.items() if text is None]
+            if upserts:
+                conn.executemany(
+                    "INSERT INTO kv (namespace, key, value, updated_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(namespace, key) DO UPDATE SET value=excluded.value, updated_at=excluded.updated_at",
+                    upserts,
+                )
+            if deletes:
+                conn.executemany("DELETE FROM kv WHERE namespace=? AND key=?", deletes)
+            self._apply_log_ops(conn, ops_batch)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def _apply_log_ops(conn: sqlite3.Connection, ops_batch: List[Tuple[Any, ...]]) -> None:
+        appends: List[Tuple[str, int, str]] = []
+        for op in ops_batch:
+            if op[0] == _OP_APPEND:
+                appends.append(op[1:])
+                continue
+            # 순서 보존: 앞선 append 를 먼저 반영한 뒤 삭제 계열 op 적용
+            if appends:
+                conn.executemany("INSERT INTO log (namespace, seq, value) VALUES (?, ?, ?)", appends)
+                appends = []
+            if op[0] == _OP_TRUNCATE:
+                conn.execute("DELETE FROM log WHERE namespace=?", (op[1],))
+            elif op[0] == _OP_TRIM:
+                conn.execute(
+                    "DELETE FROM log WHERE namespace=? AND seq NOT IN "
+                    "(SELECT seq FROM log WHERE namespace=? ORDER BY seq DESC LIMIT ?)",
+                    (op[1], op[1], op[2]),
+                )
+        if appends:
+            conn.executemany("INSERT INTO log (namespace, seq, value) VALUES (?, ?, ?)", appends)
+
+    def flush(self) -> bool:
+        """대기분을 즉시 commit 합니다 (barrier). 실패 시 False."""
+        return self._flush_pending()
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._running = False
+            self._cond.notify_all()
+            thread = self._thread
+            self._thread = None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5.0)
+        self._flush_pending()
+        with self._cond:
+            self._closed = True
+        with self._db_lock:
+            self._conn.close()
+
+    # ════════════════════════════════════════════════════════════════
+    # 읽기
+    # ════════════════════════════════════════════════════════════════
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        kv_key = (str(namespace), str(key))
+        text = self._lookup_memory(kv_key)
+        if text is _MISSING:
+            with self._db_lock:
+                row = self._conn.execute(
+                    "SELECT value FROM kv WHERE namespace=? AND key=?", kv_key
+                ).fetchone()
+                with self._cond:
+                    self._committed_kv.setdefault(kv_key, row[0] if row else None)
+            text = self._lookup_memory(kv_key)
+        if text is None or text is _MISSING:
+            return default
+        return json.loads(text)
+
+    def _lookup_memory(self, kv_key: KvKey) -> Any:
+        with self._cond:
+            for layer in (self._pending_kv, self._inflight_kv, self._committed_kv):
+                if kv_key in layer:
+                    return layer[kv_key]
+        return _MISSING
+
+    def read_log(self, namespace: str) -> List[Any]:
+        """append 기록을 순번 순으로 반환합니다 (flush 전 대기분 포함)."""
+        namespace = str(namespace)
+        with self._db_lock:
+            rows = self._conn.execute(
+                "SELECT seq, value FROM log WHERE namespace=? ORDER BY seq", (namespace,)
+            ).fetchall()
+            with self._cond:
+                ops = [op for op in self._pending_ops if op[1] == namespace]
+        entries: List[Tuple[int, str]] = list(rows)
+        for op in ops:
+            if op[0] == _OP_APPEND:
+                entries.append((op[2], op[3]))
+            elif op[0] == _OP_TRUNCATE:
+                entries = []
+            elif op[0] == _OP_TRIM:
+                entries = entries[-op[2]:] if op[2] else []
+        return [json.loads(text) for _, text in entries]
+
+    def has_log(self, namespace: str) -> bool:
+        return bool(self.read_log(namespace))
+
+    def list_keys(self, namespace: str) -> List[str]:
+        namespace = str(namespace)
+        with self._db_lock:
+            keys = {
+                row[0]
+                for row in self._conn.execute("SELECT key FROM kv WHERE namespace=?", (namespace,))
+            }
+            with self._cond:
+                for layer in (self._committed_kv, self._pending_kv):
+                    for (ns, key), text in layer.items():
+                        if ns != namespace:
+                            continue
+                        if text is None:
+                            keys.discard(key)
+                        else:
+                            keys.add(key)
+        return sorted(keys)
+
+    # ════════════════════════════════════════════════════════════════
+    # 기존 JSON 이관 표시
+    # ════════════════════════════════════════════════════════════════
+
+    def is_legacy_migrated(self, file_name: str) -> bool:
+        return self.get(LEGACY_MIGRATION_NAMESPACE, str(file_name)) is not None
+
+    def mark_legacy_migrated(self, file_name: str) -> None:
+        """이관 완료 표시를 대기열에 넣습니다 (이관 데이터와 같은 flush 로 함께 commit)."""
+        self.put(LEGACY_MIGRATION_NAMESPACE, str(file_name), {"migrated_at": time.time()})
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "pending_records": len(self._pending_kv),
+                "pending_log_ops": len(self._pending_ops),
+                "flushes": int(self._flushes),
+                "flush_errors": int(self._flush_errors),
+            }
+
+
+# ════════════════════════════════════════════════════════════════
+# 프로세스 공유 인스턴스
+# ════════════════════════════════════════════════════════════════
+
+_stores: Dict[str, StateStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_state_store(db_path: Path) -> StateStore:
+    """경로별로 하나의 StateStore 를 공유합니다 (종목별 저장소가 같은 연결/flusher 사용)."""
+    key = str(Path(db_path).resolve())
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None or store._closed:
+            store = StateStore(Path(db_path))
+            _stores[key] = store
+        return store
+
+
+def flush_state_stores() -> None:
+    with _stores_lock:
+        stores = list(_stores.values())
+    for store in stores:
+        if not store._closed:
+            store.flush()
+
+
+def close_state_stores() -> None:
+    with _stores_lock:
+        stores = list(_stores.values())
+        _stores.clear()
+    for store in stores:
+        try:
+            store.close()
+        except Exception as exc:
+            logger.error(f"상태 저장소 종료 실패: {exc}")
+
+
+atexit.register(close_state_stores)
@@ -30,6 +30,12 @@ from enum import Enum
 import requests
 from requests.exceptions import RequestException, Timeout
 
+from .http_session import (
+    DEFAULT_CONNECT_RETRIES,
+    DEFAULT_KEEPALIVE_IDLE_SEC,
+    DEFAULT_POOL_SIZE,
+    get_pooled_session,
+)
 from .logger import get_logger
 from .market_hours import KST
 from .symbol_resolver import SymbolResolver, get_symbol_resolver
@@ -606,10 +612,20 @@ class TelegramNotifier:
             bool: 요청 성공 여부
         """
         url = f"{self._api_url}/{method}"
+        # api.telegram.org keep-alive 세션 공유 (매 전송마다 TLS 핸드셰이크 방지)
+        pooled = get_pooled_session(
+            url,
+            pool_size=int(os.getenv("HTTP_POOL_SIZE", str(DEFAULT_POOL_SIZE))),
+            connect_retries=int(os.getenv("HTTP_POOL_CONNECT_RETRIES", str(DEFAULT_CONNECT_RETRIES))),
+            keepalive_idle_sec=float(
+                os.getenv("HTTP_KEEPALIVE_IDLE_SEC", str(DEFAULT_KEEPALIVE_IDLE_SEC))
+            ),
+        )
         
         for attempt in range(1, self._max_retries + 1):
             try:
-                response = requests.post(
+                response, _ = pooled.request(
+                    "POST",
                     url,
                     json=payload,
                     timeout=self._timeout
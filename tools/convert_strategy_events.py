@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+APP_ROOT = PROJECT_ROOT / "kis_trend_atr_trading"
+for _path in (APP_ROOT, PROJECT_ROOT):
+    path_str = str(_path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from analytics.event_logger import convert_strategy_event_file, resolve_strategy_event_dir
+
+
+def _load_env() -> None:
+    for env_path in (PROJECT_ROOT / ".env", APP_ROOT / ".env"):
+        if env_path.exists():
+            load_dotenv(env_path, override=False)
+
+
+def _parse_date(raw: str) -> str:
+    return datetime.strptime(raw.strip(), "%Y-%m-%d").date().isoformat()
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="strategy analytics JSONL 이벤트 아카이브를 msgpack 바이너리로 변환합니다.")
+    parser.add_argument("--date", type=_parse_date, default=None, help="대상 거래일 (YYYY-MM-DD, 생략 시 전체)")
+    parser.add_argument("--event-dir", default=None, help="analytics event dir override")
+    return parser
+
+
+def _jsonl_trade_dates(event_dir: str | None) -> list[str]:
+    base_dir = resolve_strategy_event_dir(event_dir)
+    return sorted(path.stem[len("strategy_events_"):] for path in base_dir.glob("strategy_events_*.jsonl"))
+
+
+def main() -> int:
+    _load_env()
+    args = _build_parser().parse_args()
+    trade_dates = [args.date] if args.date else _jsonl_trade_dates(args.event_dir)
+    results = [convert_strategy_event_file(event_dir=args.event_dir, trade_date=trade_date) for trade_date in trade_dates]
+    print(json.dumps(results, ensure_ascii=False, indent=2, default=str))
+    return 0 if all(row["converted"] or row["reason"] == "target_exists" for row in results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())